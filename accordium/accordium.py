@@ -34,6 +34,11 @@ class Accordium():
       self.img_width = self.img.getWidth()
       self.img_height = self.img.getHeight()
 
+      # map touch coordinates (0.0 to 1.0) to image coordinates, set up once (touches come in fast) -
+      # touches slightly off the touch surface's edges are mapped to the image's edges
+      self.map_x = valueMapper(0.0, 1.0, 0.0, float(self.img_width), clamp = True)
+      self.map_y = valueMapper(0.0, 1.0, 0.0, float(self.img_height), clamp = True)
+
 
       self.display = Display("Synaesthetic", self.img_width, self.img_height)
       self.display.drawImage(image, 0, 0)
@@ -271,32 +276,29 @@ class Accordium():
       address = message.getAddress()
       arguments = message.getArguments()
 
-      width = float(self.img_width)     # ensure float for mapping accuracy
-      height = float(self.img_height)
-
       if address == "/accordium/1":
-         x = mapValue(arguments[0], 0.0, 1.0, 0.0, width)
-         y = mapValue(arguments[1], 0.0, 1.0, 0.0, height)
+         x = self.map_x(arguments[0])
+         y = self.map_y(arguments[1])
          c = 1
          self.sonify_pixel(c, x, y)
       elif address == "/accordium/2":
-         x = mapValue(arguments[0], 0.0, 1.0, 0.0, width)
-         y = mapValue(arguments[1], 0.0, 1.0, 0.0, height)
+         x = self.map_x(arguments[0])
+         y = self.map_y(arguments[1])
          c = 2
          self.sonify_pixel(c, x, y)
       elif address == "/accordium/3":
-         x = mapValue(arguments[0], 0.0, 1.0, 0.0, width)
-         y = mapValue(arguments[1], 0.0, 1.0, 0.0, height)
+         x = self.map_x(arguments[0])
+         y = self.map_y(arguments[1])
          c = 3
          self.sonify_pixel(c, x, y)
       elif address == "/accordium/4":
-         x = mapValue(arguments[0], 0.0, 1.0, 0.0, width)
-         y = mapValue(arguments[1], 0.0, 1.0, 0.0, height)
+         x = self.map_x(arguments[0])
+         y = self.map_y(arguments[1])
          c = 4
          self.sonify_pixel(c, x, y)
       elif address == "/accordium/5":
-         x = mapValue(arguments[0], 0.0, 1.0, 0.0, width)
-         y = mapValue(arguments[1], 0.0, 1.0, 0.0, height)
+         x = self.map_x(arguments[0])
+         y = self.map_y(arguments[1])
          c = 5
          self.sonify_pixel(c, x, y)
 
@@ -1,5 +1,5 @@
 ################################################################################################################
-# midi.py       Version 2.2     31-Dec-2016     Marge Marshall, David Johnson, Bill Manaris, Kenneth Hanson
+# midi.py       Version 2.6     19-Oct-2026     Marge Marshall, David Johnson, Bill Manaris, Kenneth Hanson
 
 ###########################################################################
 #
@@ -28,6 +28,20 @@
 #
 # REVISIONS:
 #
+#   2.6     19-Oct-2026 (jt) MidiOut no longer sends MIDI messages that would not change anything - the program, pitch bend,
+#                       volume, and panning last sent to each channel are remembered (see midistate.py), so, e.g., notes
+#                       no longer send the same pitch bend (and panning) again.  Use MidiOut.resync() if the device was
+#                       reset (or changed) behind our back.
+#
+#   2.5     19-Oct-2026 (jt) Faster MidiOut.noteOn() / noteOff() - MIDI pitches (ints) are played directly (no longer converted
+#                       to frequency and back), and overlapping notes are counted in constant time (notesCurrentlyPlaying
+#                       is now an AtomicIntegerArray, indexed by channel * 128 + pitch).
+#
+#   2.4     19-Oct-2026 (jt) MidiOut.play() now caches compiled scores, so playing the same material again starts immediately.
+#
+#   2.3     19-Oct-2026 (jt) MidiOut.play() now compiles scores into flat, time-sorted event arrays (see scorecompiler.py),
+#                       which are played by a single task scheduled for the next event (instead of scheduling every note).
+#
 #   2.2     31-Dec-2016 (bm) Updated MidiOut so that, when JEM's stop button is pressed, to first stop all actives notes
 #						from sounding, and then close down.
 #
@@ -115,11 +129,13 @@ _ActiveMidiOutObjects_ = []   # holds active MidiOut objects
 
 
 # holds notes still on to prevent premature note-off for overlapping notes (only last note-off will be executed)
-# - dictionary key is (note, channel) and value is count of notes currently playing on this channel
-# (only when count is 1 will Play.frequencyOff() send a NOTE-OFF messsage for this channel-note pair)
+# - index channel * 128 + note holds the count of notes currently playing on this channel
+# (only when count is 1 will MidiOut.frequencyOff() send a NOTE-OFF messsage for this channel-note pair)
 #notesCurrentlyPlaying = {}
-# notesCurrentlyPlaying should be a list of tuples to prevent the race condition that happened with the dictionary
-notesCurrentlyPlaying = [] 
+# notesCurrentlyPlaying used to be a list of tuples to prevent the race condition that happened with the dictionary -
+# an AtomicIntegerArray has no race condition either, and updates counts in constant time (as opposed to searching a list)
+from java.util.concurrent.atomic import AtomicIntegerArray
+notesCurrentlyPlaying = AtomicIntegerArray(16 * 128)
 
 
 #################### MidiIn ##############################
@@ -549,6 +565,11 @@ class MidiOut():
       for channel in range(16):   # initialize all to center panning
          self.panning[channel] = 63                
 
+      # remember what was last sent to each channel (program, pitch bend, volume, panning), so that we do not
+      # send messages which would not change anything (e.g., the same pitch bend before every note)
+      from midistate import MidiChannelState
+      self.channelState = MidiChannelState()
+
       # prompt user to select an existing output MIDI device
       self.selectMidiOutput( self.preferredDevice )
 
@@ -577,10 +598,13 @@ class MidiOut():
    def play(self, material):
       """Play jMusic material (Score, Part, Phrase, Note) using the MIDI output device."""
       
-      from music import Note, Phrase, Part, Score, REST
+      from music import Note, Phrase, Part, Score
+      from scorecompiler import scoreCache, ScorePlayer, NOTE_ON_EVENT
       from jm.music.data import Phrase as jPhrase   # since we redefine Phrase
       from jm.music.data import Note as jNote  # needed to wrap more functionality below
 
+      original = material   # remember what we were asked to play (for the compiled score cache)
+
       # do necessary datatype wrapping (MidiSynth() expects a Score)
       if type(material) == Note:
          material = Phrase(material)
@@ -600,86 +624,27 @@ class MidiOut():
 
          score = material   # by now, material is a score, so create an alias (for readability)
 
+         # get score compiled into time-sorted note events (chords are resolved, too) - if we have played
+         # this material before, it is already compiled
+         compiledScore = scoreCache.getCompiledScore(original, score)
 
-         # loop through all parts and phrases to get all notes
-         noteList = []               # holds all notes
-         tempo = score.getTempo()    # get global tempo (can be overidden by part and phrase tempos)
-         for part in score.getPartArray():   # traverse all parts
-            channel = part.getChannel()        # get part channel
-            instrument = self.getInstrument(channel)  # get global instrument for this channel
-            if part.getInstrument() > -1:      # has the part instrument been set?
-               instrument = part.getInstrument()  # yes, so it takes precedence
-            if part.getTempo() > -1:           # has the part tempo been set?
-               tempo = part.getTempo()            # yes, so update tempo
-            for phrase in part.getPhraseArray():   # traverse all phrases in part
-               if phrase.getInstrument() > -1:        # is this phrase's instrument set?
-                  instrument = phrase.getInstrument()    # yes, so it takes precedence
-               if phrase.getTempo() > -1:          # has the phrase tempo been set?
-                  tempo = phrase.getTempo()           # yes, so update tempo
-     
-               # time factor to convert time from jMusic Score units to milliseconds
-               # (this needs to happen here every time, as we may be using the tempo from score, part, or phrase)
-               FACTOR = 1000 * 60.0 / tempo   
-
-               # process notes in this phrase
-               startTime = phrase.getStartTime() * FACTOR   # in milliseconds
-               for note in phrase.getNoteArray():
-                  frequency = note.getFrequency()
-                  panning = note.getPan()
-                  panning = mapValue(panning, 0.0, 1.0, 0, 127)    # map from range 0.0..1.0 (Note panning) to range 0..127 (as expected by Java synthesizer)
-                  start = int(startTime)                           # remember this note's start time (in milliseconds)
-
-                  # NOTE:  Below we use note length as opposed to duration (getLength() vs. getDuration())
-                  # since note length gives us a more natural sounding note (with proper decay), whereas 
-                  # note duration captures the more formal (printed score) duration (which sounds unnatural).
-                  duration = int(note.getLength() * FACTOR)             # get note length (as oppposed to duration!) and convert to milliseconds
-                  startTime = startTime + note.getDuration() * FACTOR   # update start time (in milliseconds)
-                  velocity = note.getDynamic()
-                   
-                  # accumulate non-REST notes
-                  if (frequency != REST):
-                     noteList.append((start, duration, frequency, velocity, channel, instrument, panning))   # put start time first and duration second, so we can sort easily by start time (below),
-                     # and so that notes that are members of a chord as denoted by having a duration of 0 come before the note that gives the specified chord duration
-                   
-         # sort notes by start time
-         noteList.sort()
-
-         # Schedule playing all notes in noteList
-         chordNotes = []      # used to process notes belonging in a chord
-         for start, duration, pitch, velocity, channel, instrument, panning in noteList:
-            # set appropriate instrument for this channel
-            self.setInstrument(instrument, channel)
-
-            # handle chord (if any)
-            # Chords are denoted by a sequence of notes having the same start time and 0 duration (except the last note
-            # of the chord).
-            if duration == 0:   # does this note belong in a chord?
-               chordNotes.append([start, duration, pitch, velocity, channel, panning])  # add it to the list of chord notes
-               
-            elif chordNotes == []:   # is this a regular, solo note (not part of a chord)?
-               
-               # yes, so schedule it to play via a Play.note event
-               self.note(pitch, start, duration, velocity, channel, panning)
-               #print "MidiOut.note(" + str(pitch) + ", " + str(start) + ", " + str(duration) + ", " + str(velocity) + ", " + str(channel) + ", " + str(panning) + ")"
+         # set appropriate instrument for each channel (-1 means no instrument set, so the global instrument stands)
+         for channel, instrument in compiledScore.instruments.items():
+            if instrument > -1:
+               self.setInstrument(instrument, channel)
+
+         # play a note event through the MIDI output device
+         def playEvent(compiledScore, i):
+            if compiledScore.types[i] == NOTE_ON_EVENT:
+               self.noteOn(compiledScore.pitches[i], compiledScore.velocities[i], compiledScore.channels[i], compiledScore.pannings[i])
+            else:
+               self.noteOff(compiledScore.pitches[i], compiledScore.channels[i])
 
-            else:   # note has a normal duration and it is part of a chord
+         # and play the events (only the next event is ever scheduled, no matter how many notes there are)
+         ScorePlayer(compiledScore, playEvent).start()
 
-               # first, add this note together with this other chord notes
-               chordNotes.append([start, duration, pitch, velocity, channel, panning])
-               
-               # now, schedule all notes in the chord list using last note's duration
-               for start, ignoreThisDuration, pitch, velocity, channel, panning in chordNotes:
-                  # schedule this note using chord's duration (provided by the last note in the chord)
-                  self.note(pitch, start, duration, velocity, channel, panning)
-                  #print "Chord: MidiOut.note(" + str(pitch) + ", " + str(start) + ", " + str(duration) + ", " + str(velocity) + ", " + str(channel) + ", " + str(panning) + ")"
-               # now, all chord notes have been scheduled
-
-               # so, clear chord notes to continue handling new notes (if any)
-               chordNotes = []
-   
-         # now, all notes have been scheduled for future playing - scheduled notes can always be stopped using
-         # JEM's stop button - this will stop all running timers (used by Play.note() to schedule playing of notes)
-         #print "Play.note(" + str(pitch) + ", " + str(int(start * FACTOR)) + ", " + str(int(duration * FACTOR)) + ", " + str(velocity) + ", " + str(channel) + ")"
+         # NOTE:  Scheduled notes can always be stopped using JEM's stop button - this will cancel all tasks
+         #        scheduled on Timer2's scheduler (including the one for the next event).
 
       else:   # error check    
          print "Play.midi(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
@@ -702,10 +667,10 @@ class MidiOut():
          use the default (global) panning setting of the selected MIDI device."""
 
       if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
-         # yes, so convert pitch from MIDI number (int) to Hertz (float)
-         pitch = noteToFreq(pitch)       
+         # yes, so start it directly (no need to convert it to Hertz and back, as there is no pitch bend)
+         self.__startNote__(pitch, 0, velocity, channel, panning)
 
-      if type(pitch) == float:        # a pitch in Hertz?
+      elif type(pitch) == float:      # a pitch in Hertz?
          self.frequencyOn(pitch, velocity, channel, panning)  # start it
                   
       else:         
@@ -721,12 +686,7 @@ class MidiOut():
 
          pitch, bend = freqToNote( frequency )                     # convert to MIDI note and pitch bend
 
-         # also, keep track of how many overlapping instances of this pitch are currently sounding on this channel
-         # so that we turn off only the last one - also see frequencyOff()
-         noteID = (pitch, channel)              # create an ID using pitch-channel pair
-         notesCurrentlyPlaying.append(noteID)   # add this note instance to list
-
-         self.noteOnPitchBend(pitch, bend, velocity, channel, panning)      # and start it 
+         self.__startNote__(pitch, bend, velocity, channel, panning)       # and start it
 
       else:         
 
@@ -737,10 +697,10 @@ class MidiOut():
       """Send a NOTE_OFF message for this pitch to the selected output MIDI device."""
 
       if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
-         # yes, so convert pitch from MIDI number (int) to Hertz (float)
-         pitch = noteToFreq(pitch)       
+         # yes, so stop it directly (no need to convert it to Hertz and back)
+         self.__stopNote__(pitch, channel)
 
-      if type(pitch) == float:        # a pitch in Hertz?
+      elif type(pitch) == float:      # a pitch in Hertz?
          self.frequencyOff(pitch, channel)  # stop it
                   
       else:         
@@ -754,16 +714,7 @@ class MidiOut():
 
          pitch, bend = freqToNote( frequency )                     # convert to MIDI note and pitch bend
 
-         # also, keep track of how many overlapping instances of this frequency are currently playing on this channel
-         # so that we turn off only the last one - also see frequencyOn()
-         noteID = (pitch, channel)                   # create an ID using pitch-channel pair
-
-         # next, remove this noteID from the list, so that we may check for remaining instances
-         notesCurrentlyPlaying.remove(noteID)        # remove noteID
-         if noteID not in notesCurrentlyPlaying:     # is this last instance of note?
-
-            # yes, so turn it off!
-            self.sendMidiMessage(128, channel, pitch, 0) 
+         self.__stopNote__(pitch, channel)                         # and stop it
 
       else:     # frequency was outside expected range    
 
@@ -773,6 +724,31 @@ class MidiOut():
       # Play.setPitchBend(0, channel)
 
 
+   def __startNote__(self, pitch, bend, velocity, channel, panning):
+      """Starts this MIDI pitch with this pitch bend, keeping track of how many instances of it are sounding."""
+
+      # keep track of how many overlapping instances of this pitch are currently sounding on this channel
+      # so that we turn off only the last one - also see __stopNote__()
+      notesCurrentlyPlaying.incrementAndGet(channel * 128 + pitch)
+
+      self.noteOnPitchBend(pitch, bend, velocity, channel, panning)      # and start it
+
+   def __stopNote__(self, pitch, channel):
+      """Stops this MIDI pitch, if this is the last instance of it sounding."""
+
+      noteID = channel * 128 + pitch    # where this pitch-channel pair is counted
+
+      # remove this instance of the note (but never go below zero - e.g., if the note was not sounding)
+      count = notesCurrentlyPlaying.get(noteID)
+      while count > 0 and not notesCurrentlyPlaying.compareAndSet(noteID, count, count - 1):
+         count = notesCurrentlyPlaying.get(noteID)    # someone else got here first, so try again
+
+      if count <= 1:   # is this last instance of note?
+
+         # yes, so turn it off!
+         self.sendMidiMessage(128, channel, pitch, 0)
+
+
    def note(self, pitch, start, duration, velocity=100, channel=0, panning = -1):
       """Plays a note with given 'start' time (in milliseconds from now), 'duration' (in milliseconds
          from 'start' time), with given 'velocity' on 'channel'.  Default panning of -1 means to
@@ -844,26 +820,33 @@ class MidiOut():
       # Here we adjust for no pitch bend (center) to be 0, max downward bend to be -8192, and
       # max upward bend to be 8191.  Also, we add the current pitchbend as set previously.
       pitchbend = bend + PITCHBEND_NORMAL + CURRENT_PITCHBEND[channel]   # calculate pitchbend to set
-      if (pitchbend <= PITCHBEND_MAX) and (pitchbend >= PITCHBEND_MIN):  # is pitchbend within appropriate range?
 
-         msb = int(pitchbend) / 128 # find the msb values for the first byte of pitchbend data
-         lsb = int(pitchbend) % 128 # find the lsb values for the finer tuning byte of pitchbend data
+      # hold the channel's lock, so that another note cannot change pitchbend or panning before we start
+      lock = self.channelState.getLock(channel)
+      lock.acquire()
+      try:
+         if (pitchbend <= PITCHBEND_MAX) and (pitchbend >= PITCHBEND_MIN):  # is pitchbend within appropriate range?
+
+            msb = int(pitchbend) / 128 # find the msb values for the first byte of pitchbend data
+            lsb = int(pitchbend) % 128 # find the lsb values for the finer tuning byte of pitchbend data
 
-         # send pitch bend MIDI message
-         # *** see http://computermusicresource.com/MIDI.Commands.html
-         self.sendMidiMessage(224, channel, lsb, msb)
+            # send pitch bend MIDI message (only sent if different from the channel's current pitchbend)
+            # *** see http://computermusicresource.com/MIDI.Commands.html
+            self.sendMidiMessage(224, channel, lsb, msb)
 
-      else:     # frequency was outside expected range    
+         else:     # frequency was outside expected range    
 
-         print "MidiOut.noteOnPitchBend(): Invalid pitchbend " + str(pitchbend - PITCHBEND_NORMAL) + ", expected pitchbend in range -8192 to 8192."
+            print "MidiOut.noteOnPitchBend(): Invalid pitchbend " + str(pitchbend - PITCHBEND_NORMAL) + ", expected pitchbend in range -8192 to 8192."
 
-      # and send the message to start the note on this channel
-      if panning != -1:                              # if we have a specific panning,
+         # and send the message to start the note on this channel
+         if panning != -1:                              # if we have a specific panning,
          
-         self.sendMidiMessage(176, channel, 10, panning)   # then, use it (otherwise let default / global panning stand)
-         # (see controller numbers - http://www.indiana.edu/~emusic/cntrlnumb.html)
+            self.sendMidiMessage(176, channel, 10, panning)   # then, use it (otherwise let default / global panning stand)
+            # (see controller numbers - http://www.indiana.edu/~emusic/cntrlnumb.html)
 
-      self.sendMidiMessage(144, channel, pitch, velocity)  # send the message
+         self.sendMidiMessage(144, channel, pitch, velocity)  # send the message
+      finally:
+         lock.release()
 
 
    def allNotesOff(self):
@@ -880,6 +863,10 @@ class MidiOut():
          self.sendMidiMessage(176, channel, 123, 0)        # send message for "All Notes Off" (123)
          # (see controller numbers - http://www.indiana.edu/~emusic/cntrlnumb.html)
 
+         # no notes are sounding on this channel anymore
+         for pitch in range(128):
+            notesCurrentlyPlaying.set(channel * 128 + pitch, 0)
+
          # also reset pitch bend
          self.setPitchBend(0, channel)      
 
@@ -941,10 +928,33 @@ class MidiOut():
       return self.panning[channel]
 
       
+   def resync(self):
+      """Forgets what was last sent to the output MIDI device, so that the next program, pitch bend, volume,
+         and panning messages are sent again (e.g., if the device was reset, or was sent messages by others)."""
+
+      self.channelState.forget()
+
+      
    ####### function to output MIDI message through selected output MIDI device ########
    
    def sendMidiMessage(self, msgType, msgChannel, msgData1, msgData2):
       #print "Sending Message...", msgType, msgChannel, msgData1, msgData2
+
+      # skip messages which would not change anything (e.g., same program or pitch bend as before)
+      if msgType < 240:   # a channel message?
+         lock = self.channelState.getLock(msgChannel)
+         lock.acquire()
+         try:
+            if self.channelState.changes(msgType, msgChannel, msgData1, msgData2):
+               self.__sendMidiMessage__(msgType, msgChannel, msgData1, msgData2)
+         finally:
+            lock.release()
+
+      else:               # a system message (nothing to remember)
+         self.__sendMidiMessage__(msgType, msgChannel, msgData1, msgData2)
+
+   def __sendMidiMessage__(self, msgType, msgChannel, msgData1, msgData2):
+      """Sends this MIDI message to the selected output MIDI device."""
       try:
          msg = ShortMessage()
          msg.setMessage(msgType, msgChannel, msgData1, msgData2)
@@ -0,0 +1,169 @@
+################################################################################################################
+# midirender.py       Version 1.0     19-Oct-2026     John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# This module renders compiled scores (see scorecompiler.py) to audio files through Gervill, the Java software
+# synthesizer, faster than real time.
+#
+# Play.midi() plays through the Java synthesizer in real time, i.e., a 10-minute score takes 10 minutes to
+# record (and timer jitter ends up in the recording).  Instead, Gervill can be opened as an audio stream
+# (AudioSynthesizer.openStream()), with no audio device at all.  We send it all the note events up front, each
+# timestamped with its exact time in the score, and then read the stream (i.e., the synthesizer renders audio only
+# as fast as it is read) straight into a WAV file.  So, rendering takes as long as the CPU needs, it is
+# the same every time, and works on headless machines, e.g.,
+#
+#   compiledScore = compileScore(score)
+#   seconds = renderScore(compiledScore, "song.wav")
+#
+# Gervill applies timestamped messages at control rate (every 1/147 of a second, by default), so notes start
+# within a few milliseconds of their score time - always the same few milliseconds.
+#
+# REVISIONS:
+#
+#   1.0     19-Oct-2026 (jt) First version - used by Write.audio().
+#
+
+from java.io import File
+from java.util import HashMap
+from javax.sound.midi import MidiSystem, ShortMessage
+from javax.sound.sampled import AudioFormat, AudioInputStream, AudioSystem, AudioFileFormat
+from midistate import MidiChannelState, PROGRAM_CHANGE, PITCH_BEND, CONTROL_CHANGE, PANNING_CONTROLLER
+from scorecompiler import NOTE_ON_EVENT
+
+# rendering defaults
+RENDER_FRAME_RATE = 44100      # frames per second
+RENDER_TAIL       = 2.0        # seconds to keep rendering after the last event (so that notes can decay)
+
+# MIDI commands we send (see also midistate.py)
+NOTE_ON  = 144
+NOTE_OFF = 128
+
+# pitch bend (as in Play - no bend is 8192, and the synthesizer's default bend range is 2 half tones either way)
+PITCHBEND_MIN    = 0
+PITCHBEND_MAX    = 16383
+PITCHBEND_NORMAL = 8192
+
+
+###############################################################################
+# renderScore
+#
+# Renders a CompiledScore (with note-off events) to a 16-bit stereo WAV file, and returns its duration
+# (in seconds).  Parts with no instrument set (-1) use instrument 0, as in a freshly opened synthesizer.
+###############################################################################
+
+def renderScore(compiledScore, filename, tail = RENDER_TAIL, frameRate = RENDER_FRAME_RATE):
+   """Renders 'compiledScore' to WAV file 'filename' through the Java software synthesizer (Gervill),
+      faster than real time, and returns the duration of the audio written (in seconds).  Rendering
+      continues 'tail' seconds past the last event, so that notes can decay."""
+
+   from math import log
+
+   synthesizer = MidiSystem.getSynthesizer()
+   if not hasattr(synthesizer, "openStream"):   # not Gervill (e.g., a hardware synthesizer)?
+      raise RuntimeError("renderScore(): The Java synthesizer (" + str(synthesizer.getDeviceInfo().getName()) + \
+                         ") cannot render offline.")
+
+   # open the synthesizer as an audio stream (no audio device), loading only the programs we need (see below)
+   audioFormat = AudioFormat(frameRate, 16, 2, True, False)   # 16-bit, stereo, signed, little endian
+   info = HashMap()
+   info.put("load default soundbank", False)
+   stream = synthesizer.openStream(audioFormat, info)
+
+   try:
+      receiver = synthesizer.getReceiver()
+      state = MidiChannelState()   # so that we send only pitch bends and pannings that change something
+
+      # last timestamp sent (in microseconds) - every message gets a later one, so that the synthesizer
+      # keeps them in the order sent (e.g., pitch bend before its note), and none are lost
+      lastTimeStamp = [-1]
+
+      def send(command, channel, data1, data2, time):
+         """Sends this MIDI message to the synthesizer, timestamped at 'time' (in milliseconds)."""
+         if state.changes(command, channel, data1, data2):
+            timeStamp = long(time * 1000)
+            if timeStamp <= lastTimeStamp[0]:
+               timeStamp = lastTimeStamp[0] + 1
+            lastTimeStamp[0] = timeStamp
+
+            message = ShortMessage()
+            message.setMessage(command, channel, data1, data2)
+            receiver.send(message, timeStamp)
+
+      # load the default soundbank's instruments for the programs used, and set them (at time 0)
+      programs = {}
+      for channel, instrument in compiledScore.instruments.items():
+         program = max(instrument, 0)      # -1 means no instrument set, so use the default
+         programs[program] = True
+         send(PROGRAM_CHANGE, channel, program, 0, 0)
+
+      soundbank = synthesizer.getDefaultSoundbank()
+      if soundbank is not None:
+         for instrument in soundbank.getInstruments():
+            if instrument.getPatch().getProgram() in programs:
+               synthesizer.loadInstrument( instrument )
+
+      # then, send all note events (as Play.midi() would, but with exact timestamps)
+      times      = compiledScore.times
+      types      = compiledScore.types
+      pitches    = compiledScore.pitches
+      velocities = compiledScore.velocities
+      channels   = compiledScore.channels
+      pannings   = compiledScore.pannings
+
+      sounding = [0] * (16 * 128)   # instances of each note sounding (channel * 128 + pitch), so overlapping notes end together
+      for i in xrange(len(compiledScore)):
+
+         frequency = pitches[i]
+         if not (8.17 <= frequency <= 12600.0):   # outside MIDI pitch range?
+            continue
+
+         # convert to MIDI pitch and pitch bend (see freqToNote())
+         x = log(frequency / 440.0, 2) * 12 + 69
+         pitch = int(round(x))
+         bend = int(round((x - pitch) * 4096)) + PITCHBEND_NORMAL
+         bend = min(max(bend, PITCHBEND_MIN), PITCHBEND_MAX)
+
+         channel = channels[i]
+         noteID = channel * 128 + pitch
+
+         if types[i] == NOTE_ON_EVENT:
+            send(PITCH_BEND, channel, bend % 128, bend / 128, times[i])   # lsb, msb
+            send(CONTROL_CHANGE, channel, PANNING_CONTROLLER, pannings[i], times[i])
+            send(NOTE_ON, channel, pitch, velocities[i], times[i])
+            sounding[noteID] = sounding[noteID] + 1
+
+         else:
+            sounding[noteID] = max(sounding[noteID] - 1, 0)
+            if sounding[noteID] == 0:   # is this the last instance of this note?
+               send(NOTE_OFF, channel, pitch, 0, times[i])
+
+      # finally, read exactly as many frames as the score needs (plus tail) into the file - this is where
+      # the synthesizer does its work
+      frames = long(frameRate * (compiledScore.getEndTime() / 1000.0 + tail))
+      AudioSystem.write(AudioInputStream(stream, audioFormat, frames), AudioFileFormat.Type.WAVE, File(filename))
+
+   finally:
+      synthesizer.close()
+
+   return frames / float(frameRate)
@@ -0,0 +1,129 @@
+################################################################################################################
+# midistate.py       Version 1.0     19-Oct-2026     John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# This module mirrors the state of the 16 channels of a MIDI device (program, pitch bend, volume, and panning),
+# so that messages which would not change anything are not sent again.
+#
+# Playing a score sends a program change per channel, and every note sends a pitch bend (and often a panning)
+# message before its NOTE_ON, even though these rarely change from note to note.  A MidiChannelState remembers
+# the last value sent for each channel, and changes() tells us whether a message is actually needed, e.g.,
+#
+#   state = MidiChannelState()
+#   if state.changes(192, channel, instrument, 0):   # is this a new program for this channel?
+#      ...send the program change...
+#
+# Values start as unknown, so the first message of each kind is always sent.  Since notes are played from
+# several timer threads, check-and-send should happen while holding the channel's lock (see getLock()), so that
+# what we remember is always what the device received last.
+#
+# REVISIONS:
+#
+#   1.0     19-Oct-2026 (jt) First version - used by Play (Java synthesizer) and MidiOut.
+#
+
+from threading import RLock
+
+# MIDI commands (status byte, without channel) and controllers we mirror
+PROGRAM_CHANGE     = 192
+PITCH_BEND         = 224
+CONTROL_CHANGE     = 176
+VOLUME_CONTROLLER  = 7
+PANNING_CONTROLLER = 10
+RESET_CONTROLLERS  = 121    # resets pitch bend and controllers (e.g., volume and panning) to device defaults
+
+
+class MidiChannelState:
+   """Remembers the last program, pitch bend, volume, and panning sent to each channel of a MIDI device."""
+
+   def __init__(self, channels=16):
+
+      self.programs   = [None] * channels    # last program (instrument) sent to each channel (None means unknown)
+      self.pitchBends = [None] * channels    # last pitch bend sent to each channel (0 to 16383)
+      self.volumes    = [None] * channels    # last volume sent to each channel (0 to 127)
+      self.pannings   = [None] * channels    # last panning sent to each channel (0 to 127)
+
+      self.locks = []                        # one lock per channel (to check-and-send atomically)
+      for channel in range(channels):
+         self.locks.append( RLock() )
+
+      self.suppressed = 0                    # how many messages were not needed (for diagnostics)
+
+   def getLock(self, channel):
+      """Returns the lock to hold while checking and sending messages to this channel."""
+
+      return self.locks[channel]
+
+   def changes(self, command, channel, data1, data2):
+      """Returns True if this MIDI message would change the state of this channel (and remembers the new state),
+         or False if it is redundant.  Messages we do not mirror (e.g., NOTE_ON) always return True."""
+
+      if command == PROGRAM_CHANGE:
+         return self.__update__(self.programs, channel, data1)
+
+      elif command == PITCH_BEND:
+         return self.__update__(self.pitchBends, channel, data2 * 128 + data1)   # data1 is lsb, data2 is msb
+
+      elif command == CONTROL_CHANGE:
+
+         if data1 == VOLUME_CONTROLLER:
+            return self.__update__(self.volumes, channel, data2)
+
+         elif data1 == PANNING_CONTROLLER:
+            return self.__update__(self.pannings, channel, data2)
+
+         elif data1 == RESET_CONTROLLERS:
+            self.forget(channel)     # device defaults may differ from what we remember, so start over
+
+      return True
+
+   def forget(self, channel=None):
+      """Forgets what was sent to this channel (or all channels), so the next messages are sent regardless,
+         e.g., after the device has been reset, or was sent messages behind our back."""
+
+      if channel is None:
+         channels = range(len(self.programs))
+      else:
+         channels = [channel]
+
+      for channel in channels:
+         self.programs[channel]   = None
+         self.pitchBends[channel] = None
+         self.volumes[channel]    = None
+         self.pannings[channel]   = None
+
+   def getSuppressed(self):
+      """Returns how many messages were found to be redundant so far."""
+
+      return self.suppressed
+
+   def __update__(self, values, channel, value):
+      """Remembers value for this channel, and returns True if it is different from the previous one."""
+
+      if values[channel] == value:   # nothing new?
+         self.suppressed = self.suppressed + 1
+         return False
+
+      values[channel] = value
+      return True
@@ -1,5 +1,5 @@
 ################################################################################################################
-# osc.py       Version 1.6     07-Mar-2018     David Johnson and Bill Manaris
+# osc.py       Version 1.10    19-Oct-2026     David Johnson, Bill Manaris, and John-Anthony Thevos
 
 ###########################################################################
 #
@@ -28,6 +28,27 @@
 #
 # REVISIONS:
 #
+#   1.10    19-Oct-2026 (jt) OscOut objects are now registered for JEM's Stop button once, when created (before, they were 
+#                       added again on every sendMessage(), so long sessions accumulated millions of references).
+#                       Also, JEM's Stop button now empties the list of OscOut objects, too.
+#
+#   1.9     19-Oct-2026 (jt) Added OscFanOut to mirror the same OSC messages to several destinations (e.g., other
+#                       Accordium instances, a visualizer, and a tablet).  Each message is encoded once, and the same
+#                       bytes are sent to every destination (or to a local multicast group) over a small pool of
+#                       shared sockets.  OscFanOut may be used from several threads at once.  Also added OscOut.close().
+#
+#   1.8     19-Oct-2026 (jt) Added per-address traffic statistics to OscIn (see enableStatistics(), getStatistics(),
+#                       printStatistics(), and showStatistics()).  For every OSC address we keep message count, bytes,
+#                       arrival rate and inter-arrival jitter (exponentially weighted), and total / max callback time.
+#                       When statistics are disabled (the default), the only cost per message is a single check.
+#
+#   1.7     19-Oct-2026 (jt) OscIn may now hand incoming messages to a bounded worker queue (see OscWorkerQueue),
+#                       so that slow callback functions (e.g., GUI updates, printing) no longer hold up javaosc's
+#                       single listener thread (while it is busy, the OS silently drops incoming UDP datagrams).
+#                       Messages with the same OSC address are always handled by the same worker, in arrival order.
+#                       When the queue is full, we drop the oldest message, drop the newest, or block (see
+#                       DROP_OLDEST, DROP_NEWEST, and BLOCK).
+#
 #   1.6     07-Mar-2018 (bm) Now, we allow mutliple callback functions to be associated with the same 
 #                       incoming OSC address.  This is was introduced to be consistent with the MidiIn API.
 #
@@ -59,7 +80,11 @@ from com.illposed.osc import OSCListener, OSCMessage, OSCPacket, OSCPort, OSCPor
 #from com.illposed.osc import *
 #from com.illposed.osc.utility import *
 import socket
-from java.net import InetAddress
+import threading
+from java.net import InetAddress, DatagramPacket, MulticastSocket
+from java.lang import System
+from java.util.concurrent import ArrayBlockingQueue
+from java.util.concurrent.atomic import AtomicLong
 
 # used to keep track which osc objects are active, so we can stop them when
 # JEM's Stop button is pressed
@@ -122,18 +147,59 @@ except:
 #
 # oscIn.onInput("/.*", complete)   # all OSC addresses call this function
 #
+# Worker queue:
+#
+# By default, callback functions are called directly by javaosc's (single) listener thread.  While a callback
+# is running, no more datagrams are read from the socket, and, if the callback is slow (e.g., updating a GUI,
+# or printing), the OS silently drops incoming UDP datagrams.  To avoid this, an OscIn object may hand incoming
+# messages over to a bounded queue, which is drained by one or more worker threads, e.g.,
+#
+# oscIn = OscIn( 57110, workers=2, queueSize=512, overflowPolicy=DROP_OLDEST )
+#
+# Messages with the same OSC address are always handled by the same worker, in the order they arrived.
+# If the queue fills up, the overflowPolicy decides what happens - drop the oldest queued message (good for
+# continuous controllers, e.g., sliders and XY pads), drop the newest message, or block the listener thread
+# until there is room (no messages are lost by us, but the OS may drop datagrams while we wait).
+#
+
+# Statistics:
+#
+# To find out whether a device is flooding us, or a callback function is too slow, an OscIn object may keep
+# per-address traffic statistics, e.g.,
+#
+# oscIn.enableStatistics()        # start collecting statistics
+# oscIn.showStatistics(5000)      # and print a summary every 5 seconds (or call printStatistics() when needed)
+#
+# stats = oscIn.getStatistics("/accordium/1")   # also, statistics may be inspected from code
+# print stats.getRate(), stats.getJitter(), stats.getMaxHandlerTime()
+#
 
 # a useful OSC meessage constant
 ALL_MESSAGES = "/.*"    # matches all possible OSC addresses
 
+# worker queue overflow policies (see OscIn and OscWorkerQueue)
+DROP_OLDEST = "dropOldest"   # discard the oldest queued message to make room for the new one
+DROP_NEWEST = "dropNewest"   # discard the new message (queued messages are kept)
+BLOCK       = "block"        # wait (on the listener thread) until there is room in the queue
+
 class OscIn():
 
-   def __init__(self, port = 57110):
+   def __init__(self, port = 57110, workers = 0, queueSize = 256, overflowPolicy = DROP_OLDEST):
 
       self.port = port                       # holds port to listen to (for incoming events/messages)
       self.oscPortIn = OSCPortIn(self.port)  # create port
       self.oscPortIn.startListening()        # and start it
 
+      # if asked, create worker queue to run callback functions off the listener thread (0 workers means
+      # callbacks are called directly by the listener thread, as before)
+      if workers > 0:
+         self.workerQueue = OscWorkerQueue(workers, queueSize, overflowPolicy)
+      else:
+         self.workerQueue = None
+
+      self.statistics = None         # per-address traffic statistics (None means disabled - see enableStatistics())
+      self.statisticsTimer = None    # prints statistics periodically (see showStatistics())
+
       # also, get our host IP address (to output below, for the user's convenience)
       self.IPaddress = socket.gethostbyname(socket.gethostname())
       print "\nOSC Server started:"    
@@ -172,7 +238,7 @@ class OscIn():
       else:
       
          # no, so add a new handler for this address
-         handler = GenericListener( function )            # create the listener
+         handler = GenericListener( function, self )      # create the listener
          self.oscAddressHandlers[ OSCaddress ] = handler  # remember it
          self.oscPortIn.addListener(OSCaddress, handler)  # and add it to the OscIn object
 
@@ -210,17 +276,408 @@ class OscIn():
       """
       self.showIncomingMessages = False
 
+   def getQueueDepth(self):
+      """
+      Returns the number of incoming OSC messages waiting to be handled by the worker queue
+      (always 0, if this OscIn object has no worker queue).
+      """
+      if self.workerQueue:
+         return self.workerQueue.getQueueDepth()
+      else:
+         return 0
+
+   def getDroppedMessages(self):
+      """
+      Returns how many incoming OSC messages have been dropped by the worker queue, because it was full
+      (always 0, if this OscIn object has no worker queue).
+      """
+      if self.workerQueue:
+         return self.workerQueue.getDroppedMessages()
+      else:
+         return 0
+
+   def enableStatistics(self):
+      """
+      Starts collecting per-address traffic statistics for incoming OSC messages (see getStatistics()).
+      """
+      if not self.statistics:
+         self.statistics = OscStatistics()
+
+   def disableStatistics(self):
+      """
+      Stops collecting traffic statistics (statistics collected so far are discarded).
+      """
+      self.hideStatistics()
+      self.statistics = None
+
+   def getStatistics(self, OSCaddress = None):
+      """
+      Returns the traffic statistics (an OscAddressStatistics object) for 'OSCaddress', or None, if no messages
+      have arrived for this address.  If 'OSCaddress' is omitted, it returns a dictionary of statistics for all
+      addresses seen so far.  Statistics need to be enabled first (see enableStatistics()).
+      """
+      if not self.statistics:
+         raise ValueError("OscIn: statistics are not enabled - use enableStatistics() first.")
+
+      if OSCaddress == None:
+         return self.statistics.getAll()
+      else:
+         return self.statistics.get(OSCaddress)
+
+   def printStatistics(self):
+      """
+      Prints out a summary of the traffic statistics for all addresses seen so far.
+      """
+      if self.statistics:
+         print "OSC In - statistics for port", self.port, "(queue depth " + str(self.getQueueDepth()) + \
+               ", dropped " + str(self.getDroppedMessages()) + "):"
+         self.statistics.printSummary()
+      else:
+         print "OSC In - statistics are not enabled (use enableStatistics() first)."
+
+   def showStatistics(self, interval = 5000):
+      """
+      Prints out a summary of the traffic statistics every 'interval' milliseconds (enabling statistics, if needed).
+      """
+      from timer import Timer2   # (imported here, as OscIn does not need timers otherwise)
+
+      self.enableStatistics()
+      self.hideStatistics()    # (replace earlier timer, if any)
+      self.statisticsTimer = Timer2(interval, self.printStatistics, [], True)
+      self.statisticsTimer.start()
+
+   def hideStatistics(self):
+      """
+      Stops printing out traffic statistics periodically (statistics are still collected).
+      """
+      if self.statisticsTimer:
+         self.statisticsTimer.stop()
+         self.statisticsTimer = None
+
+   def stop(self):
+      """
+      Stops listening for incoming OSC messages, and shuts down the worker queue (if any).
+      """
+      self.oscPortIn.stopListening()
+      self.oscPortIn.close()
+
+      if self.workerQueue:
+         self.workerQueue.stop()
+
+      self.hideStatistics()
+
 
 ############# helper class for OscIn #################
 class GenericListener(OSCListener):
 
-   def __init__(self, function = None):
+   def __init__(self, function = None, oscIn = None):
       self.functions = [function]
+      self.oscIn = oscIn   # the OscIn object we belong to (provides worker queue and statistics, if any)
 
    def acceptMessage(self, time, oscMessage):
       #self.function(time, oscMessage)  # *** for now, hide time, as it is not used
-      for function in self.functions:
-         function(oscMessage)
+      oscIn = self.oscIn
+
+      if oscIn and oscIn.statistics:                      # are we keeping statistics?
+         oscIn.statistics.messageArrived(oscMessage)         # yes, so count this message
+
+      if oscIn and oscIn.workerQueue:                     # do we have a worker queue?
+         oscIn.workerQueue.submit(self, oscMessage)          # yes, so let a worker call the functions
+      else:
+         self.callFunctions(oscMessage)                      # no, so call them now
+
+   def callFunctions(self, oscMessage):
+      """Calls all functions registered for this address with the provided message."""
+
+      statistics = self.oscIn and self.oscIn.statistics
+
+      if statistics:                                      # are we keeping statistics?
+         startTime = System.nanoTime()                       # yes, so also time the functions
+         for function in self.functions:
+            function(oscMessage)
+         statistics.messageHandled(oscMessage, System.nanoTime() - startTime)
+
+      else:
+         for function in self.functions:
+            function(oscMessage)
+
+
+############# helper classes for OscIn statistics #################
+#
+# OscStatistics keeps an OscAddressStatistics object for every OSC address seen.
+#
+# Arrivals are counted on javaosc's listener thread, and callback times on the thread running the callbacks
+# (the listener thread, or a worker thread - see OscWorkerQueue).  Since each address is handled by a single
+# thread of each kind, no locking is needed.
+#
+# NOTE:  javaosc hands the same message to every listener whose address pattern matches it (e.g., the default
+#        ALL_MESSAGES printing listener, and a listener for the specific address).  So that each message is
+#        counted once, we remember the last message seen.
+#
+
+class OscStatistics:
+
+   def __init__(self):
+      self.addresses = {}         # maps OSC address to its OscAddressStatistics
+      self.lastMessage = None     # last message counted (see note above)
+
+   def messageArrived(self, oscMessage):
+      """Updates arrival statistics for this message's address (called on the listener thread)."""
+
+      if oscMessage == self.lastMessage:   # already counted? (for Java objects, == means same object)
+         return
+      self.lastMessage = oscMessage
+
+      address = oscMessage.getAddress()
+      statistics = self.addresses.get(address)
+      if statistics == None:                              # first message for this address?
+         statistics = OscAddressStatistics(address)          # yes, so start keeping track
+         self.addresses[address] = statistics
+
+      statistics.arrived( System.nanoTime(), _estimateMessageSize_(address, oscMessage.getArguments()) )
+
+   def messageHandled(self, oscMessage, elapsedTime):
+      """Updates callback time statistics for this message's address (elapsedTime is in nanoseconds)."""
+
+      statistics = self.addresses.get(oscMessage.getAddress())
+      if statistics:
+         statistics.handled(elapsedTime)
+
+   def get(self, address):
+      """Returns the statistics for this address (or None, if no messages have arrived for it)."""
+      return self.addresses.get(address)
+
+   def getAll(self):
+      """Returns a dictionary of statistics for all addresses seen so far."""
+      return dict(self.addresses)
+
+   def printSummary(self):
+      """Prints out one line of statistics per address (busiest addresses first)."""
+
+      allStatistics = self.addresses.values()
+      allStatistics.sort(lambda a, b: cmp(b.messages, a.messages))
+
+      for statistics in allStatistics:
+         print "  ", statistics
+
+
+class OscAddressStatistics:
+   """Traffic statistics for a single OSC address.  Times are in milliseconds, and rates in messages per second."""
+
+   # how much weight to give to the latest message, when updating the moving averages (as in RFC 3550 jitter)
+   SMOOTHING = 1.0 / 16
+
+   def __init__(self, address):
+      self.address = address
+      self.messages = 0               # number of messages arrived
+      self.bytes = 0                  # number of bytes arrived (OSC encoded size)
+      self.lastArrival = None         # time last message arrived (in nanoseconds)
+      self.meanInterval = 0.0         # moving average of time between messages (in nanoseconds)
+      self.jitter = 0.0               # moving average of deviation from meanInterval (in nanoseconds)
+      self.handlerCalls = 0           # number of times callbacks have been called
+      self.handlerTime = 0            # total time spent in callbacks (in nanoseconds)
+      self.maxHandlerTime = 0         # longest time spent in callbacks for a single message (in nanoseconds)
+
+   def arrived(self, now, size):
+      """Updates statistics for a message of 'size' bytes, arriving at time 'now' (in nanoseconds)."""
+
+      if self.lastArrival != None:
+         interval = now - self.lastArrival
+
+         if self.messages == 1:       # first interval?
+            self.meanInterval = float(interval)   # yes, so start averaging from here
+         else:
+            self.meanInterval = self.meanInterval + (interval - self.meanInterval) * OscAddressStatistics.SMOOTHING
+            self.jitter = self.jitter + (abs(interval - self.meanInterval) - self.jitter) * OscAddressStatistics.SMOOTHING
+
+      self.lastArrival = now
+      self.messages = self.messages + 1
+      self.bytes = self.bytes + size
+
+   def handled(self, elapsedTime):
+      """Updates statistics for callbacks that took 'elapsedTime' nanoseconds."""
+      self.handlerCalls = self.handlerCalls + 1
+      self.handlerTime = self.handlerTime + elapsedTime
+      if elapsedTime > self.maxHandlerTime:
+         self.maxHandlerTime = elapsedTime
+
+   def getMessages(self):
+      """Returns the number of messages arrived."""
+      return self.messages
+
+   def getBytes(self):
+      """Returns the number of bytes arrived."""
+      return self.bytes
+
+   def getRate(self):
+      """Returns the recent arrival rate (in messages per second)."""
+      if self.meanInterval > 0:
+         return 1000000000.0 / self.meanInterval
+      else:
+         return 0.0
+
+   def getJitter(self):
+      """Returns the recent inter-arrival jitter (in milliseconds)."""
+      return self.jitter / 1000000.0
+
+   def getHandlerTime(self):
+      """Returns the total time spent in callback functions (in milliseconds)."""
+      return self.handlerTime / 1000000.0
+
+   def getMeanHandlerTime(self):
+      """Returns the average time spent in callback functions per message (in milliseconds)."""
+      if self.handlerCalls > 0:
+         return self.handlerTime / 1000000.0 / self.handlerCalls
+      else:
+         return 0.0
+
+   def getMaxHandlerTime(self):
+      """Returns the longest time spent in callback functions for a single message (in milliseconds)."""
+      return self.maxHandlerTime / 1000000.0
+
+   def __str__(self):
+      return '"%s": %d msgs, %d bytes, %.1f msgs/sec, jitter %.2f ms, handler mean %.3f ms, max %.3f ms' % \
+             (self.address, self.messages, self.bytes, self.getRate(), self.getJitter(),
+              self.getMeanHandlerTime(), self.getMaxHandlerTime())
+
+   def __repr__(self):
+      return str(self)
+
+
+def _estimateMessageSize_(address, arguments):
+   """Returns the OSC encoded size of a message (in bytes), without actually encoding it."""
+
+   # address and type tags are null-terminated strings, padded to a multiple of 4 bytes
+   size = _paddedSize_(len(address)) + _paddedSize_(len(arguments) + 1)
+
+   for argument in arguments:
+      if isinstance(argument, basestring):     # a string?
+         size = size + _paddedSize_(len(argument))
+      else:                                    # a number (int32 or float32), or anything else (approximate)
+         size = size + 4
+
+   return size
+
+def _paddedSize_(length):
+   """Returns the size of a null-terminated string of 'length' characters, padded to a multiple of 4 bytes."""
+   return (length / 4 + 1) * 4
+
+
+############# helper class for OscIn #################
+#
+# OscWorkerQueue holds incoming OSC messages until one of its worker threads gets to them.
+#
+# Each worker has its own bounded queue.  Messages are assigned to workers by OSC address, so all messages
+# sent to a given address are handled by the same worker, in the order they arrived (i.e., per-address
+# ordering is guaranteed, while different addresses may be handled in parallel).
+#
+# When a worker's queue is full, the overflow policy decides what to do (see DROP_OLDEST, DROP_NEWEST, and BLOCK).
+#
+
+class OscWorkerQueue:
+
+   def __init__(self, workers = 1, queueSize = 256, overflowPolicy = DROP_OLDEST):
+
+      # check arguments
+      if workers < 1:
+         raise ValueError("OscWorkerQueue: number of workers (" + str(workers) + ") should be at least 1.")
+      if queueSize < 1:
+         raise ValueError("OscWorkerQueue: queue size (" + str(queueSize) + ") should be at least 1.")
+      if overflowPolicy not in [DROP_OLDEST, DROP_NEWEST, BLOCK]:
+         raise ValueError("OscWorkerQueue: unknown overflow policy, " + str(overflowPolicy) + \
+                          " - expected DROP_OLDEST, DROP_NEWEST, or BLOCK.")
+
+      self.overflowPolicy = overflowPolicy
+
+      # split capacity among workers (each worker has its own queue, to preserve per-address ordering)
+      workerQueueSize = max(1, queueSize / workers)
+
+      self.queues  = []                  # one bounded queue per worker
+      self.threads = []                  # and its worker thread
+      self.dropped = AtomicLong(0)       # how many messages have been dropped (queue was full)
+      self.handled = AtomicLong(0)       # how many messages have been handled by the workers
+      self.maxDepth = 0                  # high-water mark of queued messages (approximate - updated without locking)
+
+      for i in range(workers):
+         queue = ArrayBlockingQueue(workerQueueSize)
+         thread = threading.Thread(target=self.__work__, args=[queue], name="OscIn worker " + str(i))
+         thread.setDaemon(True)          # do not keep the JVM alive because of us
+
+         self.queues.append(queue)
+         self.threads.append(thread)
+         thread.start()
+
+   def submit(self, listener, oscMessage):
+      """Queues the provided listener and message for a worker to handle (called on the listener thread)."""
+
+      item = (listener, oscMessage)
+
+      # find which worker handles this address (same address, same worker - this preserves ordering)
+      queue = self.queues[ hash(oscMessage.getAddress()) % len(self.queues) ]
+
+      # queue message, according to the overflow policy
+      if self.overflowPolicy == DROP_OLDEST:
+         while not queue.offer(item):      # is the queue full?
+            if queue.poll() is not None:      # yes, so make room by dropping the oldest message
+               self.dropped.incrementAndGet()
+
+      elif self.overflowPolicy == DROP_NEWEST:
+         if not queue.offer(item):         # is the queue full?
+            self.dropped.incrementAndGet()    # yes, so drop this message
+
+      else:   # BLOCK
+         queue.put(item)                   # wait until there is room
+
+      # update high-water mark
+      depth = queue.size()
+      if depth > self.maxDepth:
+         self.maxDepth = depth
+
+   def __work__(self, queue):
+      """Worker thread loop - handles queued messages, one at a time, until stopped."""
+
+      while True:
+         item = queue.take()               # wait for next message
+
+         if item is _STOP_WORKER_:         # are we asked to stop?
+            break                             # yes, so we are done
+
+         listener, oscMessage = item
+         try:
+            listener.callFunctions(oscMessage)
+         except Exception, e:
+            # print error to console (otherwise this worker would die silently, and stop handling messages)
+            print "OscIn worker - error while handling", '"' + str(oscMessage.getAddress()) + '":', repr(e)
+
+         self.handled.incrementAndGet()
+
+   def getQueueDepth(self):
+      """Returns the number of messages currently waiting to be handled."""
+      depth = 0
+      for queue in self.queues:
+         depth = depth + queue.size()
+      return depth
+
+   def getMaxQueueDepth(self):
+      """Returns the largest number of messages ever waiting in a worker's queue."""
+      return self.maxDepth
+
+   def getDroppedMessages(self):
+      """Returns how many messages have been dropped, because a queue was full."""
+      return self.dropped.get()
+
+   def getHandledMessages(self):
+      """Returns how many messages have been handled by the workers."""
+      return self.handled.get()
+
+   def stop(self):
+      """Discards all queued messages and stops the worker threads."""
+      for queue in self.queues:
+         queue.clear()                     # forget pending messages
+         queue.offer(_STOP_WORKER_)        # and tell worker to stop (there is room, since we just cleared it)
+
+# marks the end of a worker's queue (see OscWorkerQueue.stop())
+_STOP_WORKER_ = ("stop", None)
 
 
 #################### OscOut ##############################
@@ -248,25 +705,169 @@ class OscOut():
       self.port = port                                     # and its listening port
       self.portOut = OSCPortOut(self.IPaddress, self.port) # create the connection
 
+      # remember that this OscOut has been created and is active (so that it can be stopped/terminated by JEM, if desired)
+      _ActiveOscOutObjects_.append(self)
+
    def sendMessage(self, oscAddress, *args):
       """
       Sends an OSC message consisting of the 'oscAddress' and corresponding 'args' to the OSC output device.
       """
 
-      # HACK: For some reason, float OSC arguments do not work, unless they are explictly converted to Java Floats.
-      #       The following list comprehension does the trick.
-      from java.lang import Float
-      
-      # for every argument, if it is a float cast it to a Java Float, otherwise leave unchanged
-      args = [Float(x) if isinstance(x, float) else x for x in args]
+      args = _toOscArguments_(args)
       
       #print "sendMessage args = ", args
       oscMessage = OSCMessage( oscAddress, args )          # create OSC message from this OSC address and arguments
       self.portOut.send(oscMessage)                        # and send it to the OSC device that's listening to us
 
-      # remember that this OscIn has been created and is active (so that it can be stopped/terminated by JEM, if desired)
+   def close(self):
+      """
+      Closes the connection to the OSC device.
+      """
+      self.portOut.close()
+
+
+def _toOscArguments_(args):
+   """Returns a list of the provided arguments, ready to be placed in an OSCMessage."""
+
+   # HACK: For some reason, float OSC arguments do not work, unless they are explictly converted to Java Floats.
+   #       The following list comprehension does the trick.
+   from java.lang import Float
+
+   # for every argument, if it is a float cast it to a Java Float, otherwise leave unchanged
+   return [Float(x) if isinstance(x, float) else x for x in args]
+
+
+#################### OscFanOut ##############################
+#
+# OscFanOut is used to send the same messages to several OSC devices (e.g., to mirror our state to other
+# Accordium instances, a visualizer, and a tablet, all at once).
+#
+# Using several OscOut objects for this would encode each message several times (once per OscOut), and
+# would open a socket per OscOut.  Instead, OscFanOut encodes each message once and sends the same bytes
+# to all its destinations, using one of a small pool of sockets shared by all OscFanOut objects.
+#
+# For example:
+#
+# fanOut = OscFanOut( [("localhost", 57110), ("192.168.1.4", 9000)] )   # two destinations
+# fanOut.addDestination("192.168.1.7", 57110)                            # and another one
+#
+# fanOut.sendMessage("/accordium/1", 0.5, 0.25)   # send a message to all destinations
+#
+# If all listeners are on the local network and join a multicast group (e.g., "239.0.0.1"), a single
+# datagram (per message) reaches all of them:
+#
+# fanOut = OscFanOut()
+# fanOut.addDestination("239.0.0.1", 57110)       # multicast destinations are added like any other
+#
+
+OSC_SOCKET_POOL_SIZE = 4     # how many sockets are shared by all OscFanOut objects
+OSC_MULTICAST_TTL    = 1     # multicast datagrams stay on the local network
+
+_OscSocketPool_ = []         # the shared sockets (created as needed - see _getPooledSocket_())
+_OscSocketPoolLock_ = threading.Lock()   # OscFanOut objects may be used from several threads (e.g., timer tasks)
+
+def _getPooledSocket_():
+   """Returns the next socket from the shared pool (creating it, if needed)."""
+
+   _OscSocketPoolLock_.acquire()
+   try:
+      # NOTE: DatagramSocket.send() is thread-safe, so sockets may be shared.  We use a MulticastSocket,
+      #       as it can send to both ordinary and multicast addresses.
+      if len(_OscSocketPool_) < OSC_SOCKET_POOL_SIZE:
+         pooledSocket = MulticastSocket()                    # bind to any available local port
+         pooledSocket.setTimeToLive(OSC_MULTICAST_TTL)       # keep multicast datagrams on the local network
+         _OscSocketPool_.append(pooledSocket)
+      else:
+         # pool is full, so reuse sockets in round-robin fashion
+         pooledSocket = _OscSocketPool_.pop(0)
+         _OscSocketPool_.append(pooledSocket)
+   finally:
+      _OscSocketPoolLock_.release()
+
+   return pooledSocket
+
+def _closePooledSockets_():
+   """Closes all sockets in the shared pool."""
+
+   global _OscSocketPool_
+
+   _OscSocketPoolLock_.acquire()
+   try:
+      for pooledSocket in _OscSocketPool_:
+         pooledSocket.close()
+
+      _OscSocketPool_ = []
+   finally:
+      _OscSocketPoolLock_.release()
+
+
+class OscFanOut():
+
+   def __init__(self, destinations = []):
+      """
+      Creates a sender to the provided 'destinations', a list of (IPaddress, port) pairs (more may be added later).
+      """
+
+      self.destinations = []    # list of (IPaddress, port) pairs, as provided
+      self.addresses = []       # parallel list of (InetAddress, port) pairs (looked up once)
+      self.socket = None        # socket used to send (obtained from the shared pool when first needed)
+
+      for IPaddress, port in destinations:
+         self.addDestination(IPaddress, port)
+
+      # remember that this OscFanOut has been created and is active (so that it can be stopped/terminated by JEM, if desired)
       _ActiveOscOutObjects_.append(self)
-      
+
+   def addDestination(self, IPaddress, port):
+      """
+      Adds the OSC device at 'IPaddress' (or multicast group) and 'port' to the destinations.
+      """
+
+      if (IPaddress, port) not in self.destinations:   # avoid sending the same message twice to the same device
+         address = InetAddress.getByName(IPaddress)
+         self.destinations.append( (IPaddress, port) )
+         self.addresses.append( (address, port) )
+
+   def removeDestination(self, IPaddress, port):
+      """
+      Removes the OSC device at 'IPaddress' and 'port' from the destinations.
+      """
+
+      index = self.destinations.index( (IPaddress, port) )
+      self.destinations.pop(index)
+      self.addresses.pop(index)
+
+   def getDestinations(self):
+      """
+      Returns the list of (IPaddress, port) destinations.
+      """
+      return list(self.destinations)
+
+   def sendMessage(self, oscAddress, *args):
+      """
+      Sends an OSC message consisting of the 'oscAddress' and corresponding 'args' to all destinations.
+      """
+
+      oscMessage = OSCMessage( oscAddress, _toOscArguments_(args) )   # create OSC message
+      byteArray = oscMessage.getByteArray()                           # and encode it (once)
+
+      if self.socket == None:
+         self.socket = _getPooledSocket_()
+
+      # send the same bytes to every destination
+      # NOTE: We create new packets for every message (as opposed to reusing them), since messages may be sent
+      #       from several threads at once (e.g., timer tasks), and a packet holds its data until sent.
+      for address, port in list(self.addresses):
+         self.socket.send( DatagramPacket(byteArray, len(byteArray), address, port) )
+
+   def close(self):
+      """
+      Stops sending (the shared socket stays open for other OscFanOut objects).
+      """
+      self.destinations = []
+      self.addresses = []
+      self.socket = None
+
 
 # TO DO??: Do we need a sendBundle() for time-stamped, bunded OSC messages?
 #          To resolve - what does the timestamp mean?  When to execute?  
@@ -289,14 +890,14 @@ def _stopActiveOscObjects_():
 
    global _ActiveOscInObjects_, _ActiveOscOutObjects_
 
-   # first, stop OscIn objects
+   # first, stop OscIn objects (and their worker queues, if any)
    for oscIn in _ActiveOscInObjects_:
-      oscIn.oscPortIn.stopListening()
-      oscIn.oscPortIn.close()
+      oscIn.stop()
 
-   # now, stop OscOut objects
+   # now, stop OscOut (and OscFanOut) objects, and close the shared sockets
    for oscOut in _ActiveOscOutObjects_:
-      oscOut.portOut.close()
+      oscOut.close()
+   _closePooledSockets_()
 
    # then, delete all of them
    for oscObject in (_ActiveOscInObjects_ + _ActiveOscOutObjects_):
@@ -304,7 +905,7 @@ def _stopActiveOscObjects_():
 
    # also empty list, so things can be garbage collected
    _ActiveOscInObjects_ = []   # remove access to deleted items   
-   _ActiveOscInObjects_ = []   # remove access to deleted items   
+   _ActiveOscOutObjects_ = []  # remove access to deleted items   
 
 # now, register function with JEM (if possible)
 try:
@@ -341,3 +942,31 @@ if __name__ == '__main__':
    # send a couple of messages
    oscOut.sendMessage("/helloWorld")        # message without arguments
    oscOut.sendMessage("/itsFullOfStars", 1, 2.35, "wow!", True)   # message with arguments
+
+
+
+   ###### compare OscFanOut against several OscOut objects ######
+   from java.lang import System
+
+   numDestinations = 4       # how many listeners to mirror to
+   numMessages = 10000       # how many messages to send to each
+   ports = range(57200, 57200 + numDestinations)   # nobody is listening there (we only measure sending)
+
+   oscOuts = [OscOut("localhost", port) for port in ports]
+   fanOut = OscFanOut([("localhost", port) for port in ports])
+
+   startTime = System.nanoTime()
+   for i in range(numMessages):
+      for oscOut in oscOuts:
+         oscOut.sendMessage("/accordium/1", 0.5, 0.25)
+   oscOutTime = (System.nanoTime() - startTime) / 1000000.0
+
+   startTime = System.nanoTime()
+   for i in range(numMessages):
+      fanOut.sendMessage("/accordium/1", 0.5, 0.25)
+   fanOutTime = (System.nanoTime() - startTime) / 1000000.0
+
+   print
+   print "Sending", numMessages, "messages to", numDestinations, "destinations:"
+   print "   %d OscOut objects: %.1f ms (%.1f us per message)" % (numDestinations, oscOutTime, oscOutTime * 1000 / numMessages)
+   print "   OscFanOut:         %.1f ms (%.1f us per message)" % (fanOutTime, fanOutTime * 1000 / numMessages)
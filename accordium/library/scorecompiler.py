@@ -0,0 +1,696 @@
+################################################################################################################
+# scorecompiler.py       Version 1.2     19-Oct-2026     John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# This module compiles jMusic Scores into flat, time-sorted arrays of note events, and plays them back.
+#
+# Playing a Score used to walk Score -> Part -> Phrase -> Note (via Java getters), build a Python tuple per note,
+# sort them, and then create timer objects for every note.  Instead, compileScore() walks the Score once, and
+# stores its note events in parallel arrays (one column per attribute - time, type, pitch, velocity, etc.),
+# i.e., a few bytes per event.  Then, a ScorePlayer walks the events with a cursor, using a single scheduled task
+# at a time (i.e., for the next event), no matter how many notes the Score has.
+#
+# For example:
+#
+#   compiledScore = compileScore(score)
+#   player = ScorePlayer(compiledScore, playEvent)   # playEvent(compiledScore, i) is called for every event i
+#   player.start()
+#
+# Since live sets play the same material many times, compiled scores are also cached (see CompiledScoreCache),
+# so repeated plays start immediately, without re-compilation.
+#
+# Very large (e.g., hour-long) scores can also be streamed, i.e., their events are produced as they are needed,
+# by merging the notes of all phrases by time (see ScoreStream), and played by a StreamingScorePlayer, which only
+# schedules the events within a short lookahead window (e.g., the next 500 ms).  So, memory used (and time to start)
+# no longer depends on the length of the score, e.g.,
+#
+#   player = StreamingScorePlayer(ScoreStream(score), playEvent)   # playEvent(event) is called for every event
+#   player.start()
+#
+# REVISIONS:
+#
+#   1.2     19-Oct-2026 (jt) Added ScoreStream and StreamingScorePlayer, to play very large scores in constant memory.
+#                       (StreamingScorePlayer tags each play with a generation, so stop() and start() never leave
+#                       two scheduling chains running.)
+#
+#   1.1     19-Oct-2026 (jt) Added CompiledScoreCache (and scoreCache), an LRU cache of compiled scores, keyed by
+#                       material identity, and checked against a cheap fingerprint (note count, end time, tempo,
+#                       part instruments and channels, and a checksum of phrases and notes).
+#
+#   1.0     19-Oct-2026 (jt) First version - used by Play.midi(), Play.audio(), Play.sound(), and MidiOut.play().
+#
+
+from array import array
+from heapq import heappush, heappop     # needed to merge the notes of phrases by time (see ScoreStream)
+from collections import deque
+import threading                        # needed to guard the score cache and streaming players
+from java.lang import System
+from jm.JMC import REST
+from timer import Timer2
+
+# compiled score cache limits
+COMPILED_SCORE_CACHE_SIZE   = 64                 # max number of compiled scores to keep
+COMPILED_SCORE_CACHE_MEMORY = 16 * 1024 * 1024   # max memory for compiled scores to keep (in bytes, approximately)
+
+# how far ahead (in milliseconds) a StreamingScorePlayer schedules events
+STREAM_LOOKAHEAD = 500
+
+# event types
+NOTE_OFF_EVENT = 0   # NOTE: note-offs come before note-ons at the same time (so repeated notes are re-articulated)
+NOTE_ON_EVENT  = 1
+
+
+###############################################################################
+# CompiledScore
+#
+# Note events of a Score, sorted by time, and stored in parallel arrays:
+#
+#   times       event time (in milliseconds from the beginning of the score)
+#   types       NOTE_ON_EVENT or NOTE_OFF_EVENT
+#   pitches     frequency (in Hz - as Note.getFrequency(), to allow for microtones)
+#   velocities  0 to 127
+#   channels    0 to 15
+#   pannings    0 to 127
+#   durations   note duration (in milliseconds - for NOTE_ON_EVENTs, 0 for NOTE_OFF_EVENTs)
+#
+# Also, instruments holds the instrument of each channel (as {channel: instrument}), and endTime the
+# time of the last event.
+###############################################################################
+
+class CompiledScore:
+   """Time-sorted note events of a Score, stored in parallel arrays."""
+
+   def __init__(self):
+      self.times      = array('l')
+      self.types      = array('b')
+      self.pitches    = array('d')
+      self.velocities = array('h')
+      self.channels   = array('b')
+      self.pannings   = array('h')
+      self.durations  = array('l')
+      self.instruments = {}     # instrument of each channel
+      self.endTime = 0          # time of last event (in milliseconds)
+
+   def __len__(self):
+      return len(self.times)
+
+   def getEndTime(self):
+      """Returns the time of the last event (in milliseconds)."""
+      return self.endTime
+
+   def getMemorySize(self):
+      """Returns the (approximate) memory used by the events (in bytes)."""
+      size = 0
+      for column in [self.times, self.types, self.pitches, self.velocities, self.channels, self.pannings, self.durations]:
+         size = size + column.itemsize * len(column)
+      return size
+
+
+def compileScore(score, getInstrument = None, noteOffs = True):
+   """Returns a CompiledScore with the note events of 'score'.  Function 'getInstrument(channel)', if provided,
+      gives the instrument for parts with no instrument set (i.e., -1).  If 'noteOffs' is False, only
+      NOTE_ON_EVENTs are compiled (e.g., for audio instruments, which end notes on their own).
+   """
+
+   # loop through all parts and phrases to get all notes (as parallel lists, for now)
+   starts      = []
+   durations   = []
+   pitches     = []
+   velocities  = []
+   channels    = []
+   instruments = []
+   pannings    = []
+
+   tempo = score.getTempo()    # get global tempo (can be overidden by part and phrase tempos)
+   for part in score.getPartArray():   # traverse all parts
+      channel = part.getChannel()        # get part channel
+      instrument = part.getInstrument()  # get part instrument
+      if instrument == -1 and getInstrument is not None:   # has the part instrument not been set?
+         instrument = getInstrument(channel)                  # yes, so use the global instrument for this channel
+      if part.getTempo() > -1:           # has the part tempo been set?
+         tempo = part.getTempo()            # yes, so update tempo
+      for phrase in part.getPhraseArray():   # traverse all phrases in part
+         if phrase.getInstrument() > -1:        # is this phrase's instrument set?
+            instrument = phrase.getInstrument()    # yes, so it takes precedence
+         if phrase.getTempo() > -1:          # has the phrase tempo been set?
+            tempo = phrase.getTempo()           # yes, so update tempo
+
+         # time factor to convert time from jMusic Score units to milliseconds
+         # (this needs to happen here every time, as we may be using the tempo from score, part, or phrase)
+         FACTOR = 1000 * 60.0 / tempo
+
+         # process notes in this phrase
+         startTime = phrase.getStartTime() * FACTOR   # in milliseconds
+         for note in phrase.getNoteArray():
+            frequency = note.getFrequency()
+
+            # accumulate non-REST notes
+            if frequency != REST:
+               starts.append( int(startTime) )
+               # NOTE:  Below we use note length as opposed to duration (getLength() vs. getDuration())
+               # since note length gives us a more natural sounding note (with proper decay), whereas
+               # note duration captures the more formal (printed score) duration (which sounds unnatural).
+               durations.append( int(note.getLength() * FACTOR) )
+               pitches.append( frequency )
+               velocities.append( note.getDynamic() )
+               channels.append( channel )
+               instruments.append( instrument )
+               pannings.append( int(note.getPan() * 127) )   # map from range 0.0..1.0 (Note panning) to range 0..127
+
+            startTime = startTime + note.getDuration() * FACTOR   # update start time (in milliseconds)
+
+   # sort notes by start time (and then by duration, so that notes that are members of a chord, as denoted
+   # by having a duration of 0, come before the note that gives the specified chord duration)
+   order = range(len(starts))
+   order.sort(key = lambda i: (starts[i], durations[i], pitches[i], velocities[i], channels[i], instruments[i], pannings[i]))
+
+   compiledScore = CompiledScore()
+
+   # resolve chords, and collect note events
+   # Chords are denoted by a sequence of notes having the same start time and 0 duration (except the last note
+   # of the chord), so they get the duration of the last note.
+   events = []          # (time, type, note) - sorted below
+   chordNotes = []      # used to process notes belonging in a chord
+   for i in order:
+      compiledScore.instruments[ channels[i] ] = instruments[i]   # last instrument of each channel stands
+
+      if durations[i] == 0:   # does this note belong in a chord?
+         chordNotes.append( i )
+
+      else:
+         chordNotes.append( i )
+         for j in chordNotes:
+            durations[j] = durations[i]   # all chord notes use the chord's duration
+            events.append( (starts[j], NOTE_ON_EVENT, j) )
+            if noteOffs:
+               events.append( (starts[j] + durations[i], NOTE_OFF_EVENT, j) )
+         chordNotes = []
+   events.sort()
+
+   # finally, store events in columns
+   for time, eventType, i in events:
+      compiledScore.times.append( time )
+      compiledScore.types.append( eventType )
+      compiledScore.pitches.append( pitches[i] )
+      compiledScore.velocities.append( velocities[i] )
+      compiledScore.channels.append( channels[i] )
+      compiledScore.pannings.append( pannings[i] )
+      if eventType == NOTE_ON_EVENT:
+         compiledScore.durations.append( durations[i] )
+      else:
+         compiledScore.durations.append( 0 )
+
+   if events:
+      compiledScore.endTime = events[-1][0]
+
+   return compiledScore
+
+
+def fingerprintScore(score):
+   """Returns a cheap fingerprint of 'score', i.e., its note count, end time, tempo(s), each part's instrument
+      and channel, and a checksum of phrase start times and instruments, and note attributes (frequency, dynamic,
+      duration, length, and panning) - i.e., everything compileScore() reads - used to check if a Score has changed.
+   """
+   noteCount = 0
+   tempos = [score.getTempo()]
+   parts = []       # (instrument, channel) of each part
+   checksum = 0     # of phrase start times and instruments, and note attributes
+   for part in score.getPartArray():
+      tempos.append( part.getTempo() )
+      parts.append( (part.getInstrument(), part.getChannel()) )
+      for phrase in part.getPhraseArray():
+         tempos.append( phrase.getTempo() )
+         noteCount = noteCount + phrase.size()
+         checksum = hash( (checksum, phrase.getStartTime(), phrase.getInstrument()) )
+         for note in phrase.getNoteArray():
+            checksum = hash( (checksum, note.getFrequency(), note.getDynamic(), note.getDuration(), note.getLength(),
+                              note.getPan()) )
+   return (noteCount, score.getEndTime(), tuple(tempos), tuple(parts), checksum)
+
+
+###############################################################################
+# CompiledScoreCache
+#
+# An LRU cache of compiled scores.  Scores are cached by the identity of the material played (e.g., the Phrase
+# passed to Play.midi(), since a new Score is wrapped around it every time), and a cached compiled score is only
+# used if the score's fingerprint (see fingerprintScore()) is unchanged - otherwise, the score is compiled again.
+# The fingerprint covers everything compiled (tempos, instruments, channels, phrase start times, and notes), so
+# material edited in place is compiled again.
+#
+# Scores are compiled with no global instruments (i.e., parts with no instrument set have instrument -1), so that
+# cached scores remain valid when the global instruments change - callers resolve instrument -1 when playing.
+#
+# Least recently used scores are evicted when there are more than 'maxSize' scores, or they use more than
+# 'maxMemory' bytes.  (The cache holds on to the material, so ids of cached material are never reused.)
+#
+# The cache may be used from several threads (e.g., timer workers starting plays), so its entries are updated
+# under a lock - a score is compiled outside the lock, though, so a long compile does not hold up other plays.
+#
+# Methods:
+#
+# CompiledScoreCache( maxSize, maxMemory )
+#   Creates a cache for up to 'maxSize' compiled scores, using up to 'maxMemory' bytes.
+#
+# getCompiledScore( material, score, noteOffs )
+#   Returns the compiled 'score' (see compileScore()), where 'material' is what 'score' was created from.
+#
+# clear()
+#   Removes all compiled scores.
+#
+# getHits(), getMisses()
+#   Return how many times a compiled score was found in (or missing from) the cache.
+###############################################################################
+
+class CompiledScoreCache:
+   """An LRU cache of compiled scores."""
+
+   def __init__(self, maxSize = COMPILED_SCORE_CACHE_SIZE, maxMemory = COMPILED_SCORE_CACHE_MEMORY):
+      self.maxSize = maxSize
+      self.maxMemory = maxMemory
+      self.lock = threading.Lock()   # guards entries, order, memory, and counts
+      self.clear()
+
+   def clear(self):
+      """Removes all compiled scores."""
+      self.lock.acquire()
+      try:
+         self.entries = {}        # (id(material), noteOffs) -> [material, fingerprint, compiledScore]
+         self.order = []          # keys, from least to most recently used (few entries, so a list is fine)
+         self.memory = 0          # memory used by compiled scores (in bytes)
+         self.hits = 0
+         self.misses = 0
+      finally:
+         self.lock.release()
+
+   def getCompiledScore(self, material, score, noteOffs = True):
+      """Returns the compiled 'score', where 'material' is what 'score' was created from (e.g., a Phrase)."""
+
+      key = (id(material), noteOffs)
+      fingerprint = fingerprintScore(score)
+
+      self.lock.acquire()
+      try:
+         entry = self.entries.get(key)
+         if entry is not None and entry[0] is material and entry[1] == fingerprint:   # still valid?
+            self.hits = self.hits + 1
+            self.order.remove(key)       # yes, so it is now the most recently used
+            self.order.append(key)
+            return entry[2]
+
+         # not cached (or changed since), so compile it
+         self.misses = self.misses + 1
+         if entry is not None:
+            self.__remove__(key)
+      finally:
+         self.lock.release()
+
+      compiledScore = compileScore(score, None, noteOffs)   # outside the lock (may take a while)
+
+      self.lock.acquire()
+      try:
+         if key in self.entries:      # compiled by another thread meanwhile? (replace it with ours)
+            self.__remove__(key)
+         self.entries[key] = [material, fingerprint, compiledScore]
+         self.order.append(key)
+         self.memory = self.memory + compiledScore.getMemorySize()
+
+         # evict least recently used scores (but always keep the one just compiled)
+         while len(self.order) > 1 and (len(self.order) > self.maxSize or self.memory > self.maxMemory):
+            self.__remove__(self.order[0])
+      finally:
+         self.lock.release()
+
+      return compiledScore
+
+   def getHits(self):
+      """Returns how many times a compiled score was found in the cache."""
+      return self.hits
+
+   def getMisses(self):
+      """Returns how many times a score had to be compiled."""
+      return self.misses
+
+   def __remove__(self, key):
+      """Removes the compiled score with this key (called with the lock held)."""
+      entry = self.entries.pop(key)
+      self.order.remove(key)
+      self.memory = self.memory - entry[2].getMemorySize()
+
+
+# compiled scores played by Play.midi(), Play.audio(), Play.sound(), and MidiOut.play()
+scoreCache = CompiledScoreCache()
+
+
+###############################################################################
+# ScorePlayer
+#
+# Plays a CompiledScore, i.e., calls a function for every event, at the event's time.
+#
+# Only one task is scheduled at a time (on Timer2's scheduler) - the one for the next event(s).
+# When it runs, it calls the function for all events due, and then schedules the next task.
+# Since events are timed from the start of playback, delays do not accumulate.
+#
+# Methods:
+#
+# ScorePlayer( compiledScore, eventFunction )
+#   Creates a player for 'compiledScore', which calls eventFunction(compiledScore, i) for every event i.
+#
+# start( delay )
+#   Starts playing after 'delay' milliseconds (default is 0, i.e., now).
+#
+# stop()
+#   Stops playing (events not played yet are never played).
+#
+# isPlaying()
+#   Returns True if there are more events to play, False otherwise.
+###############################################################################
+
+class ScorePlayer:
+   """Plays a CompiledScore by calling a function for each event, at the event's time."""
+
+   def __init__(self, compiledScore, eventFunction):
+      self.compiledScore = compiledScore
+      self.eventFunction = eventFunction
+      self.cursor = 0          # next event to play
+      self.startTime = 0       # when playback started (in nanoseconds, see System.nanoTime())
+      self.task = None         # task scheduled for the next event(s)
+      self.playing = False
+
+   def start(self, delay = 0):
+      """Starts playing after 'delay' milliseconds."""
+      self.stop()              # in case we are playing already
+      self.cursor = 0
+      self.startTime = System.nanoTime() + long(delay * 1000000)
+      self.playing = True
+      self.__scheduleNextEvent__()
+
+   def stop(self):
+      """Stops playing."""
+      self.playing = False     # (in case events are being played right now)
+      if self.task is not None:
+         self.task.cancel()
+         self.task = None
+
+   def isPlaying(self):
+      """Returns True if there are more events to play, False otherwise."""
+      return self.playing
+
+   def __scheduleNextEvent__(self):
+      """Schedules a task to play the next event(s) (if any)."""
+      if self.playing and self.cursor < len(self.compiledScore):
+         dueTime = self.startTime + self.compiledScore.times[self.cursor] * 1000000
+         self.task = Timer2.scheduler.schedule((dueTime - System.nanoTime()) / 1000000.0, self.__playEvents__, [])
+      else:
+         self.task = None      # we are done
+         self.playing = False
+
+   def __playEvents__(self):
+      """Plays all events due, and schedules the next one."""
+
+      times = self.compiledScore.times
+      elapsedTime = (System.nanoTime() - self.startTime) / 1000000.0   # in milliseconds
+      numEvents = len(times)
+
+      while self.playing and self.cursor < numEvents and times[self.cursor] <= elapsedTime:
+         try:
+            self.eventFunction(self.compiledScore, self.cursor)
+         except Exception, e:
+            # print error to console (and go on with the rest of the score)
+            print repr(e)
+         self.cursor = self.cursor + 1
+
+      self.__scheduleNextEvent__()
+
+
+###############################################################################
+# ScoreStream
+#
+# The note events of a Score (as compileScore() would produce them, except that chords are resolved within their
+# phrase), produced one at a time, in time order.
+#
+# Each phrase yields its notes in start time order, so events are merged from one iterator per phrase, using
+# a heap (which holds the next note of each phrase, and the note-offs of notes sounding).  So, memory used
+# depends on the number of phrases (and notes sounding), not on the number of notes in the score.
+#
+# Events are tuples of (time, type, pitch, velocity, channel, panning, duration), as the columns of
+# a CompiledScore.  Also, instruments holds the instrument of each channel (as {channel: instrument}).
+#
+# Methods:
+#
+# ScoreStream( score, getInstrument, noteOffs )
+#   Creates a stream of the note events of 'score' (see compileScore() for 'getInstrument' and 'noteOffs').
+#
+# iter(stream)
+#   Returns a new iterator of the events (i.e., the score can be streamed more than once).
+###############################################################################
+
+class ScoreStream:
+   """The note events of a Score, produced in time order, as they are needed."""
+
+   def __init__(self, score, getInstrument = None, noteOffs = True):
+      self.noteOffs = noteOffs
+      self.instruments = {}    # instrument of each channel
+      self.phrases = []        # (phrase, channel, FACTOR) of every phrase
+
+      # find tempo and instrument of every phrase (as compileScore() does)
+      tempo = score.getTempo()
+      for part in score.getPartArray():
+         channel = part.getChannel()
+         instrument = part.getInstrument()
+         if instrument == -1 and getInstrument is not None:   # has the part instrument not been set?
+            instrument = getInstrument(channel)                  # yes, so use the global instrument for this channel
+         if part.getTempo() > -1:
+            tempo = part.getTempo()
+         for phrase in part.getPhraseArray():
+            if phrase.getInstrument() > -1:
+               instrument = phrase.getInstrument()
+            if phrase.getTempo() > -1:
+               tempo = phrase.getTempo()
+
+            self.phrases.append( (phrase, channel, 1000 * 60.0 / tempo) )
+            self.instruments[channel] = instrument
+
+   def __iter__(self):
+      """Returns an iterator of the events."""
+      return self.__events__()
+
+   def __events__(self):
+      """Yields all events, in time order (note-offs before note-ons at the same time, as compileScore())."""
+
+      heap = []     # (time, type, order, event, notes) - notes is the iterator of the phrase a note-on comes from
+      order = 0     # keeps events at the same time in the order they were found
+
+      for phrase, channel, factor in self.phrases:
+         notes = self.__phraseNotes__(phrase, channel, factor)
+         for event in notes:             # get the first note of this phrase (if any)
+            heappush(heap, (event[0], NOTE_ON_EVENT, order, event, notes))
+            order = order + 1
+            break
+
+      while heap:
+         time, eventType, ignore, event, notes = heappop(heap)
+         yield event
+
+         if eventType == NOTE_ON_EVENT:
+
+            if self.noteOffs:                # schedule its note-off
+               noteOff = (time + event[6], NOTE_OFF_EVENT, event[2], event[3], event[4], event[5], 0)
+               heappush(heap, (noteOff[0], NOTE_OFF_EVENT, order, noteOff, None))
+               order = order + 1
+
+            for event in notes:              # and get the next note of this phrase (if any)
+               heappush(heap, (event[0], NOTE_ON_EVENT, order, event, notes))
+               order = order + 1
+               break
+
+   def __phraseNotes__(self, phrase, channel, factor):
+      """Yields the note-on events of this phrase, in time order (chord notes get the duration of the chord's last note)."""
+
+      chordNotes = []    # notes of a chord, waiting for the chord's duration (i.e., that of its last note)
+
+      startTime = phrase.getStartTime() * factor   # in milliseconds
+      for i in xrange(phrase.size()):              # (notes are visited one at a time, instead of copied into an array)
+         note = phrase.getNote(i)
+         frequency = note.getFrequency()
+
+         if frequency != REST:
+            # NOTE:  As in compileScore(), we use note length as opposed to duration.
+            start = int(startTime)
+            duration = int(note.getLength() * factor)
+            pitch = frequency
+            velocity = note.getDynamic()
+            panning = int(note.getPan() * 127)
+
+            chordNotes.append( (start, pitch, velocity, panning) )
+            if duration != 0:   # is this a single note, or the last note of a chord?
+               for start, pitch, velocity, panning in chordNotes:
+                  yield (start, NOTE_ON_EVENT, pitch, velocity, channel, panning, duration)
+               chordNotes = []
+
+         startTime = startTime + note.getDuration() * factor
+
+
+###############################################################################
+# StreamingScorePlayer
+#
+# Plays the events of a ScoreStream (or any other iterator of events), i.e., calls a function for every event,
+# at the event's time.
+#
+# Only the events within the next 'lookahead' milliseconds are scheduled (on Timer2's scheduler), by a task which
+# runs every lookahead / 2 milliseconds, and takes more events from the iterator, as needed.  So, memory used
+# does not depend on the length of the score, and stopping cancels only a few tasks.  (Since events are timed
+# from the start of playback, they are as exact as those of a ScorePlayer.)  Every start() and stop() begins a new
+# generation, and tasks check theirs before doing anything, so a task of an earlier play (e.g., one already running
+# when stop() was called) can neither play an event nor keep its scheduling chain going after a restart.
+#
+# Methods:
+#
+# StreamingScorePlayer( events, eventFunction, lookahead )
+#   Creates a player for 'events', which calls eventFunction(event) for every event, scheduling them
+#   'lookahead' milliseconds ahead (default is STREAM_LOOKAHEAD).
+#
+# start( delay )
+#   Starts playing after 'delay' milliseconds (default is 0, i.e., now).
+#
+# stop()
+#   Stops playing (events not played yet are never played).
+#
+# isPlaying()
+#   Returns True if there are more events to play, False otherwise.
+###############################################################################
+
+class StreamingScorePlayer:
+   """Plays an iterator of events by calling a function for each event, at the event's time."""
+
+   def __init__(self, events, eventFunction, lookahead = STREAM_LOOKAHEAD):
+      self.events = events
+      self.eventFunction = eventFunction
+      self.lookahead = lookahead
+      self.iterator = None     # where events come from (while playing)
+      self.nextEvent = None    # next event, when it is past the lookahead window
+      self.scheduled = deque() # (time, task) of events scheduled, but not played yet (at most a window's worth)
+      self.startTime = 0       # when playback started (in nanoseconds, see System.nanoTime())
+      self.task = None         # task scheduled to take more events
+      self.playing = False
+      self.generation = 0      # incremented by every start() and stop(), so tasks of earlier plays do nothing
+      self.lock = threading.RLock()   # guards the above (tasks run on timer workers, while start() and stop() are called)
+
+   def start(self, delay = 0):
+      """Starts playing after 'delay' milliseconds."""
+      self.lock.acquire()
+      try:
+         self.stop()              # in case we are playing already
+         self.iterator = iter(self.events)
+         self.nextEvent = None
+         self.startTime = System.nanoTime() + long(delay * 1000000)
+         self.playing = True
+         self.__scheduleEvents__(self.generation)
+      finally:
+         self.lock.release()
+
+   def stop(self):
+      """Stops playing."""
+      self.lock.acquire()
+      try:
+         self.generation = self.generation + 1   # tasks already running (or about to) are now stale
+         self.playing = False
+         if self.task is not None:
+            self.task.cancel()
+            self.task = None
+         while self.scheduled:
+            time, task = self.scheduled.popleft()
+            task.cancel()
+         self.iterator = None
+      finally:
+         self.lock.release()
+
+   def isPlaying(self):
+      """Returns True if there are more events to play, False otherwise."""
+      self.lock.acquire()
+      try:
+         if self.playing and self.task is None:   # have all events been scheduled?
+            self.__forgetPlayedEvents__()
+            self.playing = len(self.scheduled) > 0   # yes, so we are done when they have been played
+         return self.playing
+      finally:
+         self.lock.release()
+
+   def __scheduleEvents__(self, generation):
+      """Schedules the events within the lookahead window, and a task to schedule more later (if any)."""
+
+      self.lock.acquire()
+      try:
+         if not self.playing or generation != self.generation:   # stopped (or restarted) since we were scheduled?
+            return
+
+         elapsedTime = (System.nanoTime() - self.startTime) / 1000000.0   # in milliseconds
+         windowEnd = elapsedTime + self.lookahead
+
+         done = False
+         while True:
+
+            if self.nextEvent is None:
+               try:
+                  self.nextEvent = self.iterator.next()
+               except StopIteration:
+                  done = True
+                  break
+               except Exception, e:
+                  # print error to console (and stop here, as there may be no more events)
+                  print repr(e)
+                  done = True
+                  break
+
+            time = self.nextEvent[0]
+            if time > windowEnd:        # past the window?
+               break                       # yes, so schedule it later
+
+            task = Timer2.scheduler.schedule(time - elapsedTime, self.__playEvent__, [self.nextEvent, generation])
+            self.scheduled.append( (time, task) )
+            self.nextEvent = None
+
+         self.__forgetPlayedEvents__()
+
+         if not done:
+            self.task = Timer2.scheduler.schedule(self.lookahead / 2.0, self.__scheduleEvents__, [generation])
+         else:
+            self.task = None         # all events are scheduled
+            self.iterator = None
+      finally:
+         self.lock.release()
+
+   def __forgetPlayedEvents__(self):
+      """Forgets the tasks of events already played (so they are not cancelled by stop()) - called with the lock held."""
+      elapsedTime = (System.nanoTime() - self.startTime) / 1000000.0
+      while self.scheduled and self.scheduled[0][0] < elapsedTime:
+         self.scheduled.popleft()
+
+   def __playEvent__(self, event, generation):
+      """Plays this event (unless stopped, or restarted, since it was scheduled)."""
+      if self.playing and generation == self.generation:
+         try:
+            self.eventFunction(event)
+         except Exception, e:
+            # print error to console (and go on with the rest of the score)
+            print repr(e)
@@ -1,5 +1,5 @@
 ###############################################################################
-# timer.py        Version 1.7     12-Aug-2016     Tobias Kohn, Bill Manaris, and Chris Benson
+# timer.py        Version 2.4     19-Oct-2026     Tobias Kohn, Bill Manaris, Chris Benson, and John-Anthony Thevos
 
 ###########################################################################
 #
@@ -27,6 +27,43 @@
 #
 # REVISIONS:
 #
+#   2.4     19-Oct-2026 (jt) Added VirtualScheduler, which schedules tasks (like TimingWheel) on a virtual clock, i.e.,
+#                 a clock that only moves when told to (used to render audio to a file, faster than real time).
+#
+#   2.3     19-Oct-2026 (jt) TimingWheel now runs due tasks on a worker thread, so a slow task no longer holds up
+#                 the dispatch thread.  Tasks run one after the other, in the order they are due (e.g., a note's
+#                 noteOff never runs before its noteOn), unless scheduled as independent (see Timer2(..., 
+#                 independent=True)), in which case they run on a pool of worker threads (see TIMER_WORKERS), in 
+#                 parallel (Jython has no GIL).  Failed tasks are reported (and counted), and queue metrics are 
+#                 available - see TimingWheel.printStatistics().
+#
+#   2.2     19-Oct-2026 (jt) Timer2.setDelay(), setRepeat() and setFunction() now update the running task in place, instead 
+#                 of stopping and restarting it (which messed up timing).  setDelay() preserves the phase, i.e., if 
+#                 the timer was 30% into its interval, it is now 30% into the new interval.
+#
+#   2.1     19-Oct-2026 (jt) Added fixed-rate mode to Timer2, i.e., Timer2(..., fixedRate=True).  Ticks are anchored to
+#                 the time the timer started (using System.nanoTime()), so they do not drift by the time each callback 
+#                 takes (the default, fixed-delay mode waits the full interval after each callback).  Late ticks are
+#                 either run right away (latePolicy=CATCH_UP), or skipped (latePolicy=SKIP).  Also, every Timer2 keeps 
+#                 lateness statistics (mean, 99th percentile, and max) - see getLatenessStatistics().
+#
+#   2.0     19-Oct-2026 (jt) EnvelopeTimer now schedules a call at the exact time of the next envelope point (on Timer2's
+#                 scheduler), instead of polling at the greatest common divisor of all envelope times on Swing's event
+#                 thread (e.g., an envelope with points at 0, 7 and 1000 ms used to wake up every millisecond).  Points are 
+#                 timed from the start of the envelope (so they do not drift), and pause() / resume() preserve the 
+#                 time remaining to the next point.
+#
+#   1.9     19-Oct-2026 (jt) Timers are now registered in __ActiveTimers__ only while running, i.e., they register 
+#                 when started, and unregister when stopped (or, if they do not repeat, when they go off).  Before, every 
+#                 timer ever created stayed in the list, so long sessions accumulated millions of dead timers.
+#                 JEM's Stop button still stops all running timers (even if no longer referenced by the program).
+#
+#   1.8     19-Oct-2026 (jt) Timer2() now uses a TimingWheel (instead of java.util.Timer) to schedule its tasks.
+#                 Pending tasks are kept in a hierarchical timing wheel with millisecond buckets, so scheduling
+#                 and cancelling take constant time, no matter how many notes are pending (java.util.Timer 
+#                 keeps them in a binary heap).  All tasks are run by a single dispatch thread, and an exception 
+#                 in one task no longer kills the thread (and, with it, all future tasks).
+#
 #   1.7     12-Aug-2016 (bm and tk) Timer() is again the original Swing timer.  Timer2() is the new and improved
 #                 based on java.util.Timer.  Timer2() now is more efficient (using only one class-level Timer, 
 #                 and instead instantiating TimerTasks).  Timer() is good for GUI animation.
@@ -67,6 +104,14 @@
 from java.awt.event import *
 from java.util import Timer as JTimer
 from java.util import TimerTask as JTimerTask
+from java.lang import System, Throwable
+from java.util.concurrent.locks import ReentrantLock
+from java.util.concurrent import ThreadPoolExecutor, LinkedBlockingQueue, ThreadFactory, TimeUnit, RejectedExecutionException
+from java.util.concurrent.atomic import AtomicLong
+from java.lang import Runnable
+from java.lang import Thread as JThread
+import threading
+from heapq import heappush, heappop   # for VirtualScheduler
 
 # used to keep track which timers are active, so we can turn them off when
 # JEM's Stop button is pressed - this way everything timed to happen into
@@ -78,7 +123,15 @@ try:
    
 except:
 
-   __ActiveTimers__  = []   # first run - let's define it to hold active objects
+   __ActiveTimers__  = {}   # first run - let's define it to hold active objects (keyed by id, for quick removal)
+
+def _registerActiveTimer_(timer):
+   """Remembers that 'timer' is running (so that it can be stopped by JEM, if desired)."""
+   __ActiveTimers__[id(timer)] = timer
+
+def _unregisterActiveTimer_(timer):
+   """Forgets 'timer', since it is no longer running (so that it can be garbage collected)."""
+   __ActiveTimers__.pop(id(timer), None)
 
 
 ##########
@@ -104,11 +157,16 @@ class TimerListener(ActionListener):
       """
       self.eventFunction = eventFunction
       self.parameters = parameters
+      self.timer = None       # timer this listener belongs to (if any)
 
    def actionPerformed(self, event = None):
       """
       Call the eventFunction.
       """
+      # if the timer goes off only once, it is no longer running
+      if self.timer is not None and not self.timer.isRepeats():
+         _unregisterActiveTimer_(self.timer)
+
       try:  
          # call the function with the specified parameters 
          # (see http://docs.python.org/2/tutorial/controlflow.html#unpacking-argument-lists)
@@ -161,10 +219,18 @@ class Timer(JSwing_Timer):
       
       JSwing_Timer.__init__(self, int(timeInterval), self.timeListener)
       self.setRepeats( repeat )      # should we do this once or forever? 
+      self.timeListener.timer = self
       
-      # remember that this timer has been created and is active (so that it can be stopped/terminated by JEM, if desired)
-      __ActiveTimers__.append(self)
-      
+   def start(self):
+      """Starts the timer."""
+      # remember that this timer is active (so that it can be stopped/terminated by JEM, if desired)
+      _registerActiveTimer_(self)
+      JSwing_Timer.start(self)
+
+   def stop(self):
+      """Stops the timer."""
+      JSwing_Timer.stop(self)
+      _unregisterActiveTimer_(self)
 
    def setFunction(self, eventFunction, parameters=[]):
       """Sets the function to execute.  The optional parameter parameters is a list of parameters to pass to the function (when called)."""
@@ -211,12 +277,713 @@ class TimerTask(JTimerTask):
       #self.timer._actionPerformed()
 
 
+
+###############################################################################
+# TimingWheel
+#
+# Class for scheduling tasks to be executed at given times in the future (used by Timer2).
+#
+# Pending tasks are kept in a hierarchical timing wheel, i.e., a few wheels of buckets.  The first
+# wheel has one bucket per millisecond (256 buckets), and each subsequent wheel has 64 buckets, each
+# spanning a full turn of the previous wheel (i.e., 256 ms, 16.4 secs, and 17.5 mins per bucket).
+# A task is placed in a bucket according to how far into the future it is due.  Every time a wheel
+# completes a turn, the next bucket of the following wheel is emptied into it (and so on).
+#
+# This way, scheduling and cancelling a task take constant time, no matter how many tasks are
+# pending (java.util.Timer keeps them in a binary heap).  A single dispatch thread sleeps until the 
+# next non-empty bucket is due (or until a task is scheduled, if there are none), and hands the tasks
+# due to a (single) serial worker thread, which runs them in the order they are due (and, at the same
+# millisecond, in the order they were scheduled).  Tasks scheduled as independent (i.e., they do not
+# care what runs before or alongside them) go to a pool of worker threads instead, so that they do not
+# delay other tasks (or each other).
+#
+# Methods:
+#
+# TimingWheel( workers )
+#   Creates a new scheduler (and starts its dispatch thread), with a serial worker thread, and 'workers'
+#   worker threads for independent tasks (0 means that the dispatch thread runs all tasks itself).
+#
+# setWorkers( workers )
+#   Changes the number of worker threads for independent tasks.
+#
+# schedule( delay, function, parameters, period, independent )
+#   Calls 'function' with 'parameters' after 'delay' milliseconds (and every 'period' milliseconds
+#   after that, if 'period' is provided).  If 'independent' is True, it may run in parallel with other
+#   tasks (and out of order).  Returns a WheelTask (which may be cancelled).
+#
+# cancelAll()
+#   Cancels all pending tasks.
+#
+# getPendingTasks()
+#   Returns the number of pending tasks.
+#
+# getQueueDepth(), getMaxQueueDepth()
+#   Return the number of batches of due tasks waiting for a (serial or pool) worker thread, now, and at most.
+#
+# getActiveWorkers(), getCompletedTasks(), getFailedTasks()
+#   Return the number of worker threads running tasks, and the number of tasks completed and failed.
+#
+# printStatistics()
+#   Prints the above.
+#####################################################################################
+
+WHEEL_BITS = [8, 6, 6, 6]    # number of buckets (in bits) of each wheel - the first wheel has millisecond buckets
+
+# what to do with late ticks of fixed-rate tasks (e.g., when the computer was busy)
+CATCH_UP = "catchUp"         # run missed ticks right away (so the number of ticks is preserved)
+SKIP     = "skip"            # skip missed ticks (and continue with the next one on schedule)
+
+TIMER_WORKERS = 4            # number of worker threads running independent Timer2 tasks (all others, e.g., Play's
+                             # notes, run in order on a single serial worker thread)
+
+class WheelTask:
+   """Task scheduled on a TimingWheel."""
+
+   def __init__(self, wheel, dueTime, function, parameters, period, fixedRate=False, latePolicy=CATCH_UP, statistics=None,
+                independent=False):
+      self.wheel      = wheel        # wheel this task is scheduled on
+      self.dueTime    = dueTime      # when to run (in nanoseconds, see System.nanoTime())
+      self.deadline   = wheel.__deadline__(dueTime)   # and its bucket (in milliseconds of the wheel's clock)
+      self.function   = function
+      self.parameters = parameters
+      self.period     = period       # how often to repeat (in milliseconds), or None to run only once
+      self.fixedRate  = fixedRate    # True means repeat relative to when the task was due (not when it ran)
+      self.latePolicy = latePolicy   # what to do with late fixed-rate ticks (CATCH_UP or SKIP)
+      self.statistics = statistics   # a LatenessStatistics (or None, to not keep any)
+      self.independent = independent # True means it may run in parallel with other tasks (on the worker pool)
+      self.bucket     = None         # bucket holding this task (None, if it is running)
+      self.scheduled  = True         # True while the task is due to run (again)
+      self.cancelled  = False
+      self.epoch      = wheel.epoch  # tasks scheduled before the last cancelAll() are no longer ours to run
+
+   def cancel(self):
+      """Cancels this task (if it has not run yet, it never will, and if it repeats, it will not run again)."""
+      self.wheel.__cancel__(self)
+
+   def run(self):
+      """Calls the task function."""
+      self.function(*self.parameters)
+
+
+class WorkerThreadFactory(ThreadFactory):
+   """Creates the worker threads of a TimingWheel."""
+
+   def __init__(self, name="TimingWheel worker"):
+      self.name  = name
+      self.count = 0
+
+   def newThread(self, runnable):
+      self.count = self.count + 1
+      thread = JThread(runnable, self.name + " " + str(self.count))
+      thread.setDaemon(True)                     # do not keep the program alive
+      thread.setPriority(JThread.MAX_PRIORITY)    # music is time-critical
+      return thread
+
+
+class TaskBatch(Runnable):
+   """Tasks due (they are run by a worker thread, one after the other)."""
+
+   def __init__(self, wheel, tasks):
+      self.wheel = wheel
+      self.tasks = tasks
+
+   def run(self):
+      for task in self.tasks:
+         self.wheel.__run__(task)
+
+
+class TimingWheel:
+   """Scheduler of tasks to be executed at given times in the future."""
+
+   def __init__(self, workers=0):
+
+      self.wheels = []       # each wheel is a list of buckets (each bucket is a list of tasks)
+      self.shifts = []       # how many bits to shift a deadline by, to find its bucket in each wheel
+      self.masks  = []       # and how many bits to keep
+      self.limits = []       # how far into the future (in milliseconds) each wheel reaches
+
+      shift = 0
+      for bits in WHEEL_BITS:
+         self.wheels.append( [[] for i in range(1 << bits)] )
+         self.shifts.append( shift )
+         self.masks.append( (1 << bits) - 1 )
+         shift = shift + bits
+         self.limits.append( 1 << shift )
+
+      self.origin     = System.nanoTime()   # the wheel's clock starts now
+      self.tick       = 0                   # next millisecond to process
+      self.pending    = 0                   # number of scheduled (not cancelled) tasks
+      self.epoch      = 0                   # number of times cancelAll() has been called (see WheelTask.epoch)
+      self.wakeUpTick = None                # when the dispatch thread will wake up (None, if not sleeping)
+
+      self.lock   = ReentrantLock()
+      self.wakeUp = self.lock.newCondition()   # signalled when a task is due earlier than the dispatch thread expects
+
+      self.serialExecutor = None                # single worker thread running tasks in order (None, if the dispatch thread runs tasks)
+      self.executor       = None                # pool of worker threads running independent tasks (None, likewise)
+      self.maxQueueDepth  = 0                   # most batches of due tasks waiting for a worker thread
+      self.completedTasks = AtomicLong()        # number of tasks completed (including failed ones)
+      self.failedTasks    = AtomicLong()        # number of tasks that raised an exception
+      self.setWorkers(workers)
+
+      self.thread = threading.Thread(target=self.__dispatch__, name="TimingWheel")
+      self.thread.setDaemon(True)          # do not keep the program alive
+      self.thread.start()
+
+   def now(self):
+      """Returns the current time of the wheel's clock (in milliseconds)."""
+      return (System.nanoTime() - self.origin) / 1000000
+
+   def schedule(self, delay, function, parameters=[], period=None, fixedRate=False, latePolicy=CATCH_UP, statistics=None,
+                independent=False):
+      """Calls 'function' with 'parameters' after 'delay' milliseconds (and every 'period' milliseconds
+         after that, if provided).  If 'fixedRate' is True, repetitions are timed from when the task was due
+         (instead of from when it ran), and late ones are handled according to 'latePolicy' (CATCH_UP or SKIP).
+         Lateness is recorded in 'statistics' (a LatenessStatistics), if provided.  If 'independent' is True,
+         the task may run in parallel with other tasks (and out of order).  Returns the scheduled task."""
+
+      dueTime = System.nanoTime() + long(delay * 1000000)
+      task = WheelTask(self, dueTime, function, parameters, period, fixedRate, latePolicy, statistics, independent)
+
+      self.lock.lock()
+      try:
+         task.epoch = self.epoch   # (in case cancelAll() was called since the task was created)
+         if self.pending == 0:
+            # the wheel has been idle (the dispatch thread stopped moving it along), so catch up with the clock now -
+            # buckets may only hold cancelled tasks, so we can skip ahead (instead of the dispatch thread going through
+            # every millisecond it was idle, while holding the lock)
+            self.tick = max(self.tick, self.now())
+         self.pending = self.pending + 1
+         self.__insert__(task)
+      finally:
+         self.lock.unlock()
+
+      return task
+
+   def reschedule(self, task, dueTime):
+      """Moves pending 'task' to run at 'dueTime' (in nanoseconds, see System.nanoTime()), instead."""
+
+      self.lock.lock()
+      try:
+         # is task waiting in a bucket? (otherwise, it has been cancelled, or is running and will be rescheduled
+         # by its period - if any)
+         if task.bucket is not None and not task.cancelled:
+            task.bucket.remove( task )
+            task.dueTime  = dueTime
+            task.deadline = self.__deadline__(dueTime)
+            self.__insert__(task)
+      finally:
+         self.lock.unlock()
+
+   def setWorkers(self, workers):
+      """Sets the number of worker threads running independent tasks (0 means that the dispatch thread runs
+         all tasks itself)."""
+
+      # (holding the lock, so that the dispatch thread never sees one executor without the other - it takes them
+      # under the lock, too, and runs tasks itself, if they have been shut down since)
+      self.lock.lock()
+      try:
+         if workers <= 0:
+            if self.executor is not None:
+               self.executor.shutdown()      # let queued tasks finish, and stop worker threads
+               self.serialExecutor.shutdown()
+               self.executor = None
+               self.serialExecutor = None
+
+         elif self.executor is None:
+            self.serialExecutor = ThreadPoolExecutor(1, 1, 0, TimeUnit.MILLISECONDS,
+                                                     LinkedBlockingQueue(), WorkerThreadFactory("TimingWheel serial worker"))
+            self.executor = ThreadPoolExecutor(workers, workers, 0, TimeUnit.MILLISECONDS, 
+                                               LinkedBlockingQueue(), WorkerThreadFactory())
+
+         elif workers > self.executor.getMaximumPoolSize():   # growing? (update maximum first)
+            self.executor.setMaximumPoolSize(workers)
+            self.executor.setCorePoolSize(workers)
+
+         else:                                                # shrinking (update core size first)
+            self.executor.setCorePoolSize(workers)
+            self.executor.setMaximumPoolSize(workers)
+      finally:
+         self.lock.unlock()
+
+   def getWorkers(self):
+      """Returns the number of worker threads running independent tasks (0 means that the dispatch thread runs
+         all tasks itself)."""
+      executor = self.executor
+      if executor is None:
+         return 0
+      return executor.getCorePoolSize()
+
+   def getQueueDepth(self):
+      """Returns the number of batches of due tasks waiting for a worker thread."""
+      self.lock.lock()
+      try:
+         if self.executor is None:
+            return 0
+         return self.serialExecutor.getQueue().size() + self.executor.getQueue().size()
+      finally:
+         self.lock.unlock()
+
+   def getMaxQueueDepth(self):
+      """Returns the most batches of due tasks that have waited for a worker thread (at the same time)."""
+      return self.maxQueueDepth
+
+   def getActiveWorkers(self):
+      """Returns the number of worker threads (serial and pool) currently running tasks."""
+      self.lock.lock()
+      try:
+         if self.executor is None:
+            return 0
+         return self.serialExecutor.getActiveCount() + self.executor.getActiveCount()
+      finally:
+         self.lock.unlock()
+
+   def getCompletedTasks(self):
+      """Returns the number of tasks completed (including failed ones)."""
+      return self.completedTasks.get()
+
+   def getFailedTasks(self):
+      """Returns the number of tasks that raised an exception."""
+      return self.failedTasks.get()
+
+   def printStatistics(self):
+      """Prints the scheduler's statistics."""
+      print "TimingWheel: %d pending tasks, %d workers (%d active), queue depth %d (max %d), %d tasks completed, %d failed" % \
+            (self.getPendingTasks(), self.getWorkers(), self.getActiveWorkers(), self.getQueueDepth(), 
+             self.getMaxQueueDepth(), self.getCompletedTasks(), self.getFailedTasks())
+
+   def cancelAll(self):
+      """Cancels all pending tasks."""
+
+      self.lock.lock()
+      try:
+         # forget tasks due, but still waiting for a worker thread
+         if self.executor is not None:
+            self.serialExecutor.getQueue().clear()
+            self.executor.getQueue().clear()
+
+         for wheel in self.wheels:
+            for i in range(len(wheel)):
+               for task in wheel[i]:
+                  task.cancelled = True
+                  task.scheduled = False
+                  task.bucket    = None
+               wheel[i] = []
+         self.pending = 0
+
+         # tasks running right now (or handed to a worker thread) are not in any bucket, so they are cancelled
+         # when they next check in with us (see __run__() and __cancel__())
+         self.epoch = self.epoch + 1
+      finally:
+         self.lock.unlock()
+
+   def getPendingTasks(self):
+      """Returns the number of pending tasks."""
+      return self.pending
+
+   def __deadline__(self, dueTime):
+      """Returns the wheel time (in milliseconds) corresponding to 'dueTime' (in nanoseconds, see System.nanoTime())."""
+      # round up to the next millisecond, so tasks never run early
+      return (dueTime - self.origin + 999999) / 1000000
+
+   def __cancel__(self, task):
+      """Cancels 'task' (it stays in its bucket, and is discarded when its bucket comes up)."""
+
+      self.lock.lock()
+      try:
+         if task.scheduled and task.epoch == self.epoch:   # still counted as pending? (see cancelAll())
+            self.pending = self.pending - 1
+         task.cancelled = True
+         task.scheduled = False
+      finally:
+         self.lock.unlock()
+
+   def __insert__(self, task):
+      """Places 'task' in the bucket corresponding to its deadline (lock must be held)."""
+
+      position = max(task.deadline, self.tick)   # overdue tasks go in the next bucket to process
+      ticks = position - self.tick
+
+      level = 0
+      while level < len(self.wheels) - 1 and ticks >= self.limits[level]:
+         level = level + 1
+
+      if ticks >= self.limits[level]:   # too far into the future?
+         position = self.tick + self.limits[level] - 1   # park it in the last bucket (it will be placed again, when emptied)
+
+      task.bucket = self.wheels[level][(position >> self.shifts[level]) & self.masks[level]]
+      task.bucket.append( task )
+
+      # if the dispatch thread is sleeping past this task's deadline, wake it up
+      if self.wakeUpTick is not None and position < self.wakeUpTick:
+         self.wakeUpTick = None
+         self.wakeUp.signal()
+
+   def __cascade__(self, level, index):
+      """Empties a bucket of the given wheel into the wheels below it (lock must be held)."""
+
+      bucket = self.wheels[level][index]
+      self.wheels[level][index] = []
+      for task in bucket:
+         if not task.cancelled:
+            self.__insert__(task)
+
+   def __advance__(self):
+      """Processes the next millisecond, and returns the tasks due (lock must be held)."""
+
+      index = self.tick & self.masks[0]
+
+      # has the first wheel completed a turn?
+      if index == 0:
+         # yes, so refill it from the next wheel (and so on, as long as wheels complete turns)
+         level = 1
+         while level < len(self.wheels):
+            cascadeIndex = (self.tick >> self.shifts[level]) & self.masks[level]
+            self.__cascade__(level, cascadeIndex)
+            if cascadeIndex != 0:
+               break
+            level = level + 1
+
+      bucket = self.wheels[0][index]
+      self.wheels[0][index] = []
+      self.tick = self.tick + 1
+
+      due = []
+      for task in bucket:
+         task.bucket = None
+         if not task.cancelled:
+            if task.period is None:   # runs only once?
+               task.scheduled = False
+               self.pending = self.pending - 1
+            due.append( task )
+      return due
+
+   def __nextWakeUpTick__(self):
+      """Returns the next millisecond with something to do, i.e., a non-empty bucket, or a wheel turn (lock must be held)."""
+
+      mask = self.masks[0]
+      tick = self.tick
+      endOfTurn = (tick | mask) + 1
+      while tick < endOfTurn and not self.wheels[0][tick & mask]:
+         tick = tick + 1
+      return tick
+
+   def __dispatch__(self):
+      """Runs tasks as they become due (this is the dispatch thread)."""
+
+      while True:
+
+         due = []
+         self.lock.lock()
+         try:
+            now = self.now()
+
+            if self.pending == 0:
+               # nothing to do, so sleep until a task is scheduled
+               # (buckets may only hold cancelled tasks, so we can skip ahead)
+               self.tick = now
+               self.wakeUpTick = self.limits[-1] + now   # i.e., any task will wake us up
+               self.wakeUp.await()
+
+            else:
+               # process all milliseconds up to now
+               while self.tick <= now and not due:
+                  due = self.__advance__()
+
+               if not due:
+                  # sleep until next non-empty bucket (or until a task is scheduled earlier than that)
+                  self.wakeUpTick = self.__nextWakeUpTick__()
+                  sleepTime = self.origin + self.wakeUpTick * 1000000 - System.nanoTime()
+                  if sleepTime > 0:
+                     self.wakeUp.awaitNanos(sleepTime)
+
+            self.wakeUpTick = None
+
+            executor       = self.executor         # (taken under the lock, as setWorkers() changes them under it)
+            serialExecutor = self.serialExecutor
+
+         finally:
+            self.lock.unlock()
+
+         # run due tasks (without holding the lock, so tasks may schedule other tasks)
+         if due:
+            if executor is not None:
+               # hand them to the serial worker thread, in order (so that the dispatch thread is not held up),
+               # except independent tasks, which go to the worker pool (so that slow ones do not delay others)
+               ordered = []
+               for task in due:
+                  if task.independent:
+                     self.__execute__(executor, [task])
+                  else:
+                     ordered.append( task )
+               if ordered:
+                  self.__execute__(serialExecutor, ordered)
+
+               queueDepth = serialExecutor.getQueue().size() + executor.getQueue().size()
+               if queueDepth > self.maxQueueDepth:
+                  self.maxQueueDepth = queueDepth
+            else:
+               for task in due:
+                  self.__run__(task)
+
+   def __execute__(self, executor, tasks):
+      """Hands 'tasks' to 'executor' to run, in order - or, if it has been shut down since (see setWorkers()),
+         runs them here, on the dispatch thread (so that the dispatch thread lives on)."""
+
+      try:
+         executor.execute( TaskBatch(self, tasks) )
+      except RejectedExecutionException:
+         for task in tasks:
+            self.__run__(task)
+
+   def __run__(self, task):
+      """Runs 'task', and reschedules it if it repeats."""
+
+      if task.cancelled or task.epoch != self.epoch:   # cancelled since it became due (see cancelAll())?
+         task.cancelled = True
+         task.scheduled = False
+         return
+
+      if task.statistics is not None:   # keeping track of lateness?
+         task.statistics.add( (System.nanoTime() - task.dueTime) / 1000000.0 )
+
+      # run task - if it fails, report it, and go on (other tasks, and later repetitions of this one, are not affected)
+      try:
+         task.run()
+      except Exception, e:
+         # print error to console (since, otherwise, error is hidden, due to this happening inside Java)
+         self.failedTasks.incrementAndGet()
+         print "Timer task " + str(task.function) + " failed: " + repr(e)
+      except Throwable, e:
+         self.failedTasks.incrementAndGet()
+         print "Timer task " + str(task.function) + " failed: " + repr(e)
+      self.completedTasks.incrementAndGet()
+
+      if task.period is not None:
+         self.lock.lock()
+         try:
+            if task.epoch != self.epoch:   # cancelled by cancelAll() while running? (it is no longer counted as pending)
+               task.cancelled = True
+               task.scheduled = False
+
+            elif not task.cancelled:
+               now = System.nanoTime()
+               period = long(task.period * 1000000)   # in nanoseconds
+
+               if task.fixedRate:
+                  # repeat 'period' after this tick was due (so that ticks do not drift)
+                  task.dueTime = task.dueTime + period
+
+                  if task.dueTime < now and task.latePolicy == SKIP:   # late, and should we skip missed ticks?
+                     missedTicks = (now - task.dueTime) / period + 1
+                     task.dueTime = task.dueTime + missedTicks * period
+                     if task.statistics is not None:
+                        task.statistics.addMissedTicks( missedTicks )
+                  # otherwise (i.e., CATCH_UP), a late tick is overdue, so it will run right away
+
+               else:
+                  # repeat 'period' after this tick ran
+                  task.dueTime = now + period
+
+               task.deadline = self.__deadline__(task.dueTime)
+               self.__insert__(task)
+         finally:
+            self.lock.unlock()
+
+
+###############################################################################
+# VirtualScheduler
+#
+# Schedules tasks, like a TimingWheel, but on a virtual clock, i.e., a clock which only moves when
+# told to - e.g., the clock of a JSyn synthesizer rendering audio to a file, as fast as possible
+# (see Play.startRendering()).  Nothing runs on its own; run() goes through the pending tasks in time
+# order, moving the clock to each task's time and calling it (from the calling thread).  This way, tasks
+# run at exactly the same (virtual) times, no matter how busy the computer is.
+#
+# Methods:
+#
+# VirtualScheduler( clock, advance )
+#   Creates a new scheduler.  'clock' is a function returning the current (virtual) time, and 'advance'
+#   a function moving it forward to a given time (both in seconds).
+#
+# schedule( delay, function, parameters )
+#   Calls 'function' with 'parameters', when run() gets 'delay' milliseconds past the current (virtual)
+#   time.  Returns a VirtualTask (which may be cancelled).
+#
+# run( until )
+#   Runs pending tasks (including the ones they schedule) in time order, and moves the clock to
+#   'until' (in seconds).  If 'until' is omitted, runs all pending tasks.
+#
+# cancelAll()
+#   Cancels all pending tasks.
+#
+# getPendingTasks()
+#   Returns the number of pending tasks.
+#####################################################################################
+
+class VirtualTask:
+   """Task scheduled on a VirtualScheduler."""
+
+   def __init__(self, dueTime, function, parameters):
+      self.dueTime    = dueTime      # when to run (in seconds of the virtual clock)
+      self.function   = function
+      self.parameters = parameters
+      self.cancelled  = False
+
+   def cancel(self):
+      """Cancels this task (if it has not run yet, it never will)."""
+      self.cancelled = True
+
+   def run(self):
+      """Calls the task function."""
+      self.function(*self.parameters)
+
+
+class VirtualScheduler:
+   """Scheduler of tasks to be executed at given times on a virtual clock."""
+
+   def __init__(self, clock, advance):
+      self.clock   = clock      # returns the current (virtual) time, in seconds
+      self.advance = advance    # moves the clock forward to a given time (in seconds)
+      self.tasks   = []         # heap of (dueTime, order, task) - tasks due at the same time run in the order scheduled
+      self.order   = 0          # how many tasks have been scheduled so far
+
+   def now(self):
+      """Returns the current time of the virtual clock (in milliseconds)."""
+      return self.clock() * 1000
+
+   def schedule(self, delay, function, parameters=[]):
+      """Calls 'function' with 'parameters' after 'delay' milliseconds (of the virtual clock).  Returns the scheduled task."""
+
+      task = VirtualTask(self.clock() + max(0, delay) / 1000.0, function, parameters)
+      heappush( self.tasks, (task.dueTime, self.order, task) )
+      self.order = self.order + 1
+      return task
+
+   def run(self, until=None):
+      """Runs pending tasks in time order, moving the clock to each task's time, and then to 'until'
+         (in seconds), if provided.  Tasks due after 'until' are left pending."""
+
+      while len(self.tasks) > 0 and (until is None or self.tasks[0][0] <= until):
+
+         dueTime, order, task = heappop( self.tasks )
+
+         if not task.cancelled:
+            if dueTime > self.clock():
+               self.advance( dueTime )   # move the clock (e.g., render audio up to this time)
+
+            try:
+               task.run()
+            except Exception, e:
+               # print error to console (and go on with the rest of the tasks)
+               print repr(e)
+
+      if until is not None and until > self.clock():
+         self.advance( until )
+
+   def cancelAll(self):
+      """Cancels all pending tasks."""
+      for dueTime, order, task in self.tasks:
+         task.cancelled = True
+      self.tasks = []
+
+   def getPendingTasks(self):
+      """Returns the number of pending tasks."""
+      return len(self.tasks)
+
+
+###############################################################################
+# LatenessStatistics
+#
+# Keeps track of how late a timer's ticks run (e.g., because the computer is busy, or other tasks
+# take long to run).  Every Timer2 has one - see Timer2.getLatenessStatistics().
+#
+# Methods:
+#
+# getCount()
+#   Returns the number of ticks measured.
+#
+# getMean(), getPercentile( percent ), getMax()
+#   Return the mean, given percentile (e.g., 99), and maximum lateness (in milliseconds).
+#   Percentiles are calculated from the most recent ticks (see LatenessStatistics.SAMPLES).
+#
+# getMissedTicks()
+#   Returns the number of ticks skipped, because they were late (see SKIP).
+#
+# reset()
+#   Starts over.
+#####################################################################################
+
+class LatenessStatistics:
+   """Lateness statistics for a timer's ticks."""
+
+   SAMPLES = 1024   # how many recent ticks to use when calculating percentiles
+
+   def __init__(self):
+      self.reset()
+
+   def reset(self):
+      """Starts over."""
+      self.count       = 0      # number of ticks measured
+      self.total       = 0.0    # total lateness (in milliseconds)
+      self.max         = 0.0    # maximum lateness (in milliseconds)
+      self.missedTicks = 0      # number of ticks skipped
+      self.samples     = []     # lateness of most recent ticks (a circular buffer)
+      self.index       = 0      # where to store the next sample (once buffer is full)
+
+   def add(self, lateness):
+      """Records the lateness of a tick (in milliseconds)."""
+      self.count = self.count + 1
+      self.total = self.total + lateness
+      if lateness > self.max:
+         self.max = lateness
+
+      if len(self.samples) < LatenessStatistics.SAMPLES:
+         self.samples.append( lateness )
+      else:
+         self.samples[self.index] = lateness
+         self.index = (self.index + 1) % LatenessStatistics.SAMPLES
+
+   def addMissedTicks(self, missedTicks):
+      """Records that 'missedTicks' ticks were skipped."""
+      self.missedTicks = self.missedTicks + missedTicks
+
+   def getCount(self):
+      """Returns the number of ticks measured."""
+      return self.count
+
+   def getMean(self):
+      """Returns the mean lateness (in milliseconds)."""
+      if self.count == 0:
+         return 0.0
+      return self.total / self.count
+
+   def getPercentile(self, percent=99):
+      """Returns the lateness (in milliseconds) which 'percent' percent of recent ticks did not exceed."""
+      samples = sorted(self.samples)
+      if not samples:
+         return 0.0
+      return samples[ int(round((len(samples) - 1) * percent / 100.0)) ]
+
+   def getMax(self):
+      """Returns the maximum lateness (in milliseconds)."""
+      return self.max
+
+   def getMissedTicks(self):
+      """Returns the number of ticks skipped, because they were late."""
+      return self.missedTicks
+
+   def __str__(self):
+      return "%d ticks, lateness mean %.2f ms, p99 %.2f ms, max %.2f ms, %d missed" % \
+             (self.count, self.getMean(), self.getPercentile(99), self.max, self.missedTicks)
+
+
 ###############################################################################
 # Timer2
 #
 # Class for creating a timer (for use to schedule tasks to be executed after 
 # a given time interval, repeatedly or once).
-# Uses java.util.Timer
+# Uses a TimingWheel (see above).
 #
 # Methods:
 #
@@ -225,6 +992,13 @@ class TimerTask(JTimerTask):
 #   is True this will go on indefinitely (default); False means once.  
 #   It uses either Swing's Timer.
 #
+# Timer2( timeInterval, function, parameters, repeat, fixedRate, latePolicy, independent)
+#   As above.  If 'fixedRate' is True, repetitions are timed from when the timer started (so they do not
+#   drift), and late ones are either run right away ('latePolicy' is CATCH_UP, default) or skipped (SKIP).
+#   Otherwise (default), each repetition happens 'timeInterval' after the previous one ran.
+#   If 'independent' is True, the function may run in parallel with other timers' functions (and out of
+#   order with them) - only for functions which share nothing with others (default is False).
+#
 # start()
 #   Starts the timer.
 #
@@ -239,40 +1013,48 @@ class TimerTask(JTimerTask):
 #
 # setRepeats( flag )
 #   Sets the repeat attribute of the timer (True means repeat; False means once).
+#
+# getLatenessStatistics()
+#   Returns the timer's LatenessStatistics (how late its ticks have been running).
 #####################################################################################
 
 class Timer2:
    """Timer used to schedule tasks to be run at fixed time intervals."""
 
-   # we use a single (static) timer to run all task instances (i.e., an instance of Timer class corresponds
-   # to an instance of Java's TimerTask, for efficiency)
-   timer = JTimer()
+   # we use a single (static) scheduler to run all task instances (i.e., an instance of Timer2 class corresponds
+   # to a WheelTask, for efficiency)
+   scheduler = TimingWheel(TIMER_WORKERS)
    
-   def __init__(self, timeInterval, function, parameters=[], repeat=True):
+   def __init__(self, timeInterval, function, parameters=[], repeat=True, fixedRate=False, latePolicy=CATCH_UP,
+                independent=False):
       """Specify time interval (in milliseconds), which function to call when the time interval has passed
-         and the parameters to pass this function, and whether to repeat (True) or do it only once."""
+         and the parameters to pass this function, and whether to repeat (True) or do it only once.
+         If 'fixedRate' is True, repetitions do not drift, and late ones are handled according to 'latePolicy'.
+         If 'independent' is True, the function may run in parallel with (and out of order with) other timers."""
          
       self._timeInterval = timeInterval
       self._function     = function
       self._parameters   = parameters
       self._repeat       = repeat
+      self._fixedRate    = fixedRate
+      self._latePolicy   = latePolicy
+      self._independent  = independent   # True means it may run on the worker pool (see TimingWheel)
+      self._statistics   = LatenessStatistics()   # how late ticks run
       self._running      = False         # True when Timer is running, False otherwise
-      self._timer        = Timer2.timer   # points to single, class-level Timer
+      self._timer        = Timer2.scheduler   # points to single, class-level scheduler
       self._timerTask    = None          # timer task to be executed (created in start() below) 
       
-      # remember that this timer has been created and is active (so that it can be stopped/terminated by JEM, if desired)
-      __ActiveTimers__.append(self)
-      
 
    def setFunction(self, eventFunction, parameters=[]):
       """Sets the function to execute.  The optional parameter parameters is a list of parameters to pass to the function (when called)."""
       self._function   = eventFunction
       self._parameters = parameters 
 
-      if self.isRunning():   # if running
-         self.stop()             # stop timer task, and
-         self.start()            # and re-start it (so that the function will take effect - no other way!)
-                                 # NOTE: This will mess up timing (task execution delay) unfortunately.
+      # if running and repeating, update the task in place (a task that runs once calls __runOnce__(), 
+      # which picks up the new function anyway)
+      if self.isRunning() and self._repeat:
+         self._timerTask.function   = eventFunction
+         self._timerTask.parameters = parameters
 
    def getRepeat(self):
       """Returns True if timer is set to repeat, False otherwise."""
@@ -286,10 +1068,31 @@ class Timer2:
 
       self._repeat = flag    # update repeat flag
 
-      self.stop()            # stop to update repeat flag
-
+      # if running, update the task in place (it keeps its next tick)
       if self.isRunning():
-         self.start()
+         task = self._timerTask
+         scheduler = self._timer
+         scheduler.lock.lock()   # (the task may be due right now)
+         try:
+            if flag:
+               task.function   = self._function
+               task.parameters = self._parameters
+               task.period     = self._timeInterval
+               task.fixedRate  = self._fixedRate
+               task.latePolicy = self._latePolicy
+
+               # if it was a one-time task, and it has already been taken out of the wheel to run (so it is no longer
+               # counted as pending), it will now be put back after it runs - so count it again
+               if not task.scheduled and not task.cancelled and task.epoch == scheduler.epoch:
+                  task.scheduled = True
+                  scheduler.pending = scheduler.pending + 1
+            else:
+               # next tick is the last one - the task keeps its period, so the next tick comes when it would have
+               # (even if we are called from the task itself), and __runOnce__() cancels it then
+               task.function   = self.__runOnce__
+               task.parameters = []
+         finally:
+            scheduler.lock.unlock()
       
    def getDelay(self):
       """Returns the delay time interval (in milliseconds)."""
@@ -302,16 +1105,28 @@ class Timer2:
          pass                      # no need to make changes
       else:                     # we need to update the time interval
 
+         previousInterval = self._timeInterval
          self._timeInterval = timeInterval
 
-         if self.isRunning():   # if running
-            self.stop()             # stop it, and
-            self.start()            # and re-start it (so that the new delay will take effect - no other way!)
-                                    # NOTE: This will mess up timing (task execution delay) unfortunately.      
+         if self.isRunning():   # if running, update the task in place
+            task = self._timerTask
+            if task.period is not None:
+               task.period = timeInterval   # for ticks after the next one
+
+            # preserve the phase, i.e., the next tick comes as far into the new interval, as it would into the old one
+            now = System.nanoTime()
+            remainingTime = task.dueTime - now
+            if remainingTime > 0 and previousInterval > 0:
+               self._timer.reschedule(task, now + long(remainingTime * float(timeInterval) / previousInterval))
+
    def isRunning(self):
       """Returns True if timer is still running, False otherwise."""
       return self._running
 
+   def getLatenessStatistics(self):
+      """Returns the timer's LatenessStatistics (how late its ticks have been running)."""
+      return self._statistics
+
    def start(self):
       """Creates a timer task to perform the desired task as specified (in terms of timeInterval and repeat)."""
 
@@ -321,16 +1136,24 @@ class Timer2:
 
          self._running = True        # we are starting! (do this first)
 
-         # create TimerTask 
-         #self._timer = JTimer()      
-         #self._timerTask = TimerTask(self, self._function, self._parameters)    
-         self._timerTask = TimerTask(self._function, self._parameters)    
+         # remember that this timer is active (so that it can be stopped/terminated by JEM, if desired)
+         _registerActiveTimer_(self)
 
-         # and schedule it!
+         # create and schedule task
          if self._repeat:
-            self._timer.schedule(self._timerTask, 0, self._timeInterval)
+            self._timerTask = self._timer.schedule(0, self._function, self._parameters, self._timeInterval,
+                                                   self._fixedRate, self._latePolicy, self._statistics,
+                                                   self._independent)
          else:
-            self._timer.schedule(self._timerTask, self._timeInterval)
+            self._timerTask = self._timer.schedule(self._timeInterval, self.__runOnce__, [], 
+                                                   statistics=self._statistics, independent=self._independent)
+
+   def __runOnce__(self):
+      """Calls the function of a timer that does not repeat (it is no longer running after this)."""
+      self._timerTask.cancel()   # (in case it was repeating - see setRepeat())
+      self._running = False
+      _unregisterActiveTimer_(self)
+      self._function(*self._parameters)
 
    def stop(self):
       """Stops scheduled task from executing."""
@@ -344,6 +1167,7 @@ class Timer2:
       #if self._timerTask:    # has a timer task been created already?
          self._timerTask.cancel()
 
+         _unregisterActiveTimer_(self)
          self._running = False        # we are done running! (do this last)
 
 
@@ -400,91 +1224,119 @@ class EnvelopeTimer:
             raise ValueError("The envelope needs increasing times -- sublist " + str(self.envelopeTimes) \
                              + " should consist of increasing absolute times (in milliseconds).")
 
-      # find the minimum tick needed (how often to check elapsed time) - for efficiency
-      self.tick = reduce(self.__gcd__, self.envelopeTimes)     # how often to check elapsed time
+      # when repeating, the envelope starts over one tick after its last point (tick is the greatest common 
+      # divisor of all envelope times - this is how often the original, polling version checked elapsed time)
+      self.tick = reduce(self.__gcd__, self.envelopeTimes)
 
-      self.elapsedTime = 0         # accumulates total elapsed time
+      self.elapsedTime = 0         # time elapsed in the current cycle of the envelope (updated when paused)
       self.envelopeIndex = 0       # remembers which envelope entry comes next
+      self.cycleStartTime = 0      # when the current cycle of the envelope started (in milliseconds, see __now__())
       
       # check how to pass arguments to function
       self.envelopeValuesAreTuples = type(self.envelopeValues[0]) == type([]) or type(self.envelopeValues[0]) == type(())  # list or tuple?
       
-      # remember if we are paused
+      # remember if we are running or paused
+      self.running = False
       self.hasPaused = False
        
-      # define timer
-      self.timer = Timer(self.tick, self.__advance__, [], True)    # keep repeating (remember, __advance()__ handles envelope repeat)
-
-      # remember that this timer has been created and is active (so that it can be stopped/terminated by JEM, if desired)
-      __ActiveTimers__.append(self)
+      # the next envelope point is scheduled on Timer2's scheduler (one task per envelope point)
+      self.task = None
       
-         
-   def __advance__(self):
-      """It calls the callback function with the current envelope value, if enough time has elapsed."""
-      
-      self.elapsedTime += self.tick
+   def __now__(self):
+      """Returns the current time (in milliseconds, from an arbitrary origin)."""
+      return System.nanoTime() / 1000000.0
+
+   def __scheduleNextPoint__(self):
+      """Schedules a call to __advance__() at the time of the next envelope point (if any)."""
 
       # do we have more envelope points?
-      if self.envelopeIndex < self.numEnvelopePoints:
+      if self.envelopeIndex >= self.numEnvelopePoints:
 
-         # is it time to call function?
-         if self.elapsedTime >= self.envelopeTimes[ self.envelopeIndex ]:
-      
-            # yes, so check how many arguments to pass
-            if self.envelopeValuesAreTuples:                 
-               # envelope values are typles (or lists), unpack them when calling function
-               self.function( *self.envelopeValues[ self.envelopeIndex ] )            
-            else:
-               # envelope values are atomic, so call function with a single argument
-               self.function( self.envelopeValues[ self.envelopeIndex ] )            
-         
-            # we have served this envelope point, so let's go to next one (if any)
-            self.envelopeIndex += 1
-         
-      elif self.repeat:   # we have finished all envelope points, so check if to repeat
-      
-         # yes, so reset
-         self.elapsedTime = 0
-         self.envelopeIndex = 0
+         if self.repeat:   # we have finished all envelope points, so check if to repeat
+
+            # yes, so start over (one tick after the last point)
+            self.cycleStartTime = self.cycleStartTime + self.envelopeTimes[-1] + self.tick
+            self.envelopeIndex = 0
+
+         else:   # we have finished all envelope points, and not repeat is needed
+
+            # shut down
+            self.stop()
+            return
+
+      # schedule next point relative to the start of the cycle (so that callback delays do not accumulate)
+      dueTime = self.cycleStartTime + self.envelopeTimes[ self.envelopeIndex ]
+      self.task = Timer2.scheduler.schedule(dueTime - self.__now__(), self.__advance__, [])
          
-      else:   # we have finished all envelope points, and not repeat is needed
-      
-         # shut down
-         self.stop()
+   def __advance__(self):
+      """It calls the callback function with the current envelope value (it is now time to do so)."""
+
+      value = self.envelopeValues[ self.envelopeIndex ]
 
+      # we have served this envelope point, so let's schedule the next one (if any) - first, in case function fails
+      self.envelopeIndex += 1
+      self.__scheduleNextPoint__()
+
+      # check how many arguments to pass
+      if self.envelopeValuesAreTuples:                 
+         # envelope values are typles (or lists), unpack them when calling function
+         self.function( *value )            
+      else:
+         # envelope values are atomic, so call function with a single argument
+         self.function( value )            
 
    def start(self):
       """(Re)start EnvelopeTimer to begin calling function."""
+      if self.task is not None:   # already scheduled?
+         self.task.cancel()           # start over
+
       self.elapsedTime = 0     # reset
       self.envelopeIndex = 0
-      self.timer.start()
+      self.cycleStartTime = self.__now__()
+      self.running = True
+      self.hasPaused = False
+      self.__scheduleNextPoint__()
+
+      # remember that this timer is active (so that it can be stopped/terminated by JEM, if desired)
+      _registerActiveTimer_(self)
    
    def stop(self):
       """Stop envelopeTimer."""
+      if self.task is not None:
+         self.task.cancel()
+         self.task = None
+
       self.elapsedTime = 0     # reset
       self.envelopeIndex = 0
-      self.timer.stop()
+      self.running = False
+      self.hasPaused = False
+      _unregisterActiveTimer_(self)
    
    def pause(self):
       """Pause EnvelopeTimer, so it may be resume (if desired)."""
-      self.hasPaused = True
-      self.timer.stop()
+      if self.running and not self.hasPaused:
+         self.task.cancel()
+         self.task = None
+         self.elapsedTime = self.__now__() - self.cycleStartTime   # remember where we are in the cycle
+         self.hasPaused = True
    
    def resume(self):
       """Resume envelopeTimer from where it was paused."""
-      self.timer.start()
-      self.hasPaused = False
+      if self.hasPaused:
+         self.cycleStartTime = self.__now__() - self.elapsedTime   # shift cycle, so the remaining time is preserved
+         self.hasPaused = False
+         self.__scheduleNextPoint__()
       
    def isRunning(self):
       """Returns True if timer is running (has been started), False otherwise."""
-      return self.timer.isRunning()
+      return self.running and not self.hasPaused
 
    def isPaused(self):
       """Returns True if timer is paused, False otherwise."""
       return self.hasPaused
    
    # Helper function - calculates the greatest common divisor between two numbers
-   # (used to find the maximum time tick to advance, given all specified envelope times - for efficiency)
+   # (used to find the time tick between repetitions, given all specified envelope times)
    def __gcd__(self, a, b):
       while b != 0:
          (a, b) = (b, a%b)
@@ -523,9 +1375,6 @@ class OscillatorTimer:
          
       # define timer
       self.timer = Timer(delay, self.__oscillate__, [], True)
-         
-      # remember that this timer has been created and is active (so that it can be stopped/terminated by JEM, if desired)
-      __ActiveTimers__.append(self)
       
 
    def __oscillate__(self):
@@ -545,10 +1394,14 @@ class OscillatorTimer:
    def start(self):
       """Start oscillator and begin calling function."""
       self.timer.start()
+
+      # remember that this timer is active (so that it can be stopped/terminated by JEM, if desired)
+      _registerActiveTimer_(self)
    
    def stop(self):
       """Stop oscillator."""
       self.timer.stop()
+      _unregisterActiveTimer_(self)
    
    def setDelay(self, delay):
       """Set time interval to wait before advancing oscillating value."""
@@ -569,16 +1422,15 @@ def __stopActiveTimers__():
 
    global __ActiveTimers__
 
-   # first, stop them
-   for timer in __ActiveTimers__:
+   # first, stop them (stopping a timer removes it from __ActiveTimers__, so iterate over a copy)
+   for timer in __ActiveTimers__.values():
       timer.stop()
 
-   # then, delete them
-   for timer in __ActiveTimers__:
-      del timer
+   # also cancel tasks scheduled directly (e.g., by Play.note())
+   Timer2.scheduler.cancelAll()
 
    # also empty list, so things can be garbage collected
-   __ActiveTimers__ = []   # remove access to deleted items   
+   __ActiveTimers__ = {}   # remove access to deleted items   
 
 # now, register function with JEM (if possible)
 try:
@@ -596,6 +1448,119 @@ except:  # otherwise (if we get an error), we are NOT inside JEM
 
 if __name__ == '__main__':
 
+   ###### compare TimingWheel against java.util.Timer ######
+   from random import randint
+   from time import sleep
+
+   def benchmarkScheduler(name, scheduleFunction, numEvents, timeSpan = 5000):
+      """Schedules 'numEvents' tasks within 'timeSpan' milliseconds, and reports schedule cost and firing lateness."""
+
+      lateness = []       # how late each task fired (in microseconds)
+
+      def fired(expectedTime):
+         lateness.append( (System.nanoTime() - expectedTime) / 1000.0 )
+
+      delays = [randint(1, timeSpan) for i in range(numEvents)]
+
+      startTime = System.nanoTime()
+      for delay in delays:
+         scheduleFunction(delay, fired, [startTime + delay * 1000000])
+      scheduleTime = (System.nanoTime() - startTime) / 1000.0   # in microseconds
+
+      # wait for all tasks to fire
+      while len(lateness) < numEvents:
+         sleep(0.1)
+
+      lateness.sort()
+      print "%s, %d events: schedule %.2f us/event, lateness mean %.0f us, p99 %.0f us, max %.0f us" % \
+            (name, numEvents, scheduleTime / numEvents, sum(lateness) / numEvents,
+             lateness[int(numEvents * 0.99)], lateness[-1])
+
+   javaTimer = JTimer()
+   def javaTimerSchedule(delay, function, parameters):
+      javaTimer.schedule(TimerTask(function, parameters), delay)
+
+   for numEvents in [10000, 100000]:
+      benchmarkScheduler("TimingWheel    ", Timer2.scheduler.schedule, numEvents)
+      benchmarkScheduler("java.util.Timer", javaTimerSchedule, numEvents)
+   javaTimer.cancel()
+
+
+   ###### after a long idle time, the first task should still be on time ######
+   def idleTest(idleMinutes = 10):
+      """Lets a wheel sit idle for 'idleMinutes' (by moving its clock forward), then checks that a task scheduled
+         afterwards is not late (i.e., the wheel does not go through every millisecond it was idle)."""
+
+      wheel = TimingWheel()
+      sleep(0.1)    # let the dispatch thread go to sleep (nothing to do)
+
+      wheel.lock.lock()
+      try:
+         wheel.origin = wheel.origin - idleMinutes * 60 * 1000 * 1000000L   # as if idle minutes went by
+      finally:
+         wheel.lock.unlock()
+
+      lateness = []
+      dueTime = System.nanoTime() + 10 * 1000000
+      wheel.schedule(10, lambda: lateness.append( (System.nanoTime() - dueTime) / 1000000.0 ))
+      sleep(0.5)
+
+      assert len(lateness) == 1, "task did not run after the wheel was idle"
+      assert lateness[0] < 20, "task ran %.1f ms late after the wheel was idle" % lateness[0]
+      print "idle test passed (%.1f ms late after %d idle minutes)." % (lateness[0], idleMinutes)
+
+   idleTest()
+
+
+   ###### soak test - registries and memory should stay flat while playing for a long time ######
+   from java.lang import Runtime
+
+   def usedMemory():
+      """Returns the heap memory in use (in bytes), after garbage collection."""
+      runtime = Runtime.getRuntime()
+      for i in range(3):
+         System.gc()
+         sleep(0.2)
+      return runtime.totalMemory() - runtime.freeMemory()
+
+   def soakTest(hours = 1.0, notesPerSecond = 20, speedUp = 60):
+      """Simulates 'hours' of playing 'notesPerSecond' notes (each using two Timer2 objects, as Play.note() used to),
+         'speedUp' times faster than real time, and checks that timers are cleaned up and heap usage stays flat."""
+
+      notesPerRealSecond = notesPerSecond * speedUp
+      realSeconds = int(hours * 3600 / speedUp)
+
+      def noteOn():
+         pass
+
+      def noteOff():
+         pass
+
+      heapUsage = []
+      for second in range(realSeconds):
+
+         # play a second's worth of notes
+         for i in range(notesPerRealSecond):
+            start = i * 1000.0 / notesPerRealSecond
+            Timer2(start, noteOn, [], False).start()
+            Timer2(start + 50, noteOff, [], False).start()
+         sleep(1.0)
+
+         if second % 10 == 9:   # every 10 seconds, check heap usage
+            heapUsage.append( usedMemory() )
+            print "soak test: %d sec, %d active timers, %d pending tasks, %.1f MB heap" % \
+                  (second + 1, len(__ActiveTimers__), Timer2.scheduler.getPendingTasks(), heapUsage[-1] / 1048576.0)
+
+      sleep(1.0)   # let last notes end
+
+      assert len(__ActiveTimers__) == 0, "timers are still registered after they went off"
+      assert Timer2.scheduler.getPendingTasks() == 0, "tasks are still pending after they went off"
+      assert usedMemory() < heapUsage[0] * 1.1 + 1048576, "heap usage grew from %d to %d bytes" % (heapUsage[0], usedMemory())
+      print "soak test passed."
+
+   soakTest()
+
+
    ###### create an timer object ######
    seconds = 0    # hold seconds passed
    def echoTime():
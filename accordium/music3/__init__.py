@@ -0,0 +1,437 @@
+################################################################################################################
+# music.py      Version 4.33         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Imports jMusic and jSyn packages into jython.  Also provides additional functionality.
+#
+# This package is made of the following parts, which are loaded lazily, i.e., the first time one of their
+# names is needed:
+#
+#   core.py               jMusic constants and utilities, our own constants, helper functions (e.g., mapValue()),
+#                         and the jMusic extensions Mod, Read, Write, Note, and Phrase
+#   play.py               Play, and the Java MIDI synthesizer
+#   audioinstruments.py   Envelope, Synthesizer, and audio instruments (e.g., AudioSample, FMSynthesisInstrument)
+#   midisequence.py       MidiSequence
+#   metronome.py          Metronome
+#
+# So, "import music3" (or "from music3 import Play") loads only the parts used, e.g., music3.Metronome loads
+# metronome.py (and the parts it needs).  "from music3 import *" still works as before, i.e., it loads everything.
+# To see what this saves, run importprofile.py (e.g., it measures time-to-first-sound both ways).
+#
+#
+# REVISIONS:
+#
+# 4.33  19-Oct-2026 (jt)  Audio instruments now build their voices (player, panners, and LineOut on the synthesizer) the first time
+#                   each is used, as opposed to all of them up front - PREWARM_VOICES are built when an instrument is created,
+#                   and AudioInstrument.prewarmVoices() builds more ahead of time.  The number of voices is now the most an
+#                   instrument may build, and idle voices are reused first, so only as many are built as are played at once.
+#                   Voices are built under the instrument's voice lock, and queries (e.g., isPlaying() or stop()) do not build them.
+#
+# 4.32  19-Oct-2026 (jt)  Audio instruments now allocate voices to pitches in constant time - free voices are kept on a stack,
+#                   each voice remembers its pitch, and pitches are keyed in cents (so the same pitch always finds its voice,
+#                   however its frequency was computed).  AudioInstrument.setVoiceStealing() lets a new pitch take a busy voice
+#                   (the oldest, or the quietest) when all are busy.  Play.audio() notes skip their remaining envelope and stop
+#                   events once their voice has been given to another note (on the synthesizer's clock, these are queued
+#                   AUDIO_LOOKAHEAD milliseconds before they are due, as notes are, so a later note is never cut off).  Voices are allocated and
+#                   freed under a per-instrument lock, as notes start and end on timer worker threads.
+#
+# 4.31  19-Oct-2026 (jt)  Added valueMapper() and scaleMapper(), which return functions that map values the way mapValue() and
+#                   mapScale() do, with everything that does not depend on the value (range widths, result type, scale
+#                   checks, and a table of the scale's pitches) calculated once, and optional clamping of values outside
+#                   the source range.  Audio instrument volume and panning changes, audio note envelopes, and accordium's
+#                   touch handling now use them.  mapValue() and mapScale() now reuse mappers, too (same results).
+#
+# 4.30  19-Oct-2026 (jt)  Mod.elongate(), Mod.shift(), Mod.invert(), and Mod.retrograde() now get the phrases (and notes) of the
+#                   material once, read the values they need, and then write back the new ones (instead of walking the
+#                   score through nested helper functions, for every note).  Mod.retrograde() calculates phrase and part
+#                   start and end times only once (and no longer prints the score's times), and Mod.invert() now also
+#                   accepts Parts and Scores.  See modbenchmark.py.
+#
+# 4.29  19-Oct-2026 (jt)  Added NoteTable (see notetable.py), which stores notes as columns of typed arrays (a few bytes per
+#                   note, instead of a jMusic Note each), for algorithmic pieces with hundreds of thousands of notes.  It is
+#                   converted to a Phrase, Part, or Score only when needed - Play.midi(), Play.midiStream(), Write.midi(),
+#                   and Write.audio() accept NoteTables, too.  A NoteTable keeps the tempo, instrument, and channel of
+#                   material added to it (flattening a Score whose parts have different instruments is an error).
+#
+# 4.28  19-Oct-2026 (jt)  Added Play.midiStream(), which plays very large (e.g., hour-long) material in constant memory - note
+#                   events are merged from all phrases as they are needed (see ScoreStream in scorecompiler.py), and only
+#                   those within a short lookahead window (500 ms, by default) are scheduled at any time.
+#
+# 4.27  19-Oct-2026 (jt)  Added Write.audio(), which saves a WAV file of what Play.midi() would play, rendered through the
+#                   Java synthesizer (Gervill) as an audio stream, with exactly timestamped events (see midirender.py).
+#                   No audio device is needed, and rendering is as fast as the CPU allows (not real time), and repeatable.
+#
+# 4.26  19-Oct-2026 (jt)  Added Play.startRendering() and Play.stopRendering(), which render audio instruments (e.g.,
+#                   Play.audio() and Play.audioNote() with AudioSample, SinewaveInstrument, or FMSynthesisInstrument)
+#                   to a WAV file, as fast as possible, with the JSyn synthesizer in non-real-time mode (no audio
+#                   device needed).  Notes are played on a virtual clock (see VirtualScheduler in timer.py), and wave
+#                   instruments now accept time stamps, too.
+#
+# 4.25  19-Oct-2026 (jt)  music3 is now a package, made of parts which are loaded lazily (see above) - "from music3 import *"
+#                   works as before.  The measurement of the Java synthesizer's startup time (see 4.24) is now part of
+#                   importprofile.py.
+#
+# 4.24  19-Oct-2026 (jt)  The Java synthesizer is no longer opened on import - it is opened on the first MIDI-producing call
+#                   (e.g., Play.noteOn() or Play.setInstrument()), and instruments are loaded one program at a time, as
+#                   they are first used (as opposed to the whole soundbank - Gervill is opened with "load default
+#                   soundbank" off, since a plain open() loads every instrument).  So, programs using only JSyn instruments
+#                   start faster, use less memory, and no longer hear the synthesizer's low-level noise.  Running this
+#                   file measures the startup time saved.
+#
+# 4.23  19-Oct-2026 (jt)  Play no longer sends MIDI messages that would not change anything - the program, pitch bend, volume,
+#                   and panning last sent to each channel of the Java synthesizer are remembered (see midistate.py), so,
+#                   e.g., notes no longer send the same pitch bend (and panning) again, and Play.setInstrument() sends
+#                   a program change only when the instrument actually changes.
+#
+# 4.22  19-Oct-2026 (jt)  Faster Play.noteOn() / noteOff() - MIDI pitches (ints) are played directly (no longer converted to
+#                   frequency and back), frequencies converted to MIDI pitch are remembered, overlapping notes are counted
+#                   in constant time (notesCurrentlyPlaying is now an AtomicIntegerArray, indexed by channel * 128 + pitch),
+#                   and the Java synthesizer's channels are obtained once.
+#
+# 4.21  19-Oct-2026 (jt)  AudioSample notes (Play.audioNote(), Play.audio(), and Play.sound()) are now queued on the synthesizer's
+#                   clock, with time stamps, AUDIO_LOOKAHEAD milliseconds early (see Play.setAudioLookahead()), so that
+#                   note onsets and envelope steps land on exact frames, even when the JVM is busy (as opposed to when
+#                   a Timer2 callback happens to run).  Also, AudioSample's loop(), stop(), setFrequency(), setVolume(),
+#                   and setPanning() accept an optional (synth) time stamp.
+#
+# 4.20  19-Oct-2026 (jt)  Play.midi(), Play.audio(), and Play.sound() now cache compiled scores (see scorecompiler.py), so
+#                   playing the same material again (e.g., looping a phrase in a live set) starts without re-compilation.
+#
+# 4.19  19-Oct-2026 (jt)  Play.midi(), Play.audio(), and Play.sound() now compile scores into flat, time-sorted event arrays
+#                   (see scorecompiler.py), which are played by a single task scheduled for the next event (instead of
+#                   scheduling every note up front).  Play.sound() now also handles chords.
+#
+# 4.18  19-Oct-2026 (jt)  Metronome.setTempo() no longer restarts the metronome's timer (which caused audible hiccups) - the
+#                   current beat is stretched (or shrunk) to the new tempo, instead.  Also, beat intervals are no longer
+#                   rounded down to whole milliseconds (e.g., at 70 BPM, beats used to come 0.14 ms early, every beat).
+#
+# 4.17  19-Oct-2026 (jt)  Metronome now uses a fixed-rate Timer2, so beats no longer slip by the time it takes to call
+#                   the functions scheduled on them (late beats are caught up, so beat counting stays correct).
+#
+# 4.16  19-Oct-2026 (jt)  __ActiveAudioInstruments__ now holds weak references (instruments no longer used by the program may be
+#                   garbage collected - JEM's Stop button stops the synthesizer anyway).  Metronomes are now registered in
+#                   __ActiveMetronomes__ only while running.  This way, long sessions do not accumulate dead objects, and
+#                   JEM's Stop button still stops everything that is playing.
+#
+# 4.15  19-Oct-2026 (jt)  Play.note(), Play.frequency(), Play.audioNote() (and envelopes) now schedule their events directly on
+#                   Timer2's TimingWheel, instead of creating a Timer2 object per event.  Scheduling a large score is now
+#                   much cheaper (constant time per event, and fewer objects).
+#
+# 4.14	05-Jan-2020	(jt, bm)  Added capability to create arbitrary jSyn instruments easily.  User creates a class inheriting
+#					from either WaveInstrument or AudioInstrument.  WaveInstrument is used for oscillator-based instruments.
+#					AudioInstrument is used for audio-based (i.e., lineIn or wave file) instruments.
+#					Both inherit from parent class Instrument.
+#
+#					The idea is to provide a simple way for users to create various synth-based instruments to use for playing
+#					Scores.  Several instrument examples have also been provided.
+#
+# 4.13  13-Nov-2019 (bm, jt)  Updated AudioSample by adding polyphony, i.e., a number of indepedent voices.  Also, removed
+#					global jSyn synthesizer.  Now, we crete a new jSyn synthesizer inside every new AudioSample.
+#					Also, fixed an error in Metronome, related to removing nonRepeated functions.
+#
+# 4.12  18-Feb-2018 (bm)  Fixed jSyn clicking sounds between subsequent runs.  Now, when the JEM stop button is pressed,
+#					we simply delete the current jSyn synthesizer instance.  This takes care of the issue.  (Before, we kept
+#					accumulating active jSyn synthesizer instances in JVM memory!  This applies only to JEM which keeps the same
+#					JVM running between runs of JythonMusic programs.)
+#
+# 4.11  21-Mar-2017 (bm)  Fixed Play.setPitchBend() to actually set the pitch bend, as it should.
+#
+# 4.10  16-Jan-2017 (bm)  Fixed Note.getPitch() to return REST for rest notes, as it should.
+#
+# 4.9   27-Dec-2016 (bm)  Fixed jMusic Note bug, where, if int pitch is given, both frequency and pitch attributes are populated, but
+#					if float pitch is given (i.e., frequency in Hertz), only the frequency attribute is populated - no pitch).
+#					Consequently, in the second case, calling getPitch() crashes the system.  We fix it by also calling setFrequency()
+#					or setPitch() in our wrapper of the Note constructor.  Also added getPitch() and getPitchBend() to fully convert
+#					a frequency to MIDI pitch information.
+#
+# 4.8   26-Dec-2016 (mm)  Added Envelope class for using with Play.audio().  An envelope contains a list of attack times (in milliseconds,
+#					relative from the previous time) and values (to reach at those times), how long to wait (delay time, in milliseconds,
+#					relative from the previous time) to get to a sustain value, and then how long to wait to reach a value of zero
+#					(in milliseconds, relative from the end time).  Also modified Play.audio() to accept an Envelope as an optional parameter.
+#
+# 4.7   11-Nov-2016 (bm)  Small bug fix in Play.midi - now we pay attention to global instrument settings, i.e., Play.setInstrument(),
+#					unless instrument has been set explicitely locally (e.g., at Phrase level).
+#
+# 4.6   07-Nov-2016 (bm)  Fixed inefficiency problem in Play.midi (took forever to play long scores, e.g., > 3000 notes).  Now, things work
+#                   in real time again.
+#
+# 4.5   05-Nov-2016 (bm)  Fixed small but important bug in Play.midi (a missing variable in the part scheduling all notes in the chord list).
+#
+# 4.4   21-Oct-2016 (bm, mm)  Fixed clicking in Play.audio() by adding a timer to lower volume right before the ending of an audio note.
+#
+# 4.3   28-Aug-2016 (bm, mm)  Added Play.audio(), Play.audioNote(), Play.audioOn(), Play.audioOff(), Play.allAudioNotesOff() to
+#                   play musical material via AudioSamples.  These functions parallel the corresponding Play.note(), etc. functions.
+#                   The only difference is that audio samples are provided to be used in place of MIDI channels to render the music.
+#                   Also fixed bug with rendering panning information in notes in Play.midi() and Play.audio().
+#                   Also, if panning information is not provided in Play.noteOn(), Play.audioOn(), etc., the global Play.setPanning()
+#                   info is now used.
+#
+# 4.2   12-Aug-2016 (bm)  Using Timer2() class (based on java.util.Timer) for Play.note(), etc.  More reliable.
+#
+# 4.1   28-Jul-2016 (bm, mm)  Resolved following issues with Play.midi():
+#                   (a) Playback now uses length of a note (vs. its duration) to determine how long it sounds (as it should).
+#                   (b) Chord durations were calculated improperly for some chord notes, due to a note sorting error.  This has been fixed by
+#                   sorting noteList in Play.midi() by start time, then duration, then pitch then etc.
+#                   (c) Fixed race condition which caused some notes from not turning off.  The dictionary used to hold instances of overlapping
+#                   notes was changed to a list.  Now, for every note to play, a tuple of pitch and channel is added to by frequencyOn() and
+#                   removed from the list by frequencyOff(), respectively. (Race condition is still present, but due to rewritten logic, it
+#                   does not cause any trouble anymore.  All concurrent notes are turned off when they should.)
+#
+# 4.0   14-May-2016 (bm, mm)  Added microtonal capabilities.  Now, we can create and play notes using frequencies (float, in Hz),
+#                   instead of pitch (0-127).  Updated new Play.midi() function to handle microtones / frequencies (by using pitchbend).
+#                   Only one frequency per channel can be played accurately (since there is only one pitchbend per channel).  Regular notes
+#                   can play concurrently as usual (i.e., for chords).  However, for concurrent microtones on a given channel,
+#					unless they have same pitchbend, only the last microtone will be rendered accurately (all others will be affected by the
+#					latest pichbend - the one used to render the last microtone - again, only one pitchbend is available per channel).
+#                   To render concurrent microtones, they have to be spread across different channels.  That's the only way to render
+#                   microtonal chords using MIDI (i.e., we are pushing MIDI as far as it goes here).
+#                   Also, updated Play.noteOn/Off(), and Play.frequencyOn/Off() accordingly, and added a few more error checks/warnings.
+#                   Additionally, now only the last note-off event for a given note-channel is executed, thus allowing overlapping notes with
+#                   same pitch (e.g., overlapping A4 notes) to render more accurately.
+#                   Finally, Play.setPitchBend() changes the global pitch bend, so if a certain frequency is played, it will be
+#                   pitchbended if pitch bend is NOT zero. This is similar to playing any note with pitch bend set to anything other
+#                   than zero.
+#
+# 3.9   30-Mar-2016 (bm)  Changed to new Play.midi() function.  It issues Play.note() calls, instead of using jMusic's Play.midi() -
+#                   the latter usually hesitates at the beginning of playing.  New way is more robust / reliable.
+#                   Old function is still available under Play.midi2().
+#
+# 3.8   04-Mar-2016 (bm)  Reverted back to __Active__ lists removing objects.  Not a good idea, especially when loading large audio files.
+#                   We need to remove old objects, when we stop, otherwise we quickly run out of memory...
+#
+# 3.7   28-Feb-2016 (bm)  Updated Metronome class to improve API and implementation - updated method add() to use absolute beats (with
+#                   the exception of 0, which means at the next beat), also soundOn() now takes a MIDI pitch to use and volume, as parameters.
+#                   Updated __Active__ lists to not remove objects.  This way, when Stop button is pressed, all objects are stopped,
+#                   even if they are not referenced in the program anymore (during Live Coding, variables may be redefined and leave
+#                   orphan objects still playing - which before could only be stopped by quiting JEM!).
+#
+# 3.6   05-Feb-2016 (bm)  Added Metronome class - it provides for synchronization of musical tasks, especially for live coding.
+#                   Methods include add(), remove(), start(), stop(), show(), hide(), soundOn(), soundOff().
+#
+# 3.5   17-Jan-2016 (bm)  Fixed Mod.invert() bug, which modified RESTs - now, we only invert non-REST notes.
+#
+# 3.4   01-Dec-2015 (bm)  Moved LiveSample to audio.py, where we can do more extensive testing for audio card formats
+#                   (e.g., Little Endian), which appeared in some Windows boxes.  Also, fixed problem of Java imports
+#                   overridding Python's enumerate() function.
+#
+# 3.3   06-May-2015 (cb)  Added LiveSample(), which implements live recording of audio, and offers
+#                   an API similar to AudioSample.  Nice!
+#
+# 3.2   22-Feb-2015 (bm)  Added Mod.elongate() to fix a problem with jMusic's Mod.elongate (it messes up the
+#                   the length of elongated notes).  Added Mod.shift() to shift the start time of material
+#                   as a whole; and Mod.merge() to merge two Parts (or two Scores) into one.  Also, updated
+#                   Mod.retrograde() to work with Parts and Scores, in addition to Phrases.
+#
+# 3.1   07-Dec-2014 (bm)  Added Note() wrapping to allow specifying length in the Note constructor (in addition
+#                   to pitch, duration, dynamic, and panning.  Updated Phrase.addNoteList() and addChord() to
+#                   include a length parameter.  This allows for easier specification of legato and staccato notes.
+#                   Also updated Note.setDuration() to adjust the note's length proportionally.
+#
+# 3.0   06-Nov-2014 (bm)  Added functionality to stop AudioSample and MidiSequence objects via JEM's Stop button
+#                       - see registerStopFunction().
+#
+# 2.9   07-Oct-2014 (bm) Resolved the various Play.midi() issues.  Andrew (Brown) fixed jMusic's MidiSynth, so
+#                   we now can use it as documented.  We initialize a total of 12 MidiSynth's (which allows up to
+#                   12 concurrent Play.midi()'s).  This should be sufficient for all practical purposes.
+#
+# 2.8   06-Sep-2014 (bm) Fixed a couple of bugs in Mod.invert() and Mod.mutate().  Also added a more meaningful
+#                   error message in Phrase.addNoteList() for the common error of providing lists with different lengths.
+#
+# 2.7   19-Aug-2014 (bm) INDIAN_SCALE and TURKISH_SCALE were taken out because they were incorrect/misleading,
+#                   as per Andrew Brown's recommendation.
+#
+# 2.6   29-May-2014 (bm) Added JEM's registerStopFunction() to register a callback function to be called,
+#                   inside JEM, when the Stop button is pressed.  This is needed to stop Play.midi from
+#                   playing music. For now, we register Play.stop(), which stops any music started through
+#                   the Play class from sounding.  Also, changed stopMidiSynths() to __stopMidiSynths__()
+#                   to hide it, since Play.stop() is now the right way to stop Play generated music from
+#                   sounding.
+#
+# 2.5   27-May-2014 (bm) Added stopMidiSynths() - a function to stop all Play.midi music right away - this
+#                   was needed for JEM. Also,Play.midi() returns the MIDI synthesizer used, so
+#                   m = Play.midi(), followed by, m.stop(), will stop that synthesizer.
+#
+# 2.4   02-May-2014 (bm) Updated fixWorkingDirForJEM() solution to work with new JEM editor by Tobias Kohn.
+#
+# 2.3   17-Dec-2013 (bm, ng) Added AudioSample panning ranging from 0 (left) to 127 (right).  Also
+#                   added Envelope class and updated AudioSample to work with it.
+#
+# 2.2   21-Nov-2013 Added a Play.note(pitch, start, duration, velocity=100, channel=0) function,
+#                   which plays a note with given 'start' time (in milliseconds from now),
+#                   'duration' (in milliseconds from 'start' time), with given 'velocity' on 'channel'.
+#                   This allows scheduling of future note events, and thus should facilitate
+#                   playing score-based or event-based musical material.
+#
+# 2.1   14-Mar-2013 Two classes - AudioSample and MidiSequence.
+#
+#                   AudioSample is instantiated with a string - the filename of an audio file (.wav or .aiff).
+#                   It supports the following functions: play(), loop(), loop(numOfTimes), stop(), pause(), resume(),
+#                   setPitch( e.g., A4 ), getPitch(), getDefaultPitch(),
+#                   setFrequency( e.g., 440.0 ), getFrequency(),
+#                   setVolume( 0-127 ), getVolume().
+#
+#                   MidiSequence is instantiated with either a string - the filename of a MIDI file (.mid), or
+#                   music library material (Score, Part, Phrase, or Note).
+#                   It supports the following functions: play(), loop(), stop(), pause(), resume(),
+#                   setPitch( e.g., A4 ), getPitch(), getDefaultPitch(),
+#                   setTempo( e.g., 80.1 ), getTempo(), getDefaultTempo(),
+#                   setVolume( 0-127 ), getVolume().
+#
+#                   For more information on function parameters, see the class definition.
+#
+# 2.0  17-Feb-2012  Added jSyn synthesizer functionality.  We now have an AudioSample class for loading audio
+#                   files (WAV or AIF), which can be played, looped, paused, resumed, and stopped.
+#                   Also, each sound has a MIDI pitch associated with it (default is A4), so we
+#                   can play different pitches with it (through pitch shifting).
+#                   Finally, we improved code organization overall.
+#
+# 1.91 13-Feb-2013  Modified mapScale() to add an argument for the key of the scale (default is C).
+#
+# 1.9  10-Feb-2013  Removed Read.image() and Write.image() - no content coupling with
+#                   image library anymore.
+# 1.81 03-Feb-2013  Now mapScale() returns an int (since it intended to be used as
+#                   a pitch value).  If we return a float, it may be confused as
+#                   a note frequency (by the Note() constructor) - that would not be good.
+#
+# 1.8  01-Jan-2013  Redefine Jython input() function to fix problem with jython 2.5.3
+#                   (see
+# 1.7  30-Dec-2012  Added missing MIDI instrument constants
+# 1.6  26-Nov-2012  Added Play.frequencyOn/Off(), and Play.set/getPitchBend() functions.
+# 1.52 04-Nov-2012  Divided complicated mapValue() to simpler mapValue() and mapScale() functions.
+# 1.51 20-Oct-2012  Restablished access to jMusic Phrase's toString() via __str__() and __repr__().
+#                   Added missing jMusic constants.
+#                   Added pitchSet parameter to mapValue()
+# 1.5  16-Sep-2012  Added MIDI_INSTRUMENTS to be used in instrument selection menus, etc.
+# 1.4  05-Sep-2012  Renamed package to 'music'.
+# 1.3  17-Nov-2011  Extended jMusic Phrase, Read, Write by wrapping them in jython classes.
+#
+
+import sys
+from types import ModuleType
+from java.lang import System
+
+# our parts, in the order they used to appear in music3.py (i.e., later ones may redefine names of earlier ones)
+SUBMODULES = ['core', 'play', 'audioinstruments', 'midisequence', 'metronome', 'notetable']
+
+# parts needed by each part (these are loaded first)
+DEPENDENCIES = {'core':             [],
+                'play':             ['core', 'audioinstruments'],
+                'audioinstruments': ['core'],
+                'midisequence':     ['core'],
+                'metronome':        ['core', 'play'],
+                'notetable':        ['core']}
+
+# where our own classes are defined (any other name, e.g., a jMusic constant, is looked for one part at a time)
+NAMES = {'Play':                   'play',
+         'Envelope':               'audioinstruments',
+         'Synthesizer':            'audioinstruments',
+         'SynthUnit':              'audioinstruments',
+         'LowPassFilter':          'audioinstruments',
+         'AudioInstrument':        'audioinstruments',
+         'SampleInstrument':       'audioinstruments',
+         'LiveSample':             'audioinstruments',
+         'AudioSample':            'audioinstruments',
+         'WaveInstrument':         'audioinstruments',
+         'SinewaveInstrument':     'audioinstruments',
+         'SquarewaveInstrument':   'audioinstruments',
+         'TrianglewaveInstrument': 'audioinstruments',
+         'FMSynthesisInstrument':  'audioinstruments',
+         'AdditiveInstrument':     'audioinstruments',
+         'VOICE_STEALING_SAME_PITCH': 'audioinstruments',
+         'VOICE_STEALING_OLDEST':     'audioinstruments',
+         'VOICE_STEALING_QUIETEST':   'audioinstruments',
+         'PREWARM_VOICES':            'audioinstruments',
+         'MidiSequence':           'midisequence',
+         'Metronome':              'metronome',
+         'NoteTable':              'notetable'}
+
+__loadTimes__ = {}    # how long each part took to load (in milliseconds, not including the parts it needs)
+
+
+class LazyModule(ModuleType):
+   """Stands in for the music3 package, and loads its parts the first time one of their names is needed."""
+
+   def __getattr__(self, name):
+      """Called only for names not loaded yet."""
+
+      if name == '__all__':     # is this "from music3 import *"?
+
+         # yes, so load everything (as we used to)
+         for submodule in SUBMODULES:
+            self.__load__(submodule)
+
+         names = [key for key in self.__dict__.keys() if not key.startswith('_') and key not in SUBMODULES]
+         self.__dict__['__all__'] = names
+         return names
+
+      if name.startswith('_'):  # private names (e.g., __loader__, when the import machinery asks) are not ours to load
+         raise AttributeError(name)
+
+      # load the part that defines this name (or, if we do not know it, try one part at a time)
+      if name in NAMES:
+         submodules = [NAMES[name]]
+      else:
+         submodules = SUBMODULES
+
+      for submodule in submodules:
+         self.__load__(submodule)
+         if name in self.__dict__:
+            return self.__dict__[name]
+
+      raise AttributeError("'module' object has no attribute '" + name + "'")
+
+   def __load__(self, submodule):
+      """Loads this part (and the parts it needs), and makes its names available from music3."""
+
+      if submodule in __loadTimes__:   # already loaded?
+         return
+
+      for dependency in DEPENDENCIES[submodule]:   # load what it needs first (so we can time each part separately)
+         self.__load__(dependency)
+
+      startTime = System.nanoTime()
+      __import__(__name__ + '.' + submodule)
+      module = sys.modules[__name__ + '.' + submodule]
+      __loadTimes__[submodule] = (System.nanoTime() - startTime) / 1000000.0
+
+      # copy its public names (all parts import core's names, so copy those only from core - otherwise,
+      # e.g., core's jMusic Play would replace our own Play)
+      core = sys.modules[__name__ + '.core']
+      for key, value in module.__dict__.items():
+         if not key.startswith('_'):
+            if module is core or core.__dict__.get(key) is not value:
+               self.__dict__[key] = value
+
+
+# replace this module with a lazy one (the import machinery hands out whatever is in sys.modules)
+__lazyModule__ = LazyModule(__name__, __doc__)
+__lazyModule__.__file__ = __file__
+__lazyModule__.__path__ = __path__
+__lazyModule__.__loadTimes__ = __loadTimes__
+__lazyModule__.__original__ = sys.modules[__name__]   # keep this module alive (the lazy module uses its globals)
+sys.modules[__name__] = __lazyModule__
+
+
+print
+print
@@ -0,0 +1,2644 @@
+################################################################################################################
+# audioinstruments.py Version 4.33         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Envelope, the JSyn Synthesizer, and audio instruments (e.g., AudioSample, LiveSample,
+# SinewaveInstrument, and FMSynthesisInstrument).
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+from music3.core import *
+
+
+#########
+# An envelope contains a list of attack times (in milliseconds, relative from the previous time) and values (to reach at those times),
+# how long to wait (delay time, in milliseconds, relative from the previous time) to get to a sustain value, and
+# then how long to wait to reach a value of zero (in milliseconds, relative from the end time).
+
+class Envelope():
+    def __init__(self, attackTimes = [2], attackValues = [1.0], delayTime = 1, sustainValue = 1.0, releaseTime = 2):
+
+        # make sure attack times and values are parallel
+        if len(attackValues) != len(attackTimes):
+
+            raise IndexError("Envelope: attack times and values need to have the same length")
+
+        else:  # all seems well
+
+            self.attackTimes = attackTimes    # in milliseconds, relative from the previous time...
+            self.attackValues = attackValues  # and the corresponding values
+            self.delayTime = delayTime        # in milliseconds, relative from the previous time...
+            self.sustainValue = sustainValue  # to reach this value
+            self.releaseTime = releaseTime    # in milliseconds, relative from the end time
+
+    # get list of attack times
+    def getAttackTimes(self):
+        return self.attackTimes
+
+    # get list of attack values
+    def getAttackValues(self):
+        return self.attackValues
+
+    # get list of lists - first element is list of attack times and second element is list attack values
+    def getAttackTimesAndValues(self):
+        return [self.attackTimes, self.attackValues]
+
+    # update attack times
+    def setAttackTimes(self, attackTimes):
+        # make sure attack times and values are parallel
+        if len(self.attackValues) != len(attackTimes):
+
+            raise IndexError("Envelope.setAttackTimes(): attack times and values need to have the same length")
+
+        else:  # all seems well
+            self.attackTimes = attackTimes
+
+    #
+    def setAttackValues(self, attackValues):
+        # make sure attack times and values are parallel
+        if len(attackValues) != len(self.attackTimes):
+
+            raise IndexError("Envelope.setAttackValues(): attack times and values need to have the same length")
+
+        else:  # all seems well
+            self.attackValues = attackValues
+
+    def setAttackTimesAndValues(self, attackTimes, attackValues):
+        # make sure attack times and values are parallel
+        if len(self.attackValues) != len(attackTimes):
+
+            raise IndexError("Envelope.setAttackTimesAndValues(): attack times and values need to have the same length")
+
+        else:  # all seems well
+            self.attackTimes = attackTimes
+            self.attackValues = attackValues
+
+    def getSustain(self):
+        return self.sustainValue
+
+    def setSustain(self, sustainValue):
+        self.sustainValue = sustainValue
+
+    def getDelay(self):
+        return self.delayTime
+
+    def setDelay(self, delayTime):
+        self.delayTime = delayTime
+
+    def getRelease(self):
+        return self.releaseTime
+
+    #update release
+    def setRelease(self, releaseTime):
+        self.releaseTime = releaseTime
+
+    # get length of envelope
+    def getLength(self):
+        return self.__getAbsoluteDelay__() + self.releaseTime
+
+    # get list of absolute attack times, attack time distance from start of envelope
+    def __getAbsoluteAttackTimes__(self):
+        # now convert relative attack times to absolute from the start time
+        absoluteAttackTimes = [ self.attackTimes[0] ]   # initialize first list element
+        for i in range(1, len(self.attackTimes)):            # process remaining times
+            absoluteAttackTimes.append(self.attackTimes[i] + absoluteAttackTimes[i-1])
+        return absoluteAttackTimes
+
+    def __getAbsoluteDelay__(self):
+        # same for delay
+        absoluteAttackTimes = self.__getAbsoluteAttackTimes__()
+        absoluteDelayTime =  absoluteAttackTimes[len(absoluteAttackTimes) - 1] + self.delayTime
+        return absoluteDelayTime
+
+
+
+######################################################################################
+#### AudioInstruments and supporting classes #########################################
+######################################################################################
+
+
+from java.io import *  # for File
+
+from math import *
+
+# used to keep track which AudioSample and LiveSample objects are active, so we can stop them when
+# JEM's Stop button is pressed
+# NOTE:  Instruments are held weakly (keyed by id), so that instruments no longer used by the program may be
+#        garbage collected (instruments playing notes are still referenced by the scheduled note events).
+from weakref import WeakValueDictionary
+__ActiveAudioInstruments__ = WeakValueDictionary()     # holds active AudioSample and LiveSample objects
+
+
+from com.jsyn import JSyn
+from com.softsynth.shared.time import TimeStamp   # needed to schedule events on the synthesizer's clock
+from java.util.concurrent.locks import ReentrantLock   # needed to allocate (and build) voices from several threads
+from com.jsyn.devices import AudioDeviceManager   # (only to say we do not care, when rendering to a file)
+
+# volume (0-127) to amplitude (0.0-1.0), and panning (0-127) to pan (-1.0 to 1.0) - set up once (see valueMapper()),
+# since volume and panning change often (e.g., for every note)
+__volumeToAmplitude__ = valueMapper(0, 127, 0.0, 1.0)
+__panningToPan__      = valueMapper(0, 127, -1.0, 1.0)
+
+# what an audio instrument does when a new pitch finds all its voices busy (see AudioInstrument.setVoiceStealing())
+VOICE_STEALING_SAME_PITCH = "same pitch"   # nothing - voices are only shared by the same pitch played again
+VOICE_STEALING_OLDEST     = "oldest"       # take the voice allocated the longest time ago
+VOICE_STEALING_QUIETEST   = "quietest"     # take the voice with the lowest volume
+
+# how many voices an audio instrument builds when created (the rest, up to its number of voices, are built the first
+# time they are used - see AudioInstrument.prewarmVoices())
+PREWARM_VOICES = 1
+
+# how long (in seconds) to keep rendering silence, before closing a file rendered offline, so that everything
+# rendered has been written (the recorder writes 1024 frames at a time)
+OFFLINE_FLUSH_TIME = 0.05
+
+class Synthesizer():
+   """
+   This implementation of synthesizer follows the Singleton design pattern. Only one
+   instance of Synthesizer may exist. Any new ones create will point to this instance.
+   https://en.wikipedia.org/wiki/Singleton_pattern
+   """
+
+   instance = None     # ensure one instance by keeping instance outside of the init
+   synthRunning = False
+   offline = False         # rendering to a file, as opposed to playing through the audio device (see startOffline())
+   recorder = None         # writes what is rendered to the file, when offline
+   wasRunning = False      # was the synthesizer running in real time, before going offline?
+
+   def __init__(self):
+      if not Synthesizer.instance:
+         Synthesizer.instance = JSyn.createSynthesizer()
+
+   def getInstance(self):
+      return  Synthesizer.instance
+
+   def startSynth(self):
+      """
+      Starts the synthesizer with the appropriate parameters.
+      """
+      if not Synthesizer.synthRunning:
+         temporarySynth  =   JSyn.createSynthesizer()
+         framerate       = temporarySynth.getFrameRate()
+
+         audioDeviceManager  = temporarySynth.getAudioDeviceManager()                  # create an audioDeviceManager to access import and output devices
+         inputPortID         = audioDeviceManager.getDefaultInputDeviceID()            # use default audio input
+         inputChannels       = audioDeviceManager.getMaxInputChannels( inputPortID )   # get the max number of channels for default input device
+         outputPortID        = audioDeviceManager.getDefaultOutputDeviceID()           # use default audio output
+         outputChannels      = audioDeviceManager.getMaxOutputChannels( outputPortID ) # get the max number of channels for default output device
+
+         del temporarySynth
+
+         Synthesizer.instance.start( framerate, inputPortID, inputChannels, outputPortID, outputChannels )
+         Synthesizer.synthRunning = True
+
+   def startOffline(self, filename):
+      """
+      Restarts the synthesizer in non-real-time mode, without an audio device, to render everything instruments play
+      into a (stereo) WAV file.  The synthesizer's clock now stands still, until moved forward (e.g., by sleepUntil()
+      on the JSyn synthesizer), which renders the audio up to that time, as fast as the CPU allows.  So, events need to
+      be queued with time stamps (or run in between moving the clock - see Play.startRendering()).
+
+      Instruments created while offline do not need an audio device (so this works without a sound card).
+      """
+      from com.jsyn.util import WaveRecorder
+
+      if Synthesizer.offline:
+         raise RuntimeError("Synthesizer is already rendering to a file (see stopOffline()).")
+
+      synth = self.getInstance()
+
+      Synthesizer.wasRunning = Synthesizer.synthRunning
+      if Synthesizer.synthRunning:
+         synth.stop()        # (this stops all voices - instruments stay on the synthesizer)
+
+      # no audio device is opened in non-real-time mode, but we still need (stereo) output buffers for the LineOuts
+      synth.setRealTime(False)
+      synth.start( synth.getFrameRate(), AudioDeviceManager.USE_DEFAULT_DEVICE, 0, AudioDeviceManager.USE_DEFAULT_DEVICE, 2 )
+      Synthesizer.synthRunning = True    # (so that instruments do not start it in real time)
+      Synthesizer.offline = True
+
+      # NOTE: The recorder is created in non-real-time mode, so the synthesizer waits for it to write to the file
+      # (instead of dropping samples).  It is started before the clock moves, otherwise, the synthesizer would wait forever.
+      Synthesizer.recorder = WaveRecorder( synth, File(filename), 2 )
+      Synthesizer.recorder.start()
+
+      # and let it hear all instruments (new instruments connect themselves)
+      for instrument in __ActiveAudioInstruments__.values():
+         instrument.__connectRecorder__( Synthesizer.recorder.getInput() )
+
+   def stopOffline(self):
+      """
+      Finishes the WAV file started by startOffline(), and goes back to real time (if the synthesizer was running
+      in real time before).
+      """
+      if Synthesizer.offline:
+         synth = self.getInstance()
+
+         synth.sleepFor( OFFLINE_FLUSH_TIME )   # render a little silence, so that everything so far gets written
+
+         Synthesizer.recorder.stop()
+         Synthesizer.recorder.close()           # (also disconnects the instruments from it)
+         Synthesizer.recorder = None
+
+         for instrument in __ActiveAudioInstruments__.values():
+            instrument.__disconnectRecorder__()
+
+         synth.stop()
+         synth.setRealTime(True)
+         Synthesizer.synthRunning = False
+         Synthesizer.offline = False
+
+         if Synthesizer.wasRunning:
+            self.startSynth()
+
+   def isOffline(self):
+      """
+      Returns True if the synthesizer is rendering to a file (see startOffline()).
+      """
+      return Synthesizer.offline
+
+   def stopSynth(self):
+      """
+      Both stop and delete this synth.
+      """
+      if Synthesizer.synthRunning:
+         Synthesizer.instance.stop()
+         del Synthesizer.instance
+         Synthesizer.instance = None
+         Synthesizer.synthRunning = False
+
+   def getFrameRate(self):
+      return self.instance.getFrameRate()
+
+
+from com.jsyn.unitgen import Multiply, LinearRamp
+
+
+class SynthUnit():
+   """
+   Creates a pass-through audio pipeline, which has one input and one output port per channel (default is 1, i.e., mono).
+   It also provides an amplitude (volume) control (which is global, i.e., same across all channels).
+   Finally, it provides a way to inject special effect units into this pipeline (e.g., filters, reverb, etc.) into the pipeline.
+
+   NOTE:  This is intended to create mono (1 channel) or stereo (2 channel) pipelines.  However, it has been
+          build to work for an arbitrary number of channels (if ever needed)...
+   """
+
+   def __init__(self, synth, channels=1):
+
+      self.numChannels = channels  # how many channels to provide (1 means mono, 2 means stereo)
+
+      self.inputs = []  # list of input ports (as many as channels)
+      self.outputs = []  # list of output ports (as many as channels)
+      self.amplitudes = []  # list of amplitude controls (linear ramps) used to control amplitude (as many as channels)
+      # self.lastUnits   = []         # list of last units in channel pipelines (used to add more units as needed)
+
+      self.synth = synth  # remember synth used to add units to
+
+      # self.lastUnit = self
+
+      # NOTE: This is empirically determined, and should NOT require modification.
+      self.DELAY = 0.0002  # how slowly to adjust volume (to avoid clicking)
+
+      # now, create all channels (1 means mono, 2 means stereo, etc.)
+      for channel in range(self.numChannels):
+         self.__createChannel__()  # create next channel
+
+   def __createChannel__(self):
+      """
+      Create a single channel of the audio pipeline.  May be called repeatedly for more (independent) channels.
+      """
+
+      # create the initial multiplier unit (we use this to provide an input port, and to control volume)
+      multiplyUnit = Multiply()  # create unit
+
+      # self.lastUnits.append( multiplyUnit )          # remember it
+      self.inputs.append(multiplyUnit.inputA)  # remember the input port (this becomes the SynthUnit's input)
+      self.outputs.append( multiplyUnit.output)  # remember the output port (for now, this becomes the SynthUnit's output...
+      # NOTE: This output may change, if more units added (e.g., filters, reverb, etc.) )
+
+      # create amplitude control and connect it to multiplier's inputB (used as amplitude aka volume)
+      amplitudeControlUnit = LinearRamp()  # create unit
+
+      self.amplitudes.append(amplitudeControlUnit)  # remember it
+      amplitudeControlUnit.output.connect(multiplyUnit.inputB)  # connect it to multiplier's inputB
+      amplitudeControlUnit.input.setup(0.0, 0.5, 1.0)  # set minimum, current, and maximum settings for control
+      amplitudeControlUnit.time.set(self.DELAY)  # and how many seconds to take for smoothing amplitude changes
+
+      # add units to synth
+      self.synth.add(multiplyUnit)
+      self.synth.add(amplitudeControlUnit)
+
+   def setAmplitude(self, amplitude, timeStamp=None):
+      """
+      Set amplitude (volume) for all channels.  If a (synth) 'timeStamp' is provided, the change happens
+      exactly at that time (otherwise, now).
+      """
+
+      if amplitude < 0.0 or amplitude > 1.0:
+         print "Amplitude (" + str(volume) + ") should range from 0.0 to 1.0."
+      else:
+         # everything is OK, so set amplitude to all channels
+         for channel in range(self.numChannels):
+            amplitudeControlUnit = self.amplitudes[channel]  # get handle to amplitude control unit
+            if timeStamp is None:
+               amplitudeControlUnit.input.set(amplitude)  # and adjust amplitude (volume)
+            else:
+               amplitudeControlUnit.input.set(amplitude, timeStamp)  # and adjust amplitude (volume), when specified
+
+   def getAmplitude(self):
+      """
+      Return amplitude (volume) for all channels.
+      """
+
+      # since all amplitude control units share the same amplitude, only one is needed to access the current value
+      amplitudeControlUnit = self.amplitudes[0]  # get handle to amplitude control unit
+      amplitude = amplitudeControlUnit.input.get()  # and get amplitude (volume)
+
+      return amplitude
+
+   def addUnit(self, unit):
+      """
+      Add a new unit to the audio pipeline, once per channel.  Assumes the unit has been created already externally,
+      and that it is compatible with the pipeline (i.e., it has input and output ports - as many channels as needed).
+      """
+
+      if self.numChannels != unit.numChannels:
+         print "Unit provided has " + str(unit.numChannels + " channels - instead expected " + str(self.numChannels)) + "."
+      else:
+         # loop through all channels
+         for channel in range(self.numChannels):
+         # get last unit in pipeline (may be multiplyUnit, if this is the first unit added, or other (e.g., filter, etc.))
+
+         # connect current last output to this unit's input
+            currentOutput = self.outputs[channel]  # get last output in pipeline for current channel
+         currentInput = unit.inputs[channel]  # get last output in pipeline for current channel
+
+         # and connect them!!!
+         currentOutput.connect(0, currentInput, 0)
+
+         # now that the connection is done, update the new output of the pipeline
+         newOutput = unit.outputs[channels]  # get new output of pipeline
+         self.outputs[channel] = newOutput  # and remember it (for next time we need to connect something!!!)
+
+         # finally, add this unit to the synth
+         channelUnit = unit.units[channel]
+         self.synth.add(channelUnit)
+
+         # now, all channels of new unit have been connected to the end of original pipeline,
+         # also, the output ports of the new pipeline have been updated to those of the new unit...
+
+         # Ready to roll!!!
+
+from com.jsyn.unitgen import FilterLowPass
+class LowPassFilter():
+   """
+   Creates low-pass filter, where threshold is desired frequency cutoff (i.e., all frequencies BELOW threshold will pass through,
+   while all other frequencies will be eliminated).
+
+   NOTE:  This is intended to create mono (1 channel) or stereo (2 channel) pipelines.  However, it has been
+          build to work for an arbitrary number of channels (if ever needed)...
+   """
+
+   def __init__(self, threshold, channels=1):
+
+      self.numChannels = channels  # how many channels to provide (1 means mono, 2 means stereo)
+
+      self.units = []  # holds units for all channels (1 for mono, 2 for stereo)
+      self.inputs = []  # list of input ports (as many as channels)
+      self.outputs = []  # list of output ports (as many as channels)
+
+      # loop through all channels
+      for channel in range(self.numChannels):
+         unit = FilterLowPass()  # create next filter
+         unit.frequency.set(threshold)  # set its frequency
+
+         self.units.append(unit)  # and remember it...
+         self.inputs.append(unit.input)  # also its input port...
+         self.outputs.append(unit.output)  # and its output port
+
+      # now, we have created enough units per channel,
+      # also updated the input and output port parallel lists (so that others can find them!)
+
+   def setThreshold(self, threshold):
+      """
+      Adjust frequency cutoff (i.e., all frequencies BELOW threshold will pass through,
+      while all other frequencies will be eliminated).
+      """
+
+      if threshold < 8.17 or threshold > 12600.0:
+         print "Frequency cutoff (" + str(threshold) + ") should range from 8.17 to 12600.0 (in Hz)."
+      else:
+         # loop through all channels
+         for unit in self.units:
+            unit.frequency.set(threshold)  # set frequency cutoff for this channel
+
+
+   def getThreshold(self):
+      """
+      Return current frequency cutoff.
+      """
+
+
+      # since all channels have the same frequency cutoff, just get first one...
+      threshold = self.units[0].frequency.get()
+
+      return threshold
+
+
+
+class AudioInstrument():
+   """
+   Encapsulates the construction of the audio pipeline shared between all instruments. It is the top most
+   class in the instrument hierarchy. This class is voice player agnostic. Subclasses specificy which voice
+   player should be instantiated by this super class.
+   Volume, panning, starting, stopping, and pausing are handled by this class.
+   """
+
+   def __init__(self, channels, voices, volume, voiceClass, *voiceClassArgs):
+
+      # define the variables that are independent from the polyphonic voices
+      self.channels  = channels
+      self.maxVoices = voices   # voices are built the first time they are used (see __getVoice__()), up to this many
+
+      # remember how to build voices (see __buildVoice__())
+      self.voiceClass     = voiceClass
+      self.voiceClassArgs = voiceClassArgs
+
+      # create the singleton synthsizer
+      self.synthesizer = Synthesizer()
+      self.synth = Synthesizer().getInstance()
+
+      self.defaultPitch     = A4               # set the default pitch to A4 - voices will modify this on their own
+      self.defaultFrequency = 440.0            # set default frequency to 440.0 - voices will modify this on their own
+
+      # initialize the parallel voice pipelines (the JSyn units of a voice are None, until the voice is built)
+      self.voices             = [None] * voices   # holds the voiceClass objects supplied by the contructor
+                                                  # these players are the beginning of the parallel pipeline shared by all instruments
+      self.voicesPitches      = [self.defaultPitch] * voices       # holds the corresponding player's set pitch as an integer between 0 and 127
+      self.voicesFrequencies  = [self.defaultFrequency] * voices   # holds the corresponding player's set frequency as a float
+      self.panLefts           = [None] * voices   # holds panLeft objects to work in tandem with panRights
+      self.panRights          = [None] * voices   # holds panRight objects to work in tandem with panLefts
+      self.pannings           = [63] * voices     # holds panning settings as an integer between 0 and 127 for corresponding players (63 is center)
+      self.volumes            = [volume] * voices # holds volume settings as an integer between 0 and 127 for corresponding players
+      self.paused             = [False] * voices  # holds boolean paused flags for corresponding players
+      self.muted              = [False] * voices  # holds boolean muted flags for corresponding players
+      self.playing            = [True] * voices   # holds boolean playing flags for corresponding players
+      self.lineOuts           = [None] * voices   # holds lineOut objects from which all sound output is produced
+                                                  # LineOut is the last component in the parallel pipeline
+                                                  # It mixes output to computer's audio (DAC) card
+      self.builtVoices        = []   # voices built so far (in the order built)
+      self.voicesReady        = [False] * voices   # holds boolean flags for voices completely built (see __getVoice__())
+      self.recordGates        = None # when rendering to a file, holds two mixers (left and right) which pass the voices to
+                                     # the recorder, while their LineOuts are started (see __connectRecorder__())
+
+      self.pitchSounding      = {}  # holds associations between a pitch currently sounding and corresponding voice (one pitch per voice)
+                                    # NOTE: Here we are simulating a MIDI synthesizer, which is polyphonic, i.e., allows several pitches to sound simultaneously on a given channel.
+                                    # We accomplish this by utilizing the various voices defined by the pipeline above and associating each sounding pitch with a single voice.
+                                    # Different pitches are associated with different voices.  We can reserve or allocate a voice to sound a specific pitch, and we can release that
+                                    # voice (presumably after the pitch has stopped sounding).  This allows us to easily play polyphonic Scores via Play.audio().
+                                    # Pitches are keyed in cents (see __getPitchKey__()), so that the same pitch always finds its voice, however its frequency was computed.
+      self.voicePitchKeys     = [None] * voices   # reverse index - holds the pitch key each voice is allocated to (None, if free)
+      self.freeVoices         = range(voices - 1, -1, -1)   # stack of free voices (the next one is at the end, so voice 0 goes first)
+                                                            # freed voices go back on top, so idle voices already built are reused
+                                                            # before new ones are built (see __getVoice__())
+      self.voiceAllocations   = [0] * voices      # holds the allocation number of the note each voice is playing (to tell apart notes sharing a voice)
+      self.allocationCount    = 0                 # number of allocations so far (voices allocated earlier have smaller numbers)
+      self.voiceStealing      = VOICE_STEALING_SAME_PITCH   # what to do when a new pitch finds all voices busy (see setVoiceStealing())
+      self.voiceLock          = ReentrantLock()   # guards the above (notes are allocated and freed from timer worker threads)
+
+      # build the voices to have ready up front (the rest are built as they are needed - so, an instrument played
+      # a few notes at a time has only a few voices on the synthesizer)
+      self.prewarmVoices( PREWARM_VOICES )
+
+      # if we are rendering to a file, let the recorder hear us too
+      if Synthesizer.recorder is not None:
+         self.__connectRecorder__( Synthesizer.recorder.getInput() )
+
+      # This concludes the set up of the parallel voice pipelines. The subclasses can now govern their own specific implementations of certain functionality
+
+
+   def __buildVoice__(self, voiceIndex):
+      """
+      Builds the pipeline of this voice (player, panners, and LineOut), and adds it to the synthesizer.
+      """
+      # import shared jSyn classes here, so as to not polute the global namespace
+      # subclasses will import jSyn classes specific to their own needs
+      from com.jsyn.unitgen import LineOut, Pan
+
+      voice = self.voiceClass( self.synth, *self.voiceClassArgs )   # instantiate single player
+      self.voices[voiceIndex] = voice   # add it to list of players
+
+      # create panning control (we simulate this using two pan controls, one for the left channel and
+      # another for the right channel) - to pan we adjust their respective pan
+      self.panLefts[voiceIndex] = Pan()
+      self.panRights[voiceIndex] = Pan()
+
+      # now, that panning is set up, initialize it (to center, unless set before the voice was built)
+      self.setPanning( self.pannings[voiceIndex], voiceIndex )
+
+      # NOTE: The two pan controls have only one of their outputs (as their names indicate)
+      # connected to LineOut.  This way, we can set their pan value as we would normally, and not worry
+      # about clipping (i.e., doubling the output amplitude).  Also, this works for both mono and
+      # stereo samples.
+
+      if self.channels == 1:
+         self.voices[voiceIndex].outputs[0].connect( 0, self.panLefts[voiceIndex].input, 0 )
+         self.voices[voiceIndex].outputs[0].connect( 0, self.panRights[voiceIndex].input, 0 )
+      elif self.channels == 2:
+         self.voices[voiceIndex].outputs[0].connect( 0, self.panLefts[voiceIndex].input, 0 )
+         self.voices[voiceIndex].outputs[1].connect( 0, self.panRights[voiceIndex].input, 0 )
+      else:
+         raise TypeError( "Can only handle mono or stereo input." )              # overkill error checking to cover possible future features
+
+
+      # set volume for this voice (0 - 127)
+      self.setVolume( self.volumes[voiceIndex], voiceIndex )
+
+      # now we are ready for the LineOuts
+      self.lineOuts[voiceIndex] = LineOut()
+
+      # connect inputs of the LineOuts to the outputs of the panners
+      self.panLefts[voiceIndex].output.connect( 0, self.lineOuts[voiceIndex].input, 0 )
+      self.panRights[voiceIndex].output.connect( 1, self.lineOuts[voiceIndex].input, 1 )
+
+      # add everything to the synth
+      self.synth.add( self.panLefts[voiceIndex] )
+      self.synth.add( self.panRights[voiceIndex] )
+      self.synth.add( self.lineOuts[voiceIndex] )
+
+      self.builtVoices.append( voiceIndex )
+
+      # if we are rendering to a file, the recorder should hear this voice too
+      if self.recordGates is not None:
+         self.__connectRecordGate__( voiceIndex )
+
+      # let subclasses do their own set up of the new voice
+      self.__initializeVoice__( voiceIndex )
+
+      self.voicesReady[voiceIndex] = True   # other threads may use it now (see __getVoice__())
+
+
+   def __initializeVoice__(self, voice):
+      """
+      Called when a voice has just been built (see __buildVoice__()).  Subclasses may override this to set up
+      their voices further.
+      """
+
+      pass
+
+
+   def __getVoice__(self, voice):
+      """
+      Returns the player of this voice, building the voice first, if this is its first use.
+      """
+
+      if not self.voicesReady[voice]:   # not built yet (or being built right now)?
+
+         # voices are built under the voice lock, so that two threads (e.g., timer workers playing a chord) do not
+         # build the same voice twice - while building, the building thread finds the voice already there (it is
+         # added first), and others wait until it is ready
+         self.voiceLock.lock()
+         try:
+            if self.voices[voice] is None:   # still not built (i.e., another thread did not beat us to it)?
+               self.__buildVoice__(voice)
+         finally:
+            self.voiceLock.unlock()
+
+      return self.voices[voice]
+
+
+   def prewarmVoices(self, count):
+      """
+      Builds the first 'count' voices now (if not built already), so that they are ready when first played.
+      Otherwise, voices are built the first time they are used (this takes some time, e.g., while playing
+      a big chord for the first time).
+      """
+
+      for voice in range( min(count, self.maxVoices) ):
+         self.__getVoice__(voice)
+
+
+   def getBuiltVoices(self):
+      """
+      Returns how many voices have been built so far (i.e., the most voices used, plus any prewarmed).
+      """
+
+      return len(self.builtVoices)
+
+
+   def __connectRecorder__(self, recorderInput):
+      """
+      Connects this instrument to a (stereo) recorder, when rendering to a file (see Synthesizer.startOffline()).
+      The LineOuts have no outputs, so the recorder hears the panners instead, through a gate (a mixer input) per voice,
+      which is open only while the voice's LineOut is started (see __startVoice__() and __stopVoice__()).
+      """
+      from com.jsyn.unitgen import MixerMono
+
+      if self.recordGates is None:   # not connected already?
+
+         self.recordGates = [MixerMono(self.maxVoices), MixerMono(self.maxVoices)]   # left and right
+
+         for voice in self.builtVoices:   # (voices built later connect themselves)
+            self.__connectRecordGate__( voice )
+
+         for channel in range( 2 ):
+            self.recordGates[channel].amplitude.set( 1.0 )
+            self.recordGates[channel].output.connect( 0, recorderInput, channel )
+            self.synth.add( self.recordGates[channel] )
+
+
+   def __connectRecordGate__(self, voice):
+      """
+      Connects this voice's panners to its recorder gates (see __connectRecorder__()).
+      """
+
+      self.panLefts[voice].output.connect( 0, self.recordGates[0].input, voice )
+      self.panRights[voice].output.connect( 1, self.recordGates[1].input, voice )
+
+      # the voice starts stopped (the synthesizer has just been restarted, or the voice is just being created)
+      self.recordGates[0].gain.set( voice, 0.0 )
+      self.recordGates[1].gain.set( voice, 0.0 )
+
+
+   def __disconnectRecorder__(self):
+      """
+      Disconnects this instrument from the recorder (see __connectRecorder__()).
+      """
+
+      if self.recordGates is not None:
+
+         for voice in self.builtVoices:
+            self.recordGates[0].input.disconnect( voice, self.panLefts[voice].output, 0 )
+            self.recordGates[1].input.disconnect( voice, self.panRights[voice].output, 1 )
+
+         for gate in self.recordGates:
+            self.synth.remove( gate )
+
+         self.recordGates = None
+
+
+   def __startVoice__(self, voice, timeStamp=None):
+      """
+      Starts the voice's LineOut (and opens its recorder gate, if rendering to a file).  If a (synth) 'timeStamp'
+      is provided, the voice starts exactly at that time (otherwise, now).
+      """
+
+      self.__getVoice__(voice)   # (build it, if needed)
+
+      if timeStamp is None:
+         self.lineOuts[voice].start()
+      else:
+         self.lineOuts[voice].start( timeStamp )
+
+      if self.recordGates is not None:
+         self.__setRecordGate__( voice, 1.0, timeStamp )
+
+
+   def __stopVoice__(self, voice, timeStamp=None):
+      """
+      Stops the voice's LineOut (and closes its recorder gate, if rendering to a file).  If a (synth) 'timeStamp'
+      is provided, the voice stops exactly at that time (otherwise, now).
+      """
+
+      if self.voices[voice] is None:   # not built yet, so nothing to stop
+         return
+
+      if timeStamp is None:
+         self.lineOuts[voice].stop()
+      else:
+         self.lineOuts[voice].stop( timeStamp )
+
+      if self.recordGates is not None:
+         self.__setRecordGate__( voice, 0.0, timeStamp )
+
+
+   def __setRecordGate__(self, voice, gain, timeStamp=None):
+      """
+      Opens (gain 1.0) or closes (gain 0.0) the voice's recorder gate (at 'timeStamp', if provided).
+      """
+
+      for gate in self.recordGates:
+         if timeStamp is None:
+            gate.gain.set( voice, gain )
+         else:
+            gate.gain.set( voice, gain, timeStamp )
+
+
+   def pause(self, voice=0):
+      """
+      Pause playing corresponding sample.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         if self.paused[voice]:
+            print "This voice is already paused!"
+         else:
+            self.__stopVoice__(voice)     # pause playing
+            self.paused[voice] = True     # remember sample is paused
+
+
+   def resume(self, voice=0):
+      """
+      Resume playing the corresponding sample from the paused position.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         if not self.paused[voice]:
+            print "This voice is already playing!"
+
+         else:
+            self.__startVoice__(voice)     # resume playing
+            self.isPaused[voice] = False   # remember sample is NOT paused
+
+
+   def stop(self, voice=0, timeStamp=None):
+      """
+      Stop the specified voice.  If a (synth) 'timeStamp' is provided, the voice stops exactly at that time
+      (otherwise, now).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         self.__stopVoice__(voice, timeStamp)
+
+
+   def stopAll(self):
+      """
+      Stop all voices.
+      """
+
+      for voice in self.builtVoices:
+         self.__stopVoice__(voice)
+
+
+   def isPaused(self, voice=0):
+      """
+      Return True if the player is paused.  Returns None, if error.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         return self.isPaused[voice]
+
+
+   def getVolume(self, voice=0):
+      """
+      Return coresponding player's current volume (volume ranges from 0 - 127).  Returns None, if error.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         return self.volumes[voice]
+
+
+   def setVolume(self, volume, voice=0, delay=0.0002, timeStamp=None):
+      """
+      Set corresponding voice's volume (volume ranges from 0 - 127).  If a (synth) 'timeStamp' is provided,
+      the change happens exactly at that time (otherwise, now).
+      """
+
+      if volume < 0 or volume > 127:
+         print "Volume (" + str(volume) + ") should range from 0 to 127."
+      else:
+         if voice < 0 or voice >= self.maxVoices:
+
+            print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+         else:
+            self.volumes[voice] = volume                                  # remember new volume
+            amplitude = __volumeToAmplitude__(self.volumes[voice])         # map volume to amplitude
+            self.__getVoice__(voice).setAmplitude( amplitude, timeStamp )
+
+
+   def getPanning(self, voice=0):
+      """
+      Return voice's current panning (panning ranges from 0 - 127).  Returns None, if error.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         return self.pannings[voice]
+
+
+   def setPanning(self, panning, voice=0, timeStamp=None):
+      """
+      Set panning of a voice (panning ranges from 0 - 127).  If a (synth) 'timeStamp' is provided,
+      the change happens exactly at that time (otherwise, now).
+      """
+
+      if panning < 0 or panning > 127:
+         print "Panning (" + str(panning) + ") should range from 0 to 127."
+      else:
+
+         if voice < 0 or voice >= self.maxVoices:
+
+            print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+         else:
+
+            self.pannings[voice] = panning                       # remember it
+
+            panValue = __panningToPan__(panning)                 # map panning from 0,127 to -1.0,1.0
+
+            self.__getVoice__(voice)                             # (build it, if needed)
+
+            if timeStamp is None:
+               self.panLefts[voice].pan.set(panValue)               # and set it
+               self.panRights[voice].pan.set(panValue)
+            else:
+               self.panLefts[voice].pan.set(panValue, timeStamp)    # and set it, when specified
+               self.panRights[voice].pan.set(panValue, timeStamp)
+
+
+   def resetVoices(self):
+      """
+      Loop through all voices, stop them, and reset them to their defaults
+      """
+      for voice in self.builtVoices:   # (voices not built yet still have their defaults)
+         if self.playing(voice):
+            self.stop(voice)      # stop each playing voice
+
+         # proceed to reset defaults
+         self.paused[voice]            = False
+         self.voicesPitches[voice]     = self.defaultPitch
+         self.voicesFrequencies[voice] = self.defaultFrequency
+         self.pannings[voice]          = self.setPanning(63, voice)     # setPanning also resets self.panLefts[voice] and self.panRights[voice]
+         self.volumes[voice]           = self.setVolume(127, voice)     # setVolume also resets self.linearRamps[voice]
+
+   ### functions associated with allocating and deallocating a voice to play a specific pitch - done to simulating a polyhonic MIDI synthesizer ####
+
+   # NOTE: Here we are simulating a MIDI synthesizer, which is polyphonic, i.e., allows several pitches to sound simultaneously on a given channel.
+   # We accomplish this by utilizing the various voices now available within an AudioSample, by associating each sounding pitch with a single voice.
+   # Different pitches are associated with different voices.  We can reserve or allocate a voice to sound a specific pitch, and we can release that
+   # voice (presumably after the pitch has stopped sounding).  This allows us to easily play polyphonic Scores via Play.audio() - very useful / powerful!!!
+
+   ### Also see Play.audio()
+
+   def allocateVoiceForPitch(self, pitch):
+      """
+      If pitch is currently sounding, it returns the voice that plays this pitch.
+      If pitch is NOT currently sounding, it returns the next available free voice,
+      and allocates as associated with this pitch.
+      Returns None, if pitch is NOT sounding, and all voices / players are occupied
+      (unless voice stealing is on - see setVoiceStealing()).
+      """
+
+      return self.__allocateVoice__(pitch)[0]
+
+
+   def __allocateVoice__(self, pitch):
+      """
+      As allocateVoiceForPitch(), but returns (voice, allocation), i.e., also the allocation number of the voice
+      (see getVoiceAllocation()), read together with the voice, so that no other thread can take it in between.
+      Returns (None, None), if no voice was allocated.
+      """
+
+      pitchKey = self.__getPitchKey__(pitch)
+
+      self.voiceLock.lock()
+      try:
+         # is pitch currently sounding?
+         voiceForThisPitch = self.pitchSounding.get(pitchKey)
+
+         if voiceForThisPitch is None:   # pitch does not have a voice already allocated, so...
+
+            if self.freeVoices:   # is there a free voice?
+               voiceForThisPitch = self.freeVoices.pop()             # yes, so take it
+            else:
+               voiceForThisPitch = self.__stealVoice__()             # no, so take one from another pitch (if allowed)
+
+            # if we got a voice...
+            if voiceForThisPitch is not None:
+
+               self.pitchSounding[pitchKey] = voiceForThisPitch      # and allocate it!
+               self.voicePitchKeys[voiceForThisPitch] = pitchKey
+
+         # now, return voice for this pitch (it could be None, if pitch is not sounding and no free voices exist!)
+         if voiceForThisPitch is None:
+            return (None, None)
+
+         # remember which note has the voice now (the same pitch played again takes over its voice, too)
+         self.allocationCount = self.allocationCount + 1
+         self.voiceAllocations[voiceForThisPitch] = self.allocationCount
+
+         return (voiceForThisPitch, self.allocationCount)
+
+      finally:
+         self.voiceLock.unlock()
+
+
+   def deallocateVoiceForPitch(self, pitch, allocation = None):
+      """
+      It assumes this pitch is currently sounding, and frees the voice that plays this pitch.
+      If 'allocation' is provided (see getVoiceAllocation()), the voice is freed only if it has not been
+      given to another note since (i.e., the same pitch played again, or voice stealing).
+      """
+
+      pitchKey = self.__getPitchKey__(pitch)
+
+      self.voiceLock.lock()
+      try:
+         # is pitch currently sounding?
+         voice = self.pitchSounding.get(pitchKey)
+
+         if voice is None:   # pitch is not currently sounding, so...
+
+            if allocation is None:   # (otherwise, its voice was stolen, which is fine)
+               print "But pitch", pitch, "is currently not sounding!!!"
+
+         elif allocation is None or allocation == self.voiceAllocations[voice]:   # still this note's voice?
+
+            del self.pitchSounding[pitchKey]   # deallocate voice for this pitch
+            self.voicePitchKeys[voice] = None
+            self.freeVoices.append(voice)      # and make it the next free voice
+
+      finally:
+         self.voiceLock.unlock()
+
+
+   def getNextFreeVoice(self):
+      """
+      Return the next available voice, i.e., a player that is not currently playing.
+      Returns None, if all voices / players are occupied.
+      """
+
+      self.voiceLock.lock()
+      try:
+         if self.freeVoices:   # are there some free voices
+            freeVoice = self.freeVoices[-1]
+         else:
+            freeVoice = None
+      finally:
+         self.voiceLock.unlock()
+
+      return freeVoice
+
+
+   def getVoiceAllocation(self, voice):
+      """
+      Returns the allocation number of the note currently playing on this voice (it changes every time the voice
+      is allocated, so scheduled events can check that the voice is still theirs - see Play.audio()).
+      """
+
+      return self.voiceAllocations[voice]
+
+
+   def setVoiceStealing(self, policy):
+      """
+      Sets what happens when a new pitch needs a voice, and all voices are busy.  With VOICE_STEALING_SAME_PITCH (the default),
+      voices are shared only by the same pitch played again, so the new pitch gets no voice.  With VOICE_STEALING_OLDEST,
+      it takes the voice of the note allocated the longest time ago, and with VOICE_STEALING_QUIETEST, the voice with the
+      lowest volume (e.g., a note fading out).  A stolen note's remaining envelope and stop events (from Play.audio()) are
+      skipped - they are queued on the synthesizer only shortly before they are due (see Play.setAudioLookahead()).
+      """
+
+      if policy not in [VOICE_STEALING_SAME_PITCH, VOICE_STEALING_OLDEST, VOICE_STEALING_QUIETEST]:
+         raise ValueError("Voice stealing policy (" + str(policy) + ") should be VOICE_STEALING_SAME_PITCH, VOICE_STEALING_OLDEST, or VOICE_STEALING_QUIETEST.")
+
+      self.voiceStealing = policy
+
+
+   def getVoiceStealing(self):
+      """
+      Returns what happens when a new pitch needs a voice, and all voices are busy (see setVoiceStealing()).
+      """
+
+      return self.voiceStealing
+
+
+   def __stealVoice__(self):
+      """
+      Takes a busy voice away from its pitch (according to the voice stealing policy), and returns it.
+      Returns None, if voices may not be stolen.  (Only called when all voices are busy, so we may look at them all.)
+      """
+
+      self.voiceLock.lock()   # (already held by __allocateVoice__() - the lock is reentrant)
+      try:
+         if self.voiceStealing == VOICE_STEALING_OLDEST:
+            voices = [(self.voiceAllocations[voice], voice) for voice in range(self.maxVoices)]
+         elif self.voiceStealing == VOICE_STEALING_QUIETEST:
+            voices = [(self.volumes[voice], self.voiceAllocations[voice], voice) for voice in range(self.maxVoices)]   # oldest, if equally quiet
+         else:
+            return None
+
+         voice = min(voices)[-1]
+
+         del self.pitchSounding[self.voicePitchKeys[voice]]   # its pitch is no longer sounding
+         self.voicePitchKeys[voice] = None
+
+         return voice
+
+      finally:
+         self.voiceLock.unlock()
+
+
+   def __getPitchKey__(self, pitch):
+      """
+      Returns the key for this pitch (a MIDI pitch, 0-127, or a frequency, in Hz) in pitchSounding, i.e., the pitch in cents
+      (a MIDI pitch times 100), so that frequencies differing only by rounding errors share a key.
+      """
+
+      if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
+         pitchKey = pitch * 100
+
+      elif type(pitch) == float and pitch > 0.0:          # a frequency (a float, in Hz)?
+         pitchKey = int(round(log(pitch / 440.0, 2.0) * 1200.0)) + 6900
+
+      else:
+         raise TypeError("Pitch (" + str(pitch) + ") should be an int (range 0 and 127) or float (such as 440.0).")
+
+      return pitchKey
+
+
+   # Calculate frequency in Hertz based on MIDI pitch. Middle C is 60.0. You
+   # can use fractional pitches so 60.5 would give you a pitch half way
+   # between C and C#.  (by Phil Burk (C) 2009 Mobileer Inc)
+   def __convertPitchToFrequency__(self, pitch):
+      """
+      Convert MIDI pitch to frequency in Hertz.
+      """
+
+      concertA = 440.0
+      return concertA * 2.0 ** ((pitch - 69) / 12.0)
+
+   def __convertFrequencyToPitch__(self, freq):
+      """
+      Converts pitch frequency (in Hertz) to MIDI pitch.
+      """
+
+      concertA = 440.0
+      return log(freq / concertA, 2.0) * 12.0 + 69
+
+   # following conversions between frequencies and semitones based on code
+   # by J.R. de Pijper, IPO, Eindhoven
+   # see http://users.utu.fi/jyrtuoma/speech/semitone.html
+   def __getSemitonesBetweenFrequencies__(self, freq1, freq2):
+      """
+      Calculate number of semitones between two frequencies.
+      """
+
+      semitones = (12.0 / log(2)) * log(freq2 / freq1)
+      return int(semitones)
+
+   def __getFrequencyChangeBySemitones__(self, freq, semitones):
+      """
+      Calculates frequency change, given change in semitones, from a frequency.
+      """
+
+      freqChange = (exp(semitones * log(2) / 12) * freq) - freq
+      return freqChange
+
+
+class SampleInstrument(AudioInstrument):
+   """
+   This class encapsulates shared functionality between AudioSample and LiveSample. It also possesses
+   two inner classes that are passed to the super constructor depending on mono or stereo output.
+   """
+
+   def __init__(self, channels, samplePitch, voices, volume, voiceClass, *voiceClassArgs):
+      # SampleInstrument.__init__(self, channels, samplePitch, voices, voiceClass, *voiceClassArgs)
+      # define locally used variables
+      self.samplePitch   = samplePitch               # remember the reference pitch from the constructor
+      self.sampleFrequency = None                        # Set reference frequency to None. This will be appropriately reassigned later
+
+      # check if the reference is a midi pitch (int) or a frequency (float)
+      # If the reference is neither an int or a float, this is an error. Catch this error in the else block
+      if (type(samplePitch) == int) and (0 <= samplePitch <= 127):         # is reference pitch in MIDI (an int)?
+         self.sampleFrequency = self.__convertPitchToFrequency__(samplePitch)   # convert the MIDI pitch to a float frequency for use in polyphony pipeline
+      elif type(samplePitch) == float:                                  # if reference pitch a frequency (a float, in Hz)?
+         self.sampleFrequency = samplePitch                                     # correctly assign the float frequency
+         self.samplePitch     = self.__convertFrequencyToPitch__(samplePitch)   # convert the float frequency to MIDI pitch, reassign referencePitch, use in the polyphony pipeline
+      else:
+         raise TypeError("Reference pitch (" + str(samplePitch) + ") should be an int (range 0 and 127) or float (such as 440.0).")
+
+
+      AudioInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)
+
+      # voices not built yet play the sample at its own pitch, too (see __initializeVoice__())
+      for voice in range(self.maxVoices):
+         if self.voices[voice] is None:
+            self.voicesPitches[voice] = self.samplePitch
+            self.voicesFrequencies[voice] = self.sampleFrequency
+
+
+   def __initializeVoice__(self, voice):
+      """
+      Sets up a voice that has just been built to play the sample at its own pitch.
+      """
+
+      # ensure the sample is playing at correct pitch by syncing its playback rate and the synth framerate
+      self.voices[voice].__syncFramerate__( self.synthesizer.getFrameRate() )
+
+      # overwrite voice pitch and frequency lists with samplePitch NOT default pitch
+      self.voicesPitches[voice] = self.samplePitch
+      self.voicesFrequencies[voice] = self.sampleFrequency
+
+      # initialze to correct frequency
+      self.setFrequency(self.sampleFrequency, voice)
+
+
+   def play(self, voice=0, start=0, size=-1):
+      """
+      Play the corresponding sample once from the millisecond 'start' until the millisecond 'start'+'size'
+      (size == -1 means to the end). If 'start' and 'size' are omitted, play the complete sample.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+         # for faster response, we restart playing (as opposed to queue at the end)
+         if self.isPlaying(voice):      # is another play is on?
+            self.stop(voice)            # yes, so stop it
+
+         self.loop(voice, 1, start, size)
+
+
+   def loop(self, voice=0, times = -1, start=0, size=-1):
+      """
+      Repeat the corresponding sample indefinitely (times = -1), or the specified number of times
+      from millisecond 'start' until millisecond 'start'+'size' (size == -1 means to the end).
+      If 'start' and 'size' are omitted, repeat the complete sample.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         startFrames = self.__msToFrames__(start)
+         sizeFrames = self.__msToFrames__(size)
+
+         # should this be here?  ***
+         self.__startVoice__(voice)
+
+         if size == -1:    # to the end?
+            sizeFrames = self.sample.getNumFrames() - startFrames  # calculate number of frames to the end
+
+         if times == -1:   # loop forever?
+            self.__getVoice__(voice).samplePlayer.dataQueue.queueLoop( self.sample, startFrames, sizeFrames )
+
+         else:             # loop specified number of times
+            self.__getVoice__(voice).samplePlayer.dataQueue.queueLoop( self.sample, startFrames, sizeFrames, times-1 )
+
+
+   def stop(self, voice=0):
+      """
+      Stop playing the corresponding sample any further and restart it from the beginning.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         if self.voices[voice] is not None:   # (a voice not built yet is not playing)
+            self.__getVoice__(voice).samplePlayer.dataQueue.clear()
+         self.paused[voice] = False  # remember this voice is NOT paused
+
+
+   def isPlaying(self, voice=0):
+      """
+      Returns True if the corresponding sample is still playing.  In case of error, returns None.
+      """
+
+      print not self.paused[voice]
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      elif self.voices[voice] is None:   # a voice not built yet is not playing
+
+         return False
+
+      else:
+
+         return self.__getVoice__(voice).samplePlayer.dataQueue.hasMore()
+
+
+   def getFrequency(self, voice=0):
+      """
+      Return sample's playback frequency.  Returns None if error.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         return self.voicesFrequencies[voice]
+
+
+   def setFrequency(self, freq, voice=0):
+      """
+      Set sample's playback frequency.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         #self.voices[voice].setFrequency( freq )
+         rateChangeFactor = float(freq) / self.voicesFrequencies[voice]                         # calculate change on playback rate
+         self.voicesFrequencies[voice] = freq                                                   # remember new frequency
+         self.voicesPitches[voice]     = self.__convertFrequencyToPitch__(freq)                 # and corresponding pitch
+
+         self.__getVoice__(voice).setFrequency( rateChangeFactor )
+
+
+   def getPitch(self, voice=0):
+      """
+      Return voice's current pitch (it may be different from the default pitch).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         return self.voicesPitches[voice]
+
+
+   def setPitch(self, pitch, voice=0):
+      """
+      Set voice's playback pitch.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+         self.setFrequency(self.__convertPitchToFrequency__(pitch), voice)   # update playback frequency (this changes the playback rate)
+
+
+   def __setPlaybackRate__(self, newRate, voice=0):
+      """
+      Set the corresponding sample's playback rate (e.g., 44100.0 Hz).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         self.__getVoice__(voice).rate.set( newRate )
+
+
+   def __getPlaybackRate__(self, voice=0):
+      """
+      Return the corresponding sample's playback rate (e.g., 44100.0 Hz).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+
+         return self.__getVoice__(voice).rate.get()
+
+
+   def __msToFrames__(self, milliseconds):
+      """
+      Converts milliseconds to frames based on the frame rate of the sample
+      """
+
+      return int(self.sample.getFrameRate() * (milliseconds / 1000.0))
+
+
+
+class LiveSample(SampleInstrument):
+   """
+   Encapsulates a sound object created from live sound via the computer microphone (or line-in),
+   which can be played once, looped, paused, resumed, stopped, copied and erased.
+   The first parameter, maxSizeInSeconds, is the recording capacity (default is 30 secs).
+   The larger this value, the more memory the object occupies, so this needs to be handled carefully.
+   Finally, we can set/get its volume (0-127), panning (0-127), pitch (0-127), and frequency (in Hz).
+   """
+
+   def __init__(self, maxRecordingTime=30, samplePitch=A4, effects=[], voices=16, volume=127):
+      # import LiveSample specific classes. We need JSyn here because LiveSample needs access to
+      # audioDeviceManager. ChannelIn and LineIn allow input from a microphone. FixedRateMonoWriter
+      # and FixedRateStereoWriter allow recording from that input. FloatSample holds this recorded audio
+      from com.jsyn import JSyn
+      from com.jsyn.unitgen import ChannelIn, LineIn, FixedRateMonoWriter, FixedRateStereoWriter, VariableRateMonoReader, VariableRateStereoReader
+      from com.jsyn.data import FloatSample
+
+      voiceClass = self.Voice
+
+
+      self.maxRecordingTime        = maxRecordingTime
+      self.actualRecordingTime     = None  # initialize to None, not zero.
+      self.beginRecordingTimeStamp = None
+      self.endRecordingTimeStamp   = None
+      self.isRecording             = False
+
+      self.samplePitch             = samplePitch   # remember the pitch
+
+      self.sampleSize = maxRecordingTime * 1000 # convert seconds into milliseconds
+      maxLoopTime     = self.__msToFrames__( self.sampleSize, framerate )
+
+      # create time stamp variables
+      self.beginRecordingTimeStamp = None    # holds timestamp of when we start recording into the sample
+      self.endRecordingTimeStamp   = None    # holds timestamp of when we stop recording into the sample
+      self.isRecording             = False   # boolean flag that is only true when the sample is being written to
+      self.recordedSampleSize      = None    # holds overall length of time of the sample rounded to nearest int
+
+      self.sample = FloatSample( maxLoopTime, channels )   # holds recorded audio
+
+      channels = self.__getInputChannels__()   # get the number of input channels from the default input device
+
+      voiceClassArgs = []
+      voiceClassArgs.append(channels)
+      voiceClassArgs.append(samplePitch)
+      voiceClassArgs.append(effects)
+
+      # ensure mono or stereo audio input
+      if not (channels == 1 or channels == 2):    # not mono or stereo audio?
+         raise TypeError( "Can only record from mono or stereo input." )
+      else:
+         if channels == 2:    # stereo audio input?
+            # If input is stereo, we must use a LineIn. LineIn assumes stereo and we have stereo in this case.
+            self.lineIn = LineIn()                                    # create input line (stereo)
+            self.recorder = FixedRateStereoWriter()                   # captures incoming audio (stereo)
+            self.lineIn.output.connect( 0, self.recorder.input, 0 )   # connect line input to the sample writer (recorder)
+            self.lineIn.output.connect( 0, self.recorder.input, 1 )
+
+         elif channels == 1:  # mono audio input?
+            # If input is mono, we must use a single channelIn. LineIn assumes stereo. For simplicity, we still name the variable lineIn.
+            self.lineIn = ChannelIn()                                   # create input line (mono)
+            self.recorder = FixedRateMonoWriter()                       # captures incoming audio (mono)
+            self.lineIn.output.connect( 0, self.recorder.input, 0 )     # connect channel input to the sample writer (recorder)
+
+      # Now that LiveSample specific information has been set, initialize the Instrument
+      SampleInstrument.__init__( self, channels, samplePitch, voices, volume, voiceClass, *voiceClassArgs)
+
+      # add LiveSample specific data to the synthesizer
+      self.synth.add( self.lineIn )
+      self.synth.add( self.recorder )
+
+      # start the synth correctly
+      self.synthesizer.startSynth()
+
+      # remember that this Instrument has been created and is active (so that it can be stopped by JEM, if desired)
+      __ActiveAudioInstruments__[id(self)] = self
+
+
+   # LiveSample has it's own play function because we need to check if anything exists to play
+   def play(self, voice=0, start=0, size=-1):
+      """
+      Play the corresponding sample once from the millisecond 'start' until the millisecond 'start'+'size'
+      (size == -1 means to the end). If 'start' and 'size' are omitted, play the complete sample.
+      """
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+         if self.recordedSampleSize == None:
+            print "Sample is empty!  You need to record before you can play."
+         else:
+            # for faster response, we restart playing (as opposed to queue at the end)
+            if self.isPlaying(voice):      # is the sample already playing?
+               self.stop(voice)            # yes, so stop it
+
+            self.loop(voice, 1, start, size)
+
+   # LiveSample has a specific loop function because it requires more error checking than other audio sources.
+   # LiveSample must be sure all durations and framerates are acceptable before looping can be successful.
+   def loop(self, voice=0, times = -1, start=0, size=-1):
+      """
+      Repeat the corresponding sample indefinitely (times = -1), or the specified number of times
+      from millisecond 'start' until millisecond 'start'+'size' (size == -1 means to the end).
+      If 'start' and 'size' are omitted, repeat the complete sample.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+         if self.recordedSampleSize == None: # is the sample currently empty?
+            print "Sample is empty!  You need to record before you can loop."
+            return -1
+
+         sampleTotalDuration = (self.recordedSampleSize / self.synth.getFrameRate()) * 1000 # total time of sample in milliseconds
+
+         # is specified start time within the total duration of sample?
+         if start < 0 or start > sampleTotalDuration:
+            print "Start time provided (" + str(start) + ") should be between 0 and sample duration (" + str(sampleTotalDuration) + ")."
+            return -1
+
+         # does the size specified exceed the total duration of the sample or is size an invalid value?
+         if size == 0 or start + size > sampleTotalDuration:
+            print "Size (" + str(size) + ") exceeds total sample duration (" + str(sampleTotalDuration) + "), given start ("+ str(start) + ")."
+            return -1
+
+         # was the size specified less than the lowest value allowed?
+         if size <= -1:
+            size = self.recordedSampleSize # play to the end of the sample
+         else:
+            size = (size/1000) * self.framerate # convert milliseconds into frames
+            start = (start/1000) * self.framerate
+
+         # loop the sample continuously?
+         if times == -1:
+            self.__getVoice__(voice).samplePlayer.dataQueue.queueLoop(self.sample, start, size)
+
+         if times == 0:
+            print "But, don't you want to play the sample at least once?"
+            return -1
+
+         else:
+            # Subtract 1 from number of times a sample should be looped.
+            # 'times' is the number of loops of the sample after the initial playing.
+            self.__getVoice__(voice).samplePlayer.dataQueue.queueLoop(self.sample, start, size, times - 1)
+
+         self.__startVoice__(voice)     # starts playing the voice
+
+
+   def startRecording(self):
+      """
+      Writes lineIn data to the sample data structure.
+      Gets a time stamp so that, when we stop, we may calculate the duration of the recording.
+      """
+
+      # make sure sample is empty
+      if self.recordedSampleSize != None:
+         print "Warning: cannot record over an existing sample.  Use erase() first, to clear it."
+
+      else:   # sample is empty, so it's OK to record
+         print "Recording..."
+
+         # make sure we are not already recording
+         if not self.isRecording:
+
+            # get timestamp of when we started recording,
+            # so, later, we can calculate duration of recording
+            self.beginRecordingTimeStamp = self.synth.createTimeStamp()
+
+            # start recording into the sample
+            # (self.recorder will update self.sample - the latter is passive, just a data holder)
+            self.recorder.dataQueue.queueOn( self.sample )    # connect the writer to the sample
+
+            self.recorder.start()                             # and write into it
+
+            self.isRecording = True  # remember that recording has started
+
+         else:   # otherwise, we are already recording, so let them know
+            print "But, you are already recording..."
+
+
+   def stopRecording(self):
+      """
+      Stops the writer from recording into the sample data structure.
+      Also, gets another time stamp so that, now, we may calculate the duration of the recording.
+      """
+
+      # make sure we are currently recording
+      if not self.isRecording:
+         print "But, you are not recording!"
+
+      else:
+         print "Stopped recording."
+
+         # stop writer from recording into the sample
+         self.recorder.dataQueue.queueOff( self.sample )
+         self.recorder.stop()
+
+         self.isRecording = False  # remember that recording has stopped
+
+         # now, let's calculate duration of recording
+
+         # get a new time stamp
+         self.endRecordingTimeStamp =  self.synth.createTimeStamp()
+
+         # calculate number of frames in the recorded sample
+         # (i.e., total duration in seconds x framerate)
+         startTime = self.beginRecordingTimeStamp.getTime()  # get start time
+         endTime = self.endRecordingTimeStamp.getTime()      # get end time
+         recordingTime = endTime - startTime                 # recording duration (in seconds)
+
+         # if we have recorded more than we can store, then we will truncate
+         # (that's the least painful solution...)
+         recordingCapacity = self.sampleSize / 1000   # convert to seconds
+         if recordingTime > recordingCapacity:
+
+         # let them know
+            exceededSeconds = recordingTime-recordingCapacity  # calculate overun
+            print "Warning: Recording too long (by", round(exceededSeconds, 2), " secs)... truncating!"
+
+                # truncate extra recording (by setting sample duration to max recording capacity)
+            sampleDuration = self.sampleSize / 1000
+         else:
+            # sample duration is within the recording capacity
+            sampleDuration = recordingTime
+
+         framerate = self.synth.getFrameRate()
+         # let's remember duration of recording (convert to frames - an integer)
+         self.recordedSampleSize = int(framerate * sampleDuration)
+
+
+   # erase makes use of both self.recorder and self.sample and self.referencePitch. We will need these.
+   def erase(self):
+      """
+      Erases all contents of the LiveSample.
+      """
+
+      # is sample currently recording?
+      if self.isRecording:
+         print "Cannot erase while recording!"
+
+      self.resetVoices()   # reset all voices to their defaults
+
+      # Now that individual voices have been stopped and reset, we can reset the source recorder by
+      # clearing the dataQueue. Now, recording of the sample will start at the beginning
+      self.recorder.dataQueue.clear()
+
+      # rewrite audio data within sample frame by frame (0.0 means empty frame - no sound)
+      for i in range(self.sample.getNumFrames()):
+         self.sample.writeDouble(i, 0.0)
+
+      # set sample size to empty
+      self.recordedSampleSize = None
+
+
+   def __getInputChannels__(self):
+      """
+      Creates a temportary synth to poll the audio card for input device information.
+      The number of input channels is necessary to determine which recording unit
+      we need to use.
+      """
+      temporarySynth      =   JSyn.createSynthesizer()
+      audioDeviceManager  = temporarySynth.getAudioDeviceManager()                  # create an audioDeviceManager to access import and output devices
+
+      inputPortID         = audioDeviceManager.getDefaultInputDeviceID()            # use default audio input
+      inputChannels       = audioDeviceManager.getMaxInputChannels( inputPortID )   # get the max number of channels for default input device
+
+      del audioDeviceManager
+      del temporarySynth
+
+      return inputChannels
+
+
+   def __msToFrames__(self, milliseconds, framerate):
+      """
+      Converts milliseconds to frames based on the frame rate of the sample
+      """
+      return int(framerate * (milliseconds / 1000.0))
+
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, channels, samplePitch=A4):
+         from com.jsyn.unitgen import VariableRateMonoReader, VariableRateStereoReader
+
+         SynthUnit.__init__(self, synth, channels)
+
+
+         if channels == 1:
+            self.samplePlayer = VariableRateMonoReader()
+            audioPipelineInput = self.inputs[0]
+            self.samplePlayer.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            self.samplePlayer = VariableRateStereoReader()
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.samplePlayer.output.connect(0, audioPipelineInputLeft, 0)
+            self.samplePlayer.output.connect(1, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+
+         self.setAmplitude(1.0)
+
+         # next, let's add all effects to audio pipeline
+         for unit in effects:
+            self.addUnit(unit, synth)
+
+         synth.add(self.samplePlayer)
+
+
+      def setFrequency(self, rateChangeFactor):
+         """
+         Changes the frequency/pitch of the sample.
+         """
+         self.samplePlayer.rate.set( rateChangeFactor )
+         #self.__setPlaybackRate__(self.__getPlaybackRate__() * rateChangeFactor)   # and set new playback rate
+
+
+      def __getPlaybackRate__(self):
+         """
+         Returns the current playback rate of the sample player.
+         """
+         return self.samplePlayer.rate.get()
+
+
+      def __setPlaybackRate__(self, newRate):
+         """
+         Changes frequency/pitch by changing the sample players' playback rate.
+         """
+         self.samplePlayer.rate.set( newRate )
+
+
+      def __syncFramerate__(self, framerate):
+         """
+         Sets the playback rate of the sample player to the framerate of the synth.
+         """
+         self.samplePlayer.rate.set( framerate )
+
+
+class AudioSample(SampleInstrument):
+   """
+   Encapsulates a sound object created from an external audio file, which can be played once,
+   looped, paused, resumed, and stopped.  Also, each sound has a MIDI pitch associated with it
+   (default is A4), so we can play different pitches with it (through pitch shifting).
+   The soud object allows for polyphony - the default is 16 different voices, which can be played,
+   pitch-shifted, looped, etc. indepedently from each other.
+   Finally, we can set/get its volume (0-127), panning (0-127), pitch (0-127), and frequency (in Hz).
+   Ideally, an audio object will be created with a specific pitch in mind.
+   Supported data formats are WAV or AIF files (16, 24 and 32 bit PCM, and 32-bit float).
+   """
+
+   def __init__(self, filename, samplePitch=A4, effects=[], voices=16, volume=127):
+      # import AudioSample specific jSyn classes here. We need os to ensure a source
+      # file exists. SampleLoader retrieves the sample and stores it in FloatSample
+      import os
+      from com.jsyn.data import FloatSample
+      from com.jsyn.util import SampleLoader
+      from com.jsyn.unitgen import VariableRateMonoReader, VariableRateStereoReader
+
+      # do we have a file?
+      if not os.path.isfile(filename):
+         raise ValueError("File '" + str(filename) + "' does not exist.")
+
+      voiceClass = self.Voice
+
+      # load and create the audio sample
+      SampleLoader.setJavaSoundPreferred( False )             # use internal jSyn sound processes
+      datafile = File(filename)                               # get sound file
+      self.sample = SampleLoader.loadFloatSample( datafile )  # load it as a a jSyn sample
+      channels = self.sample.getChannelsPerFrame()            # get number of channels in sample (1 or 2)
+
+      voiceClassArgs = []
+      voiceClassArgs.append(channels)
+      voiceClassArgs.append(samplePitch)
+      voiceClassArgs.append(effects)
+
+      framerate = self.sample.getFrameRate()                  # get framerate from the SAMPLE, not the synthesizer
+
+      # call the super constructor with
+      SampleInstrument.__init__(self, channels, samplePitch, voices, volume, voiceClass, *voiceClassArgs)
+
+                  #def __init__(self, channels, samplePitch, voices, volume, voiceClass, *voiceClassArgs):
+
+      self.synthesizer.startSynth()
+
+      # also, the original audio sample uses the SAMPLE's framerate, not the synth's
+      # self.player.rate.set( self.sample.getFrameRate()
+
+      # remember that this Instrument has been created and is active (so that it can be stopped by JEM, if desired)
+      __ActiveAudioInstruments__[id(self)] = self
+
+
+   def play(self, voice=0, start=0, size=-1):
+      """
+      Play the corresponding sample once from the millisecond 'start' until the millisecond 'start'+'size'
+      (size == -1 means to the end). If 'start' and 'size' are omitted, play the complete sample.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         # for faster response, we restart playing (as opposed to queue at the end)
+         if self.isPlaying(voice):      # is another play is on?
+            self.stop(voice)            # yes, so stop it
+
+         self.loop(voice, 1, start, size)
+
+
+   def loop(self, voice=0, times = -1, start=0, size=-1, timeStamp=None):
+      """
+      Repeat the corresponding sample indefinitely (times = -1), or the specified number of times
+      from millisecond 'start' until millisecond 'start'+'size' (size == -1 means to the end).
+      If 'start' and 'size' are omitted, repeat the complete sample.  If a (synth) 'timeStamp' is provided,
+      the sample starts exactly at that time (otherwise, now).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         startFrames = self.__msToFrames__(start)
+         sizeFrames = self.__msToFrames__(size)
+
+         if size == -1:    # to the end?
+            sizeFrames = self.sample.getNumFrames() - startFrames  # calculate number of frames to the end
+
+         dataQueue = self.__getVoice__(voice).samplePlayer.dataQueue
+
+         if timeStamp is None:   # now?
+
+            if times == -1:   # loop forever?
+               dataQueue.queueLoop( self.sample, startFrames, sizeFrames )
+
+            else:             # loop specified number of times
+               dataQueue.queueLoop( self.sample, startFrames, sizeFrames, times-1 )
+
+         else:                   # at the specified (synth) time
+
+            if times == -1:   # loop forever?
+               dataQueue.queueLoop( self.sample, startFrames, sizeFrames, timeStamp )
+
+            else:             # loop specified number of times
+               dataQueue.queueLoop( self.sample, startFrames, sizeFrames, times-1, timeStamp )
+
+         self.__startVoice__(voice)     # (no sound until the sample is actually queued)
+
+
+   def isPlaying(self, voice=0):
+      """
+      Returns True if the corresponding sample is still playing.  In case of error, returns None.
+      """
+
+      print not self.paused[voice]
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      elif self.voices[voice] is None:   # a voice not built yet is not playing
+
+         return False
+
+      else:
+
+         return self.__getVoice__(voice).samplePlayer.dataQueue.hasMore()
+
+
+   def stop(self, voice=0, timeStamp=None):
+      """
+      Stop playing the corresponding sample any further and restart it from the beginning.
+      If a (synth) 'timeStamp' is provided, the sample stops exactly at that time (otherwise, now).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         if self.voices[voice] is not None:   # (a voice not built yet is not playing)
+            if timeStamp is None:
+               self.__getVoice__(voice).samplePlayer.dataQueue.clear()
+            else:
+               self.__getVoice__(voice).samplePlayer.dataQueue.clear(timeStamp)
+         self.paused[voice] = False  # remember this voice is NOT paused
+
+
+   def setFrequency(self, freq, voice=0, timeStamp=None):
+      """
+      Set sample's playback frequency.  If a (synth) 'timeStamp' is provided, the change happens
+      exactly at that time (otherwise, now).
+      """
+
+      if timeStamp is None:
+         SampleInstrument.setFrequency(self, freq, voice)
+
+      elif voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+
+      else:
+
+         # NOTE:  The current playback rate may not have taken effect yet (it may also be scheduled for later),
+         # so we calculate the new playback rate from the sample's frequency, as opposed to the current rate.
+         self.voicesFrequencies[voice] = freq                                      # remember new frequency
+         self.voicesPitches[voice]     = self.__convertFrequencyToPitch__(freq)    # and corresponding pitch
+
+         newRate = self.synthesizer.getFrameRate() * float(freq) / self.sampleFrequency
+         self.__getVoice__(voice).__setPlaybackRate__( newRate, timeStamp )
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, channels, samplePitch=A4, effects=[]):
+         from com.jsyn.unitgen import VariableRateMonoReader, VariableRateStereoReader
+
+
+         SynthUnit.__init__(self, synth, channels)
+
+
+         if channels == 1:
+            self.samplePlayer = VariableRateMonoReader()
+            audioPipelineInput = self.inputs[0]
+            self.samplePlayer.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            self.samplePlayer = VariableRateStereoReader()
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.samplePlayer.output.connect(0, audioPipelineInputLeft, 0)
+            self.samplePlayer.output.connect(1, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+
+         self.setAmplitude(1.0)
+
+         # next, let's add all effects to audio pipeline
+         for unit in effects:
+            self.addUnit(unit, synth)
+
+         synth.add(self.samplePlayer)
+
+
+      def setFrequency(self, rateChangeFactor):
+         """
+         Changes the frequency/pitch of the sample.
+         """
+         #self.samplePlayer.rate.set( rateChangeFactor )
+
+         self.__setPlaybackRate__(self.__getPlaybackRate__() * rateChangeFactor)   # and set new playback rate
+
+
+      def __getPlaybackRate__(self):
+         """
+         Returns the current playback rate of the sample player.
+         """
+         return self.samplePlayer.rate.get()
+
+
+      def __setPlaybackRate__(self, newRate, timeStamp=None):
+         """
+         Changes frequency/pitch by changing the sample players' playback rate (at 'timeStamp', if provided).
+         """
+         if timeStamp is None:
+            self.samplePlayer.rate.set( newRate )
+         else:
+            self.samplePlayer.rate.set( newRate, timeStamp )
+
+
+      def __syncFramerate__(self, framerate):
+         """
+         Sets the playback rate of the sample player to the framerate of the synth.
+         """
+         self.samplePlayer.rate.set( framerate )
+
+
+
+################################################################
+### Wave Instruments ###
+
+class WaveInstrument(AudioInstrument):
+   """
+   Encapsulates shared behavior of all oscillating instruments.
+   """
+
+   def __init__(self, channels, voices, volume, voiceClass, *voiceClassArgs):
+      """
+      Initialize the needed arguments for the super constructor and call it.
+      """
+      # build basic infrastructure for voices
+      AudioInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)
+
+
+   def start(self, voice=0, timeStamp=None):
+      """
+      Begin playing the specified voice.  If a (synth) 'timeStamp' is provided, the voice starts exactly
+      at that time (otherwise, now).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         self.__startVoice__(voice, timeStamp)
+
+
+   def loop(self, voice=0, timeStamp=None):
+      """
+      Calls the start() function because oscillators do not require looping.
+      """
+
+      self.start(voice, timeStamp)
+
+
+   def getFrequency(self, frequency, voice=0):
+      """
+      Returns the frequency of the specified voice. Returns None if invalid voice is given.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         return self.voicesFrequencies[voice]
+
+
+   def setFrequency(self, frequency, voice=0, timeStamp=None):
+      """
+      Changes the frequency (i.e., pitch) of the specified voice.  If a (synth) 'timeStamp' is provided,
+      the change happens exactly at that time (otherwise, now).
+      """
+
+      self.__getVoice__(voice).setFrequency( frequency, timeStamp )                   # set frequency of this voice
+      self.voicesFrequencies[voice] = frequency
+      self.voicesPitches[voice] = self.__convertFrequencyToPitch__( frequency ) # also adjust pitch accordingly (since they are coupled)
+
+
+   def isPlaying(self, voice=0):
+      """
+      Returns true if voice is playing. Returns None otherwise.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      elif self.voices[voice] is None:   # a voice not built yet is not playing
+         return False
+
+      else:
+         return self.__getVoice__(voice).playing
+
+
+class SinewaveInstrument(WaveInstrument):
+   """
+   Encapsulates an oscillating sine wave.
+   """
+   def __init__(self, frequency=440.0, volume=127, effects=[], voices=16, envelope=None):
+
+
+      if volume < 0 or volume > 127:
+         print "Volume (" + str(volume) + ") should range from 0 to 127."
+      else:
+
+         if envelope == None:
+            self.envelope = Envelope([20],[1.0], 5, 0.8, 15)
+         else:
+            self.envelope = envelope
+
+         voiceClass = self.Voice
+
+         channels = 1
+
+         voiceClassArgs = []
+         voiceClassArgs.append( frequency )
+         voiceClassArgs.append( volume )
+         voiceClassArgs.append( effects )
+         voiceClassArgs.append( channels )
+
+         WaveInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)   # call super constructor
+         self.synthesizer.startSynth()
+
+         # remember that this Instrument has been created and is active (so that it can be stopped by JEM, if desired)
+         __ActiveAudioInstruments__[id(self)] = self
+
+   def getEnvelope(self):
+      """
+      Returns the instruments current envelope.
+      """
+      return self.envelope
+
+   def setEnvelope(self, envelope):
+      """
+      Sets a new envelope for this instrument.
+      """
+      # do we need sanity checking here for valid envelopes?
+      self.envelope = envelope
+
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, frequency, volume, effects, channels):
+         from com.jsyn.unitgen import SineOscillator
+
+         SynthUnit.__init__(self, synth, channels)
+
+         for unit in effects:
+            self.addUnit(unit, synth)
+
+         amplitude = __volumeToAmplitude__(volume)
+         self.oscillator = SineOscillator()
+         self.setFrequency( frequency )
+
+         if channels == 1:
+            audioPipelineInput = self.inputs[0]
+            self.oscillator.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.oscillator.output.connect(0, audioPipelineInputLeft, 0)
+            self.oscillator.output.connect(0, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+         self.oscillator.amplitude.set( amplitude )   # preserve max volume of this instrument
+         self.setAmplitude(1.0)
+
+         synth.add(self.oscillator)
+
+
+      def setFrequency(self, frequency, timeStamp=None):
+         """
+         Changes the frequency (i.e., pitch) of the specified voice (at 'timeStamp', if provided).
+         """
+         if timeStamp is None:
+            self.oscillator.frequency.set( frequency )
+         else:
+            self.oscillator.frequency.set( frequency, timeStamp )
+
+      def getFrequency(self):
+         """
+         Returns the current frequency of the oscillator as a float.
+         """
+         return self.oscillator.frequency.get()
+
+
+class SquarewaveInstrument(WaveInstrument):
+   """
+   Encapsulates an oscillating square wave. Defaults to a frequency of 440.0 (A4).
+   """
+   from com.jsyn.unitgen import SquareOscillator
+
+   def __init__(self, frequency=440.0, volume=127, effects=[], voices=16, envelope=None):
+
+      if volume < 0 or volume > 127:
+         print "Volume (" + str(volume) + ") should range from 0 to 127."
+      else:
+
+         if envelope == None:
+            self.envelope = Envelope([20],[1.0], 5, 0.8, 15)
+         else:
+            self.envelope = envelope
+
+         voiceClass = self.Voice   # class to create each voice
+
+         channels = 1
+
+         voiceClassArgs = []
+         voiceClassArgs.append(frequency)
+         voiceClassArgs.append(volume)
+         voiceClassArgs.append(effects)
+         voiceClassArgs.append(channels)
+
+         WaveInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)
+
+         self.synthesizer.startSynth()
+
+         # remember that this Instrument has been created and is active (so that it can be stopped by JEM, if desired)
+         __ActiveAudioInstruments__[id(self)] = self
+
+   def getEnvelope(self):
+      """
+      Returns the instruments current envelope.
+      """
+      return self.envelope
+
+   def setEnvelope(self, envelope):
+      """
+      Sets a new envelope for this instrument.
+      """
+      # do we need sanity checking here for valid envelopes?
+      self.envelope = envelope
+
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, frequency, volume, effects, channels):
+         from com.jsyn.unitgen import SquareOscillator
+
+         SynthUnit.__init__(self, synth, channels)
+
+         amplitude = __volumeToAmplitude__(volume)
+         self.amplitude  = amplitude
+         self.oscillator = SquareOscillator()
+         self.setFrequency(frequency)
+
+         if channels == 1:
+            audioPipelineInput = self.inputs[0]
+            self.oscillator.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.oscillator.output.connect(0, audioPipelineInputLeft, 0)
+            self.oscillator.output.connect(0, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+         self.oscillator.amplitude.set( amplitude )   # preserve max volume of this instrument
+         self.setAmplitude(1.0)
+
+         synth.add(self.oscillator)
+
+
+      def setFrequency(self, frequency, timeStamp=None):
+         """
+         Changes the frequency (i.e., pitch) of the specified voice (at 'timeStamp', if provided).
+         """
+         if timeStamp is None:
+            self.oscillator.frequency.set( frequency )
+         else:
+            self.oscillator.frequency.set( frequency, timeStamp )
+
+      def getFrequency(self):
+         """
+         Returns the current frequency of the oscillator as a float.
+         """
+         return self.oscillator.frequency.get()
+
+
+class TrianglewaveInstrument(WaveInstrument):
+   """
+   Encapsulates an oscillating triangle wave. Defaults to a frequency of 440.0 (A4).
+   """
+
+   from com.jsyn.unitgen import TriangleOscillator
+
+   def __init__(self, frequency=440.0, volume=127, effects=[], voices=16, envelope=None):
+
+      if volume < 0 or volume > 127:
+         print "Volume (" + str(volume) + ") should range from 0 to 127."
+      else:
+         if envelope == None:
+            self.envelope = Envelope([20],[1.0], 5, 0.8, 15)
+         else:
+            self.envelope = envelope
+
+         voiceClass = self.Voice   # class to create each voice
+         channels = 1
+
+         voiceClassArgs = []
+         voiceClassArgs.append(frequency)
+         voiceClassArgs.append(volume)
+         voiceClassArgs.append(effects)
+         voiceClassArgs.append(channels)
+
+         WaveInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)
+
+         self.synthesizer.startSynth()
+
+         # remember that this Instrument has been created and is active (so that it can be stopped by JEM, if desired)
+         __ActiveAudioInstruments__[id(self)] = self
+
+   def getEnvelope(self):
+      """
+      Returns the instruments current envelope.
+      """
+      return self.envelope
+
+   def setEnvelope(self, envelope):
+      """
+      Sets a new envelope for this instrument.
+      """
+      # do we need sanity checking here for valid envelopes?
+      self.envelope = envelope
+
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, frequency, volume, effects, channels):
+         from com.jsyn.unitgen import TriangleOscillator
+
+         SynthUnit.__init__(self, synth, channels)
+
+         amplitude = __volumeToAmplitude__(volume)
+         self.amplitude  = amplitude
+         self.oscillator = TriangleOscillator()
+         self.setFrequency( frequency )
+
+
+         if channels == 1:
+            audioPipelineInput = self.inputs[0]
+            self.oscillator.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.oscillator.output.connect(0, audioPipelineInputLeft, 0)
+            self.oscillator.output.connect(0, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+         self.oscillator.amplitude.set( amplitude )   # preserve max volume of this instrument
+         self.setAmplitude(1.0)
+
+         synth.add(self.oscillator)
+
+
+      def setFrequency(self, frequency, timeStamp=None):
+         """
+         Changes the frequency (i.e., pitch) of the specified voice (at 'timeStamp', if provided).
+         """
+         if timeStamp is None:
+            self.oscillator.frequency.set( frequency )
+         else:
+            self.oscillator.frequency.set( frequency, timeStamp )
+
+      def getFrequency(self):
+         """
+         Returns the current frequency of the oscillator as a float.
+         """
+         return self.oscillator.frequency.get()
+
+
+### FM Synthesis Instrument ###
+
+class FMSynthesisInstrument(WaveInstrument):
+   """
+   Encapsulates a frequency modulated sinewave.
+   The frequency of the *carrier* wave, equals centerFrequency/timbreQuality.
+   Using a ratio like this preserves the timbre of the instrument you have just
+   created.
+   """
+   def __init__(self, frequency, timbreRatio, volume=127, voices=16, envelope=None):
+      """
+      Specify the class needed to play the voice, then call the super constructor. Lastly, start the synth.
+      """
+      from com.jsyn import JSyn
+
+      if volume < 0 or volume > 127:
+         print "Volume (" + str(volume) + ") should range from 0 to 127."
+      else:
+
+         if envelope == None:
+            self.envelope = Envelope([20],[1.0], 5, 0.8, 15)
+         else:
+            self.envelope = envelope
+
+
+         voiceClass = self.Voice   # class to create each voice
+
+         channels = 1   # oscillators have one output channel
+
+         voiceClassArgs = []                  # create empty list to hold parameters
+         voiceClassArgs.append(frequency)     # append each parameter to the list
+         voiceClassArgs.append(timbreRatio)
+         voiceClassArgs.append(volume)
+         voiceClassArgs.append(channels)
+
+         WaveInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)   # call super constructor
+
+         self.synthesizer.startSynth()
+
+         # add this instrument to the global list for external tracking by JEM
+         __ActiveAudioInstruments__[id(self)] = self
+
+
+   def getEnvelope(self):
+      """
+      Returns the instruments current envelope.
+      """
+      return self.envelope
+
+
+   def setEnvelope(self, envelope):
+      """
+      Sets a new envelope for this instrument.
+      """
+      # do we need sanity checking here for valid envelopes?
+      self.envelope = envelope
+
+
+   class Voice(SynthUnit):
+      """
+      Extending SynthUnit provides access to the amplitude attribute - needed by all players.
+      """
+
+      def __init__(self, synth, frequency, timbreRatio, volume, channels):
+         """
+         This constructor establishes a pattern for instrument creation.
+            1. Call the super constructor
+            2. Define a `createInstrument` method that does the heavy lifting
+            3. add self to synth
+         """
+         from com.jsyn.unitgen import SineOscillator, Multiply
+
+         # first, let's call superconstructor to create basic circuit (output port, and amplitude control)
+         SynthUnit.__init__(self, synth)
+
+         self.timbreRatio = timbreRatio
+         # now, create the specific instrument (i.e., build circuitry responsible for this timbre)
+
+         # we now have the necessary self.frequency and self.divisor
+         # so we get up the rest of what is needed for FMSynthesis
+
+         self.carrier    = SineOscillator()   # create carrier wave
+         self.modulator  = SineOscillator()   # create modulator wave
+         self.multiplier = Multiply()         # create multiplier linking carrier and modulator
+
+         self.modulator.output.connect( self.multiplier.inputA )        # connect modulator output to one of multiplier's inputs
+         self.multiplier.output.connect( self.carrier.frequency )       # connect multiplier's output to control carrier frequency
+
+
+         if channels == 1:
+            audioPipelineInput = self.inputs[0]
+            self.carrier.output.connect(0, audioPipelineInput, 0)
+         elif channels == 2:
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            self.carrier.output.connect(0, audioPipelineInputLeft, 0)
+            self.carrier.output.connect(0, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+
+         amplitude = __volumeToAmplitude__(volume)         # map volume (0-127) to amplitude (0.0-1.0)
+         self.carrier.amplitude.set(amplitude)             # set carrier amplitude to control max volume
+         #self.inputB.set(amplitude)
+         self.modulator.amplitude.set(1.0)                 # keep modulator amplitude at 1.0 to preserve timbre
+
+         # circuit is built, so set it's base frequency
+         self.setFrequency(frequency)
+
+
+         # add all units to synth (including self)
+         synth.add( self.carrier )
+         synth.add( self.modulator )
+         synth.add( self.multiplier )
+
+
+      def setFrequency(self, frequency, timeStamp=None):
+         if timeStamp is None:
+            self.modulator.frequency.set( frequency / self.timbreRatio )
+            #self.carrier.frequency.set( frequency )
+            self.multiplier.inputB.set( frequency )
+         else:
+            self.modulator.frequency.set( frequency / self.timbreRatio, timeStamp )
+            self.multiplier.inputB.set( frequency, timeStamp )
+
+      def getFrequency(self):
+         """
+         Returns the current frequency of the oscillator as a float.
+         """
+         return self.multiplier.inputB.get()
+
+
+class AdditiveInstrument(AudioInstrument):
+   """
+   Encapualtes an additive synthesis instrument. A list of instruments are provided and
+   one voice of each is instantiated. A paralell list of amplitudes corresponds to how much
+   that particular intrument affects the sound.
+
+   No middle layer is needed for AdditiveSynthesis. Thus, it extends directly from Instrument.
+   """
+
+   def __init__(self, instrumentList, volumesList, volume=127, voices=16):
+
+      channels = 1   # assume one input channels
+
+      voiceClass = self.Voice
+      voiceClassArgs = []
+      voiceClassArgs.append(volumesList)
+      voiceClassArgs.append(channels)
+      voiceClassArgs.append(volume)
+
+      self.instrumentList = instrumentList   # each voice is made of the same voice of these instruments (see __initializeVoice__())
+
+      AudioInstrument.__init__(self, channels, voices, volume, voiceClass, *voiceClassArgs)
+
+      self.synthesizer.startSynth()
+
+      __ActiveAudioInstruments__[id(self)] = self
+
+
+   def __initializeVoice__(self, voice):
+      """
+      Connects the same voice of each instrument (built now, if needed) to a voice that has just been built.
+      """
+
+      for instrument in self.instrumentList:
+         if voice < instrument.maxVoices:
+            self.voices[voice].initializeVoice( self.synth, instrument.__getVoice__(voice) )
+
+
+   def stopAll(self):
+      """
+      Allow each voice to control its own stop all.
+      """
+      for voice in self.builtVoices:
+         self.voices[voice].stopAll()
+
+   def start(self, voice=0, timeStamp=None):
+      """
+      Begin playing the specified voice.  If a (synth) 'timeStamp' is provided, the voice starts exactly
+      at that time (otherwise, now).
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         self.__startVoice__(voice, timeStamp)
+
+
+   def loop(self, voice=0, timeStamp=None):
+      """
+      Calls the start() function because oscillators do not require looping.
+      """
+
+      self.start(voice, timeStamp)
+
+
+   def getFrequency(self, frequency, voice=0):
+      """
+      Returns the frequency of the specified voice. Returns None if invalid voice is given.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      else:
+         return self.voicesFrequencies[voice]
+
+
+   def setFrequency(self, frequency, voice=0):
+      """
+      Changes the frequency (i.e., pitch) of the specified voice.
+      """
+
+      self.__getVoice__(voice).setFrequency( frequency )                              # set frequency of this voice
+      self.voicesFrequencies[voice] = frequency
+      self.voicesPitches[voice] = self.__convertFrequencyToPitch__( frequency ) # also adjust pitch accordingly (since they are coupled)
+
+
+   def isPlaying(self, voice=0):
+      """
+      Returns true if voice is playing. Returns None otherwise.
+      """
+
+      if voice < 0 or voice >= self.maxVoices:
+
+         print "Voice (" + str(voice) + ") should range from 0 to " + str(self.maxVoices) + "."
+         return None
+
+      elif self.voices[voice] is None:   # a voice not built yet is not playing
+         return False
+
+      else:
+         return self.__getVoice__(voice).playing
+
+
+   class Voice(SynthUnit):
+      def __init__(self, synth, volumesList, channels, volume=127):
+         """
+         The addititive synthesis voice is a compound voice consisting of one or more
+         sub voices. These sub voices are one instance of a voice for each instrument
+         in the instrument list.
+         """
+
+         self.subVoices = []
+         self.volumesList = volumesList   # do something with this later
+         self.channels = channels
+
+         SynthUnit.__init__(self, synth)   # intialize the synth unit so we have access to inputA and inputB.
+
+
+
+      def initializeVoice(self, synth, subvoice):
+         """
+         Take in a voice from the and connect it to self.inputA. This should only be
+         called once at creation time. Thus, it is safe to append to the components
+         list here.
+         """
+         self.subVoices.append( subvoice )        # append this subvoice to the list of subvoices
+
+         if self.channels == 1:
+            audioPipelineInput = self.inputs[0]
+            subvoice.outputs[0].connect(0, audioPipelineInput, 0)
+         elif self.channels == 2:
+            audioPipelineInputLeft  = self.inputs[0]
+            audioPipelineInputRight = self.inputs[1]
+            subvoice.outputs[0].connect(0, audioPipelineInputLeft, 0)
+            subvoice.outputs[1].connect(0, audioPipelineInputRight, 0)
+         else:
+            raise("Can only play mono or stereo samples.")
+
+      def setFrequency(self, frequency):
+         """
+         Loop through each component voice and change its frequency to the
+         desired frequency of the composite voice.
+         """
+
+         for subvoice in self.subVoices:
+            subvoice.setFrequency( frequency )
+
+      def stopAll(self):
+         """
+         Stops all sub voices.
+         """
+         for subvoice in self.subVoices:
+            subvoice.stop()
+
+
+
+######################################################################################
+# If running inside JEM, register function that stops everything, when the Stop button
+# is pressed inside JEM.
+######################################################################################
+
+# function to stop and clean-up all active AudioSamples
+def __stopActiveAudioInstruments__():
+
+   global __ActiveAudioInstruments__
+
+   # first, stop them
+   for a in __ActiveAudioInstruments__.values():
+      a.stopAll()         # no need to check if they are playing - just do it (it's fine)
+
+   Synthesizer.stopSynth()
+
+   # also empty list, so things can be garbage collected
+   __ActiveAudioInstruments__ = WeakValueDictionary()   # remove access to deleted items
+
+# now, register function with JEM (if possible)
+try:
+
+    # if we are inside JEM, registerStopFunction() will be available
+    registerStopFunction(__stopActiveAudioInstruments__)   # tell JEM which function to call when the Stop button is pressed
+
+except:  # otherwise (if we get an error), we are NOT inside JEM
+
+    pass    # so, do nothing.
+
+
+
+
+
+# preserve Jython bindings that get ovwerwritten by the previous Java imports - a hack!
+# (also see very top of music3/core.py)
+enumerate = enumerate_preserve
@@ -0,0 +1,1294 @@
+################################################################################################################
+# core.py       Version 4.31         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# jMusic constants and utilities, our own constants (e.g., MIDI_INSTRUMENTS, and more instrument
+# and percussion names), helper functions (e.g., mapValue(), mapScale(), valueMapper(), scaleMapper(), frange()), and the
+# jMusic extensions Mod, Read, Write, Note, and Phrase.
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+# preserve Jython bindings that get overwritten by the following Java imports - a hack!
+# (also see very bottom of this file)
+enumerate_preserve = enumerate
+
+
+# import jMusic constants and utilities
+from jm.JMC import *
+from jm.util import *
+
+from jm.music.tools import *
+
+from jm.gui.cpn import *
+from jm.gui.helper import *
+from jm.gui.histogram import *
+from jm.gui.show import *
+from jm.gui.wave import *
+
+from jm.audio.io import *
+from jm.audio.synth import *
+from jm.audio.Instrument import *
+
+from jm.constants.Alignments import *
+from jm.constants.Articulations import *
+from jm.constants.DrumMap import *
+from jm.constants.Durations import *
+from jm.constants.Dynamics import *
+from jm.constants.Frequencies import *
+from jm.constants.Instruments import *
+from jm.constants.Noises import *
+from jm.constants.Panning import *
+from jm.constants.Pitches import *
+from jm.constants.ProgramChanges import *
+from jm.constants.Durations import *
+from jm.constants.Scales import *
+from jm.constants.Tunings import *
+from jm.constants.Volumes import *
+from jm.constants.Waveforms import *
+
+
+######################################################################################
+# Jython 2.5.3 fix for input()
+# see http://python.6.n6.nabble.com/input-not-working-on-Windows-td4987455.html
+# also see fix at http://pydev.org/faq.html#PyDevFAQ-Whyrawinput%28%29%2Finput%28%29doesnotworkcorrectlyinPyDev%3F
+def input(prompt):
+   return eval( raw_input(prompt) )
+
+
+######################################################################################
+# redefine scales as Jython lists (as opposed to Java arrays - for cosmetic purposes)
+AEOLIAN_SCALE        = list(AEOLIAN_SCALE)
+BLUES_SCALE          = list(BLUES_SCALE)
+CHROMATIC_SCALE      = list(CHROMATIC_SCALE)
+DIATONIC_MINOR_SCALE = list(DIATONIC_MINOR_SCALE)
+DORIAN_SCALE         = list(DORIAN_SCALE)
+HARMONIC_MINOR_SCALE = list(HARMONIC_MINOR_SCALE)
+LYDIAN_SCALE         = list(LYDIAN_SCALE)
+MAJOR_SCALE          = list(MAJOR_SCALE)
+MELODIC_MINOR_SCALE  = list(MELODIC_MINOR_SCALE)
+MINOR_SCALE          = list(MINOR_SCALE)
+MIXOLYDIAN_SCALE     = list(MIXOLYDIAN_SCALE)
+NATURAL_MINOR_SCALE  = list(NATURAL_MINOR_SCALE)
+PENTATONIC_SCALE     = list(PENTATONIC_SCALE)
+
+
+######################################################################################
+# define text labels for MIDI instruments (index in list is same as MIDI instrument number)
+MIDI_INSTRUMENTS = [ # Piano Family
+                     "Acoustic Grand Piano", "Bright Acoustic Piano", "Electric Grand Piano",
+                    "Honky-tonk Piano", "Electric Piano 1 (Rhodes)", "Electric Piano 2 (DX)",
+                    "Harpsichord", "Clavinet",
+
+                    # Chromatic Percussion Family
+                    "Celesta", "Glockenspiel", "Music Box", "Vibraphone", "Marimba",
+                    "Xylophone", "Tubular Bells", "Dulcimer",
+
+                    # Organ Family
+                    "Drawbar Organ", "Percussive Organ", "Rock Organ", "Church Organ",
+                    "Reed Organ", "Accordion", "Harmonica", "Tango Accordion",
+
+                    # Guitar Family
+                    "Acoustic Guitar (nylon)", "Acoustic Guitar (steel)", "Electric Guitar (jazz)",
+                    "Electric Guitar (clean)", "Electric Guitar (muted)", "Overdriven Guitar",
+                    "Distortion Guitar", "Guitar harmonics",
+
+                    # Bass Family
+                    "Acoustic Bass", "Electric Bass (finger)", "Electric Bass (pick)", "Fretless Bass",
+                    "Slap Bass 1", "Slap Bass 2", "Synth Bass 1", "Synth Bass 2",
+
+                    # Strings and Timpani Family
+                    "Violin", "Viola", "Cello", "Contrabass", "Tremolo Strings", "Pizzicato Strings",
+                    "Orchestral Harp", "Timpani",
+
+                    # Ensemble Family
+                    "String Ensemble 1", "String Ensemble 2", "Synth Strings 1", "Synth Strings 2",
+                    "Choir Aahs", "Voice Oohs", "Synth Voice", "Orchestra Hit",
+
+                    # Brass Family
+                    "Trumpet", "Trombone", "Tuba", "Muted Trumpet", "French Horn",
+                    "Brass Section", "SynthBrass 1", "SynthBrass 2",
+
+                    # Reed Family
+                    "Soprano Sax", "Alto Sax", "Tenor Sax", "Baritone Sax", "Oboe", "English Horn",
+                    "Bassoon", "Clarinet",
+
+                    # Pipe Family
+                    "Piccolo", "Flute", "Recorder", "Pan Flute", "Blown Bottle", "Shakuhachi",
+                    "Whistle", "Ocarina",
+
+                    # Synth Lead Family
+                    "Lead 1 (square)", "Lead 2 (sawtooth)", "Lead 3 (calliope)",  "Lead 4 (chiff)",
+                    "Lead 5 (charang)", "Lead 6 (voice)", "Lead 7 (fifths)", "Lead 8 (bass + lead)",
+
+                    # Synth Pad Family
+                    "Pad 1 (new age)", "Pad 2 (warm)", "Pad 3 (polysynth)", "Pad 4 (choir)",
+                    "Pad 5 (bowed)", "Pad 6 (metallic)", "Pad 7 (halo)", "Pad 8 (sweep)",
+
+                    # Synth Effects Family
+                    "FX 1 (rain)", "FX 2 (soundtrack)", "FX 3 (crystal)", "FX 4 (atmosphere)",
+                    "FX 5 (brightness)", "FX 6 (goblins)", "FX 7 (echoes)", "FX 8 (sci-fi)",
+
+                    # Ethnic Family
+                    "Sitar",  "Banjo", "Shamisen", "Koto", "Kalimba", "Bag pipe", "Fiddle", "Shanai",
+
+                    # Percussive Family
+                    "Tinkle Bell", "Agogo", "Steel Drums", "Woodblock", "Taiko Drum", "Melodic Tom",
+                    "Synth Drum", "Reverse Cymbal",
+
+                    # Sound Effects Family
+                    "Guitar Fret Noise", "Breath Noise", "Seashore", "Bird Tweet", "Telephone Ring",
+                    "Helicopter", "Applause", "Gunshot" ]
+
+# define text labels for inverse-lookup of MIDI pitches (index in list is same as MIDI pitch number)
+# (for enharmonic notes, e.g., FS4 and GF4, uses the sharp version, e.g. FS4)
+MIDI_PITCHES = ["C_1", "CS_1", "D_1", "DS_1", "E_1", "F_1", "FS_1", "G_1", "GS_1", "A_1", "AS_1", "B_1",
+                "C0", "CS0", "D0", "DS0", "E0", "F0", "FS0", "G0", "GS0", "A0", "AS0", "B0",
+                "C1", "CS1", "D1", "DS1", "E1", "F1", "FS1", "G1", "GS1", "A1", "AS1", "B1",
+                "C2", "CS2", "D2", "DS2", "E2", "F2", "FS2", "G2", "GS2", "A2", "AS2", "B2",
+                "C3", "CS3", "D3", "DS3", "E3", "F3", "FS3", "G3", "GS3", "A3", "AS3", "B3",
+                "C4", "CS4", "D4", "DS4", "E4", "F4", "FS4", "G4", "GS4", "A4", "AS4", "B4",
+                "C5", "CS5", "D5", "DS5", "E5", "F5", "FS5", "G5", "GS5", "A5", "AS5", "B5",
+                "C6", "CS6", "D6", "DS6", "E6", "F6", "FS6", "G6", "GS6", "A6", "AS6", "B6",
+                "C7", "CS7", "D7", "DS7", "E7", "F7", "FS7", "G7", "GS7", "A7", "AS7", "B7",
+                "C8", "CS8", "D8", "DS8", "E8", "F8", "FS8", "G8", "GS8", "A8", "AS8", "B8",
+                "C9", "CS9", "D9", "DS9", "E9", "F9", "FS9", "G9"]
+
+######################################################################################
+# provide additional MIDI rhythm constant
+
+DOTTED_WHOLE_NOTE = 4.5
+DWN = 4.5
+
+######################################################################################
+# provide additional MIDI pitch constants (for first octave, i.e., minus 1 octave)
+BS_1 = 12
+bs_1 = 12
+B_1 = 11
+b_1 = 11
+BF_1 = 10
+bf_1 = 10
+AS_1 = 10
+as_1 = 10
+A_1 = 9
+a_1 = 9
+AF_1 = 8
+af_1 = 8
+GS_1 = 8
+gs_1 = 8
+G_1 = 7
+g_1 = 7
+GF_1 = 6
+gf_1 = 6
+FS_1 = 6
+fs_1 = 6
+F_1 = 5
+f_1 = 5
+FF_1 = 4
+ff_1 = 4
+ES_1 = 5
+es_1 = 5
+E_1 = 4
+e_1 = 4
+EF_1 = 3
+ef_1 = 3
+DS_1 = 3
+ds_1 = 3
+D_1 = 2
+d_1 = 2
+DF_1 = 1
+df_1 = 1
+CS_1 = 1
+cs_1 = 1
+C_1 = 0
+c_1 = 0
+
+######################################################################################
+# provide additional MIDI instrument constants (missing from jMusic specification)
+EPIANO1 = 4
+RHODES_PIANO = 4
+DX_PIANO = 5
+DX = 5
+DULCIMER = 15
+DRAWBAR_ORGAN = 16
+PERCUSSIVE_ORGAN = 17
+ROCK_ORGAN = 18
+TANGO_ACCORDION = 23
+BANDONEON = 23
+OVERDRIVEN_GUITAR = 29
+DISTORTION_GUITAR = 30
+SLAP_BASS1 = 36
+SLAP_BASS2 = 37
+SYNTH_BASS1 = 38
+SYNTH_BASS2 = 39
+ORCHESTRAL_HARP = 46
+STRING_ENSEMBLE1 = 48
+STRING_ENSEMBLE2 = 49
+SYNTH = 50
+SYNTH_STRINGS1 = 50
+SYNTH_STRINGS2 = 51
+CHOIR_AHHS = 52
+VOICE_OOHS = 53
+SYNTH_VOICE = 54
+BRASS_SECTION = 61
+SYNTH_BRASS1 = 62
+SYNTH_BRASS2 = 63
+BLOWN_BOTTLE = 76
+LEAD_1_SQUARE = 80
+LEAD_2_SAWTOOTH = 81
+LEAD_3_CALLIOPE = 82
+CALLIOPE = 82
+LEAD_4_CHIFF = 83
+CHIFF = 83
+LEAD_5_CHARANG = 84
+LEAD_6_VOICE = 85
+LEAD_7_FIFTHS = 86
+FIFTHS = 86
+LEAD_8_BASS_LEAD = 87
+BASS_LEAD = 87
+PAD_1_NEW_AGE = 88
+NEW_AGE = 88
+PAD_2_WARM = 89
+PAD_3_POLYSYNTH = 90
+POLYSYNTH = 90
+PAD_4_CHOIR = 91
+SPACE_VOICE = 91
+PAD_5_GLASS = 92
+PAD_6_METTALIC = 93
+METALLIC = 93
+PAD_7_HALO = 94
+HALO = 94
+PAD_8_SWEEP = 95
+FX_1_RAIN = 96
+FX_2_SOUNDTRACK = 97
+FX_3_CRYSTAL = 98
+FX_4_ATMOSPHERE = 99
+FX_5_BRIGHTNESS = 100
+FX_6_GOBLINS = 101
+GOBLINS = 101
+FX_7_ECHOES = 102
+ECHO_DROPS = 102
+FX_8_SCI_FI = 103
+SCI_FI = 103
+TAIKO_DRUM = 116
+MELODIC_TOM = 117
+TOM_TOM = 117      # this is a fix (jMusic defines this as 119!)
+GUITAR_FRET_NOISE = 120
+FRET_NOISE = 120
+BREATH_NOISE = 121
+BIRD_TWEET = 123
+TELEPHONE_RING = 124
+GUNSHOT = 127
+
+# and MIDI drum and percussion abbreviations
+ABD = 35
+BASS_DRUM = 36
+BDR = 36
+STK = 37
+SNARE = 38
+SNR = 38
+CLP = 39
+ESN = 40
+LFT = 41
+CHH = 42
+HFT = 43
+PHH = 44
+LTM = 45
+OHH = 46
+LMT = 47
+HMT = 48
+CC1 = 49
+HGT = 50
+RC1 = 51
+CCM = 52
+RBL = 53
+TMB = 54
+SCM = 55
+CBL = 56
+CC2 = 57
+VSP = 58
+RC2 = 59
+HBG = 60
+LBG = 61
+MHC = 62
+OHC = 63
+LCG = 64
+HTI = 65
+LTI = 66
+HAG = 67
+LAG = 68
+CBS = 69
+MRC = 70
+SWH = 71
+LWH = 72
+SGU = 73
+LGU = 74
+CLA = 75
+HWB = 76
+LWB = 77
+MCU = 78
+OCU = 79
+MTR = 80
+OTR = 81
+
+
+######################################################################################
+#### Free music library functions ####################################################
+######################################################################################
+
+def valueMapper(minValue, maxValue, minResultValue, maxResultValue, clamp=False):
+   """
+   Returns a function that maps a value from a given source range, i.e., (minValue, maxValue),
+   to a new destination range, i.e., (minResultValue, maxResultValue), as mapValue() does.
+   Everything that does not depend on the value (range widths, result data type) is calculated
+   once, here, so this is meant for mapping many values the same way (e.g., volume to amplitude).
+   If 'clamp' is True, values outside the source range are mapped to its closest end (as opposed
+   to raising a ValueError).
+   """
+
+   # calculate everything that does not depend on the value (keeping mapValue()'s arithmetic, so that results
+   # are exactly the same)
+   sourceWidth = maxValue - minValue
+   resultWidth = maxResultValue - minResultValue
+   resultType = type(minResultValue)            # expected result data type
+   convert = resultType is not float            # (a float result needs no conversion)
+   lowest  = min(minValue, maxValue)            # (for clamping)
+   highest = max(minValue, maxValue)
+
+   def mapper(value):
+      """Maps 'value' to the destination range."""
+
+      # check if value is within the specified range
+      if value < minValue or value > maxValue:
+         if clamp:
+            value = min(max(value, lowest), highest)
+         else:
+            raise ValueError("value, " + str(value) + ", is outside the specified range, " \
+                                       + str(minValue) + " to " + str(maxValue) + ".")
+
+      result = (float(value) - minValue) / sourceWidth * resultWidth + minResultValue   # map to destination range
+
+      if convert:
+         return resultType(result)   # apply expected result data type
+      return result
+
+   return mapper
+
+def scaleMapper(minValue, maxValue, minResultValue, maxResultValue, scale=CHROMATIC_SCALE, key=None, clamp=False):
+   """
+   Returns a function that maps a value from a given source range, i.e., (minValue, maxValue), to a
+   new destination range, i.e., (minResultValue, maxResultValue), using the provided scale (pitch row)
+   and key, as mapScale() does.  The scale is checked once, here, and the pitch of every scale step in
+   the destination range is looked up in a table (instead of being calculated for every value).
+   If 'clamp' is True, values outside the source range are mapped to its closest end (as opposed
+   to raising a ValueError).
+   """
+
+   # check pitch row - it should contain offsets only from 0 to 11
+   badOffsets = [offset for offset in scale if offset < 0 or offset > 11]
+   if badOffsets != []:  # any illegal offsets?
+      raise TypeError("scale, " + str(scale) + ", should contain values only from 0 to 11.")
+
+   # figure out key of scale
+   if key == None:             # if they didn't specify a key
+      key = minResultValue % 12   # assume that minResultValue the root of the scale
+   else:                       # otherwise,
+      key = key % 12              # ensure it is between 0 and 11 (i.e., C4 and C5 both mean C, or 0).
+
+   scale = list(scale)         # (our own copy, in case the caller changes theirs)
+   scaleLength = len(scale)
+   sourceWidth = maxValue - minValue
+   resultWidth = maxResultValue - minResultValue
+   lowest  = min(minValue, maxValue)            # (for clamping)
+   highest = max(minValue, maxValue)
+
+   # the pitch of every step of the pitch row in the destination range, i.e., register * 12 + scale[scaleDegree] + key
+   # (see mapScale() - for steps of 0 and above, scale degree and register depend only on the whole part of the step)
+   pitches = []
+   highestStep = (max(minResultValue, maxResultValue) - key) * scaleLength / 12.0
+   for step in range( max(int(highestStep) + 1, 0) + 1 ):
+      pitches.append( int((step / scaleLength) * 12 + scale[step % scaleLength] + key) )
+
+   def mapper(value):
+      """Maps 'value' to the destination range, sieved through the scale."""
+
+      # check if value is within the specified range
+      if value < minValue or value > maxValue:
+         if clamp:
+            value = min(max(value, lowest), highest)
+         else:
+            raise ValueError("value, " + str(value) + ", is outside the specified range, " \
+                                       + str(minValue) + " to " + str(maxValue) + ".")
+
+      # NOTE:  The following calculation has a problem, exhibited below:
+      #
+      #   >>> x = 0
+      #   >>> mapScale(x, 0, 10, 127, 0, MAJOR_SCALE)
+      #   127
+      #
+      #   This is fine.
+      #
+      #   >>> x = 10
+      #   >>> mapScale(x, 0, 10, 127, 0, MAJOR_SCALE)
+      #   11
+      #
+      #   Problem:  This should be 0, not 11 !!
+
+      # map to destination range (i.e., chromatic scale), and then to the pitch row
+      # (subtracting 'key' aligns us with indices in the provided scale - the table adds it back)
+      chromaticStep = (float(value) - minValue) / sourceWidth * resultWidth + minResultValue - key
+      pitchRowStep = chromaticStep * scaleLength / 12
+
+      if 0 <= pitchRowStep < len(pitches):    # in the table? (always, unless the step is below 0)
+         return pitches[int(pitchRowStep)]
+
+      # otherwise, calculate it
+      scaleDegree  = int(pitchRowStep % scaleLength)
+      register     = int(pitchRowStep / scaleLength)
+      return int(register * 12 + scale[scaleDegree] + key)
+
+   return mapper
+
+# mappers used by mapValue() and mapScale() (so that the same mappings are not set up again and again)
+MAPPER_CACHE_SIZE = 256       # max number of mappers to keep (e.g., GUI controls map to ranges which change as they are resized)
+__valueMappers__ = {}
+__scaleMappers__ = {}
+
+def mapValue(value, minValue, maxValue, minResultValue, maxResultValue):
+   """
+   Maps value from a given source range, i.e., (minValue, maxValue),
+   to a new destination range, i.e., (minResultValue, maxResultValue).
+   The result will be converted to the result data type (int, or float).
+   (To map many values the same way, use valueMapper().)
+   """
+
+   # get the mapper for these ranges (the result data type is part of the key, since, e.g., 1 == 1.0)
+   key = (minValue, maxValue, minResultValue, maxResultValue, type(minResultValue))
+   mapper = __valueMappers__.get(key)
+   if mapper is None:
+      if len(__valueMappers__) >= MAPPER_CACHE_SIZE:
+         __valueMappers__.clear()
+      mapper = valueMapper(minValue, maxValue, minResultValue, maxResultValue)
+      __valueMappers__[key] = mapper
+
+   return mapper(value)
+
+def mapScale(value, minValue, maxValue, minResultValue, maxResultValue, scale=CHROMATIC_SCALE, key=None):
+   """
+   Maps value from a given source range, i.e., (minValue, maxValue), to a new destination range, i.e.,
+   (minResultValue, maxResultValue), using the provided scale (pitch row) and key.  The scale provides
+   a sieve (a pattern) to fit the results into.  The key determines how to shift the scale pattern to
+   fit a particular key - if key is not provided, we assume it is the same as minResultValue (e.g., C4
+   and C5 both refer to the key of C)).
+
+   The result will be within the destination range rounded to closest pitch in the
+   provided pitch row.   It always returns an int (since it is intended to be used
+   as a pitch value).  (To map many values the same way, use scaleMapper().)
+
+   NOTE:  We are working within a 12-step tonal system (MIDI), i.e., octave is 12 steps away,
+          so pitchRow must contain offsets (from the root) between 0 and 11.
+   """
+
+   # get the mapper for these ranges, scale, and key
+   mapperKey = (minValue, maxValue, minResultValue, maxResultValue, tuple(scale), key)
+   mapper = __scaleMappers__.get(mapperKey)
+   if mapper is None:
+      if len(__scaleMappers__) >= MAPPER_CACHE_SIZE:
+         __scaleMappers__.clear()
+      mapper = scaleMapper(minValue, maxValue, minResultValue, maxResultValue, scale, key)
+      __scaleMappers__[mapperKey] = mapper
+
+   return mapper(value)
+
+def frange(start, stop, step):
+   """
+   A range function for floats, with variable accuracy (controlled by
+   number of digits in decimal part of 'step').
+   """
+   import math
+
+   if step == 0:   # make sure we do not get into an infinite loop
+     raise ValueError, "frange() step argument must not be zero"
+
+   result = []                         # holds resultant list
+   # since Python's represetation of real numbers may not be exactly what we expect,
+   # let's round to the number of decimals provided in 'step'
+   accuracy = len(str(step-int(step))[1:])-1  # determine number of decimals in 'step'
+
+   # determine which termination condition to use
+   if step > 0:
+      done = start >= stop
+   else:
+      done = start <= stop
+
+   # generate sequence
+   while not done:
+      start = round(start, accuracy)  # use same number of decimals as 'step'
+      result.append(start)
+      start += step
+      # again, determine which termination condition to use
+      if step > 0:
+         done = start >= stop
+      else:
+         done = start <= stop
+
+   return result
+
+def xfrange(start, stop, step):
+   """
+   A generator range function for floats, with variable accuracy (controlled by
+   number of digits in decimal part of 'step').
+   """
+   import math
+
+   if step == 0:   # make sure we do not get into an infinite loop
+     raise ValueError, "frange() step argument must not be zero"
+
+   # since Python's represetation of real numbers may not be exactly what we expect,
+   # let's round to the number of decimals provided in 'step'
+   accuracy = len(str(step-int(step))[1:])-1  # determine number of decimals in 'step'
+
+   # determine which termination condition to use
+   if step > 0:
+      done = start >= stop
+   else:
+      done = start <= stop
+
+   # generate sequence
+   while not done:
+      start = round(start, accuracy)  # use same number of decimals as 'step'
+      yield start
+      start += step
+      # again, determine which termination condition to use
+      if step > 0:
+         done = start >= stop
+      else:
+         done = start <= stop
+
+######################################################################################
+#### jMusic library extensions #########################################################
+######################################################################################
+
+# A wrapper to turn class functions into "static" functions (e.g., for Mod functions).
+#
+# See http://code.activestate.com/recipes/52304-static-methods-aka-class-methods-in-python/
+#
+
+class Callable:
+    def __init__(self, functionName):
+        self.__call__ = functionName
+
+
+######################################################################################
+#### jMusic Mod extensions #########################################################
+######################################################################################
+
+from jm.music.tools import Mod as jMod  # needed to wrap more functionality below
+
+# Mod functions below work on whole scores at once, i.e., they get the phrases (or notes) of the material
+# once (as Java arrays), then read the values they need, and then write back the new ones, as opposed to
+# walking Score -> Part -> Phrase -> Note through nested helper functions, for every note.  (See modbenchmark.py.)
+
+def __getPhrases__(material, caller):
+   """Returns the phrases of 'material' (Phrase, Part, or Score)."""
+
+   if type(material) == Score:
+      phrases = []
+      for part in material.getPartArray():
+         phrases.extend( part.getPhraseArray() )
+      return phrases
+   elif type(material) == Part:
+      return material.getPhraseArray()
+   elif type(material) == Phrase or type(material) == jPhrase:
+      return [material]
+   else:   # error check
+      raise TypeError( caller + ": Unrecognized material type " + str(type(material)) + " - expected Phrase, Part, or Score." )
+
+def __getNotes__(material, caller):
+   """Returns the notes of 'material' (Phrase, Part, or Score)."""
+
+   notes = []
+   for phrase in __getPhrases__(material, caller):
+      notes.extend( phrase.getNoteArray() )
+   return notes
+
+# Create various Mod functions, in addition to Mod's default functionality.
+# This class is not meant to be instantiated, hence no "self" in function definitions.
+# Functions are made callable through class Callable, above.
+
+class Mod(jMod):
+
+   def normalize(material):
+      """Same as jMod.normalise()."""
+
+      jMod.normalise(material)
+
+   def invert(material, pitchAxis):
+      """Invert phrase (or all phrases of a part or score) using pitch as the mirror (pivot) axis."""
+
+      # get all notes at once, and their pitches (modify regular notes only, i.e., do not modify rests)
+      notes = [note for note in __getNotes__(material, "Mod.invert()") if not note.isRest()]
+      frequencies = [note.getFrequency() for note in notes]
+
+      # convert frequencies to pitches (as Note.getPitch() does), once per distinct frequency
+      pitches = {}
+      for frequency in frequencies:
+         if frequency not in pitches:
+            pitches[frequency] = freqToNote(frequency)[0]
+
+      # and adjust pitches accordingly
+      for i in xrange( len(notes) ):
+         invertedPitch = pitchAxis + (pitchAxis - pitches[frequencies[i]])   # find mirror pitch around axis (by adding difference)
+         notes[i].setPitch( invertedPitch )                                 # and update it
+
+      # now, all notes have been updated
+
+   def mutate(phrase):
+      """Same as jMod.mutate()."""
+
+      # adjust jMod.mutate() to use random durations from phrase notes
+      durations = [note.getDuration() for note in phrase.getNoteList()]
+
+      jMod.mutate(phrase, 1, 1, CHROMATIC_SCALE, phrase.getLowestPitch(),
+                  phrase.getHighestPitch(), durations)
+
+   def elongate(material, scaleFactor):
+      """Same as jMod.elongate(). Fixing a bug."""
+
+      # get all notes at once, and their durations and lengths
+      if type(material) == Note or type(material) == jNote:
+         notes = [material]
+      else:
+         notes = __getNotes__(material, "Mod.elongate()")
+      durations = [note.getDuration() for note in notes]
+      lengths   = [note.getLength() for note in notes]
+
+      # and update them
+      for i in xrange( len(notes) ):
+         note = notes[i]
+         jNote.setDuration( note, durations[i] * scaleFactor )   # (jMusic also sets length to 90% of the new duration)
+         if isinstance(note, Note):                               # our Notes keep their length proportional, instead
+            note.setLength( lengths[i] * scaleFactor )               # (as Note.setDuration() does)
+
+   def shift(material, time):
+      """It shifts all phrases' start time by 'time' (measured in QN's, i.e., 1.0 equals QN).
+         If 'time' is positive, phrases are moved later.
+         If 'time' is negative, phrases are moved earlier (at most, at the piece's start time, i.e., 0.0),
+         as negative start times make no sense.
+         'Material' can be Phrase, Part, or Score (since Notes do not have a start time).
+      """
+
+      # check type of time
+      if not (type(time) == float or type(time) == int):
+         raise TypeError( "Unrecognized time type " + str(type(time)) + " - expected int or float." )
+
+      # shift all phrases
+      for phrase in __getPhrases__(material, "Mod.shift()"):
+         newStartTime = phrase.getStartTime() + time
+         newStartTime = max(0, newStartTime)          # ensure that the new start time is at most 0 (negative start times make no sense)
+         phrase.setStartTime( newStartTime )
+
+   def merge(material1, material2):
+      """Merges 'material2' into 'material1'.  'Material1' is changed, 'material2' is unmodified.
+         Both 'materials' must be of the same type, either Part or Score.
+         It does not worry itself about instrument and channel assignments - it is left to the caller
+         to ensure that the two 'materials' are compatible this way.
+      """
+
+      # define helper functions
+      def mergeParts(part1, part2):
+         """Helper function to merge two parts into one."""
+         for phrase in part2.getPhraseList():
+            part1.addPhrase(phrase)
+
+      def mergeScores(score1, score2):
+         """Helper function to merge two scores into one."""
+         for part in score2.getPartList():
+            score1.addPart(part)
+
+      # check type of material and call the appropriate function
+      if type(material1) == Score and type(material2) == Score:
+         mergeScores(material1, material2)
+      elif type(material1) == Part and type(material2) == Part:
+         mergeParts(material1, material2)
+      elif (type(material1) == Part and type(material2) == Score) or \
+           (type(material1) == Score and type(material2) == Part):
+         raise TypeError( "Cannot merge Score and Part - arguments must be of the same type (both Score or both Part)." )
+      else:
+         raise TypeError( "Arguments must be both either Score or Part." )
+
+
+   def retrograde(material):
+      """It reverses the start times of notes in 'material'.
+         'Material' can be Phrase, Part, or Score.
+      """
+
+      # define helper functions
+      def getPartTimes(part):
+         """Helper function to return the phrases of a part, their start and end times, and the part's start
+            and end times (so that these are calculated only once - a phrase's end time visits all its notes)."""
+
+         phrases = part.getPhraseArray()
+         startTimes = [phrase.getStartTime() for phrase in phrases]
+         endTimes   = [phrase.getEndTime() for phrase in phrases]
+
+         minStartTime = min([10000000000.0] + startTimes)   # the earliest start time among all phrases (or a very large value)
+         maxEndTime   = max([0.0] + endTimes)               # the latest end time among all phrases
+
+         return phrases, startTimes, endTimes, minStartTime, maxEndTime
+
+      def retrogradePart(partTimes, time = 0.0):
+         """Helper function to retrograde a single part (given its times), and then shift it by 'time' (as Mod.shift())."""
+
+         phrases, startTimes, endTimes, startTime, endTime = partTimes
+
+         # retrograde each phrase and adjust its start time accordingly
+         for i in xrange( len(phrases) ):
+            distanceFromEnd = endTime - endTimes[i]     # get this phrase's distance from end
+
+            jMod.retrograde(phrases[i])                 # retrograde it
+
+            # the retrograded phrase needs to start as far from the beginning of the part as its orignal end used to be
+            # from the end of the part (and then be shifted, if needed)
+            newStartTime = distanceFromEnd + startTime
+            if time != 0.0:
+               newStartTime = max(0, newStartTime + time)
+            phrases[i].setStartTime( newStartTime )
+
+         # now, all phrases in this part have been retrograded and their start times have been aranged
+         # to mirror their original end times
+
+      def retrogradeScore(score):
+         """Helper function to retrograde a score."""
+
+         # calculate all part (and phrase) times once
+         partTimes = [getPartTimes(part) for part in score.getPartArray()]
+
+         # calculate the score's end time
+         endTime = max([0.0] + [times[4] for times in partTimes])   # the latest end time among all parts
+         # now, endTime holds the score's end time
+
+         # retrograde each part and adjust its start time accordingly
+         for times in partTimes:
+            # get this part's distance from the score end
+            distanceFromEnd = endTime - (times[4] + times[3])
+
+            # retrograde this part, and shift it as far as the orignal part's distance from the score end
+            retrogradePart(times, distanceFromEnd)
+         # now, all parts have been retrograded and their start times have been aranged to mirror their original
+         # end times
+
+
+      # check type of material and call the appropriate function
+      if type(material) == Score:
+         retrogradeScore(material)
+      elif type(material) == Part:
+         retrogradePart( getPartTimes(material) )
+      elif type(material) == Phrase or type(material) == jPhrase:
+         jMod.retrograde(material)
+      else:   # error check
+         raise TypeError( "Unrecognized material type " + str(type(material)) + " - expected Phrase, Part, or Score." )
+
+
+   # make these function callable without having to instantiate this class
+   normalize = Callable(normalize)
+   invert = Callable(invert)
+   mutate = Callable(mutate)
+   elongate = Callable(elongate)
+   shift = Callable(shift)
+   merge = Callable(merge)
+   retrograde = Callable(retrograde)
+
+
+######################################################################################
+# JEM working directory fix
+#
+# JEM (written partially in Java) does not allow changing current directory.
+# So, when we have the user's desired working directory we CANNOT use it to read/write
+# jMusic media files, unless we add it as a prefix here to every Read/Write operation.
+# We do so only if the filepath passed to Read/Write is just a filename (as opposed
+# to a path).
+#
+# Let's define some useful stuff here, for this fix
+
+import os.path
+
+def fixWorkingDirForJEM( filename ):
+   """It prefixes the provided filename with JEM's working directory, if available,
+      only if filename is NOT an absolute path (in which case the user truly knows
+      where they want to store it).
+   """
+
+   try:
+
+      JEM_getMainFilePath   # check if function JEM_getMainFilePath() is defined (this happens only inside JEM)
+
+      # get working dir, if JEM is available
+      workDir = JEM_getMainFilePath()
+
+      # two cases for filename:
+      #
+      # 1. a relative filepath (e.g., just a filename, or "../filename")
+      # 2. an absolute filepath
+
+      if os.path.isabs( filename ):          # if an absolute path, the user knows what they are doing
+         return filename                     # ...so, do nothing
+      else:                                  # else (if a relative pathname),
+         return workDir + filename           # ...fix it
+
+   except:
+      # if JEM is not available, do nothing (e.g., music.py is being run outside of JEM)
+      return filename
+
+
+######################################################################################
+#### jMusic Read extensions ##########################################################
+######################################################################################
+
+from jm.util import Read as jRead  # needed to wrap more functionality below
+from image import *                # import Image class and related Java libraries
+
+# Create Read.image("test.jpg") to return an image, in addition to Read's default functionality.
+# This class is not meant to be instantiated, hence no "self" in function definitions.
+# Functions are made callable through class Callable, above.
+class Read(jRead):
+
+   def midi(score, filename):
+      """Import a standard MIDI file to a jMusic score."""
+
+      # JEM working directory fix (see above)
+      filename = fixWorkingDirForJEM( filename )   # does nothing if not in JEM
+
+      # use fixed filename with jMusic's Read.midi()
+      jRead.midi(score, filename)
+
+   # make this function callable without having to instantiate this class
+   midi = Callable(midi)
+
+######################################################################################
+#### jMusic Write extensions #########################################################
+######################################################################################
+
+from jm.util import Write as jWrite  # needed to wrap more functionality below
+
+# Create Write.image(image, "test.jpg") to write an image to file, in addition
+# to Write's default functionality.
+# This class is not meant to be instantiated, hence no "self" in function definitions.
+# Functions are made callable through class Callable, above.
+
+class Write(jWrite):
+
+   def midi(score, filename):
+      """Save a standard MIDI file from a jMusic score."""
+
+      if hasattr(score, "toScore"):   # a NoteTable (see notetable.py)?
+         score = score.toScore()        # yes, so get its Score
+
+      # JEM working directory fix (see above)
+      filename = fixWorkingDirForJEM( filename )   # does nothing if not in JEM
+
+      #***
+      #print "fixWorkingDirForJEM( filename ) =", filename
+
+      # use fixed filename with jMusic's Write.midi()
+      jWrite.midi(score, filename)
+
+   def audio(material, filename, tail=2.0):
+      """Save jMusic material (Score, Part, Phrase, Note) as a WAV file, rendered through the Java synthesizer
+         faster than real time (i.e., what Play.midi() would sound like, without having to play it).
+         Rendering continues 'tail' seconds past the end, so that notes can decay.  Returns the duration
+         of the audio written (in seconds)."""
+
+      from scorecompiler import scoreCache     # needed to compile scores (loaded here, as it is seldom needed)
+      from midirender import renderScore       # needed to render compiled scores through the Java synthesizer
+
+      original = material   # remember what we were asked to render (for the compiled score cache)
+
+      # do necessary datatype wrapping (as Play.midi() does)
+      if hasattr(material, "toScore"):  # a NoteTable (see notetable.py)?
+         material = material.toScore()     # yes, so get its Score (converted only once, while the table is unchanged)
+      if type(material) == Note or type(material) == jNote:
+         material = Phrase(material)
+      if type(material) == Phrase or type(material) == jPhrase:   # no elif - we need to successively wrap from Note to Score
+         material = Part(material)
+         material.setInstrument(-1)     # indicate no default instrument (the synthesizer's default is used)
+      if type(material) == Part:        # no elif - we need to successively wrap from Note to Score
+         material = Score(material)
+
+      if type(material) != Score:       # error check
+         print "Write.audio(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+         return None
+
+      # JEM working directory fix (see above)
+      filename = fixWorkingDirForJEM( filename )   # does nothing if not in JEM
+
+      # get score compiled into time-sorted note events (if we have played or rendered it before, it is already compiled)
+      compiledScore = scoreCache.getCompiledScore(original, material)
+
+      # and render it (no audio device is needed, so this also works on headless machines)
+      return renderScore(compiledScore, filename, tail)
+
+   # make these functions callable without having to instantiate this class
+   midi = Callable(midi)
+   audio = Callable(audio)
+
+######################################################################################
+#### jMusic Note extensions ########################################################
+######################################################################################
+
+###############################################################################
+# freqToNote   Convert frequency to MIDI note number
+#        freqToNote(f) converts frequency to the closest MIDI note
+#        number with pitch bend value for finer control.  A4 corresponds to
+#        the note number 69 (concert pitch is set to 440Hz by default).
+#        The default pitch bend range is 2 half tones above and below.
+#
+#        2005-10-13 by MARUI Atsushi
+#        See http://www.geidai.ac.jp/~marui/octave/node3.html
+#
+# For example, "sliding" from A4 (MIDI pitch 69, frequency 440 Hz)
+#              to a bit over AS4 (MIDI pitch 70, frequency 466.1637615181 Hz).
+#
+#>>>for f in range(440, 468):
+#...    print freqToNote(f)
+#...
+#(69, 0)
+#(69, 322)
+#(69, 643)
+#(69, 964)
+#(69, 1283)
+#(69, 1603)
+#(69, 1921)
+#(69, 2239)
+#(69, 2555)
+#(69, 2872)
+#(69, 3187)
+#(69, 3502)
+#(69, 3816)
+#(70, -4062)
+#(70, -3750)
+#(70, -3438)
+#(70, -3126)
+#(70, -2816)
+#(70, -2506)
+#(70, -2196)
+#(70, -1888)
+#(70, -1580)
+#(70, -1272)
+#(70, -966)
+#(70, -660)
+#(70, -354)
+#(70, -50)
+#(70, 254)
+#
+# The above overshoots AS4 (MIDI pitch 70, frequency 466.1637615181 Hz).
+# So, here is converting the exact frequency:
+#
+#>>> freqToNote(466.1637615181)
+#(70, 0)
+###############################################################################
+
+def freqToNote(frequency):
+   """Converts frequency to the closest MIDI note number with pitch bend value
+      for finer control.  A4 corresponds to the note number 69 (concert pitch
+      is set to 440Hz by default).  The default pitch bend range is 4 half tones.
+   """
+
+   from math import log
+
+   concertPitch = 440.0   # 440Hz
+   bendRange = 4          # 4 half tones (2 below, 2 above)
+
+   x = log(frequency / concertPitch, 2) * 12 + 69
+   note = round(x)
+   pitchBend = round((x - note) * 8192 / bendRange * 2)
+
+   return int(note), int(pitchBend)
+
+
+def noteToFreq(note):
+   """Converts a MIDI note to the corresponding frequency.  A4 corresponds to the note number 69 (concert pitch
+      is set to 440Hz by default).
+   """
+
+   concertPitch = 440.0   # 440Hz
+
+   frequency = concertPitch * 2 ** ( (note - 69) / 12.0 )
+
+   return frequency
+
+
+
+from jm.music.data import *
+from jm.music.data import Note as jNote  # needed to wrap more functionality below
+
+# update Note to accept length which specifies the actual length (performance) of the note,
+# (whereas duration specifies the score (or denoted) length of the note).
+class Note(jNote):
+
+   def __str__(self):
+      # we disrupted access to jMusic's (Java's) Note.toString() method,
+      # so, let's fix it
+      return self.toString()
+
+   def __repr__(self):
+      # we disrupted access to jMusic's (Java's) Note.toString() method,
+      # so, let's fix it
+      return self.toString()
+
+   def __init__(self, value, duration, dynamic=85, pan=0.5, length=None):
+
+      # NOTE: If value is an int, it signifies pitch; otherwise, if it is a float,
+      # it signifies a frequency.
+
+      # set note length (if needed)
+      if length == None:   # not provided?
+         length = duration * jNote.DEFAULT_LENGTH_MULTIPLIER  # normally, duration * 0.9
+
+      # do some basic error checking
+      if type(value) == int and value != REST and (value < 0 or value > 127):
+        raise TypeError( "Note pitch should be an integer between 0 and 127 (it was " + str(value) + ")." )
+      elif type(value) == float and not value > 0.0:
+        raise TypeError( "Note frequency should be a float greater than 0.0 (it was " + str(value) + ")." )
+      elif (type(value) != int) and (type(value) != float):
+        raise TypeError( "Note first parameter should be a pitch (int) or a frequency (float) - it was " + str(type(value)) + "." )
+
+      # now, construct a jMusic Note with the proper attributes
+      jNote.__init__(self, value, duration, dynamic, pan)     # construct note
+      self.setLength( length )                                # and set its length
+
+      # NOTE: jMusic Notes if int pitch is given, they populate both frequency and pitch;
+      # (if float pitch is given, they treat if as frequency and populate only frequency - no pitch).
+      # This is a bug.  Below, we fix it by also using setPitch() or setFrequency(), which may appear
+      # redundant, but they fix this problem (as they do the proper cross-updating of pitch and frequency).
+
+      # fix jMusic Note bug (see above)
+      if type(value) == int:
+      	 self.setPitch(value)
+      elif type(value) == float:
+      	 self.setFrequency(value)
+
+
+   # fix set duration to also adjust length proportionally
+   def setDuration(self, duration):
+
+      # calculate length fector from original values
+      lengthFactor = self.getLength() / self.getDuration()
+
+      # and set new duration and length appropriately
+      jNote.setDuration(self, duration )
+      self.setLength(duration * lengthFactor )
+
+   # fix error message returned from getPitch() if frequency and pitch are not equivalent
+   def getPitch(self):
+
+      # get frequency
+      frequency = self.getFrequency()
+
+      # convert to corresponding pitch
+      if frequency == float(REST):    # is it a rest?
+         pitch = REST                    # yes, so update accordingly
+      else:   # it's a regular note, so...
+         # calculate corresponding pitch and pith bend
+         pitch, bend = freqToNote(frequency)
+
+      # return only pitch
+      return pitch
+
+   # also, create a way to get the difference between frequency and pitch, in pitch bend units (see Play class)
+   def getPitchBend(self):
+
+      # get frequency
+      frequency = self.getFrequency()
+
+      # and calculate corresponding pitch and pith bend
+      pitch, bend = freqToNote(frequency)
+
+      # return only pitch bend (from 0 to )
+      return bend + PITCHBEND_NORMAL
+
+
+######################################################################################
+#### jMusic Phrase extensions ########################################################
+######################################################################################
+
+from jm.music.data import Phrase as jPhrase  # needed to wrap more functionality below
+
+# update Phrase's addNoteList to handle chords, i.e., lists of pitches,
+# in addition to single pitches (the default functionality).
+class Phrase(jPhrase):
+
+   def __str__(self):
+      # we disrupted access to jMusic's (Java's) Phrase.toString() method,
+      # so, let's fix it
+      return self.toString()
+
+   def __repr__(self):
+      # we disrupted access to jMusic's (Java's) Phrase.toString() method,
+      # so, let's fix it
+      return self.toString()
+
+   def addChord(self, pitches, duration, dynamic=85, panoramic=0.5, length=None):
+      # set chord length (if needed)
+      if length == None:   # not provided?
+         length = duration * jNote.DEFAULT_LENGTH_MULTIPLIER  # normally, duration * 0.9
+
+      # add all notes, minus the last one, as having no duration, yet normal length
+      # (exploiting how Play.midi() and Write.midi() work)
+      for i in range( len(pitches)-1 ):
+         n = Note(pitches[i], 0.0, dynamic, panoramic, length)
+         self.addNote(n)
+
+      # now, add the last note with the proper duration (and length)
+      n = Note(pitches[-1], duration, dynamic, panoramic, length)
+      self.addNote(n)
+
+   def addNoteList(self, pitches, durations, dynamics=[], panoramics=[], lengths=[]):
+      """Add notes to the phrase using provided lists of pitches, durations, etc. """
+
+      # check if provided lists have equal lengths
+      if len(pitches) != len(durations) or \
+         (len(dynamics) != 0) and (len(pitches) != len(dynamics)) or \
+         (len(panoramics) != 0) and (len(pitches) != len(panoramics)) or \
+         (len(lengths) != 0) and (len(pitches) != len(lengths)):
+         raise ValueError("The provided lists should have the same length.")
+
+      # if dynamics was not provided, construct it with max value
+      if dynamics == []:
+         dynamics = [85] * len(pitches)
+
+      # if panoramics was not provided, construct it at CENTER
+      if panoramics == []:
+         panoramics = [0.5] * len(pitches)
+
+      # if note lengths was not provided, construct it at 90% of note duration
+      if lengths == []:
+         lengths = [duration * jNote.DEFAULT_LENGTH_MULTIPLIER for duration in durations]
+
+      # traverse the pitch list and handle every item appropriately
+      for i in range( len(pitches) ):
+         if type(pitches[i]) == list:              # is it a chord?
+            self.addChord(pitches[i], durations[i], dynamics[i], panoramics[i], lengths[i])  # yes, so add it
+         else:                                     # else, it's a note
+            n = Note(pitches[i], durations[i], dynamics[i], panoramics[i], lengths[i])       # create note
+            self.addNote(n)                                                                  # and add it
+
+# Do NOT make these functions callable - Phrase class is meant to be instantiated,
+# i.e., we will always call these from a Phrase object - not the class, e.g., as in Mod.
+
+######################################################################################
+#### MIDI pitch bend ##################################################################
+######################################################################################
+
+# The MIDI specification stipulates that pitch bend be a 14-bit value, where zero is
+# maximum downward bend, 16383 is maximum upward bend, and 8192 is the center (no pitch bend).
+PITCHBEND_MIN = 0
+PITCHBEND_MAX = 16383
+PITCHBEND_NORMAL = 8192
+
+# calculate constants from the way we handle pitch bend
+OUR_PITCHBEND_MAX    = PITCHBEND_MAX - PITCHBEND_NORMAL
+OUR_PITCHBEND_MIN    = -PITCHBEND_NORMAL
+OUR_PITCHBEND_NORMAL = 0
+
+
+######################################################################################
+# synthesized jMusic instruments (also see http://jmusic.ci.qut.edu.au/Instruments.html)
+
+#import AMInst
+#import AMNoiseInst
+#import AddInst
+#import AddMorphInst
+#import AddSynthInst
+#import BandPassFilterInst
+#import BowedPluckInst
+#import BreathyFluteInst
+#import ChiffInst
+#import ControlledHPFInst
+#import DynamicFilterInst
+#import FGTRInst
+#import FMNoiseInst
+#import FractalInst
+#import GranularInst
+#import GranularInstRT
+#import HarmonicsInst
+#import LFOFilteredSquareInst
+#import LPFilterEnvInst
+#import NoiseCombInst
+#import NoiseInst
+#import OddEvenInst
+#import OvertoneInst
+#import PluckInst
+#import PluckSampleInst
+#import PrintSineInst
+#import PulseFifthsInst
+#import PulsewaveInst
+#import RTPluckInst
+#import RTSimpleFMInst
+#import ResSawInst
+#import ReverseResampledInst
+#import RingModulationInst
+#import SabersawInst
+#import SawCombInst
+#import SawHPFInst
+#import SawLPFInst
+#import SawLPFInstB
+#import SawLPFInstE
+#import SawLPFInstF
+#import SawLPFInstG
+#import SawLPFInstRT
+#import SawtoothInst
+#import Sawtooth_LPF_Env_Inst
+#import SimpleAMInst
+#import SimpleAllPassInst
+#import SimpleFMInst
+#import SimpleFMInstRT
+#import SimplePluckInst
+#import SimpleReverbInst
+#import SimpleSampleInst
+#import SimpleSineInst
+#import SimpleTremoloInst
+#import SimplestInst
+#import SineInst
+#import SlowSineInst
+#import SquareBackwardsInst
+#import SquareCombInst
+#import SquareInst
+#import SquareLPFInst
+#import SubtractiveSampleInst
+#import SubtractiveSynthInst
+#import SuperSawInst
+#import TextInst
+#import TimpaniInst
+#import TremoloInst
+#import TriangleInst
+#import TriangleRepeatInst
+#import VaryDecaySineInst
+#import VibesInst
+#import VibratoInst
+#import VibratoInstRT
+
+# preserve Jython bindings that get ovwerwritten by the following Java imports - a hack!
+# (also see very top of this file)
+enumerate = enumerate_preserve
@@ -0,0 +1,114 @@
+################################################################################################################
+# importprofile.py       Version 1.1     19-Oct-2026     John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Measures how long music3 takes to get going, i.e., time to import it, and time to first sound (an FM synthesis
+# note, as accordium.py plays, and a MIDI note), when importing everything up front (as accordium.py does - this is
+# also what the single-file music3.py used to do), and when importing lazily.  Each should run in a fresh JVM, e.g.,
+# from the accordium folder:
+#
+#   ./jython.sh music3/importprofile.py star    # "from music3 import *" (everything is loaded up front)
+#   ./jython.sh music3/importprofile.py lazy    # "import music3" (parts are loaded as they are needed)
+#
+# It also measures opening the Java synthesizer on first use, as opposed to when importing (as we used to).
+#
+# REVISIONS:
+#
+#   1.1     19-Oct-2026 (jt) The Java synthesizer is now opened without the default soundbank's instruments (a plain
+#                       open() loads them all, so loading one program at a time saved nothing), so compare with a
+#                       separate synthesizer opened the old way.
+#
+#   1.0     19-Oct-2026 (jt) First version (also includes the Java synthesizer measurements, which used to be in music3.py).
+#
+
+import sys
+import os.path
+from java.lang import System
+
+def elapsed(startTime):
+   """Returns milliseconds since 'startTime' (from System.nanoTime())."""
+   return (System.nanoTime() - startTime) / 1000000.0
+
+# we live inside the music3 package, so make sure it can be imported
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0]))))
+
+mode = "star"
+if len(sys.argv) > 1:
+   mode = sys.argv[1]
+
+###### time to import ######
+startTime = System.nanoTime()
+
+if mode == "star":
+   from music3 import *      # everything, up front
+   import music3
+
+else:
+   import music3             # nothing, until needed
+
+importTime = elapsed(startTime)
+
+###### time to first sound ######
+startTime = System.nanoTime()
+fm = music3.FMSynthesisInstrument(440, 3)          # as accordium.py does
+music3.Play.audioNote(music3.A4, 0, 500, fm)       # queued to start AUDIO_LOOKAHEAD milliseconds from now
+audioTime = elapsed(startTime) + music3.Play.getAudioLookahead()
+
+startTime = System.nanoTime()
+music3.Play.noteOn(music3.A4)                      # opens the Java synthesizer (and loads program 0)
+midiTime = elapsed(startTime)
+
+print "%s import: %.1f ms, first audio note: %.1f ms more, first MIDI note: %.1f ms more" % \
+      (mode, importTime, audioTime, midiTime)
+print "time to first sound: %.1f ms" % (importTime + audioTime)
+
+loadTimes = music3.__loadTimes__
+for submodule in ["core", "play", "audioinstruments", "midisequence", "metronome", "notetable"]:
+   if submodule in loadTimes:
+      print "   %-20s %8.1f ms" % (submodule, loadTimes[submodule])
+   else:
+      print "   %-20s (not loaded)" % submodule
+
+###### Java synthesizer - opened on first use, as opposed to when importing (as we used to) ######
+# NOTE: A plain open() of Gervill (the Java software synthesizer) loads all of the default soundbank's instruments,
+# so play.py opens it without them (see __openJavaSynthesizer__()), and loads them one program at a time.  Below, we
+# compare with a second synthesizer, opened the old way, i.e., plain open() (it reuses the soundbank already read
+# from disk, so it measures only loading all instruments, which is what we now save).
+play = sys.modules["music3.play"]
+
+startTime = System.nanoTime()
+music3.Play.setInstrument(40, 1)                   # first use of another program (violin) - load just its instruments
+programTime = elapsed(startTime)
+
+startTime = System.nanoTime()
+oldSynthesizer = play.MidiSystem.getSynthesizer()  # a separate synthesizer (Gervill creates a new one each time)
+oldSynthesizer.open()                              # what we used to pay (loads all instruments)
+oldOpenTime = elapsed(startTime)
+oldSynthesizer.close()
+
+print "open Java synthesizer (with program 0): %.1f ms, load one more program: %.1f ms" % (midiTime, programTime)
+print "open Java synthesizer the old way (all instruments, soundbank already read): %.1f ms" % oldOpenTime
+
+music3.Play.noteOff(music3.A4)
+music3.Play.stop()
@@ -0,0 +1,342 @@
+################################################################################################################
+# metronome.py  Version 4.25         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Metronome, which schedules and synchronizes function calls (e.g., to start blocks of musical
+# material together).
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+from music3.core import *
+from music3.play import Play   # needed to sonify ticks
+from timer import *
+
+
+# used to keep track which Metronome objects are active, so we can stop them when
+# JEM's Stop button is pressed
+__ActiveMetronomes__ = {}     # holds running Metronome objects (keyed by id, for quick removal)
+
+##### Metronome class ######################################
+
+from timer import Timer
+#from gui import Display     # for Metronome tick visualization
+
+class Metronome():
+   """Creates a metronome object used in scheduling and synchronizing function call (intended for starting blocks of musical
+      material together, but could be really used for anything (e.g., GUI animzation).  This is based on the Timer class,
+      but is higher-level, based on tempo (e.g., 60 BPM), and time signatures (e.g., 4/4).
+   """
+
+   #def __init__(self, tempo=60, timeSignature=[4, 4], displaySize=50, displayTickColor=Color.RED):
+   def __init__(self, tempo=60, timeSignature=[4, 4]):
+
+      # remember title, tempo and time signature
+      self.tempo = tempo
+      self.timeSignature = timeSignature  # a list (first item is numerator, second is denominator)
+
+      # list of functions (we are asked to synchronize) and their information (parallel lists)
+      self.functions        = []    # functions to call
+      self.parameters       = []    # their corresponding parameters
+      self.desiredBeats     = []    # on which beat to call them (0 means now)
+      self.repeatFlags      = []    # if they are meant to be called repeatedly
+      self.beatCountdowns   = []    # holds beat countdown until call
+
+      # create timer, upon which to base our operation
+      delay = (60.0 / self.tempo) * 1000   # in milliseconds
+      self.timer = Timer2(delay, self.__callFunctions__, [], True, fixedRate=True, latePolicy=CATCH_UP)
+
+      # set up metronome visualization
+#      self.display = Display("Metronome", displaySize, displaySize+20, 0, 0)
+#      self.display.hide()      # initially hidden
+#
+#      # set up display ticking
+#      self.displayTickColor = displayTickColor               # color used for ticking
+#      self.displayOriginalColor = self.display.getColor()    # color to reset ticking
+#      self.flickerTimer = Timer2(100, self.display.setColor, [self.displayOriginalColor])   # create timer to reset display color (it ends fliker)
+#      self.add( self.__updateDisplay__, [], 0, True, 1)      # schedule display flickering on every beat (starts flicker)
+
+      # set up metronome visualization / sonification
+      self.currentBeat   = 1       # holds current beat relative to provided time signature (1 means first beat)
+      self.visualize     = False   # True means print out current beat on console; False do not print
+      self.sonify        = False   # True means sound each tick; False do not
+      self.sonifyPitch   = HI_MID_TOM   # which pitch to play whe ticking
+      self.sonifyChannel = 9       # which channel to use (9 is for percussion)
+      self.sonifyVolume  = 127     # how loud is strong beat (secondary beats will at 70%)
+
+
+   def add(self, function, parameters=[], desiredBeat=0, repeatFlag=False):
+      """It schedules the provided function to be called by the metronome (passing the provided parameters to it) on the
+         desired beat (0 means right away, 1 means first (strong) beat, 2 means second beat, etc.), and whether to keep
+         calling in it every time the desired beat comes around.
+      """
+      self.functions.append( function )
+      self.parameters.append( parameters )
+      self.desiredBeats.append( desiredBeat )
+      self.repeatFlags.append( repeatFlag )
+
+      # calculate beat countdown
+      beatCountdown = self.__calculateBeatCountdown__( desiredBeat )
+
+      # store beat countdown for this function
+      self.beatCountdowns.append( beatCountdown )
+
+   def remove(self, function):
+      """It removes the provided function from the list of functions scheduled (via add) to be called by the metronome.
+         If several instances of this function have been scheduled, it removes the earliest one (i.e., several calls of this
+         will be needed to remove all scheduled instances - a design choice).  If the function is not scheduled, it throws
+         an error.
+      """
+      index = self.functions.index( function )   # find index of leftmost occurrence
+      self.functions.pop( index )                # and remove it and all info
+      self.parameters.pop( index )
+      self.desiredBeats.pop( index )
+      self.repeatFlags.pop( index )
+      self.beatCountdowns.pop( index )
+
+   def removeAll(self):
+      """It removes all provided functions to be called by the metronome."""
+
+      # reinitialize all function related information
+      self.functions        = []
+      self.parameters       = []
+      self.desiredBeats     = []
+      self.repeatFlags      = []
+      self.beatCountdowns   = []
+
+   def setTempo(self, tempo):
+      """It sets the metronome's tempo."""
+
+      self.tempo = tempo        # remember new tempo
+
+      # and set it (the current beat is stretched to the new tempo, so the metronome does not skip)
+      delay = (60.0 / self.tempo) * 1000   # in milliseconds
+      self.timer.setDelay(delay)
+
+   def getTempo(self):
+      """It returns the metronome's tempo."""
+      return self.tempo
+
+   def setTimeSignature(self, timeSignature):
+      """It sets the metronome's time signature."""
+      self.timeSignature = timeSignature        # remember new time signature
+      self.currentBeat = 0                      # reinitialize current beat relative to provided time signature (1 means first beat)
+
+   def getTimeSignature(self):
+      """It returns the metronome's time signature."""
+      return self.timeSignature
+
+   def start(self):
+      """It starts the metronome."""
+      self.timer.start()
+
+      # remember that this Metronome is running (so that it can be stopped by JEM, if desired)
+      __ActiveMetronomes__[id(self)] = self
+      print "Metronome started..."
+
+   def stop(self):
+      """It starts the metronome."""
+      self.timer.stop()
+      __ActiveMetronomes__.pop(id(self), None)
+      print "Metronome stopped."
+
+#   def __updateDisplay__(self):
+#      """It temporarily flickers the metronome's visualization display to indicate a 'tick'."""
+#
+#      # change color to indicate a tick
+#      self.display.setColor( self.displayTickColor )
+#
+#      # reset display back to original color after a small delay
+#      #flikcerTimer = Timer2(250, self.display.setColor, [self.displayOriginalColor])
+#      #flikcerTimer.start()    # after completion, this timer will eventually be garbage collected (no need to reuse)
+#      self.flickerTimer.start()
+
+#   def __advanceCurrentBeat__(self):
+#      """It advances the current metronome beat."""
+#
+#      if self.visualize:   # do we need to print out current beat?
+#         print self.currentBeat
+#
+#      if self.sonify:   # do we need to sound out current beat?
+#         if self.currentBeat == 1:    # strong (first) beat?
+#            Play.note(self.sonifyPitch, 0, 200, self.sonifyVolume, self.sonifyChannel)   # louder
+#         else:
+#            Play.note(self.sonifyPitch, 0, 200, int(self.sonifyVolume * 0.7), self.sonifyChannel)   # softer
+#
+#      self.currentBeat = (self.currentBeat % self.timeSignature[0]) + 1  # wrap around as needed
+
+
+   def __callFunctions__(self):
+      """Calls all functions we are asked to synchronize."""
+
+      # do visualization / sonification tasks (if any)
+      if self.visualize:   # do we need to print out current beat?
+         print self.currentBeat
+
+      if self.sonify:   # do we need to sound out current beat?
+         if self.currentBeat == 1:    # strong (first) beat?
+            Play.note(self.sonifyPitch, 0, 200, self.sonifyVolume, self.sonifyChannel)   # louder
+         else:
+            Play.note(self.sonifyPitch, 0, 200, int(self.sonifyVolume * 0.7), self.sonifyChannel)   # softer
+
+      #***
+      #print "self.desiredBeats, self.beatCountdowns = ",
+      #print self.desiredBeats, self.beatCountdowns
+
+      # NOTE:  The following uses several for loops so that all functions are given quick service.
+      #        Once they've been called, we can loop again to do necessary book-keeping...
+
+      # first, iterate to call all functions with their (provided) parameters
+      nonRepeatedFunctions = []   # holds indices of functions to be called only once (so we can remove them later)
+      for i in range( len(self.functions) ):
+
+        # see if current function needs to be called right away
+        if self.beatCountdowns[i] == 0:
+
+           # yes, so call this function!!!
+           self.functions[i]( *(self.parameters[i]) )   # strange syntax, but does the trick...
+
+           # check if function was meant to be called only once, and if so remove from future consideration
+           if not self.repeatFlags[i]:  # call only once?
+
+              nonRepeatedFunctions.append( i )   # mark it for deletion (so it is not called again)
+
+      # now, all functions who needed to be called have been called
+
+      # next, iterate to remove any functions that were meant to be called once
+      # NOTE: We remove functions right-to-left - see use of reversed().  This way, as lists shrink,
+      #       earlier indices are still valid for other items to be removed (if any)!!!
+      for i in reversed(nonRepeatedFunctions):
+         self.functions.pop( i )
+         self.parameters.pop( i )
+         self.desiredBeats.pop( i )
+         self.repeatFlags.pop( i )
+         self.beatCountdowns.pop( i )
+
+
+      ###########################################################################################
+      # NOTE:  This belongs exactly here (before updating countdown timers below)
+
+      # advance to next beat (in anticipation...)
+      self.currentBeat = (self.currentBeat % self.timeSignature[0]) + 1  # wrap around as needed
+
+      ###########################################################################################
+
+      # finally, iterate to update countdown timers for all remaining functions
+      for i in range( len(self.functions) ):
+
+        # if this function was just called
+        if self.beatCountdowns[i] == 0:
+
+           # reinitialize its beat countdown counter, i.e., reschedule it for its next call
+
+           # calculate beat countdown
+           self.beatCountdowns[i] = self.__calculateBeatCountdown__( self.desiredBeats[i] )
+
+        else:   # it's not time to call this function, so update its information
+
+           # reduce ticks remaining to call it
+           self.beatCountdowns[i] = self.beatCountdowns[i] - 1     # we are now one tick closer to calling it
+
+      # now, all functions who needed to be called have been called, and all beat countdowns
+      # have been updated.
+
+
+   def __calculateBeatCountdown__(self, desiredBeat):
+      """Calculates the beat countdown given the desired beat."""
+
+#      if desiredBeat == 0:  # do they want now (regardess of current beat)?
+#         beatCountdown = 0     # give them now
+#      elif desiredBeat >= self.currentBeat:  # otherwise, is desired beat now or in the future?
+#         beatCountdown = desiredBeat - self.currentBeat  # calculate remaining beats until then
+#      else:  # desired beat has passed in the time signature, so we need to pick it up in the next measure
+#         beatCountdown = (desiredBeat + self.timeSignature[0]) - self.currentBeat
+
+      if desiredBeat == 0:  # do they want now (regardess of current beat)?
+         beatCountdown = 0     # give them now
+      elif self.currentBeat <= desiredBeat <= self.timeSignature[0]:  # otherwise, is desired beat the remaining measure?
+         beatCountdown = desiredBeat - self.currentBeat                            # calculate remaining beats until then
+      elif 1 <= desiredBeat < self.currentBeat:                       # otherwise, is desired beat passed in this measure?
+         beatCountdown = (desiredBeat + self.timeSignature[0]) - self.currentBeat  # pick it up in the next measure
+      elif self.timeSignature[0] < desiredBeat:                       # otherwise, is desired beat beyond this measure?
+         beatCountdown = desiredBeat - self.currentBeat + self.timeSignature[0]    # calculate remaining beats until then
+      else:  # we cannot handle negative beats
+         raise ValueError("Cannot handle negative beats, " + str(desiredBeat) + ".")
+
+      # ***
+      #print "beatCountdown =", beatCountdown
+      return beatCountdown
+
+
+   def show(self):
+      """It shows the metronome visualization display."""
+      #self.display.show()
+      self.visualize = True
+
+   def hide(self):
+      """It shows the metronome visualization display."""
+      #self.display.hide()
+      self.visualize = False
+
+   def soundOn(self, pitch=ACOUSTIC_BASS_DRUM, volume=127, channel=9):
+      """It turns the metronome sound on."""
+      self.sonify = True
+      self.sonifyPitch   = pitch   # which pitch to play whe ticking
+      self.sonifyChannel = channel # which channel to use (9 is for percussion)
+      self.sonifyVolume  = volume  # how loud is strong beat (secondary beats will at 70%)
+
+   def soundOff(self):
+      """It turns the metronome sound off."""
+      self.sonify = False
+
+
+
+
+#
+#####################################################################################
+# If running inside JEM, register function that stops everything, when the Stop button
+# is pressed inside JEM.
+######################################################################################
+
+# function to stop and clean-up all active MidiSequences
+def __stopActiveMetronomes__():
+
+   global __ActiveMetronomes__
+
+   # first, stop them (stopping a metronome removes it from __ActiveMetronomes__, so iterate over a copy)
+   for m in __ActiveMetronomes__.values():
+      m.stop()
+
+   # also empty list, so things can be garbage collected
+   __ActiveMetronomes__ = {}   # remove access to deleted items
+
+# now, register function with JEM (if possible)
+try:
+
+    # if we are inside JEM, registerStopFunction() will be available
+    registerStopFunction(__stopActiveMetronomes__)   # tell JEM which function to call when the Stop button is pressed
+
+except:  # otherwise (if we get an error), we are NOT inside JEM
+
+    pass    # so, do nothing.
@@ -0,0 +1,280 @@
+################################################################################################################
+# midisequence.py Version 4.25         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# MidiSequence, which plays (and loops) MIDI files and music library objects, and lets us
+# change their pitch, tempo, and volume while playing.
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+from music3.core import *
+from javax.sound.midi import *
+from jm.midi import MidiSynth  # needed to play and loop MIDI
+
+
+# used to keep track which MidiSequence objects are active, so we can stop them when
+# JEM's Stop button is pressed
+__ActiveMidiSequences__ = []     # holds active MidiSequence objects
+
+##### MidiSequence class ######################################
+
+class MidiSequence():
+   """Encapsulates a midi sequence object created from the provided material, which is either a string
+      - the filename of a MIDI file (.mid), or music library object (Score, Part, Phrase, or Note).
+      The midi sequence has a default MIDI pitch (e.g., A4) and volume.  The sequence can be played once, looped,
+      and stopped.  Also, we may change its pitch, tempo, and volume.  These changes happen immediately.
+   """
+
+   def __init__(self, material, pitch=A4, volume=127):
+
+      # determine what type of material we have
+      if type(material) == type(""):   # a string?
+
+         self.filename = material                # assume it's an external MIDI filename
+
+         # load and create the MIDI sample
+         self.score = Score()                    # create an empty score
+         Read.midi(self.score, self.filename)    # load the external MIDI file
+
+      else:  # determine what type of material we have
+
+         # and do necessary datatype wrapping (MidiSynth() expects a Score)
+         if type(material) == Note:
+            material = Phrase(material)
+         if type(material) == Phrase:   # no elif - we need to successively wrap from Note to Score
+            material = Part(material)
+         if type(material) == jPhrase:  # (also wrap jMusic default Phrases, in addition to our own)
+            material = Part(material)
+         if type(material) == Part:     # no elif - we need to successively wrap from Note to Score
+            material = Score(material)
+
+         if type(material) == Score:
+
+            self.score = material     # and remember it
+
+         else:   # error check
+            raise TypeError("Midi() - Unrecognized type", type(material), "- expected filename (string), Note, Phrase, Part, or Score.")
+
+      # now, self.score contains a Score object
+
+      # create Midi sequencer to playback this sample
+      self.midiSynth = self.__initMidiSynth__()
+
+      # get access to the MidiSynth's internal components (neededd for some of our operations)
+      self.sequencer = self.midiSynth.getSequencer()
+      self.synthesizer = self.midiSynth.getSynthesizer()
+
+      # set tempo factor
+      self.tempoFactor = 1.0   # scales whatever tempo is set for the sequence (1.0 means no change)
+
+      self.defaultTempo = self.score.getTempo()   # remember default tempo
+      self.playbackTempo = self.defaultTempo      # set playback tempo to default tempo
+
+      # set volume
+      self.volume = volume           # holds volume (0-127)
+      #self.setVolume( self.volume )  # set desired volume
+
+      # set MIDI score's default pitch
+      self.pitch = pitch                         # remember provided pitch
+
+      # remember that this MidiSequence has been created and is active (so that it can be stopped by JEM, if desired)
+      __ActiveMidiSequences__.append(self)
+
+
+   def __initMidiSynth__(self):
+      """Creates and initializes a MidiSynth object."""
+
+      # NOTE: Since we need access to the "guts" of the MidiSynth object, it is important to initialize it.
+      #       This happens automatically the first time we play something through it, so let's play an empty score.
+      midiSynth = MidiSynth()   # create it
+      midiSynth.play( Score() ) # and initialize it
+      return midiSynth
+
+
+   def play(self):
+      """Play the MIDI score."""
+
+      # make sure only one play is active at a time
+      if self.midiSynth.isPlaying():     # is another play is on?
+         self.stop()                        # yes, so stop it
+
+      #self.sequencer.setLoopCount(0)     # set to no repetition (needed, in case we are called after loop())
+      self.midiSynth.setCycle(False)     # turn off looping (just in case)
+      self.midiSynth.play( self.score )  # play it!
+
+   def loop(self):
+      """Repeat the score indefinitely."""
+
+      # make sure only one play is active at a time
+      if self.midiSynth.isPlaying():     # is another play is on?
+         self.stop()                        # yes, so stop it
+
+      # Due to an apparent Java Sequencer bug in setting tempo, we can only loop indefinitely (not a specified
+      # number of times).  Looping a specified number of times causes the second iteration to playback at 120 BPM.
+      #self.sequencer.setLoopCount(times)  # set the number of times to repeat the sequence
+      self.midiSynth.setCycle(True)
+      self.midiSynth.play( self.score )   # play it!
+
+   def isPlaying(self):
+      """
+      Returns True if the sequence is still playing.
+      """
+      return self.midiSynth.isPlaying()
+
+   def stop(self):
+      """Stop the MIDI score play."""
+
+      self.midiSynth.stop()
+
+   def pause(self):
+      """Pause the MIDI sequence play."""
+      self.__setTempoFactor__(0.00000000000000000000000000000000000000000001) # slow play down to (almost) a standstill
+
+   def resume(self):
+      """
+      Resume playing the sample (from the paused position).
+      """
+      self.__setTempoFactor__(1.0) # reset playback to original tempo (i.e., resume)
+
+   # low-level helper function
+   def __setTempoFactor__(self, factor = 1.0):
+      """
+      Set MIDI sequence's tempo factor (1.0 means default, i.e., no change).
+      """
+      self.sequencer.setTempoFactor( factor )
+
+
+   def setPitch(self, pitch):
+      """Set the MidiSequence's playback pitch (by transposing the MIDI material)."""
+
+      semitones = pitch - self.pitch          # get the pitch change in semitones
+      Mod.transpose( self.score, semitones )  # update score pitch appropriately
+
+      # do some low-level work inside MidiSynth
+      updatedSequence = self.midiSynth.scoreToSeq( self.score )  # get new Midi sequence from updated score
+      self.positionInMicroseconds = self.sequencer.getMicrosecondPosition()  # remember where to resume
+      self.sequencer.setSequence(updatedSequence)                # update the sequence - this restarts playing...
+      self.sequencer.setMicrosecondPosition( self.positionInMicroseconds )   # ...so reset playing to where we left off
+      self.sequencer.setTempoInBPM( self.playbackTempo )         # set tempo (needed for the first (partial) iteration)
+
+      # finally, remember new pitch
+      self.pitch = pitch
+
+   def getPitch(self):
+      """Returns the MIDI score's pitch."""
+
+      return self.pitch
+
+   def getDefaultPitch(self):
+      """Return the MidiSequence's default pitch."""
+
+      return self.defaultPitch
+
+
+   def setTempo(self, beatsPerMinute):
+      """
+      Set MIDI sequence's playback tempo.
+      """
+      # Due to an apparent Java Sequencer bug in setting tempo, when looping a specified number of times causes
+      # all but the first iteration to playback at 120 BPM, regardless of what the current tempo may be.
+      # Unable to solve the problem in the general case, below is an attempt to fix it for some cases (e.g.,
+      # for looping continuously, but not for looping a specified number of times).
+      self.playbackTempo = beatsPerMinute               # keep track of new playback tempo
+      self.sequencer.setTempoInBPM( beatsPerMinute )    # and set it
+      self.midiSynth.setTempo( beatsPerMinute )         # and set it again (this seems redundant, but see above)
+      self.score.setTempo( beatsPerMinute )             # and set it again (this seems redundant, but see above)
+
+   def getTempo(self):
+      """
+      Return MIDI sequence's playback tempo.
+      """
+      return self.playbackTempo
+
+   def getDefaultTempo(self):
+      """
+      Return MIDI sequence's default tempo (in beats per minute).
+      """
+      return self.defaultTempo
+
+
+   def setVolume(self, volume):
+      """Sets the volume for the MidiSequence (volume ranges from 0 - 127)."""
+
+      self.volume = volume    # remember new volume
+
+      # NOTE:  Setting volume through a MidiSynth is problematic.
+      #        Here we use a solution by Howard Amos (posted 8/16/2012) in
+      #        http://www.coderanch.com/t/272584/java/java/MIDI-volume-control-difficulties
+      volumeMessage = ShortMessage()    # create a MIDI message
+      #receiver = self.sequencer.getTransmitters().iterator().next().getReceiver()  # get the MidiSynth receiver
+      receiver = self.sequencer.getTransmitters()[0].getReceiver()  # get the MidiSynth receiver
+
+      for channel in range(16):   # change volume of all the MIDI channels
+         volumeMessage.setMessage(0xB0 + channel, 7, volume)   # set coarse volume control for this channel
+         receiver.send (volumeMessage, -1)                     # and communicate it to the receiver
+
+   def getVolume(self):
+      """Returns the volume for the MidiSequence (volume ranges from 0 - 127)."""
+
+      return self.volume
+
+
+######################################################################################
+# If running inside JEM, register function that stops everything, when the Stop button
+# is pressed inside JEM.
+######################################################################################
+
+# function to stop and clean-up all active MidiSequences
+def __stopActiveMidiSequences__():
+
+   global __ActiveMidiSequences__
+
+   # first, stop them
+   for m in __ActiveMidiSequences__:
+      m.stop()    # no need to check if they are playing - just do it (it's fine)
+
+   # then, delete them
+   for m in __ActiveMidiSequences__:
+      del m
+
+   # also empty list, so things can be garbage collected
+   __ActiveMidiSequences__ = []   # remove access to deleted items
+
+# now, register function with JEM (if possible)
+try:
+
+    # if we are inside JEM, registerStopFunction() will be available
+    registerStopFunction(__stopActiveMidiSequences__)   # tell JEM which function to call when the Stop button is pressed
+
+except:  # otherwise (if we get an error), we are NOT inside JEM
+
+    pass    # so, do nothing.
+
+
+
+
+# preserve Jython bindings that get ovwerwritten by the previous Java imports - a hack!
+# (also see very top of music3/core.py)
+enumerate = enumerate_preserve
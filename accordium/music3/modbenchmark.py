@@ -0,0 +1,174 @@
+################################################################################################################
+# modbenchmark.py       Version 1.0     19-Oct-2026     John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Compares Mod.elongate(), Mod.shift(), Mod.invert(), and Mod.retrograde(), which work on whole scores at once,
+# with the per-note versions they replaced (copied below), on scores of 10,000 and 100,000 notes.  Both versions
+# are run on identical scores, and their results are checked to be the same.  From the accordium folder:
+#
+#   ./jython.sh music3/modbenchmark.py            # 10,000 and 100,000 notes
+#   ./jython.sh music3/modbenchmark.py 50000      # or any other sizes
+#
+# REVISIONS:
+#
+#   1.0     19-Oct-2026 (jt) First version.
+#
+
+import sys
+import os.path
+from java.lang import System
+
+def elapsed(startTime):
+   """Returns milliseconds since 'startTime' (from System.nanoTime())."""
+   return (System.nanoTime() - startTime) / 1000000.0
+
+# we live inside the music3 package, so make sure it can be imported
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(sys.argv[0]))))
+
+from music3.core import *
+
+
+###### per-note versions (as they were) ######
+
+def elongate(material, scaleFactor):
+   def elongateNote(note, scaleFactor):
+      note.setDuration( note.getDuration() * scaleFactor)
+   def elongatePhrase(phrase, scaleFactor):
+      for note in phrase.getNoteList():
+         elongateNote(note, scaleFactor)
+   def elongatePart(part, scaleFactor):
+      for phrase in part.getPhraseList():
+         elongatePhrase(phrase, scaleFactor)
+   for part in material.getPartList():
+      elongatePart(part, scaleFactor)
+
+def shift(material, time):
+   def shiftPhrase(phrase, time):
+      newStartTime = phrase.getStartTime() + time
+      newStartTime = max(0, newStartTime)
+      phrase.setStartTime( newStartTime )
+   def shiftPart(part, time):
+      for phrase in part.getPhraseList():
+         shiftPhrase(phrase, time)
+   if type(material) == Part:
+      shiftPart(material, time)
+   else:
+      for part in material.getPartList():
+         shiftPart(part, time)
+
+def invert(material, pitchAxis):
+   # (the per-note version took a Phrase only, so call it for every phrase)
+   for part in material.getPartList():
+      for phrase in part.getPhraseList():
+         for note in phrase.getNoteList():
+            if not note.isRest():
+               invertedPitch = pitchAxis + (pitchAxis - note.getPitch())
+               note.setPitch( invertedPitch )
+
+def retrograde(material):
+   def getPartStartTime(part):
+      minStartTime = 10000000000.0
+      for phrase in part.getPhraseList():
+         minStartTime = min(minStartTime, phrase.getStartTime())
+      return minStartTime
+   def getPartEndTime(part):
+      maxEndTime   = 0.0
+      for phrase in part.getPhraseList():
+         maxEndTime   = max(maxEndTime, phrase.getEndTime())
+      return maxEndTime
+   def retrogradePart(part):
+      startTime = getPartStartTime(part)
+      endTime   = getPartEndTime(part)
+      for phrase in part.getPhraseList():
+         distanceFromEnd = endTime - phrase.getEndTime()
+         jMod.retrograde(phrase)
+         phrase.setStartTime( distanceFromEnd + startTime )
+   startTime = 10000000000.0
+   endTime   = 0.0
+   for part in material.getPartList():
+      startTime = min(startTime, getPartStartTime(part))
+      endTime   = max(endTime, getPartEndTime(part))
+   for part in material.getPartList():
+      distanceFromEnd = endTime - (getPartEndTime(part) + getPartStartTime(part))
+      retrogradePart(part)
+      shift(part, distanceFromEnd)
+
+
+###### test scores ######
+
+def makeScore(numNotes, notesPerPhrase = 100, phrasesPerPart = 10):
+   """Returns a Score with 'numNotes' notes (of our own Note class), in phrases with different start times."""
+
+   score = Score()
+   part = None
+   for i in range(numNotes / notesPerPhrase):
+      if i % phrasesPerPart == 0:
+         part = Part()
+         score.addPart(part)
+      phrase = Phrase( (i % phrasesPerPart) * 2.0 )
+      for j in range(notesPerPhrase):
+         phrase.addNote( Note(40 + (i + j) % 48, [QN, EN, HN][j % 3], 60 + j % 60) )
+      part.addPhrase(phrase)
+   return score
+
+def getColumns(score):
+   """Returns the start times of all phrases, and pitches, durations, and lengths of all notes (to compare results)."""
+
+   columns = []
+   for part in score.getPartArray():
+      for phrase in part.getPhraseArray():
+         columns.append( phrase.getStartTime() )
+         for note in phrase.getNoteArray():
+            columns.append( (note.getPitch(), note.getDuration(), note.getLength()) )
+   return columns
+
+
+###### benchmark ######
+
+sizes = [10000, 100000]
+if len(sys.argv) > 1:
+   sizes = [int(size) for size in sys.argv[1:]]
+
+benchmarks = [("elongate",   lambda score: elongate(score, 1.5),   lambda score: Mod.elongate(score, 1.5)),
+              ("shift",      lambda score: shift(score, 4.0),      lambda score: Mod.shift(score, 4.0)),
+              ("invert",     lambda score: invert(score, 64),      lambda score: Mod.invert(score, 64)),
+              ("retrograde", lambda score: retrograde(score),      lambda score: Mod.retrograde(score))]
+
+for size in sizes:
+   print "%d notes:" % size
+   for name, perNote, batch in benchmarks:
+
+      score1 = makeScore(size)
+      startTime = System.nanoTime()
+      perNote(score1)
+      perNoteTime = elapsed(startTime)
+
+      score2 = makeScore(size)
+      startTime = System.nanoTime()
+      batch(score2)
+      batchTime = elapsed(startTime)
+
+      same = getColumns(score1) == getColumns(score2)
+      print "   %-12s per note: %9.1f ms,  batch: %9.1f ms  (%.1fx)  same result: %s" % \
+            (name, perNoteTime, batchTime, perNoteTime / max(batchTime, 0.001), same)
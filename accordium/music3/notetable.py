@@ -0,0 +1,521 @@
+################################################################################################################
+# notetable.py  Version 4.29         19-Oct-2026       John-Anthony Thevos
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2026 John-Anthony Thevos
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# NoteTable, a compact score representation for algorithmic composition.
+#
+# Every note added to a Phrase is a jMusic Note (and, if created by us, a Python Note wrapper, too), i.e.,
+# a few hundred bytes per note, and a Java object to construct.  Pieces with hundreds of thousands of notes
+# run out of memory (and take seconds to build).  Instead, a NoteTable stores its notes as columns of typed
+# arrays (pitch, start, duration, dynamic, panning, and length), i.e., about 50 bytes per note, and converts
+# to jMusic Phrases, Parts, and Scores only when asked to (e.g., to play it, or to write a MIDI file), e.g.,
+#
+#   table = NoteTable()
+#   table.addNoteList(pitches, durations)   # (as Phrase.addNoteList(), including chords)
+#   Play.midi(table)                        # converted to a Score here (and only once, while unchanged)
+#
+# Pitches are stored as MIDI pitches, with fractions for frequencies in between (e.g., 440.0 Hz is 69.0,
+# and 450.0 Hz is 69.39), and start times are in beats (quarter notes), as jMusic's.
+#
+# A NoteTable is a single part, i.e., it has one tempo, instrument, and channel.  When jMusic material is added,
+# its tempo (that of the Score, or of the Part or Phrase, if set), and its part's instrument and channel are kept,
+# and used when converting back.  Flattening a Score whose parts have different instruments (or channels) into
+# one table would lose them, so it is an error - use one NoteTable per part instead.  (Tempos of individual parts
+# and phrases within a Score are not kept, only the Score's.)
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+from music3.core import *
+from array import array
+from math import log
+
+# how close (in beats) start times should be to be considered the same (start times are sums of durations)
+START_TIME_TOLERANCE = 0.000001
+
+##### NoteTable class ######################################
+
+class NoteTable:
+   """Notes stored as columns of typed arrays (pitch, start, duration, dynamic, panning, and length), which are
+      converted to jMusic material (Phrase, Part, Score) only when needed."""
+
+   def __init__(self, material=None):
+      """Creates an empty note table, or one with the notes of 'material' (Note, Phrase, Part, or Score)."""
+
+      self.pitches   = array('d')    # MIDI pitch (with fractions for microtones), or REST
+      self.starts    = array('d')    # start time (in beats)
+      self.durations = array('d')    # duration (in beats - for chords, that of the whole chord)
+      self.dynamics  = array('h')    # 0 to 127
+      self.pannings  = array('d')    # 0.0 (left) to 1.0 (right)
+      self.lengths   = array('d')    # performed length (in beats)
+
+      self.endTime = 0.0             # where the next note added goes (i.e., after the last one)
+      self.sorted = True             # are notes in start time order? (if not, conversions sort them first)
+      self.conversions = {}          # jMusic material converted from this table (while unchanged)
+
+      self.tempo = None              # in beats per minute (None means the Score default)
+      self.instrument = -1           # MIDI instrument (-1 means the global instrument, as with Phrases)
+      self.channel = 0               # MIDI channel
+
+      if material is not None:
+         self.addMaterial(material)
+
+   def __len__(self):
+      return len(self.pitches)
+
+   def __getitem__(self, index):
+      """Returns note 'index' as (pitch, start, duration, dynamic, panning, length), or, for a slice,
+         a new NoteTable with those notes."""
+
+      if type(index) == slice:
+         table = NoteTable()
+         for column in ['pitches', 'starts', 'durations', 'dynamics', 'pannings', 'lengths']:
+            setattr(table, column, getattr(self, column)[index])
+         table.sorted = self.sorted
+         table.endTime = table.getEndTime()
+         table.tempo = self.tempo
+         table.instrument = self.instrument
+         table.channel = self.channel
+         return table
+
+      return (self.pitches[index], self.starts[index], self.durations[index], self.dynamics[index], \
+              self.pannings[index], self.lengths[index])
+
+   def __str__(self):
+      return "<NoteTable with " + str(len(self)) + " notes, from " + str(self.getStartTime()) + \
+             " to " + str(self.getEndTime()) + " beats>"
+
+   def __repr__(self):
+      return self.__str__()
+
+   ##### adding notes ######################################
+
+   def addNote(self, pitch, duration, dynamic=85, panoramic=0.5, length=None, start=None):
+      """Adds a note (MIDI pitch as int, or frequency as float, as Note) at 'start' (in beats), or, by default,
+         after the last note added."""
+
+      if length is None:   # not provided?
+         length = duration * jNote.DEFAULT_LENGTH_MULTIPLIER  # normally, duration * 0.9
+
+      if start is None:
+         start = self.endTime
+
+      self.__addRow__(self.__toPitch__(pitch), start, duration, dynamic, panoramic, length)
+      self.endTime = start + duration
+
+   def addChord(self, pitches, duration, dynamic=85, panoramic=0.5, length=None, start=None):
+      """Adds a chord (a list of pitches, sharing start time and duration), as addNote()."""
+
+      if length is None:   # not provided?
+         length = duration * jNote.DEFAULT_LENGTH_MULTIPLIER  # normally, duration * 0.9
+
+      if start is None:
+         start = self.endTime
+
+      for pitch in pitches:
+         self.__addRow__(self.__toPitch__(pitch), start, duration, dynamic, panoramic, length)
+      self.endTime = start + duration
+
+   def addNoteList(self, pitches, durations, dynamics=[], panoramics=[], lengths=[]):
+      """Adds notes (and chords) after the last note added, using provided lists of pitches, durations, etc.,
+         as Phrase.addNoteList()."""
+
+      # check if provided lists have equal lengths
+      if len(pitches) != len(durations) or \
+         (len(dynamics) != 0) and (len(pitches) != len(dynamics)) or \
+         (len(panoramics) != 0) and (len(pitches) != len(panoramics)) or \
+         (len(lengths) != 0) and (len(pitches) != len(lengths)):
+         raise ValueError("The provided lists should have the same length.")
+
+      # if dynamics was not provided, construct it with max value
+      if dynamics == []:
+         dynamics = [85] * len(pitches)
+
+      # if panoramics was not provided, construct it at CENTER
+      if panoramics == []:
+         panoramics = [0.5] * len(pitches)
+
+      # if note lengths was not provided, construct it at 90% of note duration
+      if lengths == []:
+         lengths = [duration * jNote.DEFAULT_LENGTH_MULTIPLIER for duration in durations]
+
+      # build the new columns, and then append them all at once
+      newPitches    = []
+      newStarts     = []
+      newDurations  = []
+      newDynamics   = []
+      newPannings   = []
+      newLengths    = []
+
+      start = self.endTime
+      if len(self.starts) > 0 and start < self.starts[-1]:
+         self.sorted = False
+
+      for i in xrange( len(pitches) ):
+         if type(pitches[i]) == list:   # is it a chord?
+            chord = pitches[i]             # yes, so add all its pitches
+         else:
+            chord = [pitches[i]]
+
+         for pitch in chord:
+            newPitches.append( self.__toPitch__(pitch) )
+            newStarts.append( start )
+            newDurations.append( durations[i] )
+            newDynamics.append( dynamics[i] )
+            newPannings.append( panoramics[i] )
+            newLengths.append( lengths[i] )
+
+         start = start + durations[i]
+
+      self.pitches.fromlist( newPitches )
+      self.starts.fromlist( newStarts )
+      self.durations.fromlist( newDurations )
+      self.dynamics.fromlist( newDynamics )
+      self.pannings.fromlist( newPannings )
+      self.lengths.fromlist( newLengths )
+
+      self.endTime = start
+      self.changed()
+
+   def addTable(self, table, start=None):
+      """Adds the notes of another NoteTable at 'start' (in beats), or, by default, after the last note added."""
+
+      if len(table) == 0:
+         return
+
+      if start is None:
+         start = self.endTime
+
+      offset = start - table.getStartTime()   # where its notes go
+      if start < self.getLastStartTime() or not table.sorted:
+         self.sorted = False
+
+      self.pitches.extend( table.pitches )
+      if offset == 0.0:
+         self.starts.extend( table.starts )
+      else:
+         self.starts.fromlist( [time + offset for time in table.starts] )
+      self.durations.extend( table.durations )
+      self.dynamics.extend( table.dynamics )
+      self.pannings.extend( table.pannings )
+      self.lengths.extend( table.lengths )
+
+      self.endTime = max(self.endTime, table.getEndTime() + offset)
+      self.changed()
+
+   def addMaterial(self, material, start=None):
+      """Adds the notes of jMusic material (Note, Phrase, Part, or Score) at 'start' (in beats), or, by default,
+         after the last note added.  Start times of phrases are kept (relative to 'start'), and so are the tempo,
+         and the part's instrument and channel (a Score whose parts differ in those raises a ValueError)."""
+
+      if start is None:
+         start = self.endTime
+
+      if isinstance(material, jNote):
+         self.addNote(material.getFrequency(), material.getDuration(), material.getDynamic(), \
+                      material.getPan(), material.getLength(), start)
+
+      elif isinstance(material, jPhrase):
+         if material.getTempo() > -1:   # has the phrase tempo been set?
+            self.__keepTempo__(material.getTempo())
+         self.__addPhrase__(material, start)
+
+      elif isinstance(material, Part):
+         self.__keepPart__(material)
+         if material.getTempo() > -1:   # has the part tempo been set?
+            self.__keepTempo__(material.getTempo())
+         for phrase in material.getPhraseArray():
+            self.__addPhrase__(phrase, start)
+
+      elif isinstance(material, Score):
+         parts = material.getPartArray()
+         for part in parts[1:]:   # check first, so that nothing is added on error
+            if part.getInstrument() != parts[0].getInstrument() or part.getChannel() != parts[0].getChannel():
+               raise ValueError("NoteTable.addMaterial(): Score parts have different instruments (or channels), " + \
+                                "which a NoteTable cannot keep - use one NoteTable per part instead.")
+         if len(parts) > 0:
+            self.__keepPart__(parts[0])
+         self.__keepTempo__(material.getTempo())
+         for part in parts:
+            for phrase in part.getPhraseArray():
+               self.__addPhrase__(phrase, start)
+
+      else:   # error check
+         raise TypeError("NoteTable.addMaterial(): Unrecognized type " + str(type(material)) + \
+                         ", expected Note, Phrase, Part, or Score.")
+
+   def changed(self):
+      """Forgets jMusic material converted earlier - call this after changing the columns directly."""
+      self.conversions = {}
+
+   ##### accessing notes ######################################
+
+   def getStartTime(self):
+      """Returns the start time of the first note (in beats)."""
+      if len(self.starts) == 0:
+         return 0.0
+      return min(self.starts)
+
+   def getLastStartTime(self):
+      """Returns the start time of the last note (in beats)."""
+      if len(self.starts) == 0:
+         return 0.0
+      return max(self.starts)
+
+   def getEndTime(self):
+      """Returns when the last note ends (in beats)."""
+      endTime = 0.0
+      starts = self.starts
+      durations = self.durations
+      for i in xrange( len(starts) ):
+         if starts[i] + durations[i] > endTime:
+            endTime = starts[i] + durations[i]
+      return endTime
+
+   def getTempo(self):
+      """Returns the tempo (in beats per minute), or None, if not set (i.e., the Score default is used)."""
+      return self.tempo
+
+   def setTempo(self, tempo):
+      """Sets the tempo (in beats per minute) used when converting to a Score."""
+      self.tempo = tempo
+      self.changed()
+
+   def getInstrument(self):
+      """Returns the MIDI instrument used when converting to a Part (-1 means the global instrument)."""
+      return self.instrument
+
+   def setInstrument(self, instrument):
+      """Sets the MIDI instrument used when converting to a Part (-1 means the global instrument)."""
+      self.instrument = instrument
+      self.changed()
+
+   def getChannel(self):
+      """Returns the MIDI channel used when converting to a Part."""
+      return self.channel
+
+   def setChannel(self, channel):
+      """Sets the MIDI channel used when converting to a Part."""
+      self.channel = channel
+      self.changed()
+
+   def getFrequency(self, index):
+      """Returns the frequency of note 'index' (in Hz), or REST."""
+      pitch = self.pitches[index]
+      if pitch == REST:
+         return pitch
+      return noteToFreq(pitch)
+
+   ##### converting to jMusic material ######################################
+
+   def toPhrase(self):
+      """Returns a Phrase with these notes (the same one, until the table changes, so please do not modify it).
+         Notes may not overlap, other than as chords (same start and duration) - see toPart()."""
+
+      if 'phrase' not in self.conversions:
+         voices = self.__voices__()
+         if len(voices) > 1:
+            raise ValueError("NoteTable.toPhrase(): Notes overlap - use toPart() instead.")
+         self.conversions['phrase'] = self.__buildPhrase__(voices[0])
+
+      return self.conversions['phrase']
+
+   def toPart(self):
+      """Returns a Part with these notes (the same one, until the table changes, so please do not modify it).
+         Overlapping notes go in separate phrases.  The Part has the table's instrument and channel - by default,
+         no instrument (i.e., -1), so that the global instrument is used (as with Phrases)."""
+
+      if 'part' not in self.conversions:
+         part = Part()
+         part.setInstrument(self.instrument)   # -1 indicates no default instrument (needed to access global instrument)
+         part.setChannel(self.channel)
+         for rows in self.__voices__():
+            part.addPhrase( self.__buildPhrase__(rows) )
+         self.conversions['part'] = part
+
+      return self.conversions['part']
+
+   def toScore(self):
+      """Returns a Score with these notes (the same one, until the table changes, so please do not modify it),
+         at the table's tempo (if set)."""
+
+      if 'score' not in self.conversions:
+         score = Score( self.toPart() )
+         if self.tempo is not None:
+            score.setTempo(self.tempo)
+         self.conversions['score'] = score
+
+      return self.conversions['score']
+
+   ##### helper functions ######################################
+
+   def __toPitch__(self, pitch):
+      """Returns this pitch (int) or frequency (float) as a MIDI pitch (with fractions for frequencies in between)."""
+
+      if type(pitch) == int:
+         if pitch != REST and (pitch < 0 or pitch > 127):
+            raise TypeError( "Note pitch should be an integer between 0 and 127 (it was " + str(pitch) + ")." )
+         return float(pitch)
+
+      elif type(pitch) == float:
+         if pitch == REST:
+            return pitch
+         if not pitch > 0.0:
+            raise TypeError( "Note frequency should be a float greater than 0.0 (it was " + str(pitch) + ")." )
+         x = log(pitch / 440.0, 2) * 12 + 69
+         if abs(x - round(x)) < 0.000001:   # (close enough to) a MIDI pitch?
+            x = round(x)
+         return x
+
+      else:
+         raise TypeError( "Note pitch should be a pitch (int) or a frequency (float) - it was " + str(type(pitch)) + "." )
+
+   def __keepTempo__(self, tempo):
+      """Keeps the tempo of material added (the first one, if tables with different tempos are combined)."""
+      if self.tempo is None:
+         self.tempo = tempo
+         self.changed()
+
+   def __keepPart__(self, part):
+      """Keeps the instrument and channel of a part added - raises a ValueError if they differ from those kept."""
+
+      instrument = part.getInstrument()
+      channel = part.getChannel()
+      if len(self) == 0 or (self.instrument, self.channel) == (-1, 0):   # nothing kept yet?
+         self.instrument = instrument
+         self.channel = channel
+         self.changed()
+      elif (instrument, channel) != (self.instrument, self.channel):
+         raise ValueError("NoteTable.addMaterial(): Part instrument " + str(instrument) + " (channel " + str(channel) + \
+                          ") differs from the table's, instrument " + str(self.instrument) + " (channel " + \
+                          str(self.channel) + ") - use one NoteTable per part instead.")
+
+   def __addRow__(self, pitch, start, duration, dynamic, panoramic, length):
+      """Appends a note to the columns."""
+
+      if len(self.starts) > 0 and start < self.starts[-1]:
+         self.sorted = False
+
+      self.pitches.append( pitch )
+      self.starts.append( start )
+      self.durations.append( duration )
+      self.dynamics.append( dynamic )
+      self.pannings.append( panoramic )
+      self.lengths.append( length )
+
+      self.changed()
+
+   def __addPhrase__(self, phrase, start):
+      """Adds the notes of this phrase (rests are implied by start times), with its start time relative to 'start'."""
+
+      time = start + phrase.getStartTime()
+      chordNotes = []    # notes of a chord, waiting for the chord's duration (i.e., that of its last note)
+      for i in xrange( phrase.size() ):
+         note = phrase.getNote(i)
+         duration = note.getDuration()
+         frequency = note.getFrequency()
+
+         if frequency != REST:
+            self.__addRow__(self.__toPitch__(frequency), time, duration, note.getDynamic(), note.getPan(), note.getLength())
+            chordNotes.append( len(self.durations) - 1 )
+
+         if duration != 0.0:   # a single note (or rest), or the last note of a chord?
+            for row in chordNotes:
+               self.durations[row] = duration
+            chordNotes = []
+
+         time = time + duration
+
+      self.endTime = max(self.endTime, time)
+
+   def __voices__(self):
+      """Returns the notes, as lists of rows in start time order, so that notes in each list do not overlap
+         (other than as chords, i.e., same start time and duration)."""
+
+      starts = self.starts
+      durations = self.durations
+
+      order = range( len(starts) )
+      if not self.sorted:
+         order.sort(key = lambda i: starts[i])   # (stable, so chords stay in the order added)
+
+      voices = []   # [rows, start and duration of last note, end time]
+      for i in order:
+         start = starts[i]
+         for voice in voices:
+            if voice[2] <= start + START_TIME_TOLERANCE or \
+               abs(voice[1][0] - start) < START_TIME_TOLERANCE and voice[1][1] == durations[i]:   # fits here?
+               break
+         else:   # no voice has room for it, so start a new one
+            voice = [[], (start, durations[i]), start]
+            voices.append( voice )
+
+         voice[0].append( i )
+         voice[1] = (start, durations[i])
+         voice[2] = max(voice[2], start + durations[i])
+
+      if not voices:   # no notes, so one empty voice
+         voices.append( [[], None, None] )
+
+      return [voice[0] for voice in voices]
+
+   def __buildPhrase__(self, rows):
+      """Returns a Phrase with the notes in 'rows' (which do not overlap, other than as chords)."""
+
+      if not rows:
+         return Phrase(0.0)
+
+      pitches = self.pitches
+      starts = self.starts
+
+      phrase = Phrase( starts[rows[0]] )
+      time = starts[rows[0]]    # where the next note goes
+      for k in xrange( len(rows) ):
+         i = rows[k]
+         start = starts[i]
+
+         if start > time + START_TIME_TOLERANCE:        # is there a gap?
+            phrase.addNote( jNote(REST, start - time) )    # yes, so fill it with a rest
+
+         if k + 1 < len(rows) and abs(starts[rows[k+1]] - start) < START_TIME_TOLERANCE:   # a chord note (not the last)?
+            duration = 0.0                                 # yes, so it has no duration of its own (see Phrase.addChord())
+         else:
+            duration = self.durations[i]
+         time = start + duration
+
+         # create a jMusic Note directly (our Note wrapper would only add to memory used)
+         pitch = pitches[i]
+         if pitch == REST:
+            note = jNote(REST, duration)
+         elif pitch == int(pitch):                                # a MIDI pitch?
+            note = jNote(int(pitch), duration, self.dynamics[i], self.pannings[i])
+            note.setPitch( int(pitch) )                           # (see Note - fixes a jMusic bug)
+         else:                                                    # a frequency in between
+            note = jNote(noteToFreq(pitch), duration, self.dynamics[i], self.pannings[i])
+            note.setFrequency( noteToFreq(pitch) )
+         note.setLength( self.lengths[i] )
+
+         phrase.addNote( note )
+
+      return phrase
@@ -0,0 +1,1189 @@
+################################################################################################################
+# play.py       Version 4.32         19-Oct-2026       Bill Manaris, John-Anthony Thevos, Marge Marshall, Chris Benson, and Kenneth Hanson
+
+###########################################################################
+#
+# This file is part of Jython Music.
+#
+# Copyright (C) 2011-2016 Bill Manaris, Marge Marshall, Chris Benson, and Kenneth Hanson
+#
+#    Jython Music is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Jython Music is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Jython Music.  If not, see <http://www.gnu.org/licenses/>.
+#
+###########################################################################
+
+#
+# Play (MIDI and audio playback), and the Java MIDI synthesizer it uses.
+#
+# (Part of the music3 package - see __init__.py for how its parts are loaded, and for revisions.)
+#
+
+from music3.core import *
+
+######################################################################################
+#### jMusic Play extensions ##########################################################
+######################################################################################
+
+from jm.util import Play as jPlay  # needed to wrap more functionality below
+
+# Create Play.noteOn(pitch, velocity, channel) to start a MIDI note sounding,
+#        Play.noteOff(pitch, channel) to stop the corresponding note from sounding, and
+#        Play.setInstrument(instrument, channel) to change instrument for this channel.
+#
+# This adds to existing Play functionality.
+# This class is not meant to be instantiated, hence no "self" in function definitions.
+# Functions are made callable through class Callable, above.
+
+from javax.sound.midi import *
+
+# NOTE: Opening the Java synthesizer generates some low-level noise in the audio output, and loading its soundbank
+# takes time (and memory).  But many programs (e.g., those using only JSyn instruments) never send it a single MIDI
+# message.  So, we open it just-in-time, i.e., on the first MIDI-producing call, such as Play.noteOn() (see
+# __getMidiChannels__() below), and load instruments one program at a time, as they are first used (see __loadProgram__()).
+
+Java_synthesizer = None     # holds the Java synthesizer (None, until first needed)
+__midiChannels__ = None     # holds the synthesizer's channels (obtained once, as opposed to on every MIDI event)
+
+__soundbankPrograms__ = {}  # maps program number to the default soundbank's instruments for it (across banks)
+__loadedPrograms__    = {}  # programs whose instruments have been loaded into the synthesizer
+
+from java.util import HashMap                # needed to open the synthesizer without its default instruments
+from java.util.concurrent.locks import ReentrantLock
+__javaSynthesizerLock__ = ReentrantLock()   # so that only one thread opens the synthesizer (or loads a program)
+
+def __getMidiChannels__():
+   """Returns the Java synthesizer's channels, opening the synthesizer if this is the first time it is needed."""
+
+   if __midiChannels__ is None:    # not opened yet?
+
+      __javaSynthesizerLock__.lock()
+      try:
+         if __midiChannels__ is None:    # still not opened (i.e., another thread did not beat us to it)?
+            __openJavaSynthesizer__()    # yes, so open it now
+      finally:
+         __javaSynthesizerLock__.unlock()
+
+   return __midiChannels__
+
+def __openJavaSynthesizer__():
+   """Opens the Java synthesizer, and loads the instruments for program 0 (the default program of all channels)."""
+   global Java_synthesizer, __midiChannels__
+
+   synthesizer = MidiSystem.getSynthesizer()  # get a Java synthesizer
+
+   # activate it (should we worry about close()???) - a plain open() of Gervill (the Java software synthesizer)
+   # loads every instrument of the default soundbank, so, if we can, open it without them (as midirender.py does),
+   # and load instruments per program below
+   if hasattr(synthesizer, "openStream"):     # Gervill (i.e., an AudioSynthesizer)?
+      info = HashMap()
+      info.put("load default soundbank", False)
+      synthesizer.open(None, info)               # yes, so open it on the default audio line, with no instruments
+   else:
+      synthesizer.open()                         # no, so it manages its own instruments
+
+   # find the default soundbank's instruments for each program (e.g., program 0 is both piano and standard drum kit)
+   soundbank = synthesizer.getDefaultSoundbank()
+   if soundbank is not None:
+      for instrument in soundbank.getInstruments():
+         program = instrument.getPatch().getProgram()
+         if program not in __soundbankPrograms__:
+            __soundbankPrograms__[program] = []
+         __soundbankPrograms__[program].append( instrument )
+
+   Java_synthesizer = synthesizer
+   __loadProgram__(0)                         # make default instruments available
+
+   __midiChannels__ = synthesizer.getChannels()   # we are ready (do this last, since other threads check it)
+
+def __loadProgram__(program):
+   """Loads the default soundbank's instruments for this program into the Java synthesizer (if not loaded already)."""
+
+   if program not in __loadedPrograms__:   # first time we see this program?
+
+      __javaSynthesizerLock__.lock()
+      try:
+         if program not in __loadedPrograms__:   # still not loaded (i.e., another thread did not beat us to it)?
+            for instrument in __soundbankPrograms__.get(program, []):
+               Java_synthesizer.loadInstrument( instrument )
+            __loadedPrograms__[program] = True     # only now (other threads may skip loading when they see it)
+      finally:
+         __javaSynthesizerLock__.unlock()
+
+# remember what was last sent to each channel (program, pitch bend, volume, panning), so that we do not
+# send messages which would not change anything (e.g., the same pitch bend before every note)
+from midistate import MidiChannelState
+__midiChannelState__ = MidiChannelState()
+
+
+# initialize pitchbend across channels to 0
+CURRENT_PITCHBEND = {}    # holds pitchbend to be used when playing a note / frequency (see below)
+for i in range(16):
+   CURRENT_PITCHBEND[i] = 0   # set this channel's pitchbend to zero
+
+
+#########
+# NOTE:  The following code addresses Play.midi() functionality.  In order to be able to stop music
+# that is currently playing, we wrap the jMusic Play class inside a Python Play class and rebuild
+# play music functionality from basic elements.
+
+from jm.midi import MidiSynth  # needed to play and loop MIDI
+from time import sleep         # needed to implement efficient busy-wait loops (see below)
+from timer import *            # needed to schedule future tasks
+from scorecompiler import scoreCache, ScorePlayer, NOTE_ON_EVENT   # needed to play scores efficiently
+from scorecompiler import ScoreStream, StreamingScorePlayer, STREAM_LOOKAHEAD   # needed to stream very large scores
+from music3.audioinstruments import AudioSample, WaveInstrument, Envelope, Synthesizer, TimeStamp   # needed to play audio notes
+from music3.audioinstruments import __stopActiveAudioInstruments__
+
+# allocate enough MidiSynths and reuse them (when available)
+__midiSynths__ = []            # holds all available jMusic MidiSynths
+MAX_MIDI_SYNTHS = 12           # max number of concurrent MidiSynths allowed
+                               # NOTE: This is an empirical value - not documented - may change.
+
+# how early (in milliseconds) audio notes are queued on the synthesizer, to start exactly on time (see Play.audioNote())
+# NOTE: If the JVM is busy for longer than this, notes may start late (but still, as soon as possible).
+AUDIO_LOOKAHEAD = 50
+
+# NOTE: When rendering audio to a file (see Play.startRendering()), the synthesizer's clock only moves when told to,
+# so audio notes are scheduled on a VirtualScheduler (which moves the clock from note to note), instead of Timer2.
+__renderScheduler__ = None    # holds the VirtualScheduler, while rendering (None, otherwise)
+
+def __getAudioScheduler__():
+   """Returns the scheduler audio notes are played by, i.e., Timer2's, or the virtual one, while rendering to a file."""
+
+   if __renderScheduler__ is None:
+      return Timer2.scheduler
+   else:
+      return __renderScheduler__
+
+def __getMidiSynth__():
+   """Returns the next available MidiSynth (if any), or None."""
+
+   # make sure all possible MidiSynths are allocated
+   if __midiSynths__ == []:
+      for i in range(MAX_MIDI_SYNTHS):
+         __midiSynths__.append( MidiSynth() )   # create a new MIDI synthesizer
+   # now, all MidiSynths are allocated
+
+   # find an available MidiSynth to play the material (it's possible that all are allocated,
+   # since this function may be called repeatedly, while other music is still sounding
+   i = 0
+   while i < MAX_MIDI_SYNTHS and __midiSynths__[i].isPlaying():
+      i = i + 1     # check if the next MidiSynth is available
+   # now, i either points to the next available MidiSynth, or MAX_MIDI_SYNTHS if none is available
+
+   # did we find an available MidiSynth?
+   if i < MAX_MIDI_SYNTHS:
+      midiSynth = __midiSynths__[i]
+   else:
+      midiSynth = None
+
+   return midiSynth    # let them have it (hopefully, they will use it right away)
+
+# Provide a way to stop all MidiSynths from playing.
+def __stopMidiSynths__():
+   """Stops all MidiSynths from playing."""
+   for midiSynth in __midiSynths__:
+      if midiSynth.isPlaying():    # if playing, stop it
+         midiSynth.stop()
+
+
+# Holds notes currently sounding, in order to prevent premature NOTE-OFF for overlapping notes on the same channel
+# For every frequencyOn() we increment the count of (pitch, channel), and for every frequencyOff() we decrement it.
+# If it is the last one, we execute a NOTE-OFF (otherwise, we don't).
+# NOTE: Counts are kept in an AtomicIntegerArray (at index channel * 128 + pitch), so updating them takes constant time,
+# and is safe, even when notes start and stop concurrently (e.g., from different timer threads).
+from java.util.concurrent.atomic import AtomicIntegerArray
+notesCurrentlyPlaying = AtomicIntegerArray(16 * 128)
+
+# Holds MIDI pitch and pitch bend for frequencies played (converting a frequency involves a logarithm, and
+# scores use only a few different frequencies, anyway)
+__notesForFrequencies__ = {}
+MAX_NOTES_FOR_FREQUENCIES = 4096    # start over if more frequencies are used (e.g., when sonifying continuous data)
+
+def __freqToNoteCached__(frequency):
+   """Same as freqToNote(), but remembers frequencies already converted."""
+
+   global __notesForFrequencies__
+
+   pitchAndBend = __notesForFrequencies__.get(frequency)
+   if pitchAndBend is None:   # not converted before?
+      if len(__notesForFrequencies__) >= MAX_NOTES_FOR_FREQUENCIES:
+         __notesForFrequencies__ = {}       # start over
+      pitchAndBend = freqToNote(frequency)
+      __notesForFrequencies__[frequency] = pitchAndBend
+   return pitchAndBend
+
+class Play(jPlay):
+
+   # redefine Play.midi to fix jMusic bug (see above) - now, we can play as many times as we wish.
+   def midi(material):
+      """Play jMusic material (Score, Part, Phrase, Note) using our own Play.note() function."""
+
+      if hasattr(material, "toScore"):   # a NoteTable?
+         material = material.toScore()      # yes, so get its Score (converted only once, while the table is unchanged)
+
+      original = material   # remember what we were asked to play (for the compiled score cache)
+
+      # do necessary datatype wrapping (MidiSynth() expects a Score)
+      if type(material) == Note:
+         material = Phrase(material)
+      if type(material) == jNote:    # (also wrap jMusic default Notes, in addition to our own)
+         material = Phrase(material)
+      if type(material) == Phrase:   # no elif - we need to successively wrap from Note to Score
+         material = Part(material)
+         material.setInstrument(-1)     # indicate no default instrument (needed to access global instrument)
+      if type(material) == jPhrase:  # (also wrap jMusic default Phrases, in addition to our own)
+         material = Part(material)
+         material.setInstrument(-1)     # indicate no default instrument (needed to access global instrument)
+      if type(material) == Part:     # no elif - we need to successively wrap from Note to Score
+         material = Score(material)
+      if type(material) == Score:
+
+         # we are good - let's play it then!
+
+         score = material   # by now, material is a score, so create an alias (for readability)
+
+         # get score compiled into time-sorted note events (chords are resolved, too) - if we have played
+         # this material before, it is already compiled
+         compiledScore = scoreCache.getCompiledScore(original, score)
+
+         # set appropriate instrument for each channel (-1 means no instrument set, so the global instrument stands)
+         for channel, instrument in compiledScore.instruments.items():
+            if instrument > -1:
+               Play.setInstrument(instrument, channel)
+
+         # and play the events (only the next event is ever scheduled, no matter how many notes there are)
+         ScorePlayer(compiledScore, Play.__midiEvent__).start()
+
+         # NOTE:  Scheduled notes can always be stopped using JEM's stop button - this will cancel all tasks
+         #        scheduled on Timer2's scheduler (including the one for the next event).
+
+      else:   # error check
+         print "Play.midi(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+
+   def __midiEvent__(compiledScore, i):
+      """Plays event 'i' of a compiled score (see Play.midi())."""
+
+      if compiledScore.types[i] == NOTE_ON_EVENT:
+         Play.noteOn(compiledScore.pitches[i], compiledScore.velocities[i], compiledScore.channels[i], compiledScore.pannings[i])
+      else:
+         Play.noteOff(compiledScore.pitches[i], compiledScore.channels[i])
+
+   def midiStream(material, lookahead = STREAM_LOOKAHEAD):
+      """Play jMusic material (Score, Part, Phrase, Note) like Play.midi(), but stream it, i.e., only the events within the
+         next 'lookahead' milliseconds are scheduled at any time.  Memory used (and time to start) does not depend on the
+         length of the material, so this is meant for very large (e.g., hour-long) scores.  Returns the player (see
+         StreamingScorePlayer in scorecompiler.py), e.g., to stop() it."""
+
+      # do necessary datatype wrapping (as Play.midi() does)
+      if hasattr(material, "toScore"):   # a NoteTable?
+         material = material.toScore()
+      if type(material) == Note or type(material) == jNote:
+         material = Phrase(material)
+      if type(material) == Phrase or type(material) == jPhrase:   # no elif - we need to successively wrap from Note to Score
+         material = Part(material)
+         material.setInstrument(-1)     # indicate no default instrument (needed to access global instrument)
+      if type(material) == Part:        # no elif - we need to successively wrap from Note to Score
+         material = Score(material)
+
+      if type(material) != Score:       # error check
+         print "Play.midiStream(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+         return None
+
+      # note events are merged from all phrases, as they are needed (no compiled score is kept)
+      stream = ScoreStream(material)
+
+      # set appropriate instrument for each channel (-1 means no instrument set, so the global instrument stands)
+      for channel, instrument in stream.instruments.items():
+         if instrument > -1:
+            Play.setInstrument(instrument, channel)
+
+      player = StreamingScorePlayer(stream, Play.__midiStreamEvent__, lookahead)
+      player.start()
+
+      # NOTE:  As with Play.midi(), JEM's Stop button cancels the player's tasks (they are all on Timer2's scheduler).
+
+      return player
+
+   def __midiStreamEvent__(event):
+      """Plays a streamed note event, i.e., (time, type, pitch, velocity, channel, panning, duration) - see Play.midiStream()."""
+
+      time, eventType, pitch, velocity, channel, panning, duration = event
+      if eventType == NOTE_ON_EVENT:
+         Play.noteOn(pitch, velocity, channel, panning)
+      else:
+         Play.noteOff(pitch, channel)
+
+
+   # old way - should be removed in future release (together will *all* references of __midiSynths__'s)
+   def midi2(material):
+      """This is the original Play.midi() - retained for backup and testing purposes.
+         Play jMusic material (Score, Part, Phrase, Note) using next available MidiSynth (if any)."""
+
+      from jm.music.data import Phrase as jPhrase   # since we extend Phrase later
+
+      midiSynth = __getMidiSynth__()  # get next available MidiSynth (or None if all busy)
+      #midiSynth = MidiSynth()    # create a new MIDI synthesizer
+
+      # did we find an available midiSynth?
+      if midiSynth:
+         # play the music
+         # do necessary datatype wrapping (MidiSynth() expects a Score)
+         if type(material) == Note:
+            material = Phrase(material)
+         if type(material) == jNote:    # (also wrap jMusic default Notes, in addition to our own)
+            material = Phrase(material)
+         if type(material) == Phrase:   # no elif - we need to successively wrap from Note to Score
+            material = Part(material)
+         if type(material) == jPhrase:  # (also wrap jMusic default Phrases, in addition to our own)
+            material = Part(material)
+         if type(material) == Part:     # no elif - we need to successively wrap from Note to Score
+            material = Score(material)
+         if type(material) == Score:
+
+            midiSynth.play( material )   # play it!
+
+         else:   # error check
+            print "Play.midi(): Unrecognized type" + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+
+      else:   # error check
+         print "Play.midi(): All", MAX_MIDI_SYNTHS, "MIDI synthesizers are busy - (try again later?)"
+
+      return midiSynth  # return midiSynth playing
+
+
+   # NOTE:  Here we connect noteOn() and frequencyOn() with noteOnPitchBend() to allow for
+   # playing microtonal music.  Although this may seem as cyclical (i.e., that in noteOn() we
+   # convert pitch to frequency, and then call frequencyOn() which convert the frequency back to pitch,
+   # so that it can call noteOnPitchBend() ), this is the only way we can make everything work.
+   # We are constrained by the fact that jMusic Note objects are limited in how they handle pitch and
+   # frequency (i.e., that creating a Note with pitch will set the Note's corresponding frequency,
+   # but not the other way around), and the fact that we can call Note.getFrequency() above in Play.midi()
+   # without problem, but NOT Note.getPitch(), which will crash if the Note was instantiated with a frequency
+   # (i.e., pitch is not available / set).
+   # Therefore, we need to make the run about here, so that we keep everything else easier to code / maintain,
+   # and also keep the API (creating and play notes) simpler.  So, do NOT try to simplify the following code,
+   # as it is the only way (I think) that can make everything else work simply - also see Play.midi().
+   def noteOn(pitch, velocity=100, channel=0, panning = -1):
+      """Send a NOTE_ON message for this pitch to the Java synthesizer object.  Default panning of -1 means to
+         use the default (global) panning setting of the Java synthesizer."""
+
+      if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
+         # yes, so start it directly (no need to convert it to Hertz and back, as there is no pitch bend)
+         Play.__startNote__(pitch, 0, velocity, channel, panning)
+
+      elif type(pitch) == float:      # a pitch in Hertz?
+         Play.frequencyOn(pitch, velocity, channel, panning)  # start it
+
+      else:
+
+         print "Play.noteOn(): Unrecognized pitch " + str(pitch) + ", expected MIDI pitch from 0 to 127 (int), or frequency in Hz from 8.17 to 12600.0 (float)."
+
+
+   def frequencyOn(frequency, velocity=100, channel=0, panning = -1):
+      """Send a NOTE_ON message for this frequency (in Hz) to the Java synthesizer object.  Default panning of -1 means to
+         use the default (global) panning setting of the Java synthesizer."""
+
+      if (type(frequency) == float) and (8.17 <= frequency <= 12600.0): # a pitch in Hertz (within MIDI pitch range 0 to 127)?
+
+         pitch, bend = __freqToNoteCached__( frequency )           # convert to MIDI note and pitch bend
+
+         Play.__startNote__(pitch, bend, velocity, channel, panning)       # and start it
+
+      else:
+
+         print "Play.frequencyOn(): Invalid frequency " + str(frequency) + ", expected frequency in Hz from 8.17 to 12600.0 (float)."
+
+   def noteOff(pitch, channel=0):
+      """Send a NOTE_OFF message for this pitch to the Java synthesizer object."""
+
+      if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
+         # yes, so stop it directly (no need to convert it to Hertz and back)
+         Play.__stopNote__(pitch, channel)
+
+      elif type(pitch) == float:      # a pitch in Hertz?
+         Play.frequencyOff(pitch, channel)  # stop it
+
+      else:
+
+         print "Play.noteOff(): Unrecognized pitch " + str(pitch) + ", expected MIDI pitch from 0 to 127 (int), or frequency in Hz from 8.17 to 12600.0 (float)."
+
+   def frequencyOff(frequency, channel=0):
+      """Send a NOTE_OFF message for this frequency (in Hz) to the Java synthesizer object."""
+
+      if (type(frequency) == float) and (8.17 <= frequency <= 12600.0): # a frequency in Hertz (within MIDI pitch range 0 to 127)?
+
+         pitch, bend = __freqToNoteCached__( frequency )           # convert to MIDI note and pitch bend
+
+         Play.__stopNote__(pitch, channel)                         # and stop it
+
+      else:     # frequency was outside expected range
+
+         print "Play.frequencyOff(): Invalid frequency " + str(frequency) + ", expected frequency in Hz from 8.17 to 12600.0 (float)."
+
+      # NOTE: Just to be good citizens, also turn pitch bend to normal (i.e., no bend).
+      # Play.setPitchBend(0, channel)
+
+   def __startNote__(pitch, bend, velocity, channel, panning):
+      """Starts this MIDI pitch with this pitch bend, keeping track of how many instances of it are sounding."""
+
+      # keep track of how many overlapping instances of this pitch are currently sounding on this channel
+      # so that we turn off only the last one - also see __stopNote__()
+      notesCurrentlyPlaying.incrementAndGet(channel * 128 + pitch)
+
+      Play.noteOnPitchBend(pitch, bend, velocity, channel, panning)      # and start it
+
+   def __stopNote__(pitch, channel):
+      """Stops this MIDI pitch, if this is the last instance of it sounding."""
+
+      noteID = channel * 128 + pitch    # where this pitch-channel pair is counted
+
+      # remove this instance of the note (but never go below zero - e.g., if the note was not sounding)
+      count = notesCurrentlyPlaying.get(noteID)
+      while count > 0 and not notesCurrentlyPlaying.compareAndSet(noteID, count, count - 1):
+         count = notesCurrentlyPlaying.get(noteID)    # someone else got here first, so try again
+
+      if count <= 1 and __midiChannels__ is not None:   # is this last instance of note (and could it be sounding)?
+
+         # yes, so turn it off!
+         __midiChannels__[channel].noteOff(pitch)
+
+# Commented out below, because it might give the impression that different pitch bends
+# signify different notes to be turned off - not so.  NOTE_OFF messages are based solely on pitch.
+#
+#   def noteOffPitchBend(pitch, bend = 0, channel=0):
+#      """Send a NOTE_OFF message for this pitch to the Java synthesizer object."""
+#      # NOTE_OFF messages are based on pitch (i.e., pitch bend is irrelevant / ignored)
+#      Play.noteOff(pitch, channel)
+
+   def note(pitch, start, duration, velocity=100, channel=0, panning = -1):
+      """Plays a note with given 'start' time (in milliseconds from now), 'duration' (in milliseconds
+         from 'start' time), with given 'velocity' on 'channel'.  Default panning of -1 means to
+         use the default (global) panning setting of the Java synthesizer. """
+
+      # TODO: We should probably test for negative start times and durations.
+
+      # schedule the note-on and note-off events
+      Timer2.scheduler.schedule(start, Play.noteOn, [pitch, velocity, channel, panning])
+      Timer2.scheduler.schedule(start+duration, Play.noteOff, [pitch, channel])
+
+      # NOTE:  We schedule directly on Timer2's scheduler (instead of creating two Timer2 objects), since
+      #        these events are never stopped or rescheduled individually (JEM's Stop button cancels them all).
+
+   def frequency(frequency, start, duration, velocity=100, channel=0, panning = -1):
+      """Plays a frequency with given 'start' time (in milliseconds from now), 'duration' (in milliseconds
+         from 'start' time), with given 'velocity' on 'channel'.  Default panning of -1 means to
+         use the default (global) panning setting of the Java synthesizer."""
+
+      # NOTE:  We assume that the end-user will ensure that concurrent microtones end up on
+      # different channels.  This is needed since MIDI has only one pitch band per channel,
+      # and most microtones require their unique pitch bending.
+
+      # TODO: We should probably test for negative start times and durations.
+
+      # schedule the frequency-on and frequency-off events
+      Timer2.scheduler.schedule(start, Play.frequencyOn, [frequency, velocity, channel, panning])
+      Timer2.scheduler.schedule(start+duration, Play.frequencyOff, [frequency, channel])
+
+      # call pitchBendNormal to turn off the timer, if it is on
+      #setPitchBendNormal(channel)
+
+      #setPitchBendNormal(channel, start+duration, True)
+
+
+# (Repeated here for convenience...)
+# The MIDI specification stipulates that pitch bend be a 14-bit value, where zero is
+# maximum downward bend, 16383 is maximum upward bend, and 8192 is the center (no pitch bend).
+#PITCHBEND_MIN = 0
+#PITCHBEND_MAX = 16383
+#PITCHBEND_NORMAL = 8192
+
+# calculate constants from the way we handle pitch bend
+#OUR_PITCHBEND_MAX    = PITCHBEND_MAX - PITCHBEND_NORMAL
+#OUR_PITCHBEND_MIN    = -PITCHBEND_NORMAL
+#OUR_PITCHBEND_NORMAL = 0
+
+
+   # No (normal) pitch bend in JythonMusic (as opposed to MIDI) is 0, max downward bend is -8192, and max upward bend is 8191.
+   # (Result is undefined if you exceed these values - it may wrap around or it may cap.)
+   def setPitchBend(bend = 0, channel=0):
+      """Set global pitchbend variable to be used when a note / frequency is played."""
+
+      if (bend <= OUR_PITCHBEND_MAX) and (bend >= OUR_PITCHBEND_MIN):   # is pitchbend within appropriate range?
+
+         # (holding the channel's lock, so that a note starting on another thread cannot send its own pitchbend
+         # in between - otherwise, what we remember sending may not be what the synthesizer got last)
+         lock = __midiChannelState__.getLock(channel)
+         lock.acquire()
+         try:
+            CURRENT_PITCHBEND[channel] = bend        # remember the pitch bend (e.g., for Play.noteOn() )
+
+            # and set the pitchbend on the Java synthesizer (this is the only place this is done!)
+            MIDI_pitchbend = bend + PITCHBEND_NORMAL                  # convert to MIDI pitchbend to set
+            Play.__sendPitchBend__(MIDI_pitchbend, channel)           # and set it (send message, if needed)!
+         finally:
+            lock.release()
+
+      else:     # frequency was outside expected range
+
+         print "Play.setPitchBend(): Invalid pitchbend " + str(bend) + ", expected pitchbend in range " + \
+               str(OUR_PITCHBEND_MIN) + " to " + str(OUR_PITCHBEND_MAX) + "."
+
+
+   def getPitchBend(channel=0):
+      """returns the current pitchbend for this channel."""
+
+      return CURRENT_PITCHBEND[channel]
+
+
+   # No (normal) pitch bend is 0, max downward bend is -8192, and max upward bend is 8191.
+   # (Result is undefined if you exceed these values - it may wrap around or it may cap.)
+
+   def noteOnPitchBend(pitch, bend = 0, velocity=100, channel=0, panning = -1):
+      """Send a NOTE_ON message for this pitch and pitch bend to the Java synthesizer object.
+         Default panning of -1 means to use the default (global) panning setting of the Java synthesizer."""
+
+      #Play.setPitchBend(bend, channel)  # remember current pitchbend for this channel
+
+
+      # NOTE: Our normal (or no) pitch bend is 0, max downward bend is -8192, and max upward bend is 8191.
+      # However, internally, the MIDI specification wants normal pitch bend to be 8192, max downward
+      # bend to be 0, and max upward bend to be 16383).
+      # So, convert it and add the current global pitchbend, as set previously.
+      MIDI_pitchbend = bend + PITCHBEND_NORMAL + CURRENT_PITCHBEND[channel]
+
+      # Since it is possible that, together with the global pitchbend, we may be out of range,
+      # let's check to make sure.
+      if (MIDI_pitchbend <= PITCHBEND_MAX) and (MIDI_pitchbend >= PITCHBEND_MIN):   # is pitchbend within appropriate range?
+
+         # we are OK, so set pitchbend on the Java synthesizer!
+         # (holding the channel's lock, so that another note cannot change pitchbend or panning before we start)
+         lock = __midiChannelState__.getLock(channel)
+         lock.acquire()
+         try:
+            Play.__sendPitchBend__(MIDI_pitchbend, channel)          # send message (if pitchbend has changed)
+
+            # then, also send message to start the note on this channel
+            if panning != -1:                              # if we have a specific panning...
+               Play.__sendPanning__(panning, channel)         # ... use it (otherwise, we use the default global panning)
+
+            __getMidiChannels__()[channel].noteOn(pitch, velocity)   # and start the note on Java synthesizer
+         finally:
+            lock.release()
+
+      else:     # frequency was outside expected range
+
+         print "Play.noteOnPitchBend(): Invalid pitchbend " + str(pitchbend - PITCHBEND_NORMAL) + \
+               ", expected pitchbend in range " + str(PITCHBEND_MIN-PITCHBEND_NORMAL) + " to " + str(PITCHBEND_MAX-PITCHBEND_NORMAL) + \
+               ".  Perhaps reset global pitch bend via Play.setPitchBend(0)... ?"
+
+
+   def allNotesOff():
+      """It turns off all notes on all channels."""
+
+      Play.allFrequenciesOff()
+
+
+   def allFrequenciesOff():
+      """It turns off all notes on all channels."""
+
+      if __midiChannels__ is None:   # has the Java synthesizer not been opened yet?
+
+         # then nothing is sounding, so just reset pitch bend (no need to open the synthesizer for this)
+         for channel in range(16):
+            CURRENT_PITCHBEND[channel] = 0
+         return
+
+      for channel in range(16):  # cycle through all channels
+         channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+         channelHandle.allNotesOff()                               # send the message
+
+         # no notes are sounding on this channel anymore
+         for pitch in range(128):
+            notesCurrentlyPlaying.set(channel * 128 + pitch, 0)
+
+         # also reset pitch bend
+         Play.setPitchBend(0, channel)
+
+
+   def stop():
+      """It stops all Play music from sounding."""
+
+      # NOTE:  This could also handle Play.note() notes, which may have been
+      #        scheduled to start sometime in the future.  For now, we assume that timer.py
+      #        (which provides Timer objects) handles stopping of timers on its own.  If so,
+      #        this takes care of our problem, for all practical purposes.  It is possible
+      #        to have a race condition (i.e., a note that starts playing right when stop()
+      #        is called, but a second call of stop() (e.g., double pressing of a stop button)
+      #        will handle this, so we do not concern ourselves with it.
+
+      # first, stop the internal __getMidiSynth__ synthesizers
+      __stopMidiSynths__()
+
+      # then, stop all sounding notes
+      Play.allNotesOff()
+      Play.allAudioNotesOff()
+
+      # NOTE: In the future, we may also want to handle scheduled notes through Play.note().  This could be done
+      # by creating a list of Timers created via note() and looping through them to stop them here.
+
+
+   def setInstrument(instrument, channel=0):
+      """Send a patch change message for this channel to the Java synthesizer object."""
+
+      lock = __midiChannelState__.getLock(channel)
+      lock.acquire()
+      try:
+         if __midiChannelState__.changes(192, channel, instrument, 0):   # is this a different instrument?
+            channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+            __loadProgram__(instrument)                               # make sure it is loaded
+            channelHandle.programChange(channel, instrument)          # send the message
+      finally:
+         lock.release()
+
+   def getInstrument(channel=0):
+      """Gets the current instrument for this channel of the Java synthesizer object."""
+
+      channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+      instrument = channelHandle.getProgram()                   # get the instrument
+      return instrument
+
+   def setVolume(volume, channel=0):
+      """Sets the current coarse volume for this channel to the Java synthesizer object."""
+
+      lock = __midiChannelState__.getLock(channel)
+      lock.acquire()
+      try:
+         if __midiChannelState__.changes(176, channel, 7, volume):   # is this a different volume?
+            channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+            channelHandle.controlChange(7, volume)                    # send the message
+      finally:
+         lock.release()
+
+   def getVolume(channel=0):
+      """Gets the current coarse volume for this channel of the Java synthesizer object."""
+
+      channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+      return channelHandle.getController(7)                     # obtain the current value for volume controller
+
+   def setPanning(panning, channel=0):
+      """Sets the current panning setting for this channel to the Java synthesizer object."""
+
+      lock = __midiChannelState__.getLock(channel)
+      lock.acquire()
+      try:
+         Play.__sendPanning__(panning, channel)                    # send the message (if needed)
+      finally:
+         lock.release()
+
+   def getPanning(channel=0):
+      """Gets the current panning setting for this channel of the Java synthesizer object."""
+
+      channelHandle = __getMidiChannels__()[channel]            # get a handle to channel
+      return channelHandle.getController(10)                # obtain the current value for panning controller
+
+   def __sendPitchBend__(MIDI_pitchbend, channel):
+      """Sets this (MIDI) pitchbend on this channel of the Java synthesizer object, unless it is already set.
+         The caller should hold the channel's lock."""
+
+      if __midiChannelState__.changes(224, channel, MIDI_pitchbend % 128, MIDI_pitchbend / 128):
+         __getMidiChannels__()[channel].setPitchBend( MIDI_pitchbend )   # send message
+
+   def __sendPanning__(panning, channel):
+      """Sets this panning on this channel of the Java synthesizer object, unless it is already set.
+         The caller should hold the channel's lock."""
+
+      if __midiChannelState__.changes(176, channel, 10, panning):
+         __getMidiChannels__()[channel].controlChange(10, panning)     # send message
+
+
+   def audio(material, listOfAudioSamples, listOfEnvelopes = []):
+      """Play jMusic material using a list of audio samples as voices"""
+
+      original = material   # remember what we were asked to play (for the compiled score cache)
+
+      # do necessary datatype wrapping (MidiSynth() expects a Score)
+      if type(material) == Note:
+         material = Phrase(material)
+      if type(material) == jNote:    # (also wrap jMusic default Notes, in addition to our own)
+         material = Phrase(material)
+      if type(material) == Phrase:   # no elif - we need to successively wrap from Note to Score
+         material = Part(material)
+      if type(material) == jPhrase:  # (also wrap jMusic default Phrases, in addition to our own)
+         material = Part(material)
+      if type(material) == Part:     # no elif - we need to successively wrap from Note to Score
+         material = Score(material)
+      if type(material) == Score:
+
+         # we are good - let's play it then!
+
+         score = material   # by now, material is a score, so create an alias (for readability)
+
+         # get score compiled into time-sorted note events (audio notes end on their own, so no note-offs needed) -
+         # if we have played this material before, it is already compiled
+         #NOTE: channel is used as an index for the audio voice
+         compiledScore = scoreCache.getCompiledScore(original, score, noteOffs = False)
+
+         # set appropriate instrument for each channel (-1 means no instrument set, so the global instrument stands)
+         for channel, instrument in compiledScore.instruments.items():
+            if instrument > -1:
+               Play.setInstrument(instrument, channel)
+
+         # notes are timed on the synthesizer's clock, from when the score starts (leaving time to queue the first notes)
+         startTime = Play.__getAudioTime__() + AUDIO_LOOKAHEAD / 1000.0
+
+         # play a note using the audio sample of its channel (and its envelope, if any)
+         def playEvent(compiledScore, i):
+            channel = compiledScore.channels[i]
+            onsetTime = startTime + compiledScore.times[i] / 1000.0
+            if len(listOfEnvelopes) != 0:
+               Play.__audioNoteAt__(compiledScore.pitches[i], onsetTime, compiledScore.durations[i], listOfAudioSamples[channel], compiledScore.velocities[i], compiledScore.pannings[i], listOfEnvelopes[channel])
+            else:
+               Play.__audioNoteAt__(compiledScore.pitches[i], onsetTime, compiledScore.durations[i], listOfAudioSamples[channel], compiledScore.velocities[i], compiledScore.pannings[i])
+
+         if __renderScheduler__ is None:
+            # and play the events (scheduled notes can always be stopped using JEM's stop button)
+            ScorePlayer(compiledScore, playEvent).start()
+
+         else:   # rendering to a file, so the clock stands still - hand all notes to the virtual scheduler right away
+            for i in range( len(compiledScore) ):
+               playEvent(compiledScore, i)
+
+      else:   # error check
+         print "Play.audio(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+
+
+
+   def audioNote(pitch, start, duration, audioSample, velocity = 127, panning = -1, envelope = Envelope()):
+      """Play a note using an AudioSample for generating the sound."""
+
+      # when should the note start (in synthesizer time, i.e., seconds)?
+      onsetTime = audioSample.synth.getCurrentTime() + start / 1000.0
+
+      Play.__audioNoteAt__(pitch, onsetTime, duration, audioSample, velocity, panning, envelope)
+
+
+   def __audioNoteAt__(pitch, onsetTime, duration, audioSample, velocity = 127, panning = -1, envelope = Envelope()):
+      """Play a note using an AudioSample for generating the sound, starting at 'onsetTime' (in synthesizer time,
+         i.e., seconds - see Play.__getAudioTime__()).
+
+         AudioSample notes are queued on the synthesizer AUDIO_LOOKAHEAD milliseconds early, with time stamps, so that
+         the note and its envelope start exactly on time (i.e., on the right frame), even if the JVM is busy.
+         Other instruments are played via Timer2 (i.e., when the note is due).  When rendering to a file, wave
+         instruments (e.g., SinewaveInstrument) are queued with time stamps, too (see Play.startRendering()).
+      """
+
+      if (type(pitch) == int) and (0 <= pitch <= 127):   # a MIDI pitch?
+         # yes, so convert pitch from MIDI number (int) to Hertz (float)
+         pitch = noteToFreq(pitch)
+
+      # ***
+      # NOTE:  To work with AdditiveSynthesisInstrument (where such an instrument may actually consist of many normal instruments, each with
+      #        its own envelope (e.g., instrument.getEnvelope() and insrument.setEnvelope())...),
+      #        we use AdditiveSynthesisInstrument.getInstruments(), and then we iterate / repeat the following code, for each
+      #        componennt instrument / envelope pair. ***
+
+      # apply envelope to note
+      if envelope.getLength() > duration:
+         print("Play.audioNote(): Envelope is too large for this note,\n midi: " + str(pitch) + "\nnote length: " + str(duration) + "\nenvelope length: " + str(envelope.getLength()))
+      else:
+
+         # how long until the note starts (in milliseconds)?
+         start = (onsetTime - audioSample.synth.getCurrentTime()) * 1000
+
+         # can we queue this note on the synthesizer's clock?
+         timeStamped = isinstance(audioSample, AudioSample) or \
+                       (__renderScheduler__ is not None and isinstance(audioSample, WaveInstrument))
+
+         # now, make everything happen
+         scheduler = __getAudioScheduler__()
+         if timeStamped:
+            scheduler.schedule(max(0, start - AUDIO_LOOKAHEAD), Play.__playAudioNoteNow__, [pitch, duration, audioSample, velocity, panning, envelope, onsetTime])
+         else:
+            scheduler.schedule(max(0, start), Play.__playAudioNoteNow__, [pitch, duration, audioSample, velocity, panning, envelope])
+
+
+   def setAudioLookahead(lookahead):
+      """Sets how early (in milliseconds) audio notes are queued on the synthesizer, so that they start exactly on time."""
+
+      global AUDIO_LOOKAHEAD
+
+      if lookahead < 0:
+         raise ValueError("Audio lookahead, " + str(lookahead) + ", should be 0 or more milliseconds.")
+
+      AUDIO_LOOKAHEAD = lookahead
+
+
+   def getAudioLookahead():
+      """Returns how early (in milliseconds) audio notes are queued on the synthesizer."""
+
+      return AUDIO_LOOKAHEAD
+
+
+   def __getAudioTime__():
+      """Returns the current synthesizer time (in seconds)."""
+
+      return Synthesizer().getInstance().getCurrentTime()
+
+
+   def __playAudioNoteNow__(pitch, duration, audioSample, velocity, panning, envelope, onsetTime = None):
+      """To play an audio note, using an AudioSample, we need a voice.  Since other notes may be playing in parallel,
+	     we need to wait until the last possible moment to get the AudioSample voice through which this note will be sounded.
+         This function performs just that, and then schedules all other timers needed to apply envelope changes, to start
+         the note sounding, and then stop the note from sounding.
+
+         If 'onsetTime' (in synthesizer time) is provided, these events are queued on the synthesizer (with time stamps),
+         instead, relative to the note's onset - the onset and attack right away, and the rest AUDIO_LOOKAHEAD milliseconds
+         before they are due (so that they can still be skipped, if the voice is given to another note).
+
+         NOTE:  This is a little convoluted, but required, due to the use of envelopes and Timers to schedule the playing of notes
+         into the future.
+      """
+
+      # allocate a AudioSample voice to play this pitch, and remember which allocation of the voice is ours (if the voice
+      # is given to another note before this one ends - i.e., the same pitch played again, or voice stealing - our remaining
+      # events leave it alone) - both are returned together, since other notes are allocated from other threads, too
+      voice, allocation = audioSample.__allocateVoice__(pitch)
+
+      if voice == None:   # is there an available voice?
+         raise ValueError("AudioSample does not have enough free voices to play this pitch, " + str(pitch) + ".")
+
+      # now, we have a voice to play this pitch, so do it!!!
+
+
+      # now create the list of delays that will be passed to the setVolume method
+      # convert delays to seconds for the amplitude smoother
+      attackDelays = []
+      attackTimes = envelope.getAttackTimes()
+      for i in range(len(attackTimes)):
+         attackDelays.append(float(attackTimes[i]) / 1000.0)
+      # now we have a list of how long each attack lasts in seconds
+
+      delayDelay = float(envelope.getDelay() / 1000.0)
+      releaseDelay = float(envelope.getRelease() / 1000.0)
+      # and how long the delay and release lasts in seconds
+
+      # adjust attackValues relative to note velocity (mapping them all the same way)
+      toVelocity = valueMapper( 0.0, 1.0, 0, velocity )
+      relativeAttackValues = []
+      for value in envelope.getAttackValues():
+         relativeAttackValues.append( toVelocity(value) )    # adjust and remember
+
+      # adjust sustainValue relative to note velocity
+      relativeSustainValue = toVelocity( envelope.sustainValue )
+
+      # ***
+      # NOTE:  Here is probably where we get clicking sound... to test (perhaps add a little bit extra to release time,
+      #        i.e., to lower the volume competely a little before the actual end of the note...).
+
+
+      # get absolute release time
+      absoluteReleaseTime = duration - envelope.getRelease()
+
+      if onsetTime is None:   # play now?
+
+         # everything is ready, so schedule playing of note (events due at the same time run in the order scheduled)
+         scheduler = __getAudioScheduler__()
+         scheduler.schedule(0, Play.__audioOn__, [pitch, audioSample, voice, velocity, panning])   # start note
+
+         # schedule envelope attack
+         absoluteAttackTimes = envelope.__getAbsoluteAttackTimes__()
+         for i in range( len(relativeAttackValues) ):
+             scheduler.schedule(absoluteAttackTimes[i], Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                                audioSample.setVolume, [relativeAttackValues[i], voice, attackDelays[i]]])
+
+         # schedule envelope sustain and release
+         scheduler.schedule(envelope.__getAbsoluteDelay__(), Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            audioSample.setVolume, [relativeSustainValue, voice, delayDelay]])
+         scheduler.schedule(absoluteReleaseTime, Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            audioSample.setVolume, [0, voice, releaseDelay]])
+
+         # stop note
+         scheduler.schedule(duration, Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            Play.__audioOff__, [pitch, audioSample, voice]])
+
+         # and, finally, deallocate this AudioSample voice, to free it for other / future pitches
+         scheduler.schedule(duration, audioSample.deallocateVoiceForPitch, [pitch, allocation])
+
+      else:   # queue the note on the synthesizer's clock (so that it starts exactly on time)
+
+         onset = TimeStamp(onsetTime)
+
+         Play.__audioOn__(pitch, audioSample, voice, velocity, panning, onset)   # start note
+
+         # queue envelope attack
+         absoluteAttackTimes = envelope.__getAbsoluteAttackTimes__()
+         for i in range( len(relativeAttackValues) ):
+            audioSample.setVolume(relativeAttackValues[i], voice, attackDelays[i], onset.makeRelative(absoluteAttackTimes[i] / 1000.0))
+
+         # the rest of the note's events are queued AUDIO_LOOKAHEAD milliseconds before they are due (with the same time
+         # stamps), as the note itself was - so that, if the voice is given to another note in the meantime (i.e., the same
+         # pitch played again, or voice stealing), they are skipped, as opposed to cutting off the other note
+         scheduler = __getAudioScheduler__()
+         untilOnset = (onsetTime - audioSample.synth.getCurrentTime()) * 1000 - AUDIO_LOOKAHEAD   # when to queue events due at onset
+
+         # envelope sustain and release
+         delay = envelope.__getAbsoluteDelay__()
+         scheduler.schedule(max(0, untilOnset + delay), Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            audioSample.setVolume, [relativeSustainValue, voice, delayDelay, onset.makeRelative(delay / 1000.0)]])
+         scheduler.schedule(max(0, untilOnset + absoluteReleaseTime), Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            audioSample.setVolume, [0, voice, releaseDelay, onset.makeRelative(absoluteReleaseTime / 1000.0)]])
+
+         # stop note
+         scheduler.schedule(max(0, untilOnset + duration), Play.__audioVoiceEvent__, [audioSample, voice, allocation,
+                            Play.__audioOff__, [pitch, audioSample, voice, onset.makeRelative(duration / 1000.0)]])
+
+         # and, finally, deallocate this AudioSample voice (when the note ends), to free it for other / future pitches
+         scheduler.schedule(untilOnset + AUDIO_LOOKAHEAD + duration, audioSample.deallocateVoiceForPitch, [pitch, allocation])
+
+
+   def __audioVoiceEvent__(audioSample, voice, allocation, function, parameters):
+      """Calls 'function' with 'parameters' (an envelope or stop event of a note), unless the note's voice has been
+         given to another note since (see AudioInstrument.getVoiceAllocation())."""
+
+      if audioSample.getVoiceAllocation(voice) == allocation:
+         function(*parameters)
+
+
+   def __audioOn__(pitch, audioSample, voice, velocity = 127, panning = -1, timeStamp = None):
+      """Start playing a specific pitch at a given volume using provided audio sample.  If a (synth) 'timeStamp'
+         is provided, the pitch starts exactly at that time (AudioSample and wave instruments only)."""
+
+      if panning != -1:                              # if we have a specific panning...
+         audioSample.setPanning(panning, voice, timeStamp)         # then, use it (otherwise let default / global panning stand
+      else:                                          # otherwise...
+         audioSample.setPanning( Play.getPanning(), voice, timeStamp )   # use the global / default panning
+
+      if timeStamp is None:
+         audioSample.setFrequency(pitch, voice)                  # set the sample to the specified frequency
+      else:
+         audioSample.setFrequency(pitch, voice, timeStamp)
+      audioSample.setVolume(velocity, voice, 0.0002, timeStamp)   # and specified volume
+
+      # NOTE: Here we have a choice - either use audioSample.play() or audioSample.loop()
+      # This makes a difference IF the length of note being played is longer than the audio sample
+      # being used.  In this case, play() will end before the note's end, whereas loop() will
+      # keep looping the audio sample until the end of the note.  We opt for loop(), hoping that
+      # the audio sample has been prepared to be nicely loopable (and also, stopping in the midst of it,
+      # still sounds OK).  So, this puts extra work on the audio sample preparer / end-user...
+      # but makes better sense overall...
+
+      if timeStamp is None:
+         audioSample.loop(voice)                            # and play the pitch!
+      else:
+         audioSample.loop(voice, timeStamp = timeStamp)     # and play the pitch (when specified)!
+
+
+   def __audioOff__(pitch, audioSample, voice, timeStamp = None):
+      """Stop playing the specified pitch on the provided audio sample (at 'timeStamp', if provided - AudioSample and
+         wave instruments only)."""
+      if timeStamp is None:
+         audioSample.stop(voice)
+      else:
+         audioSample.stop(voice, timeStamp)
+
+
+
+   def allAudioNotesOff():
+      """It turns off all notes on all audio samples."""
+
+      # NOTE:  We are probably overreaching here... as this will stop *all* AudioSamples from playing.
+      # This is a quick way to stop music played via Play.audio().
+      __stopActiveAudioInstruments__()
+
+      # NOTE: In the future, we may also want to handle scheduled notes through Play.audio().  This could be done
+      # by creating a list of AudioSamples and Timers created via audioNote() and looping through them to stop them here.
+
+
+   def startRendering(filename):
+      """Renders audio played from now on (via Play.audio() or Play.audioNote()) to a (stereo) WAV file, instead of
+         playing it through the audio device - as fast as the computer allows, once Play.stopRendering() is called.
+         For example,
+
+            Play.startRendering("song.wav")
+            Play.audio(score, [FMSynthesisInstrument(440, 3), SinewaveInstrument()])
+            Play.stopRendering()
+
+         The synthesizer runs in non-real-time mode, without an audio device (so this also works without a sound card,
+         if instruments are created after rendering starts), and its clock only moves as notes are rendered.
+         MIDI notes (e.g., Play.midi()) are not rendered (see Write.midi(), instead)."""
+
+      global __renderScheduler__
+
+      if __renderScheduler__ is not None:
+         raise RuntimeError("Play.startRendering(): Already rendering (see Play.stopRendering()).")
+
+      filename = fixWorkingDirForJEM( filename )   # does nothing if not in JEM
+
+      synthesizer = Synthesizer()
+      synthesizer.startOffline(filename)
+
+      synth = synthesizer.getInstance()
+      __renderScheduler__ = VirtualScheduler(synth.getCurrentTime, synth.sleepUntil)
+
+
+   def stopRendering(tail = 0):
+      """Renders everything played since Play.startRendering() (and 'tail' more milliseconds, e.g., to let reverb
+         ring), finishes the WAV file, and goes back to playing in real time.  Returns how long the rendered audio
+         is (in seconds)."""
+
+      global __renderScheduler__
+
+      if __renderScheduler__ is None:
+         raise RuntimeError("Play.stopRendering(): Not rendering (see Play.startRendering()).")
+
+      synthesizer = Synthesizer()
+      synth = synthesizer.getInstance()
+      startTime = synth.getCurrentTime()   # (the clock has not moved since rendering started)
+
+      # play all notes (moving the clock from one to the next, i.e., rendering as fast as possible), and then the tail
+      __renderScheduler__.run()
+      __renderScheduler__.run( synth.getCurrentTime() + tail / 1000.0 )
+      duration = synth.getCurrentTime() - startTime
+
+      __renderScheduler__ = None
+      synthesizer.stopOffline()
+
+      return duration
+
+
+   # NOTE: Experimental - plays scores with audio instruments and MIDI instruments - without chords
+   def sound(material, listOfAudioSamples, listOfEnvelopes = []):
+      """Play jMusic material using a list of audio samples or MIDI instruments as voices"""
+
+      original = material   # remember what we were asked to play (for the compiled score cache)
+
+      # do necessary datatype wrapping (MidiSynth() expects a Score)
+      if type(material) == Note:
+         material = Phrase(material)
+      if type(material) == jNote:    # (also wrap jMusic default Notes, in addition to our own)
+         material = Phrase(material)
+      if type(material) == Phrase:   # no elif - we need to successively wrap from Note to Score
+         material = Part(material)
+      if type(material) == jPhrase:  # (also wrap jMusic default Phrases, in addition to our own)
+         material = Part(material)
+      if type(material) == Part:     # no elif - we need to successively wrap from Note to Score
+         material = Score(material)
+      if type(material) == Score:
+
+         # we are good - let's play it then!
+
+         score = material   # by now, material is a score, so create an alias (for readability)
+
+         # get score compiled into time-sorted note events (if we have played this material before, it is already compiled)
+         #NOTE: channel is used as an index for the audio voice
+         compiledScore = scoreCache.getCompiledScore(original, score)
+
+         # check instrument of each channel (before playing anything), and set MIDI instruments
+         for channel in compiledScore.instruments.keys():
+
+            if type(listOfAudioSamples[channel]) == int:   # is this a MIDI instrument?
+               Play.setInstrument(listOfAudioSamples[channel], channel)   # yes, so set it for this channel
+
+            # else, if this is not an audio instrument, this is a mistake
+            elif not isinstance( listOfAudioSamples[channel], AudioSample ):
+               raise TypeError( "Play.sound(): Unrecognized instrument type " + str(type(listOfAudioSamples[channel])) + ", expected AudioSample, or int (i.e., a MIDI instrument)." )
+
+         # notes are timed on the synthesizer's clock, from when the score starts (leaving time to queue the first notes)
+         startTime = Play.__getAudioTime__() + AUDIO_LOOKAHEAD / 1000.0
+
+         # play a note using the MIDI synthesizer, or the audio sample of its channel
+         def playEvent(compiledScore, i):
+            channel = compiledScore.channels[i]
+            onsetTime = startTime + compiledScore.times[i] / 1000.0
+            if type(listOfAudioSamples[channel]) == int:   # is this a MIDI instrument?
+               # play it when due (so that it stays in sync with the audio notes)
+               delay = (onsetTime - Play.__getAudioTime__()) * 1000
+               Timer2.scheduler.schedule(max(0, delay), Play.__midiEvent__, [compiledScore, i])
+            elif compiledScore.types[i] == NOTE_ON_EVENT:        # audio notes end on their own
+               if len(listOfEnvelopes) != 0:
+                  Play.__audioNoteAt__(compiledScore.pitches[i], onsetTime, compiledScore.durations[i], listOfAudioSamples[channel], compiledScore.velocities[i], compiledScore.pannings[i], listOfEnvelopes[channel])
+               else:
+                  Play.__audioNoteAt__(compiledScore.pitches[i], onsetTime, compiledScore.durations[i], listOfAudioSamples[channel], compiledScore.velocities[i], compiledScore.pannings[i])
+
+         # and play the events (scheduled notes can always be stopped using JEM's stop button)
+         ScorePlayer(compiledScore, playEvent).start()
+
+      else:   # error check
+         print "Play.sound(): Unrecognized type " + str(type(material)) + ", expected Note, Phrase, Part, or Score."
+
+
+   ########################################################################
+   # make these functions callable without having to instantiate this class
+   midi = Callable(midi)
+   midiStream = Callable(midiStream)
+   __midiStreamEvent__ = Callable(__midiStreamEvent__)
+   __midiEvent__ = Callable(__midiEvent__)
+   midi2 = Callable(midi2)
+   noteOn = Callable(noteOn)
+   noteOnPitchBend = Callable(noteOnPitchBend)
+   noteOff = Callable(noteOff)
+   __startNote__ = Callable(__startNote__)
+   __stopNote__ = Callable(__stopNote__)
+   note = Callable(note)
+   frequency = Callable(frequency)
+   #microtonal = Callable(microtonal)
+   #noteOffPitchBend = Callable(noteOffPitchBend)
+   allNotesOff = Callable(allNotesOff)
+   frequencyOn = Callable(frequencyOn)
+   frequencyOff = Callable(frequencyOff)
+   allFrequenciesOff = Callable(allFrequenciesOff)
+   stop = Callable(stop)
+   setInstrument = Callable(setInstrument)
+   getInstrument = Callable(getInstrument)
+   setVolume = Callable(setVolume)
+   getVolume = Callable(getVolume)
+   setPanning = Callable(setPanning)
+   __sendPitchBend__ = Callable(__sendPitchBend__)
+   __sendPanning__ = Callable(__sendPanning__)
+   getPanning = Callable(getPanning)
+   setPitchBend = Callable(setPitchBend)
+   getPitchBend = Callable(getPitchBend)
+   #setPitchBendNormal = Callable(setPitchBendNormal)
+   audioNote = Callable(audioNote)
+   __audioNoteAt__ = Callable(__audioNoteAt__)
+   setAudioLookahead = Callable(setAudioLookahead)
+   getAudioLookahead = Callable(getAudioLookahead)
+   __getAudioTime__ = Callable(__getAudioTime__)
+   __playAudioNoteNow__ = Callable(__playAudioNoteNow__)
+   __audioVoiceEvent__ = Callable(__audioVoiceEvent__)
+   audio = Callable(audio)
+   __audioOn__ = Callable(__audioOn__)
+   __audioOff__ = Callable(__audioOff__)
+   allAudioNotesOff = Callable(allAudioNotesOff)
+   startRendering = Callable(startRendering)
+   stopRendering = Callable(stopRendering)
+   sound = Callable(sound)
+
+
+######################################################################################
+# If running inside JEM, register function that stops music from playing, when the
+# Stop button is pressed inside JEM.
+######################################################################################
+
+try:
+
+    # if we are inside JEM, registerStopFunction() will be available
+    registerStopFunction(Play.stop)   # tell JEM which function to call when the Stop button is pressed
+
+except:  # otherwise (if we get an error), we are NOT inside JEM
+
+    pass    # so, do nothing.
+
+
+
+
+
+# preserve Jython bindings that get ovwerwritten by the previous Java imports - a hack!
+# (also see very top of music3/core.py)
+enumerate = enumerate_preserve
@@ -0,0 +1,353 @@
+"""
+A small, dependency-free OSC encoder/decoder for the CPython side (e.g. the Sensel bridge).
+
+Messages are written into a preallocated bytearray with struct.pack_into, and packets are
+parsed from a memoryview without copying (blobs come back as memoryview slices of the packet).
+Supported argument types are int ('i'), float ('f'), string ('s'), blob ('b') and
+True/False ('T'/'F'), as well as (nested) bundles.
+
+    encoder = OscEncoder()
+    packet = encoder.encode_message("/this/is/a/channel", [1, 23.25, 99.5, 266.5])
+
+    message = parse_packet(packet)    # OscMessage(address='/this/is/a/channel', args=(1, 23.25, 99.5, 266.5))
+"""
+import socket
+import struct
+from collections import namedtuple
+
+DEFAULT_BUFFER_SIZE = 65536          # largest UDP datagram we expect to send
+IMMEDIATELY = 1                      # special OSC time tag meaning "now"
+BUNDLE_TAG = b"#bundle\0"
+
+OscMessage = namedtuple("OscMessage", ["address", "args"])
+OscBundle = namedtuple("OscBundle", ["timetag", "elements"])
+
+_INT = struct.Struct(">i")
+_FLOAT = struct.Struct(">f")
+_TIMETAG = struct.Struct(">Q")
+
+# type tags for the Python types we know how to send (bool is handled separately, since it is an int)
+_TYPE_TAGS = {
+    int: "i",
+    float: "f",
+    str: "s",
+    bytes: "b",
+    bytearray: "b",
+    memoryview: "b",
+}
+
+_numeric_structs = {}                # type tags (e.g. "ifff") -> struct.Struct for all-numeric arguments
+
+
+def _padded(length):
+    """
+    Returns 'length' rounded up to the next multiple of 4.
+    """
+    return (length + 3) & ~3
+
+
+def _numeric_struct(tags):
+    """
+    Returns a (cached) struct.Struct for a run of int/float arguments, or None if 'tags' has other types.
+    """
+    packer = _numeric_structs.get(tags)
+    if packer is None:
+        if tags.strip("if"):
+            return None
+        packer = struct.Struct(">" + tags)
+        _numeric_structs[tags] = packer
+    return packer
+
+
+def _type_tag(arg):
+    if arg is True:
+        return "T"
+    if arg is False:
+        return "F"
+    try:
+        return _TYPE_TAGS[type(arg)]
+    except KeyError:
+        raise TypeError("OSC arguments must be int, float, str, bool or bytes, not " + type(arg).__name__)
+
+
+class OscEncoder:
+    """
+    Encodes OSC messages and bundles into a preallocated buffer.
+
+    The memoryview returned by the encode methods points into the encoder's buffer, so it is
+    only valid until the next call (send it, or copy it with bytes(), before encoding again).
+    """
+
+    def __init__(self, size=DEFAULT_BUFFER_SIZE):
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self._prefixes = {}          # (address, type tags) -> encoded address and type tag strings
+
+    def encode_message(self, address, args=()):
+        """
+        Encodes an OSC message and returns it as a memoryview into the buffer.
+        """
+        end = self.write_message(address, args, 0)
+        return self.view[:end]
+
+    def encode_bundle(self, elements, timetag=IMMEDIATELY):
+        """
+        Encodes an OSC bundle and returns it as a memoryview into the buffer.
+
+        'elements' is a list of (address, args) pairs and/or OscBundle tuples (for nested bundles).
+        """
+        end = self.write_bundle(elements, timetag, 0)
+        return self.view[:end]
+
+    def write_message(self, address, args, offset):
+        """
+        Writes an OSC message at 'offset' in the buffer, and returns the offset just past it.
+        """
+        tags = "".join([_type_tag(arg) for arg in args])
+
+        # the address and type tag strings rarely change, so encode them once
+        key = (address, tags)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix = _encode_string(address) + _encode_string("," + tags)
+            self._prefixes[key] = prefix
+
+        buffer = self.buffer
+        end = offset + len(prefix)
+        buffer[offset:end] = prefix
+
+        # fast path - only ints and floats (e.g. a Sensel contact), packed in one go
+        packer = _numeric_struct(tags)
+        if packer is not None:
+            packer.pack_into(buffer, end, *args)
+            return end + packer.size
+
+        for arg, tag in zip(args, tags):
+            if tag == "i":
+                _INT.pack_into(buffer, end, arg)
+                end = end + 4
+            elif tag == "f":
+                _FLOAT.pack_into(buffer, end, arg)
+                end = end + 4
+            elif tag == "s":
+                data = arg.encode("utf-8")
+                size = _padded(len(data) + 1)
+                struct.pack_into("%ds" % size, buffer, end, data)   # pads with null bytes
+                end = end + size
+            elif tag == "b":
+                size = len(arg)
+                _INT.pack_into(buffer, end, size)
+                end = end + 4
+                buffer[end:end + size] = arg
+                padding = _padded(size) - size
+                buffer[end + size:end + size + padding] = b"\0" * padding
+                end = end + size + padding
+            # 'T' and 'F' have no data
+        return end
+
+    def write_bundle(self, elements, timetag, offset):
+        """
+        Writes an OSC bundle at 'offset' in the buffer, and returns the offset just past it.
+        """
+        buffer = self.buffer
+        buffer[offset:offset + 8] = BUNDLE_TAG
+        _TIMETAG.pack_into(buffer, offset + 8, timetag)
+        end = offset + 16
+
+        for element in elements:
+            start = end + 4          # leave room for the element size
+            if isinstance(element, OscBundle):
+                end = self.write_bundle(element.elements, element.timetag, start)
+            else:
+                address, args = element
+                end = self.write_message(address, args, start)
+            _INT.pack_into(buffer, start - 4, end - start)
+        return end
+
+
+def _encode_string(string):
+    """
+    Returns 'string' as a null-terminated OSC string, padded to a multiple of 4 bytes.
+    """
+    data = string.encode("utf-8")
+    return data + b"\0" * (_padded(len(data) + 1) - len(data))
+
+
+def _parse_string(view, offset):
+    """
+    Parses the OSC string at 'offset', and returns (string, offset just past it).
+    """
+    # strings are padded to a multiple of 4 bytes, so the last byte of the last word is always null
+    end = offset + 3
+    while view[end] != 0:
+        end = end + 4
+    next_offset = end + 1
+
+    # find the actual end of the string within its last word
+    end = end - 3
+    while view[end] != 0:
+        end = end + 1
+    return str(view[offset:end], "utf-8"), next_offset
+
+
+def parse_packet(data):
+    """
+    Parses an OSC packet (bytes, bytearray or memoryview), and returns an OscMessage or OscBundle.
+
+    Blob arguments are returned as memoryview slices of 'data' (no copying).
+    """
+    view = memoryview(data)
+    if view[:8] == BUNDLE_TAG:
+        return _parse_bundle(view)
+    return _parse_message(view)
+
+
+def _parse_message(view):
+    address, offset = _parse_string(view, 0)
+    if offset >= len(view):
+        return OscMessage(address, ())           # no type tag string (old-style message without arguments)
+
+    tags, offset = _parse_string(view, offset)
+    if not tags.startswith(","):
+        raise ValueError("OSC message " + address + " has an invalid type tag string: " + tags)
+    tags = tags[1:]
+
+    # fast path - only ints and floats
+    unpacker = _numeric_struct(tags)
+    if unpacker is not None:
+        return OscMessage(address, unpacker.unpack_from(view, offset))
+
+    args = []
+    for tag in tags:
+        if tag == "i":
+            args.append(_INT.unpack_from(view, offset)[0])
+            offset = offset + 4
+        elif tag == "f":
+            args.append(_FLOAT.unpack_from(view, offset)[0])
+            offset = offset + 4
+        elif tag == "s":
+            string, offset = _parse_string(view, offset)
+            args.append(string)
+        elif tag == "b":
+            size = _INT.unpack_from(view, offset)[0]
+            offset = offset + 4
+            args.append(view[offset:offset + size])
+            offset = offset + _padded(size)
+        elif tag == "T":
+            args.append(True)
+        elif tag == "F":
+            args.append(False)
+        else:
+            raise ValueError("OSC message " + address + " has an unsupported type tag: " + tag)
+    return OscMessage(address, tuple(args))
+
+
+def _parse_bundle(view):
+    timetag = _TIMETAG.unpack_from(view, 8)[0]
+    elements = []
+    offset = 16
+    while offset < len(view):
+        size = _INT.unpack_from(view, offset)[0]
+        offset = offset + 4
+        elements.append(parse_packet(view[offset:offset + size]))
+        offset = offset + size
+    return OscBundle(timetag, elements)
+
+
+class OscClient:
+    """
+    Sends OSC messages over UDP (a drop-in replacement for pythonosc's SimpleUDPClient).
+    """
+
+    def __init__(self, address, port):
+        self.destination = (address, port)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.encoder = OscEncoder()
+
+    def send_message(self, address, value):
+        """
+        Sends an OSC message with a single argument, or a list of arguments.
+        """
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        self.socket.sendto(self.encoder.encode_message(address, value), self.destination)
+
+    def send_bundle(self, elements, timetag=IMMEDIATELY):
+        """
+        Sends several (address, args) messages in a single bundle (i.e., a single datagram).
+        """
+        self.socket.sendto(self.encoder.encode_bundle(elements, timetag), self.destination)
+
+    def close(self):
+        self.socket.close()
+
+
+def benchmark(contacts=range(1, 17), repeats=2000):
+    """
+    Compares encoding and decoding of Sensel frames (two messages per contact) against pythonosc.
+    """
+    import timeit
+
+    try:
+        from pythonosc.osc_message_builder import OscMessageBuilder
+        from pythonosc.osc_message import OscMessage as PythonOscMessage
+    except ImportError:
+        OscMessageBuilder = None
+        print("pythonosc is not installed, so only this codec is measured.")
+
+    addresses = ["/this/is/a/different/channel", "/this/is/a/channel"]
+    encoder = OscEncoder()
+
+    print("contacts   encode (us/frame)    decode (us/frame)")
+    for n in contacts:
+        frame = [[i, 23.25 + i, 99.484375, 266.5] for i in range(n)]
+
+        def encode():
+            for args in frame:
+                for address in addresses:
+                    encoder.encode_message(address, args)
+
+        packets = [bytes(encoder.encode_message(address, args)) for args in frame for address in addresses]
+
+        def decode():
+            for packet in packets:
+                parse_packet(packet)
+
+        encode_time = min(timeit.repeat(encode, number=repeats, repeat=3)) / repeats * 1e6
+        decode_time = min(timeit.repeat(decode, number=repeats, repeat=3)) / repeats * 1e6
+        line = "%8d   %7.1f" % (n, encode_time)
+
+        if OscMessageBuilder is not None:
+
+            def encode_pythonosc():
+                for args in frame:
+                    for address in addresses:
+                        builder = OscMessageBuilder(address=address)
+                        for arg in args:
+                            builder.add_arg(arg)
+                        builder.build().dgram
+
+            def decode_pythonosc():
+                for packet in packets:
+                    PythonOscMessage(packet).params
+
+            pythonosc_encode = min(timeit.repeat(encode_pythonosc, number=repeats, repeat=3)) / repeats * 1e6
+            pythonosc_decode = min(timeit.repeat(decode_pythonosc, number=repeats, repeat=3)) / repeats * 1e6
+            line = line + " (pythonosc %7.1f)   %7.1f (pythonosc %7.1f)" % (pythonosc_encode, decode_time, pythonosc_decode)
+        else:
+            line = line + "                      %7.1f" % decode_time
+        print(line)
+
+
+if __name__ == "__main__":
+    encoder = OscEncoder()
+
+    # round trip a message with every supported type
+    packet = encoder.encode_message("/test", [1, 2.5, "hello", b"\x01\x02\x03", True, False])
+    print(parse_packet(packet))
+
+    # and a (nested) bundle
+    packet = encoder.encode_bundle([("/a", [1, 2.0]), OscBundle(IMMEDIATELY, [("/b", ["c"])])])
+    print(parse_packet(packet))
+
+    benchmark()
@@ -4,7 +4,7 @@ import sensel
 import binascii
 import threading
 
-from pythonosc.udp_client import SimpleUDPClient
+from osc_codec import OscClient
 
 enter_pressed = False;
 ip = ""
@@ -88,7 +88,7 @@ def closeSensel(frame):
 if __name__ == "__main__":
     #global enter_pressed
     handle = openSensel()
-    client = SimpleUDPClient("192.168.1.4", 1337)
+    client = OscClient("192.168.1.4", 1337)
 
     for x in sensel.__dir__():
         print(x)